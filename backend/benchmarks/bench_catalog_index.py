@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark catalog ID lookups: boolean-mask scans vs the compiled CatalogIndex
+
+Run from backend/:
+    python benchmarks/bench_catalog_index.py [--repeat 20]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.catalog_index import CatalogIndex
+from src.core.data_loader import DataLoader
+
+def mapped_item_ids(mappings):
+    """Every item ID referenced by the category mappings, in mapping order"""
+    return [
+        item_id
+        for category_mapping in mappings.get('category_mappings', {}).values()
+        for mapping in category_mapping.get('item_mappings', {}).values()
+        for item_id in mapping.get('item_ids', [])
+    ]
+
+def mask_lookup(catalog, item_ids):
+    """The old _apply_costs lookup: full ID column scan plus iterrows per ID"""
+    rows = 0
+    for item_id in item_ids:
+        for _, item in catalog[catalog['ID'] == item_id].iterrows():
+            rows += item.get('Cost(Mid)', 0) is not None
+    return rows
+
+def index_lookup(index, item_ids):
+    """The compiled lookup: dict hit plus array reads per row"""
+    rows = 0
+    for item_id in item_ids:
+        for position in index.lookup(item_id):
+            rows += index.record(position)['unit_cost'] is not None
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark catalog ID lookups')
+    parser.add_argument('--config', default='config/settings.json', help='Path to settings.json')
+    parser.add_argument('--repeat', type=int, default=20, help='Passes over all mapped IDs')
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    data_loader = DataLoader(args.config)
+    catalog = data_loader.load_catalog()
+    item_ids = mapped_item_ids(data_loader.mappings)
+
+    build_seconds = timeit.timeit(lambda: CatalogIndex(catalog), number=1)
+    index = CatalogIndex(catalog)
+
+    assert mask_lookup(catalog, item_ids) == index_lookup(index, item_ids), "lookups disagree"
+
+    mask_seconds = timeit.timeit(lambda: mask_lookup(catalog, item_ids), number=args.repeat)
+    index_seconds = timeit.timeit(lambda: index_lookup(index, item_ids), number=args.repeat)
+    lookups = len(item_ids) * args.repeat
+
+    print(f"Catalog: {len(catalog)} rows, {len(item_ids)} mapped IDs, {args.repeat} passes")
+    print(f"Index build:      {build_seconds * 1000:10.2f} ms (once per snapshot)")
+    print(f"Mask scan:        {mask_seconds / lookups * 1e6:10.2f} us/lookup")
+    print(f"CatalogIndex:     {index_seconds / lookups * 1e6:10.2f} us/lookup")
+    print(f"Speedup:          {mask_seconds / index_seconds:10.1f}x")
+
+if __name__ == "__main__":
+    main()
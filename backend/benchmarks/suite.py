@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the estimation pipeline
+
+Times engine construction, catalog loading, standard estimates for small,
+medium and large projects in every tier, detailed estimates with 5/50/500
+rooms, CatalogMapper lookups and ReportGenerator outputs. Everything runs
+offline against the files named in settings.json.
+
+Each run is appended to a JSON history file; `compare` checks the latest run
+against an earlier one and exits non-zero when a metric slowed down by more
+than its threshold. benchmarks/thresholds.json sets the statistic compared
+(median by default), the allowed relative slowdown per metric prefix, and an
+absolute floor below which differences are treated as noise.
+
+Run from backend/:
+    python benchmarks/suite.py run [--repeat 5] [--only estimate] [--label my-change]
+    python benchmarks/suite.py compare [--baseline -2] [--candidate -1]
+    python benchmarks/suite.py run --gate        # run, then compare against the previous run
+
+To benchmark at scale, point --config at a generated dataset:
+    python -m src.utils.synthetic_data --output /tmp/synthetic --rows 100000
+    python benchmarks/suite.py run --config /tmp/synthetic/settings.json --label synthetic-100k
+"""
+
+import argparse
+import gc
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.data_loader import DataLoader
+from src.core.estimation_engine import EstimationEngine, EnhancedEstimationEngine
+from src.utils.catalog_mapper import CatalogMapper
+from src.utils.report_generator import ReportGenerator
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_HISTORY = os.path.join(BENCHMARK_DIR, 'results', 'history.json')
+DEFAULT_THRESHOLDS = os.path.join(BENCHMARK_DIR, 'thresholds.json')
+
+PROJECT_SIZES = {
+    'small': {'square_footage': 3000, 'bedroom_count': 3, 'primary_bath_count': 1, 'secondary_bath_count': 1},
+    'medium': {'square_footage': 6500, 'bedroom_count': 5, 'primary_bath_count': 1, 'secondary_bath_count': 3,
+               'powder_room_count': 2},
+    'large': {'square_footage': 15000, 'bedroom_count': 8, 'primary_bath_count': 2, 'secondary_bath_count': 6,
+              'powder_room_count': 3}
+}
+ROOM_COUNTS = (5, 50, 500)
+ROOM_TYPES = [
+    ('kitchen', 400), ('primary_bath', 250), ('secondary_bath', 120), ('powder_room', 50),
+    ('bedroom', 300), ('living', 600), ('utility', 90), ('laundry', 80)
+]
+
+def detailed_project(room_count, tier='Luxury'):
+    """Enhanced project payload with room_count rooms cycling through the common room types"""
+    rooms = {}
+    for index in range(room_count):
+        room_type, room_sf = ROOM_TYPES[index % len(ROOM_TYPES)]
+        rooms[f"room_{index}"] = {'name': f"{room_type.replace('_', ' ').title()} {index}", 'type': room_type,
+                                  'square_footage': room_sf}
+    total_sf = int(sum(room['square_footage'] for room in rooms.values()) * 1.15)
+    return {'project_name': f"Benchmark {room_count} rooms", 'square_footage': total_sf, 'global_tier': tier,
+            'rooms': rooms}
+
+class Workspace:
+    """Config and engines shared by the benchmarks of one run"""
+
+    def __init__(self, config_path):
+        self.config_path = config_path
+        self.temp_dir = tempfile.mkdtemp(prefix='estimator-bench-')
+        self._engine = None
+
+        # Estimates are timed with the quantity and baseline caches off so repeats measure the work, not the memo
+        with open(config_path) as file:
+            config = json.load(file)
+        config.setdefault('estimation', {})['quantity_cache'] = {'enabled': False}
+        config['estimation']['baseline_cache'] = {'enabled': False}
+        self.cold_config_path = os.path.join(self.temp_dir, 'settings.json')
+        with open(self.cold_config_path, 'w') as file:
+            json.dump(config, file)
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            self._engine = EnhancedEstimationEngine(self.cold_config_path)
+        return self._engine
+
+    def close(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+def engine_cases(workspace):
+    yield 'engine.construct', lambda: EstimationEngine(workspace.config_path), None
+
+def catalog_cases(workspace):
+    yield 'catalog.load', lambda: DataLoader(workspace.config_path).load_catalog(), None
+
+def estimate_cases(workspace):
+    engine = workspace.engine
+    for size, project in PROJECT_SIZES.items():
+        for tier in engine.config.get('estimation', {}).get('tiers', {}):
+            data = dict(project, tier=tier)
+            yield f"estimate.{size}.{tier}", lambda data=data: engine.estimate_project(data), None
+
+def detailed_cases(workspace):
+    engine = workspace.engine
+    for room_count in ROOM_COUNTS:
+        data = detailed_project(room_count)
+        # The 500-room estimate runs a fifth as often
+        yield (f"detailed.rooms_{room_count}", lambda data=data: engine.estimate_detailed_project(data),
+               0.2 if room_count >= 500 else None)
+
+def mapper_cases(workspace):
+    config = workspace.engine.config
+    catalog_path = config.get('data', {}).get('enhanced_catalog_path', 'data/catalog_enhanced.csv')
+    if not os.path.exists(catalog_path):
+        print(f"Skipping mapper benchmarks: {catalog_path} not found")
+        return
+
+    yield 'mapper.build', lambda: CatalogMapper(catalog_path), None
+
+    mapper = CatalogMapper(catalog_path)
+    pairs = [
+        (module, quantity_name)
+        for module, mapping in workspace.engine.mappings.get('category_mappings', {}).items()
+        for quantity_name in mapping.get('item_mappings', {})
+    ]
+
+    def lookups():
+        for module, quantity_name in pairs:
+            mapper.get_catalog_items_for_quantity(module, quantity_name, 'Luxury')
+
+    yield 'mapper.lookups', lookups, None
+    yield 'mapper.suggestions', lambda: mapper.generate_mapping_suggestions(), None
+
+def report_cases(workspace):
+    generator = ReportGenerator(workspace.engine.config)
+    standard = workspace.engine.estimate_project(dict(PROJECT_SIZES['large'], tier='Luxury'))
+    detailed = workspace.engine.estimate_detailed_project(detailed_project(50))
+    csv_path = os.path.join(workspace.temp_dir, 'report.csv')
+
+    yield 'report.summary', lambda: generator.generate_summary_report(standard), None
+    yield 'report.detailed', lambda: generator.generate_detailed_report(detailed), None
+    yield 'report.csv', lambda: generator.generate_csv_report(standard, csv_path), None
+
+GROUPS = {
+    'engine': engine_cases,
+    'catalog': catalog_cases,
+    'estimate': estimate_cases,
+    'detailed': detailed_cases,
+    'mapper': mapper_cases,
+    'report': report_cases
+}
+
+def time_case(fn, repeat):
+    """Run fn once to warm up, then repeat times; durations in ms"""
+    fn()
+    durations = []
+    for _ in range(repeat):
+        # Like timeit, keep the collector out of the measurement so results don't
+        # depend on what earlier benchmarks left on the heap
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            fn()
+            durations.append((time.perf_counter() - started) * 1000)
+        finally:
+            gc.enable()
+    return {
+        'median_ms': round(statistics.median(durations), 4),
+        'min_ms': round(min(durations), 4),
+        'mean_ms': round(statistics.fmean(durations), 4),
+        'runs': repeat
+    }
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                               check=True, timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+def selected(name, only):
+    """True when no filter is given, or name is one of only or sits under one at a '.' boundary"""
+    return not only or any(name == prefix or name.startswith(prefix + '.') for prefix in only)
+
+def run_suite(config_path, repeat, only=None):
+    """Run the selected benchmark groups; returns {metric: timing}"""
+    workspace = Workspace(config_path)
+    metrics = {}
+    try:
+        for group, cases in GROUPS.items():
+            # A group is built when it is selected itself or holds a selected metric
+            if not selected(group, only) and not any(prefix.startswith(group + '.') for prefix in only):
+                continue
+            for name, fn, scale in list(cases(workspace)):
+                if not selected(name, only):
+                    continue
+                runs = max(1, int(repeat * scale)) if scale else repeat
+                metrics[name] = time_case(fn, runs)
+                print(f"{name:40s} {metrics[name]['median_ms']:12.3f} ms  (min {metrics[name]['min_ms']:.3f}, {runs} runs)")
+    finally:
+        workspace.close()
+    return metrics
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path) as file:
+        return json.load(file)
+
+def save_history(path, history, max_runs):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w') as file:
+        json.dump(history[-max_runs:], file, indent=2)
+    os.replace(temp_path, path)
+
+def load_thresholds(path):
+    thresholds = {'statistic': 'median_ms', 'default': 0.25, 'min_delta_ms': 0.5, 'metrics': {}}
+    if path and os.path.exists(path):
+        with open(path) as file:
+            thresholds.update(json.load(file))
+    return thresholds
+
+def threshold_for(thresholds, metric):
+    """Allowed relative slowdown: the longest matching prefix in 'metrics', else 'default'"""
+    matches = [prefix for prefix in thresholds.get('metrics', {}) if selected(metric, [prefix])]
+    if matches:
+        return thresholds['metrics'][max(matches, key=len)]
+    return thresholds.get('default', 0.25)
+
+def find_run(history, ref):
+    """A run by list index ('-1' is the latest) or by label"""
+    try:
+        return history[int(ref)]
+    except ValueError:
+        pass
+    except IndexError:
+        return None
+    for run in reversed(history):
+        if run.get('label') == ref:
+            return run
+    return None
+
+def compare_runs(baseline, candidate, thresholds):
+    """
+    Compare two runs metric by metric
+
+    Returns:
+        (rows, regressions): rows of (metric, baseline_ms, candidate_ms, change, allowed, status)
+    """
+    rows = []
+    regressions = []
+    statistic = thresholds.get('statistic', 'median_ms')
+    min_delta_ms = thresholds.get('min_delta_ms', 0.5)
+    for metric, timing in sorted(candidate['metrics'].items()):
+        previous = baseline['metrics'].get(metric)
+        if previous is None:
+            rows.append((metric, None, timing[statistic], None, None, 'new'))
+            continue
+        before, after = previous[statistic], timing[statistic]
+        change = (after - before) / before if before else 0.0
+        allowed = threshold_for(thresholds, metric)
+        # Tiny absolute differences are timer noise, whatever their ratio
+        regressed = change > allowed and after - before > min_delta_ms
+        status = 'REGRESSED' if regressed else ('faster' if change < 0 else 'ok')
+        rows.append((metric, before, after, change, allowed, status))
+        if regressed:
+            regressions.append(metric)
+    return rows, regressions
+
+def print_comparison(baseline, candidate, rows):
+    print(f"Baseline:  {baseline.get('label') or baseline['timestamp']} ({baseline.get('commit') or 'unknown commit'})")
+    print(f"Candidate: {candidate.get('label') or candidate['timestamp']} ({candidate.get('commit') or 'unknown commit'})")
+    for metric, before, after, change, allowed, status in rows:
+        if before is None:
+            print(f"{metric:40s} {'-':>12s} {after:12.3f} ms  {status}")
+        else:
+            print(f"{metric:40s} {before:12.3f} {after:12.3f} ms  {change:+8.1%} (allowed {allowed:+.0%})  {status}")
+
+def command_compare(args, history=None):
+    history = history if history is not None else load_history(args.history)
+    baseline = find_run(history, args.baseline)
+    candidate = find_run(history, args.candidate)
+    if baseline is None or candidate is None:
+        print(f"Need two runs to compare; {args.history} has {len(history)}")
+        return 0 if args.gate_missing_ok else 2
+
+    rows, regressions = compare_runs(baseline, candidate, load_thresholds(args.thresholds))
+    print_comparison(baseline, candidate, rows)
+    if regressions:
+        print(f"\n{len(regressions)} metric(s) regressed: {', '.join(regressions)}")
+        return 1
+    print("\nNo regressions")
+    return 0
+
+def command_run(args):
+    logging.disable(logging.CRITICAL)
+    metrics = run_suite(args.config, args.repeat, args.only)
+    logging.disable(logging.NOTSET)
+
+    run = {
+        'timestamp': datetime.now().isoformat(),
+        'label': args.label,
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'metrics': metrics
+    }
+    history = load_history(args.history)
+    history.append(run)
+    save_history(args.history, history, args.max_history)
+    print(f"\nSaved run {len(history)} to {args.history}")
+
+    if args.gate:
+        print()
+        args.baseline, args.candidate, args.gate_missing_ok = '-2', '-1', True
+        return command_compare(args, history)
+    return 0
+
+def main():
+    parser = argparse.ArgumentParser(description='Estimation pipeline benchmarks')
+    parser.add_argument('--history', default=DEFAULT_HISTORY, help='JSON file runs are appended to')
+    parser.add_argument('--thresholds', default=DEFAULT_THRESHOLDS, help='JSON file of allowed slowdowns')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='Run the benchmarks and append the results to the history')
+    run_parser.add_argument('--config', default='config/settings.json', help='Path to settings.json')
+    run_parser.add_argument('--repeat', type=int, default=5, help='Timed runs per benchmark (after one warm-up)')
+    run_parser.add_argument('--only', nargs='+', help='Metrics to run by name or dotted prefix, e.g. estimate.large detailed.rooms_5')
+    run_parser.add_argument('--label', help='Name for this run, usable as a compare reference')
+    run_parser.add_argument('--max-history', type=int, default=100, help='Runs kept in the history file')
+    run_parser.add_argument('--gate', action='store_true', help='Compare against the previous run and fail on regressions')
+
+    compare_parser = subparsers.add_parser('compare', help='Compare two runs from the history')
+    compare_parser.add_argument('--baseline', default='-2', help='Run index or label to compare against')
+    compare_parser.add_argument('--candidate', default='-1', help='Run index or label to check')
+    compare_parser.set_defaults(gate_missing_ok=False)
+
+    args = parser.parse_args()
+    if args.command == 'run':
+        return command_run(args)
+    return command_compare(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,22 +1,58 @@
 # api/app.py
-from fastapi import FastAPI, HTTPException, Depends
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, ValidationError
 from typing import Dict, List, Optional, Any, Union
 import logging
 import json
 from datetime import datetime
 
+from src.core.snapshot_manager import SnapshotManager
+from src.api.executor import EstimationExecutor
+from src.api.response_cache import ResponseCache
+from src.api.single_flight import SingleFlight
 from src.core.estimation_engine import EstimationEngine
 from src.core.estimation_engine import EnhancedEstimationEngine
+from src.core.profiler import get_profile_counters
 from src.utils.report_generator import ReportGenerator
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+CONFIG_PATH = 'config/settings.json'
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build the shared engine snapshot once at startup and watch it for changes"""
+    manager = SnapshotManager(CONFIG_PATH, engine_factories={
+        'standard': EstimationEngine.from_snapshot,
+        'enhanced': EnhancedEstimationEngine.from_snapshot
+    })
+    app.state.snapshot_manager = manager
+    app.state.report_generator = ReportGenerator()
+    app.state.response_cache = ResponseCache.from_config(manager.snapshot.config)
+    app.state.single_flight = SingleFlight()
+    logger.info(f"Engine snapshot {manager.version} ready; sharing it across all requests")
+
+    # Estimation is blocking pandas work, so it runs on worker pools instead of the event loop
+    executor = EstimationExecutor.from_config(manager.snapshot.config, CONFIG_PATH)
+    app.state.executor = executor
+    manager.add_listener(lambda old, new: executor.reset_heavy_pool())
+
+    reload_interval = manager.snapshot.config.get('api', {}).get('reload_interval_seconds', 5)
+    manager.start(reload_interval)
+    try:
+        yield
+    finally:
+        manager.stop()
+        executor.shutdown()
+
 # Initialize FastAPI app
-app = FastAPI(title="Construction Budget Calculator API")
+app = FastAPI(title="Construction Budget Calculator API", lifespan=lifespan)
 
 # Add CORS middleware to allow frontend communication
 app.add_middleware(
@@ -59,35 +95,101 @@ class ValidationResult(BaseModel):
     invalid_values: List[Dict[str, Any]] = []
     warnings: List[str] = []
 
-# Dependency to get engine instances
-def get_standard_engine():
-    return EstimationEngine()
+# Dependencies returning the process-wide engines built in lifespan()
+def get_standard_engine(request: Request) -> EstimationEngine:
+    return request.app.state.snapshot_manager.get_engine('standard')
+
+def get_enhanced_engine(request: Request) -> EnhancedEstimationEngine:
+    return request.app.state.snapshot_manager.get_engine('enhanced')
+
+def get_report_generator(request: Request) -> ReportGenerator:
+    return request.app.state.report_generator
+
+def get_executor(request: Request) -> EstimationExecutor:
+    return request.app.state.executor
+
+def get_response_cache(request: Request) -> ResponseCache:
+    return request.app.state.response_cache
 
-def get_enhanced_engine():
-    return EnhancedEstimationEngine()
+def get_single_flight(request: Request) -> SingleFlight:
+    return request.app.state.single_flight
 
-def get_report_generator():
-    return ReportGenerator()
+async def _cached_estimate(response_cache: ResponseCache, single_flight: SingleFlight, executor: EstimationExecutor,
+                           kind: str, version: str, data_dict: Dict[str, Any], compute):
+    """Serve an estimate from the response cache, or compute and store it once for concurrent callers"""
+    key = response_cache.key(kind, data_dict, version)
+    
+    # Memory hits are answered on the event loop; disk lookups and writes run on the light pool
+    if response_cache.disk_path:
+        cached = response_cache.get_memory(key)
+        if cached is None:
+            cached = await executor.run_light(response_cache.get, key)
+    else:
+        cached = response_cache.get(key)
+    if cached is not None:
+        return cached
+    
+    async def compute_and_store():
+        result = await compute()
+        metadata = result.get('summary', {}).get('metadata', {}) if isinstance(result, dict) else {}
+        if metadata.get('catalog_version') != version:
+            # A reload landed mid-request; don't file this result under the snapshot it wasn't built from
+            logger.info(f"Not caching {kind} estimate built from snapshot {metadata.get('catalog_version')} "
+                        f"(requested {version})")
+            return result
+        if 'profile' in metadata:
+            # Profiles time one particular run, so a cached copy would misreport later requests
+            return result
+        if response_cache.disk_path:
+            await executor.run_light(response_cache.put, key, result)
+        else:
+            response_cache.put(key, result)
+        return result
+    
+    # Identical requests arriving while this one computes share its result
+    return await single_flight.run(key, compute_and_store)
 
 # API endpoints
 @app.get("/api/health")
-async def health_check():
+async def health_check(request: Request):
     """Check if the API is running"""
-    return {"status": "ok", "timestamp": datetime.now().isoformat()}
+    return {
+        "status": "ok",
+        "timestamp": datetime.now().isoformat(),
+        "catalog_version": request.app.state.snapshot_manager.version
+    }
+
+@app.get("/api/metrics")
+async def get_metrics(request: Request, executor: EstimationExecutor = Depends(get_executor)):
+    """Get worker pool queue depth and wait times, cache hit rates and profiled estimate totals"""
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "executor": executor.metrics(),
+        "quantity_cache": request.app.state.snapshot_manager.snapshot.quantity_cache.stats(),
+        "baseline_cache": request.app.state.snapshot_manager.snapshot.baseline_cache.stats(),
+        "response_cache": request.app.state.response_cache.stats(),
+        "single_flight": request.app.state.single_flight.stats(),
+        "profile": get_profile_counters().stats()
+    }
 
 @app.post("/api/estimate")
 async def create_estimate(
     project_data: ProjectData,
-    engine: EstimationEngine = Depends(get_standard_engine)
+    engine: EstimationEngine = Depends(get_standard_engine),
+    executor: EstimationExecutor = Depends(get_executor),
+    response_cache: ResponseCache = Depends(get_response_cache),
+    single_flight: SingleFlight = Depends(get_single_flight)
 ):
     """Create a standard estimate"""
     try:
         # Convert to dictionary for the engine
         data_dict = project_data.dict(exclude_none=True)
         
-        # Run estimation
-        result = engine.estimate_project(data_dict)
-        return result
+        # Run estimation, unless this exact project was estimated against this snapshot recently
+        return await _cached_estimate(
+            response_cache, single_flight, executor, 'standard', engine.snapshot.version, data_dict,
+            lambda: executor.run_light(engine.estimate_project, data_dict)
+        )
     except Exception as e:
         logger.error(f"Error creating estimate: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -95,24 +197,120 @@ async def create_estimate(
 @app.post("/api/estimate/detailed")
 async def create_detailed_estimate(
     project_data: ProjectData,
-    engine: EnhancedEstimationEngine = Depends(get_enhanced_engine)
+    engine: EnhancedEstimationEngine = Depends(get_enhanced_engine),
+    executor: EstimationExecutor = Depends(get_executor),
+    response_cache: ResponseCache = Depends(get_response_cache),
+    single_flight: SingleFlight = Depends(get_single_flight)
 ):
     """Create a detailed estimate with room and trade customizations"""
     try:
         # Convert to dictionary for the engine
         data_dict = project_data.dict(exclude_none=True)
         
-        # Run detailed estimation
-        result = engine.estimate_detailed_project(data_dict)
-        return result
+        # Run detailed estimation, unless this exact project was estimated against this snapshot recently
+        return await _cached_estimate(
+            response_cache, single_flight, executor, 'detailed', engine.snapshot.version, data_dict,
+            lambda: executor.run_heavy(engine, 'estimate_detailed_project', data_dict)
+        )
     except Exception as e:
         logger.error(f"Error creating detailed estimate: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
+def _parse_ndjson_line(line: bytes) -> Any:
+    """Parse one NDJSON line; a malformed line comes back as its error so indexes still line up with the input"""
+    try:
+        return json.loads(line)
+    except ValueError as e:
+        return e
+
+async def _read_ndjson(chunks, max_items: int, max_line_bytes: int) -> List[Any]:
+    """
+    Read an NDJSON body into parsed items, one per non-blank line
+    
+    Lines are parsed chunk by chunk, but the whole body is read before any item
+    runs. Reading stops early once there are more than max_items. A line longer
+    than max_line_bytes, terminated or not, is rejected with a 413.
+    """
+    items = []
+    pending = b''
+    async for chunk in chunks:
+        lines = (pending + chunk).split(b'\n')
+        pending = lines.pop()
+        if len(pending) > max_line_bytes or any(len(line) > max_line_bytes for line in lines):
+            raise HTTPException(status_code=413, detail=f"Batch line exceeds the limit of {max_line_bytes} bytes")
+        items.extend(_parse_ndjson_line(line) for line in lines if line.strip())
+        if len(items) > max_items:
+            return items
+    if pending.strip():
+        items.append(_parse_ndjson_line(pending))
+    return items
+
+@app.post("/api/estimate/batch")
+async def create_batch_estimate(
+    request: Request,
+    engine: EstimationEngine = Depends(get_standard_engine),
+    executor: EstimationExecutor = Depends(get_executor)
+):
+    """Estimate many projects and stream each result as NDJSON when it finishes"""
+    batch_settings = engine.config.get('api', {}).get('batch', {})
+    max_items = batch_settings.get('max_items', 1000)
+    content_type = request.headers.get('content-type', '')
+    if 'ndjson' in content_type or 'jsonlines' in content_type:
+        # One project per line; too many items or an overlong line is rejected without reading the rest
+        items = await _read_ndjson(request.stream(), max_items, batch_settings.get('max_line_bytes', 1048576))
+    else:
+        try:
+            items = json.loads(await request.body())
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid batch body: {str(e)}")
+        if not isinstance(items, list):
+            raise HTTPException(status_code=400, detail="Invalid batch body: Batch body must be a JSON array or NDJSON")
+
+    if len(items) > max_items:
+        raise HTTPException(status_code=413, detail=f"Batch exceeds the limit of {max_items} projects")
+
+    # Validate every item up front; bad items become error lines instead of failing the batch
+    rejected = []
+    accepted = []
+    for index, item in enumerate(items):
+        if isinstance(item, Exception):
+            rejected.append({'index': index, 'status': 'validation_error', 'message': f"Invalid JSON: {str(item)}"})
+            continue
+        try:
+            accepted.append((index, ProjectData(**item).dict(exclude_none=True)))
+        except (ValidationError, TypeError) as e:
+            rejected.append({'index': index, 'status': 'validation_error', 'message': str(e)})
+
+    async def run_item(slots, index, data_dict):
+        # Standard estimates are light work; the slots keep one batch from filling the light pool's queue
+        async with slots:
+            try:
+                return await executor.run_light(engine.estimate_batch_item, index, data_dict)
+            except Exception as e:
+                logger.error(f"Error running batch item {index}: {str(e)}", exc_info=True)
+                return {'index': index, 'status': 'error', 'message': str(e)}
+
+    async def stream_results():
+        slots = asyncio.Semaphore(batch_settings.get('max_workers', 4))
+        tasks = [asyncio.ensure_future(run_item(slots, index, data_dict)) for index, data_dict in accepted]
+        try:
+            for item in rejected:
+                yield json.dumps(item) + "\n"
+            for next_done in asyncio.as_completed(tasks):
+                yield json.dumps(await next_done, default=str) + "\n"
+        finally:
+            # Client went away: drop work that has not started yet
+            for task in tasks:
+                task.cancel()
+
+    logger.info(f"Streaming batch of {len(items)} projects ({len(rejected)} rejected)")
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
 @app.post("/api/estimate/validate")
 async def validate_project_data(
     project_data: ProjectData,
-    engine: EstimationEngine = Depends(get_standard_engine)
+    engine: EstimationEngine = Depends(get_standard_engine),
+    executor: EstimationExecutor = Depends(get_executor)
 ):
     """Validate project data before estimation"""
     try:
@@ -120,7 +318,7 @@ async def validate_project_data(
         data_dict = project_data.dict(exclude_none=True)
         
         # Validate data
-        validation_result = engine.validate_project_data(data_dict)
+        validation_result = await executor.run_light(engine.validate_project_data, data_dict)
         return validation_result
     except Exception as e:
         logger.error(f"Error validating project data: {str(e)}", exc_info=True)
@@ -130,11 +328,12 @@ async def validate_project_data(
 async def save_estimation(
     name: str,
     estimation_data: Dict[str, Any],
-    engine: EstimationEngine = Depends(get_standard_engine)
+    engine: EstimationEngine = Depends(get_standard_engine),
+    executor: EstimationExecutor = Depends(get_executor)
 ):
     """Save an estimation result"""
     try:
-        success = engine.save_estimation(estimation_data, name)
+        success = await executor.run_light(engine.save_estimation, estimation_data, name)
         if success:
             return {"status": "success", "message": f"Estimation saved as '{name}'"}
         else:
@@ -146,11 +345,12 @@ async def save_estimation(
 @app.get("/api/load/{name}")
 async def load_estimation(
     name: str,
-    engine: EstimationEngine = Depends(get_standard_engine)
+    engine: EstimationEngine = Depends(get_standard_engine),
+    executor: EstimationExecutor = Depends(get_executor)
 ):
     """Load a saved estimation"""
     try:
-        estimation = engine.load_estimation(name)
+        estimation = await executor.run_light(engine.load_estimation, name)
         if estimation:
             return estimation
         else:
@@ -269,12 +469,13 @@ async def generate_report(
     estimate_id: str,
     format: str = "summary",
     engine: EstimationEngine = Depends(get_standard_engine),
-    report_generator: ReportGenerator = Depends(get_report_generator)
+    report_generator: ReportGenerator = Depends(get_report_generator),
+    executor: EstimationExecutor = Depends(get_executor)
 ):
     """Generate a report for a saved estimate"""
     try:
         # Load the estimation
-        estimation = engine.load_estimation(estimate_id)
+        estimation = await executor.run_light(engine.load_estimation, estimate_id)
         if not estimation:
             raise HTTPException(status_code=404, detail=f"Estimation '{estimate_id}' not found")
         
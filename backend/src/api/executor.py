@@ -0,0 +1,187 @@
+# api/executor.py
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Dict, Any
+
+from src.core.profiler import get_profile_counters
+from src.core.worker_engine import init_worker_engine, run_snapshot_method, timed_call
+
+logger = logging.getLogger(__name__)
+
+class PoolMetrics:
+    """Thread-safe counters for one worker pool"""
+
+    def __init__(self, max_workers):
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.in_flight = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.total_run_seconds = 0.0
+
+    def record_submit(self):
+        with self._lock:
+            self.submitted += 1
+            self.in_flight += 1
+
+    def record_finish(self, submitted_at, started_at, finished_at, failed=False):
+        with self._lock:
+            self.in_flight -= 1
+            if failed:
+                self.failed += 1
+                return
+            self.completed += 1
+            wait = max(0.0, started_at - submitted_at)
+            self.total_wait_seconds += wait
+            self.max_wait_seconds = max(self.max_wait_seconds, wait)
+            self.total_run_seconds += max(0.0, finished_at - started_at)
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            completed = self.completed or 1
+            return {
+                'max_workers': self.max_workers,
+                'submitted': self.submitted,
+                'completed': self.completed,
+                'failed': self.failed,
+                'in_flight': self.in_flight,
+                # Work beyond the worker count is waiting in the pool's queue
+                'queue_depth': max(0, self.in_flight - self.max_workers),
+                'avg_wait_ms': round(self.total_wait_seconds / completed * 1000, 3),
+                'max_wait_ms': round(self.max_wait_seconds * 1000, 3),
+                'avg_run_ms': round(self.total_run_seconds / completed * 1000, 3)
+            }
+
+class EstimationExecutor:
+    """
+    Runs blocking estimation work off the asyncio event loop.
+
+    Light calls (standard estimates, validation, file I/O) go to a thread pool.
+    Heavy calls (detailed estimates) go to a process pool whose workers preload
+    the catalog once, or to a second thread pool when heavy_mode is 'thread'.
+    """
+
+    def __init__(self, config_path='config/settings.json', light_workers=4,
+                 heavy_mode='process', heavy_workers=2):
+        """
+        Args:
+            config_path: settings.json path used to preload process workers
+            light_workers: Thread count for light calls
+            heavy_mode: 'process' or 'thread'
+            heavy_workers: Worker count for heavy calls
+        """
+        if heavy_mode not in ('process', 'thread'):
+            raise ValueError(f"heavy_mode must be 'process' or 'thread', got '{heavy_mode}'")
+
+        self.config_path = config_path
+        self.heavy_mode = heavy_mode
+        self.light_pool = ThreadPoolExecutor(max_workers=light_workers, thread_name_prefix='estimate-light')
+        self.light_metrics = PoolMetrics(light_workers)
+        self.heavy_workers = heavy_workers
+        # Guards heavy_pool, which reset_heavy_pool swaps from the snapshot watcher thread
+        self._heavy_lock = threading.Lock()
+        self.heavy_pool = self._create_heavy_pool()
+        self.heavy_metrics = PoolMetrics(heavy_workers)
+
+    @classmethod
+    def from_config(cls, config, config_path='config/settings.json'):
+        """Create an executor from the api.executor section of settings.json"""
+        settings = config.get('api', {}).get('executor', {})
+        return cls(
+            config_path=config_path,
+            light_workers=settings.get('light_workers', 4),
+            heavy_mode=settings.get('heavy_mode', 'process'),
+            heavy_workers=settings.get('heavy_workers', 2)
+        )
+
+    def _create_heavy_pool(self):
+        if self.heavy_mode == 'process':
+            return ProcessPoolExecutor(
+                max_workers=self.heavy_workers,
+                initializer=init_worker_engine,
+                initargs=(self.config_path,)
+            )
+        return ThreadPoolExecutor(max_workers=self.heavy_workers, thread_name_prefix='estimate-heavy')
+
+    async def _submit(self, schedule, metrics, fn, *args):
+        loop = asyncio.get_running_loop()
+        submitted_at = time.time()
+        metrics.record_submit()
+        try:
+            result, started_at = await schedule(loop, timed_call, fn, *args)
+        except BaseException:
+            metrics.record_finish(submitted_at, submitted_at, time.time(), failed=True)
+            raise
+        metrics.record_finish(submitted_at, started_at, time.time())
+        return result
+
+    def _schedule_light(self, loop, fn, *args):
+        return loop.run_in_executor(self.light_pool, fn, *args)
+
+    def _schedule_heavy(self, loop, fn, *args):
+        """Submit to the current heavy pool, moving to its replacement if a reset shut it down meanwhile"""
+        while True:
+            with self._heavy_lock:
+                pool = self.heavy_pool
+            try:
+                return loop.run_in_executor(pool, fn, *args)
+            except RuntimeError:
+                with self._heavy_lock:
+                    if pool is self.heavy_pool:
+                        raise
+
+    async def run_light(self, fn, *args):
+        """Run a blocking callable on the light thread pool"""
+        return await self._submit(self._schedule_light, self.light_metrics, fn, *args)
+
+    async def run_heavy(self, engine, method_name, *args):
+        """
+        Run an engine method on the heavy pool
+
+        In process mode the call runs on the worker's preloaded engine, which must
+        hold the same snapshot version as the given engine (see
+        run_snapshot_method); in thread mode it runs on the given shared engine.
+        A profiled result from a worker is folded into this process's profile
+        counters.
+        """
+        if self.heavy_mode == 'process':
+            result = await self._submit(self._schedule_heavy, self.heavy_metrics, run_snapshot_method,
+                                        engine.snapshot.version, method_name, *args)
+            get_profile_counters().record_result(result)
+            return result
+        return await self._submit(self._schedule_heavy, self.heavy_metrics, getattr(engine, method_name), *args)
+
+    def reset_heavy_pool(self):
+        """
+        Replace process workers so they preload the current snapshot; in-flight work still finishes
+
+        Called from the snapshot watcher thread, so the swap happens under the
+        heavy pool lock and submissions that hit the old pool retry on the new one.
+        """
+        if self.heavy_mode != 'process':
+            return
+        new_pool = self._create_heavy_pool()
+        with self._heavy_lock:
+            old_pool, self.heavy_pool = self.heavy_pool, new_pool
+        old_pool.shutdown(wait=False)
+        logger.info("Recycled heavy estimation workers")
+
+    def metrics(self) -> Dict[str, Any]:
+        """Queue depth, wait and run time for both pools"""
+        return {
+            'light': self.light_metrics.as_dict(),
+            'heavy': dict(self.heavy_metrics.as_dict(), mode=self.heavy_mode)
+        }
+
+    def shutdown(self):
+        self.light_pool.shutdown(wait=False)
+        with self._heavy_lock:
+            heavy_pool = self.heavy_pool
+        heavy_pool.shutdown(wait=False)
@@ -0,0 +1,217 @@
+# src/api/response_cache.py
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+def _json_default(value):
+    """Serialize numpy scalars that end up in estimate results"""
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+def project_cache_key(kind: str, project_data: Dict[str, Any], version: str) -> str:
+    """
+    Canonical hash of an estimate request
+
+    Args:
+        kind: Which estimate ('standard', 'detailed')
+        project_data: Normalized project data (ProjectData.dict(exclude_none=True))
+        version: Snapshot version, so a catalog or mapping change misses the cache
+    """
+    payload = json.dumps({'kind': kind, 'version': version, 'project': project_data},
+                         sort_keys=True, separators=(',', ':'), default=_json_default)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+class ResponseCache:
+    """
+    Whole-response cache for estimate endpoints.
+
+    An in-memory LRU bounded by entry count, with a TTL, and an optional
+    directory of JSON files that survives restarts. A hit returns the stored
+    result as-is; nothing is recomputed.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 300, disk_path: Optional[str] = None,
+                 max_disk_entries: int = 4096, enabled: bool = True):
+        """
+        Args:
+            max_entries: Results kept in memory
+            ttl_seconds: Age after which a result is no longer served
+            disk_path: Directory for the on-disk tier, None to keep results in memory only
+            max_disk_entries: Files kept in disk_path before the oldest are removed
+            enabled: Set False to make every lookup a miss and store nothing
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.disk_path = disk_path
+        self.max_disk_entries = max_disk_entries
+        self.enabled = enabled
+
+        self._entries: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_writes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if self.disk_path:
+            os.makedirs(self.disk_path, exist_ok=True)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'ResponseCache':
+        """Build from the api.response_cache section of settings.json"""
+        settings = config.get('api', {}).get('response_cache', {})
+        return cls(
+            max_entries=settings.get('max_entries', 256),
+            ttl_seconds=settings.get('ttl_seconds', 300),
+            disk_path=settings.get('disk_path'),
+            max_disk_entries=settings.get('max_disk_entries', 4096),
+            enabled=settings.get('enabled', True)
+        )
+
+    def key(self, kind: str, project_data: Dict[str, Any], version: str) -> str:
+        return project_cache_key(kind, project_data, version)
+
+    def get_memory(self, key: str) -> Optional[Dict[str, Any]]:
+        """Result from the in-memory tier, None on a miss (never touches disk)"""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, result = entry
+            if time.time() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Result from memory, then disk; a disk hit is promoted to memory"""
+        result = self.get_memory(key)
+        if result is not None or not self.enabled:
+            return result
+
+        if self.disk_path:
+            stored = self._read_disk(key)
+            if stored is not None:
+                self._remember(key, stored['result'], stored['stored_at'])
+                with self._lock:
+                    self.disk_hits += 1
+                return stored['result']
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, result: Dict[str, Any]):
+        """Store a result in memory and, if configured, on disk"""
+        if not self.enabled:
+            return
+
+        stored_at = time.time()
+        self._remember(key, result, stored_at)
+        if self.disk_path:
+            self._write_disk(key, result, stored_at)
+
+    def _remember(self, key, result, stored_at):
+        with self._lock:
+            self._entries[key] = (stored_at, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _file_for(self, key: str) -> str:
+        return os.path.join(self.disk_path, f"{key}.json")
+
+    def _read_disk(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._file_for(key)
+        try:
+            with open(path, 'r') as file:
+                stored = json.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable response cache file {path}: {str(e)}")
+            return None
+
+        if time.time() - stored.get('stored_at', 0) > self.ttl_seconds:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        return stored
+
+    def _write_disk(self, key, result, stored_at):
+        path = self._file_for(key)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, 'w') as file:
+                json.dump({'stored_at': stored_at, 'result': result}, file, default=_json_default)
+            os.replace(temp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not write response cache file {path}: {str(e)}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return
+
+        with self._lock:
+            self._disk_writes += 1
+            prune = self._disk_writes % 64 == 0
+        if prune:
+            self._prune_disk()
+
+    def _prune_disk(self):
+        """Remove the oldest files once the directory holds more than max_disk_entries"""
+        try:
+            files = [entry for entry in os.scandir(self.disk_path) if entry.name.endswith('.json')]
+        except OSError:
+            return
+        if len(files) <= self.max_disk_entries:
+            return
+
+        files.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in files[:len(files) - self.max_disk_entries]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+    def clear(self):
+        """Drop every cached result, in memory and on disk"""
+        with self._lock:
+            self._entries.clear()
+        if self.disk_path and os.path.isdir(self.disk_path):
+            for entry in os.scandir(self.disk_path):
+                if entry.name.endswith('.json'):
+                    os.remove(entry.path)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                'enabled': self.enabled,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl_seconds,
+                'disk_path': self.disk_path,
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': round((self.hits + self.disk_hits) / lookups, 4) if lookups else 0.0
+            }
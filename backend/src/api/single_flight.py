@@ -0,0 +1,53 @@
+# src/api/single_flight.py
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent async computations.
+
+    The first caller for a key starts the computation; callers that arrive
+    with the same key while it is running await that same computation and
+    get its result (or its exception). The computation is shielded, so a
+    caller that disconnects does not cancel it for the others.
+
+    Used from the event loop only, so no locking is needed.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def run(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """Run compute() for key, or join the run already in progress"""
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            logger.debug(f"Joining in-flight computation {key[:12]}")
+            return await asyncio.shield(task)
+
+        task = asyncio.ensure_future(compute())
+        self._in_flight[key] = task
+        self.leaders += 1
+        task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Future):
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Mark the exception retrieved in case every caller went away
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        """Leader and coalesced request counts"""
+        return {
+            'in_flight': len(self._in_flight),
+            'leaders': self.leaders,
+            'coalesced': self.coalesced
+        }
@@ -0,0 +1,87 @@
+# src/core/baseline_cache.py
+
+import copy
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 64
+
+class BaselineCache:
+    """
+    LRU memo of the whole-house categories of detailed estimates.
+
+    A detailed estimate prices foundation, roofing, HVAC and the other non-room
+    categories from the house-level project fields alone, so repeated detailed
+    calls for the same house (e.g. while rooms are being edited) can share them.
+    Keys are the canonical JSON of those fields; results are deep-copied in and
+    out. Lives on the engine snapshot, so a catalog or mapping reload starts empty.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, enabled: bool = True):
+        self.max_entries = max_entries
+        self.enabled = enabled
+
+        self._entries: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'BaselineCache':
+        """Build from the estimation.baseline_cache section of settings.json"""
+        settings = config.get('estimation', {}).get('baseline_cache', {})
+        return cls(
+            max_entries=settings.get('max_entries', DEFAULT_MAX_ENTRIES),
+            enabled=settings.get('enabled', True)
+        )
+
+    @staticmethod
+    def key(project_data: Dict[str, Any]) -> str:
+        """Canonical key of the house-level project fields"""
+        return json.dumps(project_data, sort_keys=True, separators=(',', ':'), default=str)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Copy of the stored baseline, None on a miss"""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return copy.deepcopy(entry)
+
+    def put(self, key: str, baseline: Dict[str, Any]):
+        if not self.enabled:
+            return
+
+        entry = copy.deepcopy(baseline)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self):
+        """Drop every stored baseline"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size"""
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses
+            }
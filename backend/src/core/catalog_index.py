@@ -0,0 +1,68 @@
+# src/core/catalog_index.py
+
+import logging
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, Tuple
+
+logger = logging.getLogger(__name__)
+
+class CatalogIndex:
+    """
+    Read-only lookup structure compiled from the cost catalog.
+
+    Maps each catalog ID to its row positions and keeps the columns costing
+    needs as NumPy arrays, so finding an item is a dict lookup instead of a
+    boolean scan over the whole ID column.
+    """
+
+    def __init__(self, catalog: pd.DataFrame):
+        """
+        Args:
+            catalog: Catalog DataFrame as returned by DataLoader.load_catalog
+        """
+        catalog = catalog if catalog is not None else pd.DataFrame()
+        self.size = len(catalog)
+
+        self.cost = self._column(catalog, 'Cost(Mid)', 0.0, float)
+        self.markup = self._column(catalog, 'Markup Percentage', 0.0, float)
+        self.unit = self._column(catalog, 'Unit', 'EA', object)
+        self.item = self._column(catalog, 'Item', '', object)
+        self.category = self._column(catalog, 'Category', '', object)
+
+        # ID -> row positions in catalog order; rows without an ID are never matched
+        positions: Dict[str, list] = {}
+        if 'ID' in catalog.columns:
+            for position, item_id in enumerate(catalog['ID'].tolist()):
+                if isinstance(item_id, str):
+                    positions.setdefault(item_id, []).append(position)
+        self._positions = {item_id: tuple(rows) for item_id, rows in positions.items()}
+
+        logger.info(f"Indexed {len(self._positions)} catalog IDs over {self.size} rows")
+
+    @staticmethod
+    def _column(catalog: pd.DataFrame, name: str, default, dtype) -> np.ndarray:
+        """Copy a catalog column into an array, or fill with the default if it is absent"""
+        if name in catalog.columns:
+            return catalog[name].to_numpy(dtype=dtype)
+        return np.full(len(catalog), default, dtype=dtype)
+
+    def __contains__(self, item_id) -> bool:
+        return item_id in self._positions
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def lookup(self, item_id) -> Tuple[int, ...]:
+        """Row positions for a catalog ID, empty if the ID is unknown"""
+        return self._positions.get(item_id, ())
+
+    def record(self, position: int) -> Dict[str, Any]:
+        """The catalog fields costing needs for one row"""
+        return {
+            'item_name': self.item[position],
+            'category': self.category[position],
+            'unit': self.unit[position],
+            'unit_cost': self.cost[position].item(),
+            'markup': self.markup[position].item()
+        }
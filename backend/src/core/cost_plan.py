@@ -0,0 +1,190 @@
+# src/core/cost_plan.py
+
+import logging
+import numpy as np
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+from src.core.catalog_index import CatalogIndex
+
+logger = logging.getLogger(__name__)
+
+# Conversion factors between quantity units and catalog units
+UNIT_CONVERSIONS = {
+    # Area conversions
+    ('SF', 'SY'): 1/9,   # Square feet to square yards
+    ('SY', 'SF'): 9,     # Square yards to square feet
+    ('SF', 'SQFT'): 1,   # Common unit aliases
+    ('SQFT', 'SF'): 1,
+
+    # Length conversions
+    ('LF', 'FT'): 1,     # Linear feet to feet (same)
+    ('FT', 'LF'): 1,
+
+    # Volume conversions
+    ('CY', 'CF'): 27,    # Cubic yards to cubic feet
+    ('CF', 'CY'): 1/27,
+
+    # Count/quantity conversions
+    ('EA', 'EACH'): 1,   # Each (same)
+    ('EACH', 'EA'): 1,
+
+    # Liquid measure
+    ('GAL', 'GALLON'): 1,
+    ('GALLON', 'GAL'): 1
+}
+
+def guess_quantity_unit(quantity_name: str) -> str:
+    """Guess the most likely unit for a quantity based on its name"""
+    name = quantity_name.lower()
+
+    if any(term in name for term in ['_sf', 'square_feet', 'area', 'sqft']):
+        return 'SF'
+    elif any(term in name for term in ['_lf', 'linear_feet', 'length']):
+        return 'LF'
+    elif any(term in name for term in ['_cy', 'cubic_yards', 'concrete']):
+        return 'CY'
+    elif any(term in name for term in ['_ea', 'count', 'quantity']):
+        return 'EA'
+    elif any(term in name for term in ['gallons', '_gal']):
+        return 'GAL'
+
+    # Default to 'EA' if no match
+    return 'EA'
+
+def get_unit_conversion_factor(from_unit: str, to_unit: str) -> Union[float, None]:
+    """Get conversion factor between units, or None if incompatible"""
+    # If units are the same, no conversion needed
+    if from_unit == to_unit:
+        return 1.0
+
+    return UNIT_CONVERSIONS.get((from_unit.upper(), to_unit.upper()))
+
+class CategoryCostPlan:
+    """
+    Resolved catalog rows for every ID-mapped quantity of one category.
+
+    Rows for all quantities are stored back to back; `slices` gives each
+    quantity's [start, stop) range into the row arrays.
+    """
+
+    def __init__(self, category: str):
+        self.category = category
+        self.slices: Dict[str, Tuple[int, int]] = {}
+        self.quantity_units: Dict[str, str] = {}
+        self.item_ids: List[str] = []
+        self.positions = np.empty(0, dtype=np.int64)
+        self.catalog_units = np.empty(0, dtype=object)
+        self.factors = np.empty(0, dtype=float)
+        # Whole-number factors (e.g. EA -> EACH) keep integer quantities integral
+        self.integral_factors = np.empty(0, dtype=bool)
+
+    def __contains__(self, quantity_name) -> bool:
+        return quantity_name in self.slices
+
+class CostPlan:
+    """
+    Catalog costing compiled once per catalog + mapping snapshot.
+
+    For each category and ID-mapped quantity the plan stores the catalog rows
+    the IDs resolve to, their units and the conversion factor from the
+    quantity's default unit, so costing is a gather-multiply over arrays.
+    IDs that do not resolve are reported once here instead of on every estimate.
+    """
+
+    def __init__(self, mappings: Dict[str, Any], catalog_index: CatalogIndex):
+        """
+        Args:
+            mappings: Parsed catalog mappings (category_mappings -> item_mappings)
+            catalog_index: Compiled index of the cost catalog
+        """
+        self.catalog_index = catalog_index
+        self.categories: Dict[str, CategoryCostPlan] = {}
+        self.unresolved: Dict[str, Dict[str, List[str]]] = {}
+
+        for category, category_mapping in mappings.get('category_mappings', {}).items():
+            self.categories[category] = self._compile_category(category, category_mapping.get('item_mappings', {}))
+
+        unresolved_count = sum(len(quantities) for quantities in self.unresolved.values())
+        for category, quantities in self.unresolved.items():
+            logger.warning(f"Cost plan: {len(quantities)} '{category}' quantities have no catalog items for their IDs: "
+                           f"{', '.join(f'{name} {ids}' for name, ids in quantities.items())}")
+        logger.info(f"Compiled cost plan for {len(self.categories)} categories ({unresolved_count} unresolved quantities)")
+
+    def _compile_category(self, category: str, item_mappings: Dict[str, Any]) -> CategoryCostPlan:
+        plan = CategoryCostPlan(category)
+        positions, catalog_units, factors = [], [], []
+
+        for quantity_name, mapping in item_mappings.items():
+            item_ids = mapping.get('item_ids') or []
+            if not item_ids:
+                continue
+
+            quantity_unit = guess_quantity_unit(quantity_name)
+            start = len(positions)
+            for item_id in item_ids:
+                for position in self.catalog_index.lookup(item_id):
+                    catalog_unit = self.catalog_index.unit[position]
+                    plan.item_ids.append(item_id)
+                    positions.append(position)
+                    catalog_units.append(catalog_unit)
+                    factors.append(get_unit_conversion_factor(quantity_unit, catalog_unit) or 1.0)
+
+            plan.slices[quantity_name] = (start, len(positions))
+            plan.quantity_units[quantity_name] = quantity_unit
+            if start == len(positions):
+                self.unresolved.setdefault(category, {})[quantity_name] = list(item_ids)
+
+        plan.positions = np.array(positions, dtype=np.int64)
+        plan.catalog_units = np.array(catalog_units, dtype=object)
+        plan.factors = np.array(factors, dtype=float)
+        plan.integral_factors = np.array([isinstance(factor, int) for factor in factors], dtype=bool)
+        return plan
+
+    def get(self, category: str) -> Optional[CategoryCostPlan]:
+        """Compiled plan for a category, None if the category has no mappings"""
+        return self.categories.get(category)
+
+    def cost_rows(self, plan: CategoryCostPlan, selections: List[Tuple[str, Any, Optional[str]]]) -> Dict[str, list]:
+        """
+        Cost the catalog rows for a set of quantities in one gather-multiply
+
+        Args:
+            plan: Category plan from get()
+            selections: (quantity_name, quantity_value, quantity_unit) in output order;
+                quantity_unit overrides the plan's default unit when the estimator supplied one
+
+        Returns:
+            Lists aligned row-for-row over the selected quantities' catalog rows:
+            rows (plan row numbers), quantity (converted), unit_cost, total_cost
+        """
+        rows, values, factors, integral = [], [], [], []
+        for quantity_name, quantity_value, quantity_unit in selections:
+            start, stop = plan.slices[quantity_name]
+            rows.extend(range(start, stop))
+            values.extend([quantity_value] * (stop - start))
+            if quantity_unit is None or quantity_unit == plan.quantity_units[quantity_name]:
+                factors.extend(plan.factors[start:stop].tolist())
+                integral.extend(plan.integral_factors[start:stop].tolist())
+            else:
+                for catalog_unit in plan.catalog_units[start:stop]:
+                    factor = get_unit_conversion_factor(quantity_unit, catalog_unit) or 1.0
+                    factors.append(factor)
+                    integral.append(isinstance(factor, int))
+
+        positions = plan.positions[np.array(rows, dtype=np.int64)]
+        quantity = np.asarray(values, dtype=float) * np.asarray(factors, dtype=float)
+        unit_cost = self.catalog_index.cost[positions]
+        total_cost = unit_cost * quantity
+
+        # Match plain Python arithmetic: int quantity * int factor stays an int
+        quantity_values = [
+            int(converted) if whole and isinstance(value, int) else converted
+            for converted, value, whole in zip(quantity.tolist(), values, integral)
+        ]
+
+        return {
+            'rows': rows,
+            'quantity': quantity_values,
+            'unit_cost': unit_cost.tolist(),
+            'total_cost': total_cost.tolist()
+        }
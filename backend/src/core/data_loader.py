@@ -4,6 +4,9 @@ import pandas as pd
 import logging
 from typing import Dict, Any, List, Union
 
+from src.utils.catalog_cache import load_cached_frame, strip_catalog_junk
+from src.utils.search_index import SearchIndex
+
 logger = logging.getLogger(__name__)
 
 class DataLoader:
@@ -11,9 +14,15 @@ class DataLoader:
     
     def __init__(self, config_path: str = 'config/settings.json'):
         """Initialize with path to configuration file"""
+        self.config_path = config_path
         self.config = self._load_json(config_path)
-        self.mappings = self._load_json(os.path.join('config', 'catalog_mappings_03.19.25.json'))
+        self.mappings_path = self.config.get('data', {}).get(
+            'mappings_path', os.path.join('config', 'catalog_mappings_03.19.25.json')
+        )
+        self.mappings = self._load_json(self.mappings_path)
         self.catalog = None
+        self.catalog_path = None
+        self.search_index = None
     
     def _load_json(self, path: str) -> Dict[str, Any]:
         """Load and parse a JSON file"""
@@ -28,40 +37,16 @@ class DataLoader:
             return {}
     
     def load_catalog(self, path: str = None) -> pd.DataFrame:
-        """Load the cost catalog CSV file with proper data typing and validation"""
+        """Load the cost catalog, from its Parquet cache when the CSV is unchanged"""
         catalog_path = path or self.config.get('data', {}).get('catalog_path', 'data/catalog_enhanced.csv')
+        self.catalog_path = catalog_path
+        use_cache = self.config.get('data', {}).get('catalog_cache', True)
         
         try:
-            # Define column types for better data handling
-            dtype_map = {
-                'Item': str,
-                'Cost (Low)': str,  # Will convert these to float after handling currency symbols
-                'Cost (High)': str,
-                'Cost(Mid)': str,
-                'Unit': str,
-                'Qty': float,
-                'Markup Percentage': float,
-                'Cost Code': float,
-                'Category': str,
-                'ID': str
-            }
-            
-            # Load catalog with specified dtypes
-            self.catalog = pd.read_csv(catalog_path, dtype=dtype_map)
-            
-            # Clean and convert cost columns
-            for col in ['Cost (Low)', 'Cost (High)', 'Cost(Mid)']:
-                if col in self.catalog.columns:
-                    # Remove currency symbols and convert to float
-                    self.catalog[col] = self.catalog[col].str.replace('[\$,]', '', regex=True).astype(float)
-            
-            # Fill missing values
-            self.catalog['Unit'] = self.catalog['Unit'].fillna('EA')
-            self.catalog['Markup Percentage'] = self.catalog['Markup Percentage'].fillna(0)
-            
-            # Create a standardized 'SearchItem' column for better matching
-            self.catalog['SearchItem'] = self.catalog['Item'].str.lower().str.replace('[^a-z0-9]', ' ', regex=True)
-            
+            self.catalog = load_cached_frame(
+                catalog_path, lambda: self._parse_catalog_csv(catalog_path), 'loader', enabled=use_cache
+            )
+            self.search_index = SearchIndex(self.catalog, fields=('SearchItem', 'Item'), filter_columns=('Category',))
             logger.info(f"Loaded catalog with {len(self.catalog)} items")
             return self.catalog
         except FileNotFoundError:
@@ -71,6 +56,44 @@ class DataLoader:
             logger.error(f"Error loading catalog: {str(e)}")
             return pd.DataFrame()
     
+    def _parse_catalog_csv(self, catalog_path: str) -> pd.DataFrame:
+        """Parse the cost catalog CSV with proper data typing and validation"""
+        # Define column types for better data handling
+        dtype_map = {
+            'Item': str,
+            'Cost (Low)': str,  # Will convert these to float after handling currency symbols
+            'Cost (High)': str,
+            'Cost(Mid)': str,
+            'Unit': str,
+            'Qty': float,
+            'Markup Percentage': float,
+            'Cost Code': float,
+            'Category': str,
+            'ID': str
+        }
+        
+        # Load catalog with specified dtypes
+        # Read in one pass so sparse columns (e.g. EstimatorModule) get one dtype in large files
+        catalog = pd.read_csv(catalog_path, dtype=dtype_map, low_memory=False)
+        
+        # Drop empty trailing columns and section-header rows
+        catalog = strip_catalog_junk(catalog)
+        
+        # Clean and convert cost columns
+        for col in ['Cost (Low)', 'Cost (High)', 'Cost(Mid)']:
+            if col in catalog.columns:
+                # Remove currency symbols and convert to float
+                catalog[col] = catalog[col].str.replace(r'[\$,]', '', regex=True).astype(float)
+        
+        # Fill missing values
+        catalog['Unit'] = catalog['Unit'].fillna('EA')
+        catalog['Markup Percentage'] = catalog['Markup Percentage'].fillna(0)
+        
+        # Create a standardized 'SearchItem' column for better matching
+        catalog['SearchItem'] = catalog['Item'].str.lower().str.replace('[^a-z0-9]', ' ', regex=True)
+        
+        return catalog
+    
     def match_quantity_to_catalog_items(self, category: str, quantity_name: str, quantity_value: Union[int, float]) -> pd.DataFrame:
         """Match a specific quantity to catalog items using enhanced matching logic"""
         if self.catalog is None:
@@ -79,10 +102,10 @@ class DataLoader:
         if self.catalog.empty:
             return pd.DataFrame()
         
-        # Get category items
-        category_items = self.get_category_items(category)
+        # Get category rows
+        category_rows = self._get_category_rows(category)
         
-        if category_items.empty:
+        if len(category_rows) == 0:
             return pd.DataFrame()
         
         # Get mapping information for this category
@@ -97,25 +120,29 @@ class DataLoader:
             mapped_item_ids = item_mappings[quantity_name].get('item_ids', [])
             if mapped_item_ids:
                 # Return items that match any of the IDs in the list
+                category_items = self.catalog.iloc[category_rows]
                 return category_items[category_items['ID'].isin(mapped_item_ids)]
             
             # If we have search terms, use those as fallback
             search_terms = item_mappings[quantity_name].get('search_terms', [])
             if search_terms:
-                # Create a regex pattern from all search terms
+                # Match any of the search terms through the token index
                 pattern = '|'.join(search_terms)
-                return category_items[category_items['SearchItem'].str.contains(pattern, regex=True, na=False)]
+                return self.catalog.iloc[self.search_index.match_pattern('SearchItem', pattern, rows=category_rows)]
         
         # Fall back to existing matching logic for quantities without mappings
         # First, standardize the quantity name for searching
         search_quantity = quantity_name.lower().replace('_', ' ')
         
         # Look for items containing the search term
-        matching_items = category_items[
-            category_items['SearchItem'].str.contains(search_quantity, na=False)
-        ]
+        matching_rows = self.search_index.match_pattern('SearchItem', search_quantity, rows=category_rows)
         
-        return matching_items
+        return self.catalog.iloc[matching_rows]
+
+    def _get_category_rows(self, category: str):
+        """Row positions of catalog items in an estimation category's catalog categories"""
+        catalog_categories = self.mappings.get('category_mappings', {}).get(category, {}).get('catalog_categories', [])
+        return self.search_index.filter_any('Category', catalog_categories)
 
     def get_category_items(self, category: str) -> pd.DataFrame:
         """Get catalog items for a specific estimation category"""
@@ -124,12 +151,9 @@ class DataLoader:
                 
         if self.catalog.empty:
             return pd.DataFrame()
-                
-        # Get catalog categories for this estimation category
-        catalog_categories = self.mappings.get('category_mappings', {}).get(category, {}).get('catalog_categories', [])
         
-        # Filter catalog for these categories
-        return self.catalog[self.catalog['Category'].isin(catalog_categories)]
+        # Filter catalog for this category's catalog categories
+        return self.catalog.iloc[self._get_category_rows(category)]
     
     def save_estimation(self, estimation_results: Dict[str, Any], filename: str) -> bool:
         """Save estimation results to a JSON file"""
@@ -0,0 +1,150 @@
+# src/core/engine_snapshot.py
+
+import hashlib
+import importlib
+import logging
+import os
+from typing import Dict, Any, List, Optional
+
+from src.core.baseline_cache import BaselineCache
+from src.core.catalog_index import CatalogIndex
+from src.core.cost_plan import CostPlan
+from src.core.data_loader import DataLoader
+from src.core.quantity_cache import QuantityCache
+from src.core.service_table import ServiceTable
+from src.utils.catalog_mapper import CatalogMapper
+from src.utils.events import events
+
+logger = logging.getLogger(__name__)
+
+class EngineSnapshot:
+    """
+    Immutable bundle of everything an estimation engine reads but never writes:
+    configuration, category mappings, the cost catalog with its ID index,
+    compiled cost plan and electrical service table, estimator instances and
+    the optional catalog mapper.
+
+    A snapshot is built once (e.g. at API startup) and shared read-only by every
+    engine and every request. Per-estimate state lives in EstimationContext. The
+    only mutable members are the quantity and baseline caches, memos of estimator
+    results that are discarded along with the snapshot when its files change.
+
+    `version` is a content hash of the source files the snapshot was built from,
+    so two snapshots built from identical files share a version.
+    """
+
+    __slots__ = ('config_path', 'data_loader', 'config', 'mappings', 'catalog', 'catalog_index',
+                 'cost_plan', 'service_table', 'estimators', 'quantity_cache', 'baseline_cache', 'catalog_mapper', 'source_paths', 'version')
+
+    def __init__(self, config_path, data_loader, config, mappings, catalog, estimators, catalog_mapper,
+                 source_paths=None, version='unknown', catalog_index=None):
+        object.__setattr__(self, 'config_path', config_path)
+        object.__setattr__(self, 'data_loader', data_loader)
+        object.__setattr__(self, 'config', config)
+        object.__setattr__(self, 'mappings', mappings)
+        object.__setattr__(self, 'catalog', catalog)
+        object.__setattr__(self, 'catalog_index', catalog_index or CatalogIndex(catalog))
+        object.__setattr__(self, 'cost_plan', CostPlan(mappings, self.catalog_index))
+        # Reuse the loader's Item index when it was built over this catalog
+        loader_index = getattr(data_loader, 'search_index', None) if getattr(data_loader, 'catalog', None) is catalog else None
+        object.__setattr__(self, 'service_table', ServiceTable(catalog, loader_index))
+        object.__setattr__(self, 'estimators', estimators)
+        object.__setattr__(self, 'quantity_cache', QuantityCache.from_config(config or {}))
+        object.__setattr__(self, 'baseline_cache', BaselineCache.from_config(config or {}))
+        object.__setattr__(self, 'catalog_mapper', catalog_mapper)
+        object.__setattr__(self, 'source_paths', tuple(source_paths or ()))
+        object.__setattr__(self, 'version', version)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"EngineSnapshot is immutable (tried to set '{name}')")
+
+    @classmethod
+    def load(cls, config_path: str = 'config/settings.json') -> 'EngineSnapshot':
+        """Read config, mappings and catalog from disk and initialize estimators"""
+        data_loader = DataLoader(config_path)
+        config = data_loader.config
+        mappings = data_loader.mappings
+        catalog = data_loader.load_catalog()
+        estimators = initialize_estimators(mappings, config)
+        events.configure_from(config)
+
+        # Initialize catalog mapper if enhanced catalog exists
+        enhanced_catalog_path = config.get('data', {}).get('enhanced_catalog_path')
+        if (enhanced_catalog_path and os.path.exists(enhanced_catalog_path)):
+            catalog_mapper = CatalogMapper(
+                enhanced_catalog_path, use_cache=config.get('data', {}).get('catalog_cache', True)
+            )
+        else:
+            catalog_mapper = None
+
+        source_paths = snapshot_source_paths(data_loader)
+        version = compute_source_version(source_paths)
+
+        logger.info(f"Built engine snapshot {version} from {config_path} ({len(catalog)} catalog items)")
+        return cls(config_path, data_loader, config, mappings, catalog, estimators, catalog_mapper,
+                   source_paths, version)
+
+    @property
+    def catalog_item_count(self) -> int:
+        """Number of rows in the cost catalog"""
+        return len(self.catalog) if self.catalog is not None else 0
+
+def snapshot_source_paths(data_loader: DataLoader) -> List[str]:
+    """List the files a snapshot is built from, in a stable order"""
+    paths = [data_loader.config_path, data_loader.mappings_path, data_loader.catalog_path]
+
+    enhanced_catalog_path = data_loader.config.get('data', {}).get('enhanced_catalog_path')
+    if enhanced_catalog_path:
+        paths.append(enhanced_catalog_path)
+
+    return [path for path in paths if path]
+
+def compute_source_version(paths: List[str]) -> str:
+    """Hash the contents of the given files into a short version string"""
+    digest = hashlib.sha256()
+
+    for path in paths:
+        digest.update(path.encode('utf-8'))
+        try:
+            with open(path, 'rb') as file:
+                for chunk in iter(lambda: file.read(1 << 20), b''):
+                    digest.update(chunk)
+        except OSError:
+            # Missing files still contribute their path so adding one changes the version
+            digest.update(b'<missing>')
+
+    return digest.hexdigest()[:16]
+
+def initialize_estimators(mappings: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Optional[object]]:
+    """Initialize all estimator modules based on mappings with better error handling"""
+    estimators = {}
+
+    for category in mappings.get('category_mappings', {}):
+        try:
+            # Dynamically import the estimator module
+            module_name = f"src.estimators.{category}"
+            logger.info(f"Attempting to load module: {module_name}")
+            try:
+                module = importlib.import_module(module_name)
+                # Get the estimator class (assumed to be named CategoryEstimator)
+                class_name = f"{category.title().replace('_', '')}Estimator"
+                logger.info(f"Attempting to load class: {class_name} from module: {module_name}")
+                estimator_class = getattr(module, class_name)
+                estimator = estimator_class()
+
+                # Pass config to estimator if it accepts it
+                if hasattr(estimator, 'set_config'):
+                    estimator.set_config(config)
+
+                estimators[category] = estimator
+                logger.info(f"Loaded estimator for {category}")
+            except (ImportError, AttributeError) as e:
+                logger.warning(f"Could not load estimator for {category}: {str(e)}")
+                # Add a placeholder that will later be properly implemented
+                estimators[category] = None
+        except Exception as e:
+            logger.error(f"Error initializing estimator for {category}: {str(e)}")
+            estimators[category] = None
+
+    logger.info(f"Initialized estimators: {list(estimators.keys())}")
+    return estimators
@@ -0,0 +1,19 @@
+# src/core/estimation_context.py
+
+from typing import Dict, Any, List
+
+class EstimationContext:
+    """
+    Mutable state for a single estimate.
+
+    The engine and its snapshot are shared between requests, so anything that
+    changes while an estimate runs (the project being estimated, match caches,
+    prefiltered catalog slices) is kept here and thrown away afterwards.
+    """
+
+    def __init__(self, project_data: Dict[str, Any] = None):
+        self.project_data = dict(project_data or {})
+        self.match_cache: Dict[Any, Any] = {}
+        self.electrical_cache: Dict[Any, Any] = {}
+        self.unmatched_electrical: List[str] = []
+        self.prefiltered_catalogs: Dict[str, Any] = {}
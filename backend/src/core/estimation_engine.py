@@ -1,75 +1,82 @@
 # src/core/estimation_engine.py (key fixes)
 
+import copy
+import json
 import logging
-import importlib
-import os
+import math
+import threading
+import weakref
+import numpy as np
 import pandas as pd 
-from typing import Dict, Any, Union, List, Optional
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from typing import Dict, Any, Union, List, Optional, Iterable, Iterator
 from datetime import datetime
-from src.core.data_loader import DataLoader
-from src.utils.catalog_mapper import CatalogMapper
+from src.core.engine_snapshot import EngineSnapshot, initialize_estimators
+from src.core.cost_plan import guess_quantity_unit, get_unit_conversion_factor
+from src.core.estimation_context import EstimationContext
 from src.core.material_manager import MaterialManager
+from src.core.profiler import EstimateProfile, count_lookups, get_profile_counters
+from src.core.worker_engine import in_worker_process, init_worker_engine, run_snapshot_method
+from src.estimators.batch import TIER_NAMES, batch_row, encode_tiers
+from src.utils.events import events
 
 logger = logging.getLogger(__name__)
 
 class EstimationEngine:
     """Core estimation engine that integrates quantities with costs"""
     
-    def __init__(self, config_path='config/settings.json'):
-        """Initialize the estimation engine"""
-        self.data_loader = DataLoader(config_path)
-        self.config = self.data_loader.config
-        self.mappings = self.data_loader.mappings
-        self.catalog = self.data_loader.load_catalog()
-        self.estimators = self._initialize_estimators()
-        self.current_project_data = {}  # Store current project data
-        self._match_cache = {}  # Cache for catalog matches
-        
-        # Add caching for electrical lookups
-        self._electrical_cache = {}
-        self._unmatched_electrical = []
-        self._prefiltered_catalogs = {}
-        
-        # Initialize catalog mapper if enhanced catalog exists
-        enhanced_catalog_path = self.config.get('data', {}).get('enhanced_catalog_path')
-        if (enhanced_catalog_path and os.path.exists(enhanced_catalog_path)):
-            self.catalog_mapper = CatalogMapper(enhanced_catalog_path)
-        else:
-            self.catalog_mapper = None
-    
+    def __init__(self, config_path='config/settings.json', snapshot=None):
+        """
+        Initialize the estimation engine
+
+        Args:
+            config_path: Path to settings.json, used when no snapshot is given
+            snapshot: Optional prebuilt EngineSnapshot to share instead of reloading
+        """
+        self._bind_snapshot(snapshot or EngineSnapshot.load(config_path))
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """Create an engine that shares an already-built snapshot"""
+        return cls(snapshot=snapshot)
+
+    def _bind_snapshot(self, snapshot):
+        """Expose the snapshot's read-only data under the engine's usual attributes"""
+        self.snapshot = snapshot
+        self.data_loader = snapshot.data_loader
+        self.config = snapshot.config
+        self.mappings = snapshot.mappings
+        self.catalog = snapshot.catalog
+        self.catalog_index = snapshot.catalog_index
+        self.cost_plan = snapshot.cost_plan
+        self.service_table = snapshot.service_table
+        self.estimators = snapshot.estimators
+        self.quantity_cache = snapshot.quantity_cache
+        self.baseline_cache = snapshot.baseline_cache
+        
+        # Opt-in fan-out of categories to a thread or process pool ('off' runs them in order)
+        self.category_mode = self._pool_mode(
+            'categories', self.config.get('estimation', {}).get('parallel_categories', {}).get('mode', 'off'))
+        self._category_pool = None
+        self._category_pool_lock = threading.Lock()
+        
+        # Opt-in fan-out of a detailed estimate's rooms, in chunks, to a second pool
+        room_settings = self.config.get('estimation', {}).get('parallel_rooms', {})
+        self.room_mode = self._pool_mode('rooms', room_settings.get('mode', 'off'))
+        self.room_workers = room_settings.get('max_workers', 4)
+        self.room_min_rooms = room_settings.get('min_rooms', 8)
+        self._room_pool = None
+        self._room_pool_lock = threading.Lock()
+        
+        # Optional instrumentation reported under summary.metadata.profile
+        profile_settings = self.config.get('estimation', {}).get('profile', {})
+        self.profiling = profile_settings.get('enabled', False)
+        self.profile_memory = profile_settings.get('track_memory', True)
+        self.catalog_mapper = snapshot.catalog_mapper
+
     def _initialize_estimators(self):
         """Initialize all estimator modules based on mappings with better error handling"""
-        estimators = {}
-        
-        for category in self.mappings.get('category_mappings', {}):
-            try:
-                # Dynamically import the estimator module
-                module_name = f"src.estimators.{category}"
-                logger.info(f"Attempting to load module: {module_name}")
-                try:
-                    module = importlib.import_module(module_name)
-                    # Get the estimator class (assumed to be named CategoryEstimator)
-                    class_name = f"{category.title().replace('_', '')}Estimator"
-                    logger.info(f"Attempting to load class: {class_name} from module: {module_name}")
-                    estimator_class = getattr(module, class_name)
-                    estimator = estimator_class()
-                    
-                    # Pass config to estimator if it accepts it
-                    if hasattr(estimator, 'set_config'):
-                        estimator.set_config(self.config)
-                        
-                    estimators[category] = estimator
-                    logger.info(f"Loaded estimator for {category}")
-                except (ImportError, AttributeError) as e:
-                    logger.warning(f"Could not load estimator for {category}: {str(e)}")
-                    # Add a placeholder that will later be properly implemented
-                    estimators[category] = None
-            except Exception as e:
-                logger.error(f"Error initializing estimator for {category}: {str(e)}")
-                estimators[category] = None
-        
-        logger.info(f"Initialized estimators: {list(estimators.keys())}")
-        return estimators
+        return initialize_estimators(self.mappings, self.config)
     
     def validate_project_data(self, project_data):
         """Validate project data to ensure required fields are present and valid"""
@@ -142,16 +149,18 @@ class EstimationEngine:
         
         return validation_results
     
-    def estimate_project(self, project_data):
-        """Run estimation for all categories based on project data with improved error handling"""
-        # Store the current project data for reference in other methods
-        self.current_project_data = project_data.copy()
-        
-        # Clear caches before new estimation
-        self._electrical_cache = {}
-        self._unmatched_electrical = []
-        self._prefiltered_catalogs = {}
-        self._match_cache = {}
+    def estimate_project(self, project_data, profile=None):
+        """
+        Run estimation for all categories based on project data with improved error handling
+
+        Args:
+            project_data: Project data dict
+            profile: Record a per-category profile; None follows estimation.profile.enabled
+        """
+        # Per-estimate state lives in a context so the engine itself can be shared.
+        # Work on the context's copy so the caller's dict is never modified.
+        context = EstimationContext(project_data)
+        project_data = context.project_data
         
         # Validate project data
         validation_results = self.validate_project_data(project_data)
@@ -170,7 +179,7 @@ class EstimationEngine:
                 'warnings': validation_results.get('warnings', []),
                 'metadata': {
                     'estimation_date': datetime.now().isoformat(),
-                    'catalog_version': getattr(self.catalog, 'version', 'unknown'),
+                    'catalog_version': self.snapshot.version,
                     'catalog_item_count': len(self.catalog) if self.catalog is not None else 0
                 }
             }
@@ -182,74 +191,18 @@ class EstimationEngine:
             project_data['tier'] = self._determine_tier(square_footage)
             results['project']['tier'] = project_data['tier']
         
-        # Run estimation for each category
-        total_cost = 0
-        category_costs = {}
+        estimate_profile = EstimateProfile(self.profile_memory) if self._profiling(profile) else None
         
-        for category, estimator in self.estimators.items():
-            logger.info(f"Estimating category: {category}")
-            print(f"Estimating category: {category}")
-            if estimator is None:
-                results['categories'][category] = {
-                    'status': 'not_implemented',
-                    'message': f"Estimator for {category} is not yet implemented"
-                }
-                results['summary']['warnings'].append(f"Category '{category}' has no estimator implementation")
-                continue
-                
-            try:
-                # Calculate quantities
-                quantities = estimator.calculate_quantities(
-                    square_footage=project_data.get('square_footage', 0),
-                    tier=project_data.get('tier', 'Premium'),
-                    **{k: v for k, v in project_data.items() if k not in ['square_footage', 'tier']}  # Pass remaining project data as kwargs
-                )
-                logger.info(f"Calculated quantities for {category}: {quantities}")
-                print(f"Calculated quantities for {category}: {quantities}")
-                
-                # Match with catalog costs if quantities were calculated
-                if quantities:
-                    costed_items = self._apply_costs(category, quantities)
-                    logger.info(f"Costed items for {category}: {costed_items}")
-                    print(f"Costed items for {category}: {costed_items}")
-                    
-                    # Check for missing matches
-                    quantity_keys = set(quantities.keys())
-                    matched_quantities = set(item['original_quantity_name'] for item in costed_items if 'original_quantity_name' in item)
-                    unmatched_quantities = quantity_keys - matched_quantities
-                    
-                    # Filter out known non-quantity keys like 'units'
-                    unmatched_quantities = [q for q in unmatched_quantities if q != 'units']
-                    
-                    if unmatched_quantities:
-                        warning_msg = f"Category '{category}' has {len(unmatched_quantities)} unmatched quantities: {', '.join(unmatched_quantities)}"
-                        results['summary']['warnings'].append(warning_msg)
-                    
-                    # Calculate totals
-                    category_cost = sum(item.get('total_cost', 0) for item in costed_items)
-                    total_cost += category_cost
-                    category_costs[category] = category_cost
-                    
-                    results['categories'][category] = {
-                        'status': 'success',
-                        'quantities': quantities,
-                        'costed_items': costed_items,
-                        'total_cost': category_cost,
-                        'unmatched_quantities': list(unmatched_quantities)
-                    }
-                else:
-                    results['categories'][category] = {
-                        'status': 'no_quantities',
-                        'message': f"No quantities calculated for {category}"
-                    }
-                    results['summary']['warnings'].append(f"Category '{category}' produced no quantities")
-            except Exception as e:
-                logger.error(f"Error estimating {category}: {str(e)}", exc_info=True)
-                results['categories'][category] = {
-                    'status': 'error',
-                    'message': str(e)
-                }
-                results['summary']['warnings'].append(f"Error in category '{category}': {str(e)}")
+        # Run estimation for each category, merging results in mapping order
+        outcomes = self._run_categories(project_data, context, estimate_profile)
+        for category, (category_result, warnings, category_profile) in zip(self.estimators, outcomes):
+            results['categories'][category] = category_result
+            results['summary']['warnings'].extend(warnings)
+            if category_profile is not None:
+                estimate_profile.categories[category] = category_profile
+        
+        if estimate_profile is not None:
+            results['summary']['metadata']['profile'] = estimate_profile.finish('standard', get_profile_counters())
         
         # Add this function to sanitize NaN values
         def sanitize_cost(cost):
@@ -280,11 +233,240 @@ class EstimationEngine:
                 for category, cost in category_costs.items()
             }
         
-        # Clear the match cache after estimation
-        self._match_cache = {}
-        
         return results
 
+    def _profiling(self, profile):
+        """Whether to profile this estimate: the per-call flag, else the configured default"""
+        return self.profiling if profile is None else bool(profile)
+    
+    def _run_categories(self, project_data, context, profile=None, categories=None):
+        """
+        Estimate every category (or just those in categories), sequentially or on the configured category pool
+        
+        Returns:
+            List of (category_result, warnings, category_profile) in self.estimators order,
+            category_profile being None unless profile (an EstimateProfile) is given
+        """
+        selected = {
+            category: estimator for category, estimator in self.estimators.items()
+            if categories is None or category in categories
+        }
+        
+        mode = self.category_mode
+        if mode == 'off' or len(selected) < 2:
+            return [
+                self._estimate_category(category, estimator, project_data, context, profile)
+                for category, estimator in selected.items()
+            ]
+        
+        pool = self._get_category_pool()
+        if mode == 'process':
+            # Worker processes estimate against their own preloaded engine, reloading it
+            # first if it was built from other files than this engine's snapshot
+            futures = [pool.submit(run_snapshot_method, self.snapshot.version, 'estimate_category', category,
+                                   project_data, profile is not None, self.profile_memory)
+                       for category in selected]
+        else:
+            futures = [pool.submit(self._estimate_category, category, estimator, project_data, context, profile)
+                       for category, estimator in selected.items()]
+        
+        outcomes = []
+        for category, future in zip(selected, futures):
+            try:
+                outcomes.append(future.result())
+            except Exception as e:
+                # Only pool failures land here; estimator errors are caught per category
+                logger.error(f"Error estimating {category} on the category pool: {str(e)}", exc_info=True)
+                outcomes.append(({'status': 'error', 'message': str(e)}, [f"Error in category '{category}': {str(e)}"], None))
+        return outcomes
+    
+    @staticmethod
+    def _pool_mode(kind, mode):
+        """
+        The parallel_<kind> mode to run with
+        
+        Unknown modes run sequentially. So does process mode in an engine that is
+        itself a pool worker (e.g. on the API's heavy pool): those workers already
+        use the cores, and each starting a process pool would multiply the processes.
+        """
+        if mode not in ('off', 'thread', 'process'):
+            logger.warning(f"Unknown parallel_{kind} mode '{mode}', running {kind} sequentially")
+            return 'off'
+        if mode == 'process' and in_worker_process():
+            logger.info(f"Running {kind} sequentially: this engine already runs in a worker process")
+            return 'off'
+        return mode
+    
+    def _get_category_pool(self):
+        """Create the category pool on first use (shut down when the engine is collected)"""
+        with self._category_pool_lock:
+            if self._category_pool is None:
+                settings = self.config.get('estimation', {}).get('parallel_categories', {})
+                self._category_pool = self._start_pool(self.category_mode, settings.get('max_workers', 4), 'category')
+            return self._category_pool
+    
+    def _get_room_pool(self):
+        """Create the room pool on first use (shut down when the engine is collected)"""
+        with self._room_pool_lock:
+            if self._room_pool is None:
+                self._room_pool = self._start_pool(self.room_mode, self.room_workers, 'room')
+            return self._room_pool
+    
+    def _start_pool(self, mode, max_workers, kind):
+        """Start a thread or process pool for category or room estimation"""
+        if mode == 'process':
+            pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=init_worker_engine,
+                initargs=(self.snapshot.config_path,)
+            )
+        else:
+            pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f'estimate-{kind}')
+        weakref.finalize(self, pool.shutdown, wait=False)
+        logger.info(f"Started {mode} pool with {max_workers} workers for {kind} estimation")
+        return pool
+    
+    def estimate_category(self, category, project_data, profile=False, track_memory=False):
+        """Estimate one category of a project on its own (used by category worker processes)"""
+        context = EstimationContext(project_data)
+        estimate_profile = EstimateProfile(track_memory) if profile else None
+        try:
+            return self._estimate_category(category, self.estimators.get(category), context.project_data,
+                                           context, estimate_profile)
+        finally:
+            if estimate_profile is not None:
+                estimate_profile.close()
+    
+    def _estimate_category(self, category, estimator, project_data, context, profile=None):
+        """
+        Calculate and cost one category, never raising
+        
+        Returns:
+            (category_result, warnings, category_profile) for results['categories'], the summary
+            warnings and summary.metadata.profile (None when profile is None)
+        """
+        section = profile.section() if profile is not None else None
+        category_result, warnings = self._calculate_category(category, estimator, project_data, context, section)
+        if section is None:
+            return category_result, warnings, None
+        return category_result, warnings, section.finish(status=category_result.get('status'))
+    
+    def _calculate_category(self, category, estimator, project_data, context, section=None):
+        """Body of _estimate_category; laps the section (if any) after each phase"""
+        events.trace('category.start', category=category)
+        if estimator is None:
+            return (
+                {
+                    'status': 'not_implemented',
+                    'message': f"Estimator for {category} is not yet implemented"
+                },
+                [f"Category '{category}' has no estimator implementation"]
+            )
+        
+        try:
+            # Calculate quantities (memoized on the inputs the estimator reads)
+            quantities = self.quantity_cache.calculate_quantities(
+                category, estimator,
+                square_footage=project_data.get('square_footage', 0),
+                tier=project_data.get('tier', 'Premium'),
+                **{k: v for k, v in project_data.items() if k not in ['square_footage', 'tier']}  # Pass remaining project data as kwargs
+            )
+            events.trace('category.quantities', category=category, quantities=quantities)
+            if section is not None:
+                section.lap('quantities')
+            
+            # Match with catalog costs if quantities were calculated
+            if not quantities:
+                return (
+                    {
+                        'status': 'no_quantities',
+                        'message': f"No quantities calculated for {category}"
+                    },
+                    [f"Category '{category}' produced no quantities"]
+                )
+            
+            costed_items = self._apply_costs(category, quantities, context)
+            events.trace('category.costed', category=category, items=len(costed_items), costed_items=costed_items)
+            if section is not None:
+                section.lap('costing')
+            
+            # Check for missing matches
+            quantity_keys = set(quantities.keys())
+            matched_quantities = set(item['original_quantity_name'] for item in costed_items if 'original_quantity_name' in item)
+            unmatched_quantities = quantity_keys - matched_quantities
+            
+            # Filter out known non-quantity keys like 'units'
+            unmatched_quantities = [q for q in unmatched_quantities if q != 'units']
+            
+            warnings = []
+            if unmatched_quantities:
+                warning_msg = f"Category '{category}' has {len(unmatched_quantities)} unmatched quantities: {', '.join(unmatched_quantities)}"
+                warnings.append(warning_msg)
+            
+            # Calculate totals
+            category_cost = sum(item.get('total_cost', 0) for item in costed_items)
+            if section is not None:
+                section.lap('matching')
+            
+            return (
+                {
+                    'status': 'success',
+                    'quantities': quantities,
+                    'costed_items': costed_items,
+                    'total_cost': category_cost,
+                    'unmatched_quantities': list(unmatched_quantities)
+                },
+                warnings
+            )
+        except Exception as e:
+            logger.error(f"Error estimating {category}: {str(e)}", exc_info=True)
+            return (
+                {
+                    'status': 'error',
+                    'message': str(e)
+                },
+                [f"Error in category '{category}': {str(e)}"]
+            )
+
+    def estimate_batch_item(self, index, project_data):
+        """
+        Estimate one project of a batch, never raising
+
+        Returns:
+            {'index', 'status', 'result'} on success or {'index', 'status': 'error', 'message'}
+        """
+        try:
+            result = self.estimate_project(project_data)
+        except Exception as e:
+            logger.error(f"Error estimating batch item {index}: {str(e)}", exc_info=True)
+            return {'index': index, 'status': 'error', 'message': str(e)}
+
+        return {'index': index, 'status': result.get('status', 'success'), 'result': result}
+
+    def estimate_many(self, projects: Iterable[Dict[str, Any]], max_workers: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Estimate many projects in parallel against this engine's snapshot
+
+        Results are yielded as each project finishes, so they arrive out of input
+        order; use the 'index' field to match them up. A failing project produces
+        an error item and does not stop the rest.
+
+        Args:
+            projects: Iterable of project data dicts
+            max_workers: Thread count, defaults to api.batch.max_workers in settings.json
+        """
+        projects = list(projects)
+        if not projects:
+            return
+
+        if max_workers is None:
+            max_workers = self.config.get('api', {}).get('batch', {}).get('max_workers', 4)
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(projects)), thread_name_prefix='estimate-batch') as pool:
+            futures = [pool.submit(self.estimate_batch_item, index, project) for index, project in enumerate(projects)]
+            for future in as_completed(futures):
+                yield future.result()
+
     def _determine_tier(self, square_footage):
         """Determine project tier based on square footage"""
         tiers = self.config.get('estimation', {}).get('tiers', {})
@@ -308,155 +490,152 @@ class EstimationEngine:
         # Try to guess from quantity name
         return self._guess_quantity_unit(quantity_name)
     
-    def _apply_costs(self, category, quantities):
+    def _apply_costs(self, category, quantities, context=None):
         """Apply costs from catalog to calculated quantities with direct lookups only"""
-        if not quantities:
-            logger.warning(f"No quantities provided for category: {category}")
-            return []
-            
-        costed_items = []
+        return self._apply_costs_many(category, [quantities], context)[0]
+    
+    def _apply_costs_many(self, category, quantities_list, context=None):
+        """
+        Apply costs to several quantity dicts of one category in a single costing pass
         
-        # Special handling for electrical service if this is the electrical category
-        if category == "electrical" and "electrical_service_name" in quantities and "main_panel_size" in quantities:
-            electrical_service_name = quantities["electrical_service_name"]
-            main_panel_size = quantities["main_panel_size"]
-            main_panel_quantity = quantities.get("main_panel_quantity", 1)
-            
-            # Find the exact match for this electrical service
-            service_matches = self.catalog[
-                (self.catalog['Item'].str.contains(electrical_service_name, case=False, na=False)) &
-                (self.catalog['Item'].str.contains(str(main_panel_size), case=False, na=False))
-            ]
+        Args:
+            category (str): Category all the quantities belong to
+            quantities_list (list): Quantity dicts, e.g. one per room
+            context (EstimationContext): Per-estimate state for the enclosing project
             
-            if not service_matches.empty:
-                item = service_matches.iloc[0]
-                unit_cost = item.get('Cost(Mid)', 0)
-                total_cost = unit_cost * main_panel_quantity
-                
-                costed_items.append({
-                    'item_id': item.get('ID', ''),
-                    'item_name': item.get('Item', ''),
-                    'category': item.get('Category', ''),
-                    'quantity': main_panel_quantity,  # Use 1 or specified panel quantity, NOT the amp size
-                    'unit': item.get('Unit', 'Each'),
-                    'unit_cost': unit_cost,
-                    'total_cost': total_cost,
-                    'markup': item.get('Markup Percentage', 0),
-                    'note': "Direct match for electrical service",
-                    'original_quantity_name': "electrical_service",
-                    'original_quantity_value': electrical_service_name
-                })
-                logger.info(f"Costed electrical service: {item.get('Item', '')} (quantity: {main_panel_quantity})")
+        Returns:
+            list: One list of costed items per quantity dict, in the same order
+        """
+        # Rows for ID-mapped quantities were resolved once when the snapshot was built
+        plan = self.cost_plan.get(category)
         
         # Define quantities to skip for electrical service
         skip_quantities = ["electrical_service_name", "main_panel_size", "main_panel_quantity"] if category == "electrical" else []
         
-        # Get category mapping
-        category_mapping = self.mappings.get('category_mappings', {}).get(category, {})
-        item_mappings = category_mapping.get('item_mappings', {})
-        
-        # Process each quantity
-        for quantity_name, quantity_value in quantities.items():
-            # Skip non-quantity keys like 'units'
-            if quantity_name == 'units' or not quantity_value or quantity_name in skip_quantities:
+        # Walk every input's quantities in order, queueing planned ones so they are all costed in one pass
+        staged = []
+        selections = []
+        for quantities in quantities_list:
+            if not quantities:
+                logger.warning(f"No quantities provided for category: {category}")
+                staged.append(None)
                 continue
             
-            # Look for direct ID mappings first
-            if quantity_name in item_mappings and item_mappings[quantity_name].get('item_ids'):
-                item_ids = item_mappings[quantity_name].get('item_ids', [])
+            costed_items = []
+            
+            # Special handling for electrical service if this is the electrical category
+            if category == "electrical" and "electrical_service_name" in quantities and "main_panel_size" in quantities:
+                electrical_service_name = quantities["electrical_service_name"]
+                main_panel_size = quantities["main_panel_size"]
+                main_panel_quantity = quantities.get("main_panel_quantity", 1)
+                
+                # Service levels were resolved to catalog items when the snapshot was built
+                item = self.service_table.lookup(main_panel_size, electrical_service_name)
+                count_lookups()
                 
-                # Find items with these IDs
-                for item_id in item_ids:
-                    matching_items = self.catalog[self.catalog['ID'] == item_id]
+                if item is not None:
+                    unit_cost = item.get('Cost(Mid)', 0)
+                    total_cost = unit_cost * main_panel_quantity
                     
-                    if not matching_items.empty:
-                        for _, item in matching_items.iterrows():
-                            # Extract unit if provided
-                            unit = self._extract_quantity_unit(quantities, quantity_name)
-                            
-                            # Calculate conversion factor if needed
-                            catalog_unit = item.get('Unit', 'EA')
-                            conversion_factor = self._get_unit_conversion_factor(unit, catalog_unit) or 1.0
-                            
-                            # Apply conversion factor
-                            adjusted_quantity = quantity_value * conversion_factor
-                            
-                            # Calculate cost
-                            unit_cost = item.get('Cost(Mid)', 0)
-                            total_cost = unit_cost * adjusted_quantity
-                            
-                            # Add to costed items
-                            costed_items.append({
-                                'item_id': item_id,
-                                'item_name': item.get('Item', ''),
-                                'category': item.get('Category', ''),
-                                'quantity': adjusted_quantity,
-                                'unit': catalog_unit,
-                                'unit_cost': unit_cost,
-                                'total_cost': total_cost,
-                                'markup': item.get('Markup Percentage', 0),
-                                'note': "Direct match by ID",
-                                'original_quantity_name': quantity_name,
-                                'original_quantity_value': quantity_value
-                            })
-                            logger.info(f"Costed item by ID: {costed_items[-1]}")
-                        
-                        # We've found and processed matches, continue to next quantity
-                        continue
+                    costed_items.append({
+                        'item_id': item.get('ID', ''),
+                        'item_name': item.get('Item', ''),
+                        'category': item.get('Category', ''),
+                        'quantity': main_panel_quantity,  # Use 1 or specified panel quantity, NOT the amp size
+                        'unit': item.get('Unit', 'Each'),
+                        'unit_cost': unit_cost,
+                        'total_cost': total_cost,
+                        'markup': item.get('Markup Percentage', 0),
+                        'note': "Direct match for electrical service",
+                        'original_quantity_name': "electrical_service",
+                        'original_quantity_value': electrical_service_name
+                    })
+                    events.trace('cost.service', item=lambda: item.get('Item', ''), quantity=main_panel_quantity)
+            
+            quantity_units = quantities.get('units') if isinstance(quantities.get('units'), dict) else {}
+            
+            segments = []
+            for quantity_name, quantity_value in quantities.items():
+                # Skip non-quantity keys like 'units'
+                if quantity_name == 'units' or not quantity_value or quantity_name in skip_quantities:
+                    continue
                 
-                # If we get here, no items with those IDs were found
-                logger.warning(f"No catalog items found with IDs {item_ids} for {quantity_name}")
-            else:
-                # Fallback for items without direct catalog match
-                costed_items.append({
-                    'item_name': quantity_name.replace('_', ' ').title(),
-                    'quantity': quantity_value,
-                    'unit': 'EA',
-                    'unit_cost': 0,
-                    'total_cost': 0,
-                    'note': 'No catalog match found',
-                    'original_quantity_name': quantity_name,
-                    'original_quantity_value': quantity_value
-                })
-                logger.warning(f"No catalog match found for {quantity_name}")
+                if plan is not None and quantity_name in plan:
+                    # IDs that resolve to nothing were reported when the plan was compiled
+                    selections.append((quantity_name, quantity_value, quantity_units.get(quantity_name)))
+                    segments.append(('plan', quantity_name, quantity_value))
+                else:
+                    # Fallback for items without direct catalog match
+                    segments.append(('fallback', {
+                        'item_name': quantity_name.replace('_', ' ').title(),
+                        'quantity': quantity_value,
+                        'unit': 'EA',
+                        'unit_cost': 0,
+                        'total_cost': 0,
+                        'note': 'No catalog match found',
+                        'original_quantity_name': quantity_name,
+                        'original_quantity_value': quantity_value
+                    }))
+                    events.trace('cost.unmatched', category=category, quantity=quantity_name)
+            
+            count_lookups(len(segments))
+            staged.append((costed_items, segments))
         
-        return costed_items
+        costed_rows = self.cost_plan.cost_rows(plan, selections) if selections else None
+        
+        # Costed rows come back in queue order, so one running row index spans all inputs
+        results = []
+        row = 0
+        for entry in staged:
+            if entry is None:
+                results.append([])
+                continue
+            
+            costed_items, segments = entry
+            for segment in segments:
+                if segment[0] == 'fallback':
+                    costed_items.append(segment[1])
+                    continue
+                
+                _, quantity_name, quantity_value = segment
+                start, stop = plan.slices[quantity_name]
+                for plan_row in range(start, stop):
+                    position = plan.positions[plan_row]
+                    costed_items.append({
+                        'item_id': plan.item_ids[plan_row],
+                        'item_name': self.catalog_index.item[position],
+                        'category': self.catalog_index.category[position],
+                        'quantity': costed_rows['quantity'][row],
+                        'unit': plan.catalog_units[plan_row],
+                        'unit_cost': costed_rows['unit_cost'][row],
+                        'total_cost': costed_rows['total_cost'][row],
+                        'markup': self.catalog_index.markup[position].item(),
+                        'note': "Direct match by ID",
+                        'original_quantity_name': quantity_name,
+                        'original_quantity_value': quantity_value
+                    })
+                    if events.tracing:
+                        events.trace('cost.item', category=category, item=costed_items[-1])
+                    row += 1
+            results.append(costed_items)
+        
+        return results
     
-    def _prefilter_electrical_catalog(self):
+    def _prefilter_electrical_catalog(self, context):
         """Pre-filter catalog items for electrical category with error handling"""
         try:
-            if hasattr(self.catalog_mapper, 'catalog') and not self.catalog_mapper.catalog.empty:
-                # Extract all electrical items once
-                electrical_catalog = self.catalog_mapper.catalog[
-                    self.catalog_mapper.catalog['EstimatorModule'] == 'electrical'
-                ]
+            if hasattr(self.catalog_mapper, 'electrical_index') and not self.catalog_mapper.catalog.empty:
+                # Electrical rows are grouped once per snapshot by the mapper's index
+                index = self.catalog_mapper.electrical_index
                 
-                if not electrical_catalog.empty:
-                    self._prefiltered_catalogs['electrical'] = electrical_catalog
+                if len(index.rows) > 0:
+                    context.prefiltered_catalogs['electrical'] = index.frame
                     
                     # Further segment by tier for faster lookups
-                    self._prefiltered_catalogs['electrical_by_tier'] = {
-                        "Premium": electrical_catalog[electrical_catalog['ConstructionTier'] == 'Premium'],
-                        "Luxury": electrical_catalog[electrical_catalog['ConstructionTier'] == 'Luxury'],
-                        "Ultra-Luxury": electrical_catalog[electrical_catalog['ConstructionTier'] == 'Ultra-Luxury']
-                    }
+                    context.prefiltered_catalogs['electrical_by_tier'] = dict(index.tier_frames)
                     
                     # Segment by component type for even faster lookups
-                    component_terms = {
-                        "outlets": ["outlet", "receptacle", "plug", "gfci"],
-                        "switches": ["switch", "dimmer", "control"],
-                        "lights": ["light", "fixture", "lamp", "recessed", "chandelier", "pendant"],
-                        "panels": ["panel", "circuit", "breaker"]
-                    }
-                    
-                    self._prefiltered_catalogs['electrical_by_component'] = {}
-                    
-                    for component, terms in component_terms.items():
-                        component_filter = '|'.join(terms)
-                        component_items = electrical_catalog[
-                            electrical_catalog['SearchItem'].str.contains(component_filter, case=False, na=False)
-                        ]
-                        self._prefiltered_catalogs['electrical_by_component'][component] = component_items
+                    context.prefiltered_catalogs['electrical_by_component'] = dict(index.component_frames)
         except Exception as e:
             logger.warning(f"Error pre-filtering electrical catalog: {str(e)}")
             # Continue without pre-filtering
@@ -477,16 +656,12 @@ class EstimationEngine:
         
         if electrical_service_name and main_panel_size:
             try:
-                # Find matching catalog item for the electrical service
-                matching_items = self.data_loader.catalog[
-                    (self.data_loader.catalog['Item'].str.contains(electrical_service_name, case=False)) & 
-                    (self.data_loader.catalog['Item'].str.contains(str(main_panel_size), case=False))
-                ]
+                # Find the catalog item for the electrical service level
+                item = self.service_table.lookup(main_panel_size, electrical_service_name)
+                count_lookups()
                 
-                # If matching items found, create costed item (only add the first/best match)
-                if not matching_items.empty:
-                    item = matching_items.iloc[0]
-                    
+                # If a matching item was found, create costed item
+                if item is not None:
                     # Calculate cost details
                     costed_item = {
                         'item_id': item.get('ID', ''),
@@ -503,7 +678,7 @@ class EstimationEngine:
                     }
                     
                     costed_items.append(costed_item)
-                    logger.info(f"Costed electrical service: {item.get('Item', '')} (quantity: {main_panel_quantity})")
+                    events.trace('cost.service', item=lambda: item.get('Item', ''), quantity=main_panel_quantity)
             except Exception as e:
                 logger.warning(f"Error matching electrical service: {str(e)}")
         
@@ -526,12 +701,11 @@ class EstimationEngine:
             
             try:
                 # Find matching catalog items for the quantity
-                matching_items = self.data_loader.catalog[
-                    self.data_loader.catalog['Item'].str.contains(
-                        quantity_name.replace('_', ' '), 
-                        case=False
-                    )
-                ]
+                matching_rows = self.data_loader.search_index.match_pattern(
+                    'Item', quantity_name.replace('_', ' '), case=False
+                )
+                count_lookups()
+                matching_items = self.data_loader.catalog.iloc[matching_rows]
                 
                 if not matching_items.empty:
                     item = matching_items.iloc[0]
@@ -578,60 +752,11 @@ class EstimationEngine:
     
     def _guess_quantity_unit(self, quantity_name: str) -> str:
         """Guess the most likely unit for a quantity based on its name"""
-        name = quantity_name.lower()
-        
-        if any(term in name for term in ['_sf', 'square_feet', 'area', 'sqft']):
-            return 'SF'
-        elif any(term in name for term in ['_lf', 'linear_feet', 'length']):
-            return 'LF'
-        elif any(term in name for term in ['_cy', 'cubic_yards', 'concrete']):
-            return 'CY'
-        elif any(term in name for term in ['_ea', 'count', 'quantity']):
-            return 'EA'
-        elif any(term in name for term in ['gallons', '_gal']):
-            return 'GAL'
-        
-        # Default to 'EA' if no match
-        return 'EA'
+        return guess_quantity_unit(quantity_name)
 
     def _get_unit_conversion_factor(self, from_unit: str, to_unit: str) -> Union[float, None]:
         """Get conversion factor between units, or None if incompatible"""
-        # If units are the same, no conversion needed
-        if from_unit == to_unit:
-            return 1.0
-        
-        # Define common conversions
-        conversions = {
-            # Area conversions
-            ('SF', 'SY'): 1/9,   # Square feet to square yards
-            ('SY', 'SF'): 9,     # Square yards to square feet
-            ('SF', 'SQFT'): 1,   # Common unit aliases
-            ('SQFT', 'SF'): 1,
-            
-            # Length conversions
-            ('LF', 'FT'): 1,     # Linear feet to feet (same)
-            ('FT', 'LF'): 1,
-            
-            # Volume conversions
-            ('CY', 'CF'): 27,    # Cubic yards to cubic feet
-            ('CF', 'CY'): 1/27,
-            
-            # Count/quantity conversions
-            ('EA', 'EACH'): 1,   # Each (same)
-            ('EACH', 'EA'): 1,
-            
-            # Liquid measure
-            ('GAL', 'GALLON'): 1,
-            ('GALLON', 'GAL'): 1
-        }
-        
-        # Check if conversion exists
-        key = (from_unit.upper(), to_unit.upper())
-        if key in conversions:
-            return conversions[key]
-        
-        # No valid conversion found
-        return None
+        return get_unit_conversion_factor(from_unit, to_unit)
     
     def get_benchmark_data(self, tier=None):
         """Get benchmark cost data for comparison."""
@@ -755,32 +880,28 @@ class EstimationEngine:
 class EnhancedEstimationEngine(EstimationEngine):
     """Extended estimation engine that supports room-level and trade-level customization"""
     
-    def __init__(self, config_path='config/settings.json'):
+    def __init__(self, config_path='config/settings.json', snapshot=None):
         """Initialize the enhanced estimation engine"""
-        super().__init__(config_path)
+        super().__init__(config_path, snapshot)
         self.room_registry = {}  # Store room estimator references
         
-    def estimate_detailed_project(self, enhanced_project_data):
+    def estimate_detailed_project(self, enhanced_project_data, profile=None):
         """
         Run estimation for a project with room-level and trade-level customization
         
         Args:
             enhanced_project_data (dict): Project data with rooms and trade-specific configurations
+            profile (bool): Record per-category and per-room profiles; None follows estimation.profile.enabled
             
         Returns:
             dict: Estimation results with detailed breakdown
         """
-        # Initialize logger
-        logger.info(f"Starting detailed estimation for project: {enhanced_project_data.get('project_name', 'Unnamed')}")
-        
-        # Store the current project data for reference
-        self.current_project_data = enhanced_project_data.copy()
+        # Announce the estimate (formatted only if src.events logs at INFO)
+        events.emit('detailed.start', project_name=enhanced_project_data.get('project_name', 'Unnamed'),
+                    rooms=len(enhanced_project_data.get('rooms') or {}))
         
-        # Clear caches before new estimation
-        self._electrical_cache = {}
-        self._unmatched_electrical = []
-        self._prefiltered_catalogs = {}
-        self._match_cache = {}
+        # Per-estimate state lives in a context so the engine itself can be shared
+        context = EstimationContext(enhanced_project_data)
         
         # Extract basic project info
         square_footage = enhanced_project_data.get('square_footage', 0)
@@ -797,15 +918,14 @@ class EnhancedEstimationEngine(EstimationEngine):
                 'warnings': [],
                 'metadata': {
                     'estimation_date': datetime.now().isoformat(),
-                    'catalog_version': getattr(self.catalog, 'version', 'unknown'),
+                    'catalog_version': self.snapshot.version,
                     'catalog_item_count': len(self.catalog) if self.catalog is not None else 0
                 }
             },
             'total_cost': 0
         }
         
-        # Process global estimation first (for baseline)
-        logger.info("Calculating global estimation baseline")
+        # House-level fields for the whole-house categories
         basic_project_data = {
             'square_footage': square_footage,
             'tier': global_tier
@@ -816,13 +936,10 @@ class EnhancedEstimationEngine(EstimationEngine):
             if key not in ['rooms', 'trades', 'global_tier', 'project_name', 'construction_type']:
                 basic_project_data[key] = value
         
-        global_estimate = self.estimate_project(basic_project_data)
+        estimate_profile = EstimateProfile(self.profile_memory) if self._profiling(profile) else None
         
-        # Extract global category costs for reference
-        global_category_costs = {}
-        for category, data in global_estimate.get('categories', {}).items():
-            if data.get('status') == 'success':
-                global_category_costs[category] = data.get('total_cost', 0)
+        # Whole-house categories are priced once for the house, room categories only per room
+        baseline = self._estimate_baseline(basic_project_data, estimate_profile)
         
         # Process room-specific estimations
         rooms_data = enhanced_project_data.get('rooms', {})
@@ -832,16 +949,21 @@ class EnhancedEstimationEngine(EstimationEngine):
         category_costs = {}
         room_costs = {}
         
-        # Process each room
-        for room_id, room in rooms_data.items():
-            logger.info(f"Processing room: {room.get('name')}")
-            room_estimate = self._estimate_room(
-                room, 
-                global_tier, 
-                trades_data, 
-                global_category_costs
+        # Process all rooms, batched by category
+        try:
+            room_estimates = self._run_rooms(
+                rooms_data,
+                global_tier,
+                trades_data,
+                context,
+                estimate_profile
             )
-            
+        except BaseException:
+            if estimate_profile is not None:
+                estimate_profile.close()
+            raise
+        
+        for room_id, room_estimate in room_estimates.items():
             results['rooms'][room_id] = room_estimate
             room_costs[room_id] = room_estimate.get('total_cost', 0)
             total_cost += room_estimate.get('total_cost', 0)
@@ -856,10 +978,10 @@ class EnhancedEstimationEngine(EstimationEngine):
         # Process non-room categories (those that aren't associated with specific rooms)
         non_room_categories = self._get_non_room_categories()
         for category in non_room_categories:
-            if category in global_estimate.get('categories', {}):
-                results['categories'][category] = global_estimate['categories'][category]
-                if global_estimate['categories'][category].get('status') == 'success':
-                    cost = global_estimate['categories'][category].get('total_cost', 0)
+            if category in baseline:
+                results['categories'][category] = baseline[category]
+                if baseline[category].get('status') == 'success':
+                    cost = baseline[category].get('total_cost', 0)
                     category_costs[category] = cost
                     total_cost += cost
         
@@ -868,6 +990,9 @@ class EnhancedEstimationEngine(EstimationEngine):
         results['summary']['room_breakdown'] = room_costs
         results['total_cost'] = total_cost
         
+        if estimate_profile is not None:
+            results['summary']['metadata']['profile'] = estimate_profile.finish('detailed', get_profile_counters())
+        
         # Add percentage breakdown
         if total_cost > 0:
             results['summary']['percentage_breakdown'] = {
@@ -875,12 +1000,45 @@ class EnhancedEstimationEngine(EstimationEngine):
                 for category, cost in category_costs.items()
             }
         
-        # Clear the match cache after estimation
-        self._match_cache = {}
-        
         return results
     
-    def _estimate_room(self, room, global_tier, trades_data, global_category_costs):
+    def _estimate_baseline(self, project_data, profile=None):
+        """
+        Estimate the whole-house categories of a detailed estimate
+        
+        Results are kept in the snapshot's baseline cache, so repeated detailed
+        estimates of the same house reuse them. A profiled call always recomputes.
+        
+        Args:
+            project_data (dict): House-level project data (no rooms or trades)
+            profile (EstimateProfile): Profile to add category sections to, None when not profiling
+            
+        Returns:
+            dict: Category results for the non-room categories, empty when the house data is invalid
+        """
+        key = self.baseline_cache.key(project_data)
+        if profile is None:
+            baseline = self.baseline_cache.get(key)
+            if baseline is not None:
+                events.trace('baseline.reused', categories=len(baseline))
+                return baseline
+        
+        logger.info("Calculating whole-house categories")
+        context = EstimationContext(project_data)
+        baseline = {}
+        if self.validate_project_data(context.project_data)['is_valid']:
+            non_room_categories = self._get_non_room_categories()
+            categories = [category for category in self.estimators if category in non_room_categories]
+            outcomes = self._run_categories(context.project_data, context, profile, categories)
+            for category, (category_result, _, category_profile) in zip(categories, outcomes):
+                baseline[category] = category_result
+                if category_profile is not None:
+                    profile.categories[category] = category_profile
+        
+        self.baseline_cache.put(key, baseline)
+        return baseline
+    
+    def _estimate_room(self, room, global_tier, trades_data, context):
         """
         Estimate costs for a specific room
         
@@ -888,11 +1046,253 @@ class EnhancedEstimationEngine(EstimationEngine):
             room (dict): Room data including type, size, and tier
             global_tier (str): Global project tier
             trades_data (dict): Global trade tier overrides
-            global_category_costs (dict): Global category costs for reference
+            context (EstimationContext): Per-estimate state for the enclosing project
             
         Returns:
             dict: Room estimation results
         """
+        return self._estimate_rooms({None: room}, global_tier, trades_data, context)[None]
+    
+    def _run_rooms(self, rooms, global_tier, trades_data, context, profile=None):
+        """
+        Estimate a detailed project's rooms, in one batch or in chunks on the configured room pool
+        
+        Each chunk is estimated with its own context and the chunks are merged back
+        in room order, so the result never depends on how the pool scheduled them.
+        
+        Returns:
+            dict: Room id to room estimation results, in the order of rooms
+        """
+        mode = self.room_mode
+        if mode == 'off' or len(rooms) < max(self.room_min_rooms, 2):
+            return self._estimate_rooms(rooms, global_tier, trades_data, context, profile)
+        
+        pool = self._get_room_pool()
+        chunks = self._room_chunks(rooms, self.room_workers)
+        house_data = {key: value for key, value in context.project_data.items() if key != 'rooms'}
+        track = profile is not None
+        if mode == 'process':
+            # Worker processes estimate against their own preloaded engine, reloaded if stale
+            futures = [pool.submit(run_snapshot_method, self.snapshot.version, 'estimate_rooms', chunk,
+                                   global_tier, trades_data, house_data, track, self.profile_memory)
+                       for chunk in chunks]
+        else:
+            futures = [pool.submit(self.estimate_rooms, chunk, global_tier, trades_data,
+                                   house_data, track, self.profile_memory)
+                       for chunk in chunks]
+        
+        estimated = {}
+        for future in futures:
+            chunk_estimates, chunk_profile = future.result()
+            estimated.update(chunk_estimates)
+            if chunk_profile is not None:
+                profile.merge(chunk_profile)
+        return {room_id: estimated[room_id] for room_id in rooms}
+    
+    @staticmethod
+    def _room_chunks(rooms, count):
+        """
+        Split rooms into at most count chunks of similar size
+        
+        Rooms with the same definition apart from their name go to the same chunk,
+        so repeated rooms are still estimated only once.
+        """
+        groups = {}
+        for room_id, room in rooms.items():
+            definition = json.dumps({key: value for key, value in room.items() if key != 'name'},
+                                    sort_keys=True, default=str)
+            groups.setdefault(definition, {})[room_id] = room
+        
+        chunks = [{} for _ in range(min(count, len(groups)))]
+        for group in sorted(groups.values(), key=len, reverse=True):
+            min(chunks, key=len).update(group)
+        return chunks
+    
+    def estimate_rooms(self, rooms, global_tier, trades_data, project_data, profile=False, track_memory=False):
+        """
+        Estimate a chunk of a detailed project's rooms on their own (used by the room pool)
+        
+        Returns:
+            (room_estimates, profile) where profile holds the chunk's rooms and
+            room_batches sections, None when not profiling
+        """
+        context = EstimationContext(project_data)
+        estimate_profile = EstimateProfile(track_memory) if profile else None
+        try:
+            room_estimates = self._estimate_rooms(rooms, global_tier, trades_data, context, estimate_profile)
+        finally:
+            if estimate_profile is not None:
+                estimate_profile.close()
+        
+        if estimate_profile is None:
+            return room_estimates, None
+        return room_estimates, {'rooms': estimate_profile.rooms, 'room_batches': estimate_profile.room_batches}
+    
+    def _estimate_rooms(self, rooms, global_tier, trades_data, context, profile=None):
+        """
+        Estimate costs for several rooms, batching the work across rooms by category
+        
+        Each room's categories are planned first. Rooms that plan out identically
+        (see _room_key) are estimated once and copied under their own name. Every
+        category then runs once for all the rooms that need it (one quantity batch,
+        one costing pass) and the results are put back together room by room,
+        exactly as a per-room loop would.
+        
+        Args:
+            rooms (dict): Room id to room data, in output order
+            global_tier (str): Global project tier
+            trades_data (dict): Global trade tier overrides
+            context (EstimationContext): Per-estimate state for the enclosing project
+            profile (EstimateProfile): Profile to add room and batch sections to, None when not profiling
+            
+        Returns:
+            dict: Room id to room estimation results
+        """
+        plans = {}
+        batches = {}
+        templates = {}
+        copies = {}
+        for room_id, room in rooms.items():
+            events.trace('room.start', room_id=room_id, name=room.get('name'))
+            section = profile.section() if profile is not None else None
+            try:
+                room_result, tasks = self._plan_room(room, global_tier, trades_data, context)
+            except BaseException:
+                if section is not None:
+                    section.finish()
+                raise
+            if section is not None:
+                profile.rooms[room_id] = section.finish(type=room_result['type'])
+            
+            # Repeated rooms reuse the first identical room's result
+            key = self._room_key(room_result, tasks)
+            if key is not None:
+                if key in templates:
+                    copies[room_id] = (templates[key], room_result['name'])
+                    continue
+                templates[key] = room_id
+            
+            plans[room_id] = (room, room_result, tasks)
+            for category, _, category_project_data in tasks:
+                batches.setdefault(category, []).append((room_id, category_project_data))
+        
+        outcomes = {}
+        for category, batch in batches.items():
+            section = profile.section() if profile is not None else None
+            try:
+                outcomes[category] = self._estimate_room_batch(category, batch, context, section)
+            except BaseException:
+                if section is not None:
+                    section.finish()
+                raise
+            if section is not None:
+                profile.room_batches[category] = section.finish(rooms=len(batch))
+        
+        room_estimates = {}
+        for room_id in rooms:
+            if room_id in copies:
+                template_id, name = copies[room_id]
+                room_result = self._copy_room_result(room_estimates[template_id])
+                room_result['name'] = name
+                if profile is not None:
+                    profile.rooms[room_id].update(categories=len(room_result['categories']), template=template_id)
+                room_estimates[room_id] = room_result
+                continue
+            
+            room, room_result, tasks = plans[room_id]
+            for category, category_tier, _ in tasks:
+                outcome = outcomes[category][room_id]
+                
+                # Skip if no quantities were calculated
+                if outcome is None:
+                    continue
+                
+                if isinstance(outcome, Exception):
+                    logger.error(f"Error estimating {category} for room {room.get('name')}: {str(outcome)}", exc_info=outcome)
+                    room_result['categories'][category] = {
+                        'status': 'error',
+                        'message': str(outcome)
+                    }
+                    room_result['warnings'].append(f"Error in category '{category}': {str(outcome)}")
+                    continue
+                
+                quantities, costed_items = outcome
+                
+                # Calculate category total
+                category_cost = sum(item.get('total_cost', 0) for item in costed_items)
+                
+                # Store category results
+                room_result['categories'][category] = {
+                    'status': 'success',
+                    'quantities': quantities,
+                    'costed_items': costed_items,
+                    'total_cost': category_cost,
+                    'tier': category_tier
+                }
+                
+                room_result['category_costs'][category] = category_cost
+                room_result['total_cost'] += category_cost
+            
+            if profile is not None:
+                profile.rooms[room_id]['categories'] = len(room_result['categories'])
+            room_estimates[room_id] = room_result
+        
+        return room_estimates
+    
+    def _room_key(self, room_result, tasks):
+        """
+        Key under which two planned rooms produce the same result apart from their name
+        
+        Built from the room's type, square footage and tier plus each category's
+        effective tier and allocation factor; None if those can't be hashed.
+        """
+        room_sf = room_result['square_footage']
+        key = (room_result['type'], type(room_sf), room_sf, room_result['tier']) + tuple(
+            (category, category_tier,
+             category_project_data.get('allocation_factor') if isinstance(category_project_data, dict)
+             else repr(category_project_data))
+            for category, category_tier, category_project_data in tasks
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    
+    @staticmethod
+    def _copy_room_result(room_result):
+        """
+        Copy of a room result that shares nothing mutable with it
+        
+        Much cheaper than a deepcopy: costed items only hold scalars unless the
+        estimator's quantity value itself was a container.
+        """
+        categories = {}
+        for category, category_result in room_result['categories'].items():
+            category_result = dict(category_result)
+            if 'quantities' in category_result:
+                category_result['quantities'] = copy.deepcopy(category_result['quantities'])
+                category_result['costed_items'] = [
+                    dict(item) if not isinstance(item.get('original_quantity_value'), (dict, list)) else copy.deepcopy(item)
+                    for item in category_result['costed_items']
+                ]
+            categories[category] = category_result
+        
+        return dict(
+            room_result,
+            categories=categories,
+            category_costs=dict(room_result['category_costs']),
+            warnings=list(room_result['warnings'])
+        )
+    
+    def _plan_room(self, room, global_tier, trades_data, context):
+        """
+        Set up a room's result and the estimator inputs for each of its categories
+        
+        Returns:
+            tuple: (room_result, [(category, category_tier, category_project_data)]); the
+                project data is the exception raised building it when that failed
+        """
         # Determine effective room tier
         room_tier = room.get('tier', global_tier)
         room_sf = room.get('square_footage', 0)
@@ -919,17 +1319,14 @@ class EnhancedEstimationEngine(EstimationEngine):
         allocation_factors = self._calculate_room_allocation_factors(
             room_type, 
             room_sf, 
-            self.current_project_data.get('square_footage', 0)
+            context.project_data.get('square_footage', 0)
         )
         
-        # Process each applicable category
+        tasks = []
         for category in applicable_categories:
             # Skip if category is not implemented
             if category not in self.estimators or self.estimators[category] is None:
                 continue
-                
-            # Get estimator instance
-            estimator = self.estimators[category]
             
             # Determine category tier (room trade > global trade > room > global)
             category_tier = self._determine_category_tier(
@@ -959,43 +1356,112 @@ class EnhancedEstimationEngine(EstimationEngine):
                         category_project_data['is_primary_bath'] = True
                     elif room_type == 'secondary_bath':
                         category_project_data['is_secondary_bath'] = True
-                
-                # Calculate quantities for this room and category
-                quantities = estimator.calculate_quantities(
-                    **category_project_data
+            except Exception as e:
+                category_project_data = e
+            
+            tasks.append((category, category_tier, category_project_data))
+        
+        return room_result, tasks
+    
+    def _estimate_room_batch(self, category, batch, context, section=None):
+        """
+        Calculate and cost one category for a batch of rooms
+        
+        Args:
+            category (str): Category to estimate
+            batch (list): (room_id, category_project_data) per room
+            context (EstimationContext): Per-estimate state for the enclosing project
+            section (ProfileSection): Profile section to lap, None when not profiling
+            
+        Returns:
+            dict: Room id to (quantities, costed_items), None when there were no
+                quantities, or the exception that failed the room
+        """
+        outcomes = {}
+        pending = []
+        for room_id, category_project_data in batch:
+            if isinstance(category_project_data, Exception):
+                outcomes[room_id] = category_project_data
+            else:
+                pending.append((room_id, category_project_data))
+        
+        quantities_list = self._room_quantities(category, [data for _, data in pending])
+        if section is not None:
+            section.lap('quantities')
+        
+        costable = []
+        for (room_id, _), quantities in zip(pending, quantities_list):
+            if isinstance(quantities, Exception):
+                outcomes[room_id] = quantities
+            elif not quantities:
+                outcomes[room_id] = None
+            else:
+                costable.append((room_id, quantities))
+        
+        try:
+            costed = self._apply_costs_many(category, [quantities for _, quantities in costable], context)
+        except Exception:
+            # Cost room by room so the failure is reported against the room that caused it
+            costed = []
+            for _, quantities in costable:
+                try:
+                    costed.append(self._apply_costs(category, quantities, context))
+                except Exception as e:
+                    costed.append(e)
+        if section is not None:
+            section.lap('costing')
+        
+        for (room_id, quantities), costed_items in zip(costable, costed):
+            outcomes[room_id] = costed_items if isinstance(costed_items, Exception) else (quantities, costed_items)
+        
+        return outcomes
+    
+    def _room_quantities(self, category, inputs):
+        """
+        Quantities for a batch of room inputs from one calculate_quantities_batch call
+        
+        Only square footage and tier are passed: the room flags in the inputs
+        (room_type, allocation_factor, ...) are not read by any estimator. Rooms
+        the batch can't take (an unknown tier, square footage that isn't a finite
+        number), and every room of a batch that raised, are calculated on their
+        own so an error stays with its room.
+        
+        Returns:
+            list: Quantities per input, or the exception calculating them raised
+        """
+        estimator = self.estimators[category]
+        results = [None] * len(inputs)
+        rows = [
+            index for index, data in enumerate(inputs)
+            if data['tier'] in TIER_NAMES and type(data['square_footage']) in (int, float)
+            and math.isfinite(data['square_footage'])
+        ]
+        if rows:
+            # An object array keeps each room's int or float square footage
+            square_footage = np.empty(len(rows), dtype=object)
+            square_footage[:] = [inputs[index]['square_footage'] for index in rows]
+            try:
+                columns = estimator.calculate_quantities_batch(
+                    square_footage, encode_tiers([inputs[index]['tier'] for index in rows])
                 )
-                
-                # Skip if no quantities were calculated
-                if not quantities:
-                    continue
-                
-                # Match with catalog costs
-                costed_items = self._apply_costs(category, quantities)
-                
-                # Calculate category total
-                category_cost = sum(item.get('total_cost', 0) for item in costed_items)
-                
-                # Store category results
-                room_result['categories'][category] = {
-                    'status': 'success',
-                    'quantities': quantities,
-                    'costed_items': costed_items,
-                    'total_cost': category_cost,
-                    'tier': category_tier
-                }
-                
-                room_result['category_costs'][category] = category_cost
-                room_result['total_cost'] += category_cost
-                
             except Exception as e:
-                logger.error(f"Error estimating {category} for room {room.get('name')}: {str(e)}", exc_info=True)
-                room_result['categories'][category] = {
-                    'status': 'error',
-                    'message': str(e)
-                }
-                room_result['warnings'].append(f"Error in category '{category}': {str(e)}")
+                logger.debug(f"Batch quantities failed for {category}, calculating room by room: {str(e)}")
+                rows = []
+            else:
+                for position, index in enumerate(rows):
+                    results[index] = batch_row(columns, position)
         
-        return room_result
+        batched = set(rows)
+        for index, data in enumerate(inputs):
+            if index in batched:
+                continue
+            try:
+                results[index] = estimator.calculate_quantities(
+                    square_footage=data['square_footage'], tier=data['tier']
+                )
+            except Exception as e:
+                results[index] = e
+        return results
     
     def _determine_category_tier(self, category, room_trades, global_trades, room_tier, global_tier):
         """
@@ -1127,7 +1593,7 @@ class EnhancedEstimationEngine(EstimationEngine):
         # 4. Fall back to global tier
         return global_tier
     
-    def _modify_quantities_for_tier(self, quantities, base_tier, target_tier):
+    def _modify_quantities_for_tier(self, quantities, base_tier, target_tier, category):
         """
         Adjust quantities based on tier differences
         
@@ -1135,6 +1601,7 @@ class EnhancedEstimationEngine(EstimationEngine):
             quantities (dict): Dictionary of calculated quantities
             base_tier (str): Tier used for initial calculations
             target_tier (str): Tier to adjust quantities to
+            category (str): Category the quantities belong to
         
         Returns:
             dict: Adjusted quantities
@@ -1208,7 +1675,7 @@ class EnhancedEstimationEngine(EstimationEngine):
         adjustment_key = (base_tier, target_tier)
         
         if adjustment_key in tier_factors:
-            category_adjustments = tier_factors[adjustment_key].get(self.current_category, {})
+            category_adjustments = tier_factors[adjustment_key].get(category, {})
             for quantity_name, factor in category_adjustments.items():
                 if quantity_name in adjusted_quantities:
                     adjusted_quantities[quantity_name] = adjusted_quantities[quantity_name] * factor
@@ -0,0 +1,244 @@
+# src/core/profiler.py
+
+"""
+Optional per-estimate instrumentation.
+
+When profiling is on, each category and room is measured in a ProfileSection:
+wall time split into phases, catalog lookups, quantity cache hits and misses
+and, if memory tracking is on, the tracemalloc peak while it ran. Sections are
+collected by an EstimateProfile, reported under summary.metadata.profile and
+folded into the process-wide ProfileCounters.
+
+The counting hooks (count_lookups, count_cache) read one thread-local and do
+nothing when no section is active, so a disabled profiler costs next to
+nothing. tracemalloc is process-wide: peaks are exact only while one section
+runs at a time and overlap when categories or requests run concurrently.
+"""
+
+import threading
+import time
+import tracemalloc
+from typing import Dict, Any, Optional
+
+_active = threading.local()
+
+_tracing_lock = threading.Lock()
+_tracing_users = 0
+_tracing_owned = False
+
+def _start_tracing():
+    """Start tracemalloc for one more user (left alone if someone else started it)"""
+    global _tracing_users, _tracing_owned
+    with _tracing_lock:
+        if _tracing_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _tracing_owned = True
+        _tracing_users += 1
+
+def _stop_tracing():
+    """Release one user; tracemalloc stops with the last one if we started it"""
+    global _tracing_users, _tracing_owned
+    with _tracing_lock:
+        _tracing_users = max(_tracing_users - 1, 0)
+        if _tracing_users == 0 and _tracing_owned:
+            tracemalloc.stop()
+            _tracing_owned = False
+
+def count_lookups(count: int = 1):
+    """Add catalog lookups to the section running on this thread, if any"""
+    section = getattr(_active, 'section', None)
+    if section is not None:
+        section.catalog_lookups += count
+
+def count_cache(hit: bool):
+    """Record a quantity cache hit or miss against the section running on this thread, if any"""
+    section = getattr(_active, 'section', None)
+    if section is not None:
+        if hit:
+            section.cache_hits += 1
+        else:
+            section.cache_misses += 1
+
+class ProfileSection:
+    """Measurements for one category or room, active on the thread that created it until finish()"""
+
+    __slots__ = ('track_memory', 'phases', 'catalog_lookups', 'cache_hits', 'cache_misses',
+                 '_started', '_lap', '_memory_base', '_previous')
+
+    def __init__(self, track_memory: bool = False):
+        self.track_memory = track_memory and tracemalloc.is_tracing()
+        self.phases: Dict[str, float] = {}
+        self.catalog_lookups = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        if self.track_memory:
+            tracemalloc.reset_peak()
+            self._memory_base = tracemalloc.get_traced_memory()[0]
+        else:
+            self._memory_base = 0
+
+        self._previous = getattr(_active, 'section', None)
+        _active.section = self
+        self._started = self._lap = time.perf_counter()
+
+    def lap(self, phase: str):
+        """Charge the time since the previous lap (or the start) to a phase"""
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + (now - self._lap) * 1000
+        self._lap = now
+
+    def finish(self, **extra) -> Dict[str, Any]:
+        """Deactivate the section and return its measurements"""
+        wall_ms = (time.perf_counter() - self._started) * 1000
+        _active.section = self._previous
+
+        entry = {
+            'wall_ms': round(wall_ms, 3),
+            'phases_ms': {phase: round(ms, 3) for phase, ms in self.phases.items()},
+            'catalog_lookups': self.catalog_lookups,
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+            'peak_kb': None
+        }
+        if self.track_memory and tracemalloc.is_tracing():
+            peak = tracemalloc.get_traced_memory()[1] - self._memory_base
+            entry['peak_kb'] = round(max(peak, 0) / 1024, 1)
+        entry.update(extra)
+        return entry
+
+def _combine(entry: Dict[str, Any], other: Dict[str, Any]) -> Dict[str, Any]:
+    """One section entry covering the work of two (counts and times add up, peak memory is the larger)"""
+    combined = dict(entry)
+    for field in ('wall_ms', 'catalog_lookups', 'cache_hits', 'cache_misses', 'rooms'):
+        if field in other:
+            combined[field] = combined.get(field, 0) + other[field]
+    combined['wall_ms'] = round(combined['wall_ms'], 3)
+    combined['phases_ms'] = dict(entry.get('phases_ms', {}))
+    for phase, elapsed in other.get('phases_ms', {}).items():
+        combined['phases_ms'][phase] = round(combined['phases_ms'].get(phase, 0) + elapsed, 3)
+    peaks = [peak for peak in (entry.get('peak_kb'), other.get('peak_kb')) if peak is not None]
+    combined['peak_kb'] = max(peaks) if peaks else None
+    return combined
+
+class EstimateProfile:
+    """Sections of one estimate, in the shape reported under summary.metadata.profile"""
+
+    def __init__(self, track_memory: bool = False):
+        self.track_memory = track_memory
+        self.categories: Dict[str, Dict[str, Any]] = {}
+        self.rooms: Dict[str, Dict[str, Any]] = {}
+        self.room_batches: Dict[str, Dict[str, Any]] = {}
+        self._started = time.perf_counter()
+        if track_memory:
+            _start_tracing()
+
+    def section(self) -> ProfileSection:
+        """Start measuring a category, room or room batch on the current thread"""
+        return ProfileSection(self.track_memory)
+
+    def merge(self, report: Dict[str, Any]):
+        """Add the rooms and room_batches sections of rooms estimated separately (e.g. on a room pool)"""
+        self.rooms.update(report.get('rooms', {}))
+        for category, entry in report.get('room_batches', {}).items():
+            total = self.room_batches.get(category)
+            self.room_batches[category] = entry if total is None else _combine(total, entry)
+
+    def close(self):
+        """Release memory tracking; safe to call more than once"""
+        if self.track_memory:
+            self.track_memory = False
+            _stop_tracing()
+
+    def finish(self, kind: str, counters: Optional['ProfileCounters'] = None) -> Dict[str, Any]:
+        """
+        Stop the profile and return its report
+
+        Args:
+            kind: Which estimate ('standard', 'detailed'), counted in the process totals
+            counters: Process counters to fold the sections into, None to skip
+        """
+        track_memory = self.track_memory
+        self.close()
+
+        report = {
+            'wall_ms': round((time.perf_counter() - self._started) * 1000, 3),
+            'track_memory': track_memory,
+            'categories': self.categories
+        }
+        if kind == 'detailed':
+            report['rooms'] = self.rooms
+            report['room_batches'] = self.room_batches
+
+        if counters is not None:
+            counters.record(kind, report)
+        return report
+
+class ProfileCounters:
+    """Process-wide totals of profiled estimates, by category, room type and room batch"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.estimates: Dict[str, int] = {}
+            self.categories: Dict[str, Dict[str, Any]] = {}
+            self.rooms: Dict[str, Dict[str, Any]] = {}
+            self.room_batches: Dict[str, Dict[str, Any]] = {}
+
+    def record(self, kind: str, report: Dict[str, Any]):
+        """Add one estimate's report (a detailed report's categories are its whole-house ones)"""
+        with self._lock:
+            self.estimates[kind] = self.estimates.get(kind, 0) + 1
+            for category, entry in report.get('categories', {}).items():
+                self._add(self.categories, category, entry)
+            for entry in report.get('rooms', {}).values():
+                self._add(self.rooms, entry.get('type', 'generic'), entry)
+            for category, entry in report.get('room_batches', {}).items():
+                self._add(self.room_batches, category, entry)
+
+    def record_result(self, result: Dict[str, Any]):
+        """Fold in the profile of an estimate computed in another process, if it has one"""
+        report = result.get('summary', {}).get('metadata', {}).get('profile') if isinstance(result, dict) else None
+        if not report:
+            return
+        self.record('detailed' if 'rooms' in report else 'standard', report)
+
+    @staticmethod
+    def _add(totals, name, entry):
+        total = totals.get(name)
+        if total is None:
+            total = totals[name] = {'count': 0, 'wall_ms': 0.0, 'max_wall_ms': 0.0, 'catalog_lookups': 0,
+                                    'cache_hits': 0, 'cache_misses': 0, 'max_peak_kb': None}
+        total['count'] += 1
+        total['wall_ms'] += entry['wall_ms']
+        total['max_wall_ms'] = max(total['max_wall_ms'], entry['wall_ms'])
+        total['catalog_lookups'] += entry['catalog_lookups']
+        total['cache_hits'] += entry['cache_hits']
+        total['cache_misses'] += entry['cache_misses']
+        if entry.get('peak_kb') is not None:
+            total['max_peak_kb'] = max(total['max_peak_kb'] or 0, entry['peak_kb'])
+
+    def stats(self) -> Dict[str, Any]:
+        """Totals with mean wall time per category and room type"""
+        with self._lock:
+            def summarize(totals):
+                return {
+                    name: dict(total, wall_ms=round(total['wall_ms'], 3),
+                               mean_wall_ms=round(total['wall_ms'] / total['count'], 3))
+                    for name, total in totals.items()
+                }
+            return {
+                'estimates': dict(self.estimates),
+                'categories': summarize(self.categories),
+                'rooms': summarize(self.rooms),
+                'room_batches': summarize(self.room_batches)
+            }
+
+_counters = ProfileCounters()
+
+def get_profile_counters() -> ProfileCounters:
+    """Process-wide profile counters (one set per process; worker processes keep their own)"""
+    return _counters
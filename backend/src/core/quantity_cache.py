@@ -0,0 +1,166 @@
+# src/core/quantity_cache.py
+
+import copy
+import logging
+import sys
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+from src.core.profiler import count_cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 4096
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+def approximate_size(value) -> int:
+    """Rough in-memory size of a quantities dict (containers plus their contents)"""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(approximate_size(key) + approximate_size(item) for key, item in value.items())
+    elif isinstance(value, (list, tuple, set)):
+        size += sum(approximate_size(item) for item in value)
+    return size
+
+class QuantityCache:
+    """
+    LRU memo of estimator calculate_quantities() results.
+
+    Estimators are pure functions of square footage, tier and the few kwargs
+    listed in their QUANTITY_INPUTS, so the key is built from just those
+    inputs and unrelated project fields don't fragment the cache. Entries are
+    bounded by count and by approximate size in bytes. Results are deep-copied
+    in and out so callers may modify what they get back.
+
+    A category's entries are dropped when its estimator's config object is
+    replaced (e.g. by set_config); call invalidate() after changing a config
+    in place.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES,
+                 enabled: bool = True):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+
+        self._entries: 'OrderedDict[Tuple, Tuple[Dict[str, Any], int]]' = OrderedDict()
+        self._configs: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.uncacheable = 0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'QuantityCache':
+        """Build from the estimation.quantity_cache section of settings.json"""
+        settings = config.get('estimation', {}).get('quantity_cache', {})
+        return cls(
+            max_entries=settings.get('max_entries', DEFAULT_MAX_ENTRIES),
+            max_bytes=settings.get('max_bytes', DEFAULT_MAX_BYTES),
+            enabled=settings.get('enabled', True)
+        )
+
+    def calculate_quantities(self, category: str, estimator, /, square_footage, tier, **kwargs) -> Dict[str, Any]:
+        """Return estimator.calculate_quantities(...) for these inputs, computing it on a miss"""
+        if not self.enabled:
+            return estimator.calculate_quantities(square_footage=square_footage, tier=tier, **kwargs)
+
+        key = self._key(category, estimator, square_footage, tier, kwargs)
+        if key is None:
+            with self._lock:
+                self.uncacheable += 1
+            return estimator.calculate_quantities(square_footage=square_footage, tier=tier, **kwargs)
+
+        with self._lock:
+            self._check_config(category, estimator)
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                hit = True
+            else:
+                self.misses += 1
+                hit = False
+        count_cache(hit)
+        if hit:
+            return copy.deepcopy(entry[0])
+
+        # Compute outside the lock; two threads missing on the same key both compute
+        quantities = estimator.calculate_quantities(square_footage=square_footage, tier=tier, **kwargs)
+        self._store(key, quantities)
+        return quantities
+
+    def _key(self, category, estimator, square_footage, tier, kwargs) -> Optional[Tuple]:
+        """Cache key from the inputs the estimator reads, None if they can't be hashed"""
+        inputs = getattr(estimator, 'QUANTITY_INPUTS', None)
+        names = sorted(kwargs) if inputs is None else [name for name in inputs if name in kwargs]
+
+        # Types are part of the key: 2 and 2.0 hash alike but can produce different output types
+        key = (category, id(estimator), type(square_footage), square_footage, tier) + tuple(
+            (name, type(kwargs[name]), kwargs[name]) for name in names
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _check_config(self, category, estimator):
+        """Drop a category's entries when its estimator's config object changed (lock held)"""
+        config = getattr(estimator, 'config', None)
+        if category in self._configs and self._configs[category] is not config:
+            self._drop(lambda key: key[0] == category)
+            logger.info(f"Estimator config for {category} changed; dropped its cached quantities")
+        self._configs[category] = config
+
+    def _store(self, key, quantities):
+        size = approximate_size(quantities)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous[1]
+            self._entries[key] = (copy.deepcopy(quantities), size)
+            self.bytes += size
+
+            while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.bytes -= evicted_size
+                self.evictions += 1
+
+    def _drop(self, predicate):
+        for key in [key for key in self._entries if predicate(key)]:
+            self.bytes -= self._entries.pop(key)[1]
+
+    def invalidate(self, category: Optional[str] = None):
+        """Drop cached quantities for one category, or everything"""
+        with self._lock:
+            if category is None:
+                self._entries.clear()
+                self._configs.clear()
+                self.bytes = 0
+            else:
+                self._drop(lambda key: key[0] == category)
+                self._configs.pop(category, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'enabled': self.enabled,
+                'entries': len(self._entries),
+                'bytes': self.bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'uncacheable': self.uncacheable
+            }
@@ -0,0 +1,69 @@
+# src/core/service_table.py
+
+import logging
+import pandas as pd
+from typing import Dict, Iterable, Optional, Tuple
+
+from src.estimators.electrical import service_level_keys
+from src.utils.search_index import SearchIndex
+
+logger = logging.getLogger(__name__)
+
+class ServiceTable:
+    """
+    Catalog items for electrical service levels, resolved once per snapshot.
+
+    Keyed on (amp size, service name) for every service the electrical
+    estimator can select. Each key resolves to the first catalog row whose
+    Item contains both the service name and the amp size (case-insensitive),
+    the same row the per-estimate catalog scan used to find.
+    """
+
+    def __init__(self, catalog: pd.DataFrame, search_index: Optional[SearchIndex] = None,
+                 service_keys: Optional[Iterable[Tuple[int, str]]] = None):
+        """
+        Args:
+            catalog: Cost catalog with an Item column
+            search_index: Index over the catalog's Item column (built if not given)
+            service_keys: (main_panel_size, electrical_service_name) pairs to resolve;
+                defaults to every service level of the electrical estimator
+        """
+        catalog = catalog if catalog is not None else pd.DataFrame()
+        if search_index is None:
+            search_index = SearchIndex(catalog, fields=('Item',))
+
+        self.items: Dict[Tuple[str, str], Optional[pd.Series]] = {}
+        unresolved = []
+
+        for panel_size, service_name in (service_keys if service_keys is not None else service_level_keys()):
+            rows = search_index.match_pattern(
+                'Item', str(panel_size), case=False,
+                rows=search_index.match_pattern('Item', service_name, case=False)
+            )
+            self.items[self._key(panel_size, service_name)] = catalog.iloc[rows[0]] if len(rows) > 0 else None
+            if len(rows) == 0:
+                unresolved.append(f"{panel_size} A '{service_name}'")
+
+        if unresolved:
+            logger.warning(f"Service table: no catalog item for {', '.join(unresolved)}")
+        logger.info(f"Resolved {len(self.items) - len(unresolved)} of {len(self.items)} electrical service levels")
+
+    @staticmethod
+    def _key(panel_size, service_name) -> Tuple[str, str]:
+        return (str(panel_size), str(service_name).lower())
+
+    def __contains__(self, key) -> bool:
+        return self._key(*key) in self.items
+
+    def lookup(self, panel_size, service_name) -> Optional[pd.Series]:
+        """
+        Catalog row for a service level, None if it has no catalog item
+
+        Combinations outside the table are not searched for; they are
+        reported and return None.
+        """
+        key = self._key(panel_size, service_name)
+        if key not in self.items:
+            logger.warning(f"Unknown electrical service: {panel_size} A '{service_name}' is not a known service level")
+            return None
+        return self.items[key]
@@ -0,0 +1,153 @@
+# src/core/snapshot_manager.py
+
+import logging
+import os
+import threading
+from typing import Callable, Dict, Any, Optional, Tuple
+
+from src.core.engine_snapshot import EngineSnapshot, compute_source_version
+
+logger = logging.getLogger(__name__)
+
+class SnapshotManager:
+    """
+    Owns the current EngineSnapshot and hot-swaps it when source files change.
+
+    The watcher polls file mtimes/sizes, confirms a real change by content hash,
+    builds the replacement snapshot in the background and then swaps it in with
+    a single reference assignment. Engines handed out before the swap keep
+    pointing at the old snapshot, so in-flight estimates finish against the data
+    they started with.
+    """
+
+    def __init__(self, config_path: str = 'config/settings.json',
+                 engine_factories: Optional[Dict[str, Callable]] = None,
+                 snapshot: Optional[EngineSnapshot] = None):
+        """
+        Args:
+            config_path: Path to settings.json used to (re)build snapshots
+            engine_factories: Mapping of engine name to a callable taking a snapshot
+            snapshot: Optional prebuilt initial snapshot
+        """
+        self.config_path = config_path
+        self.engine_factories = engine_factories or {}
+        self._listeners = []
+        self._reload_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+        initial = snapshot or EngineSnapshot.load(config_path)
+        self._state = self._build_state(initial)
+        self._file_stats = self._stat_sources(initial.source_paths)
+
+    def _build_state(self, snapshot: EngineSnapshot) -> Tuple[EngineSnapshot, Dict[str, Any]]:
+        """Create the engines for a snapshot; swapped in together as one tuple"""
+        engines = {name: factory(snapshot) for name, factory in self.engine_factories.items()}
+        return snapshot, engines
+
+    @property
+    def snapshot(self) -> EngineSnapshot:
+        """The snapshot new requests should use"""
+        return self._state[0]
+
+    @property
+    def version(self) -> str:
+        """Content hash of the current snapshot"""
+        return self._state[0].version
+
+    def get_engine(self, name: str):
+        """Get the named engine bound to the current snapshot"""
+        return self._state[1][name]
+
+    def add_listener(self, callback: Callable[[EngineSnapshot, EngineSnapshot], None]):
+        """Register a callback invoked as callback(old_snapshot, new_snapshot) after each swap"""
+        self._listeners.append(callback)
+
+    def _stat_sources(self, paths) -> Dict[str, Optional[Tuple[float, int]]]:
+        """Record (mtime, size) for each source file, None if missing"""
+        stats = {}
+        for path in paths:
+            try:
+                stat = os.stat(path)
+                stats[path] = (stat.st_mtime, stat.st_size)
+            except OSError:
+                stats[path] = None
+        return stats
+
+    def check_for_changes(self) -> bool:
+        """
+        Reload if any source file changed on disk
+
+        Returns:
+            True if a new snapshot was swapped in
+        """
+        current = self.snapshot
+        stats = self._stat_sources(current.source_paths)
+        if stats == self._file_stats:
+            return False
+
+        # Timestamps moved; only rebuild if the content actually differs
+        self._file_stats = stats
+        if compute_source_version(current.source_paths) == current.version:
+            return False
+
+        return self.reload()
+
+    def reload(self) -> bool:
+        """
+        Build a fresh snapshot and atomically swap it in
+
+        Returns:
+            True if the swap happened, False if the build failed or nothing changed
+        """
+        with self._reload_lock:
+            old_snapshot = self.snapshot
+            try:
+                new_snapshot = EngineSnapshot.load(self.config_path)
+            except Exception as e:
+                logger.error(f"Snapshot reload failed, keeping version {old_snapshot.version}: {str(e)}", exc_info=True)
+                return False
+
+            if new_snapshot.version == old_snapshot.version:
+                return False
+
+            if new_snapshot.catalog is None or new_snapshot.catalog.empty:
+                logger.error(f"Reloaded catalog is empty, keeping version {old_snapshot.version}")
+                return False
+
+            # Single reference assignment: readers see either the old or the new state
+            self._state = self._build_state(new_snapshot)
+            self._file_stats = self._stat_sources(new_snapshot.source_paths)
+
+        logger.info(f"Swapped engine snapshot {old_snapshot.version} -> {new_snapshot.version}")
+        for listener in self._listeners:
+            try:
+                listener(old_snapshot, new_snapshot)
+            except Exception as e:
+                logger.warning(f"Snapshot listener failed: {str(e)}")
+        return True
+
+    def start(self, interval_seconds: float = 5.0):
+        """Start polling source files in a daemon thread"""
+        if self._thread is not None or interval_seconds <= 0:
+            return
+
+        self._stop_event.clear()
+
+        def watch():
+            while not self._stop_event.wait(interval_seconds):
+                try:
+                    self.check_for_changes()
+                except Exception as e:
+                    logger.error(f"Snapshot watcher error: {str(e)}", exc_info=True)
+
+        self._thread = threading.Thread(target=watch, name='snapshot-watcher', daemon=True)
+        self._thread.start()
+        logger.info(f"Watching {len(self.snapshot.source_paths)} snapshot sources every {interval_seconds}s")
+
+    def stop(self):
+        """Stop the polling thread"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
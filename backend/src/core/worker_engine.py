@@ -0,0 +1,64 @@
+# src/core/worker_engine.py
+
+"""
+Engine used inside worker processes.
+
+Process pools call init_worker_engine once per worker (as the pool initializer)
+so the catalog, mappings and estimators are loaded before any work arrives.
+Tasks then run against that preloaded engine instead of rebuilding it.
+"""
+
+import logging
+import multiprocessing
+import time
+
+logger = logging.getLogger(__name__)
+
+_worker_engine = None
+_in_worker = False
+
+def init_worker_engine(config_path='config/settings.json'):
+    """Build this process's engine; used as a ProcessPoolExecutor initializer"""
+    global _worker_engine, _in_worker
+    from src.core.estimation_engine import EnhancedEstimationEngine
+
+    # Set before building, so the engine sees it when choosing its own pools
+    _in_worker = multiprocessing.parent_process() is not None
+    _worker_engine = EnhancedEstimationEngine(config_path)
+    logger.info(f"Worker engine ready (snapshot {_worker_engine.snapshot.version})")
+
+def in_worker_process():
+    """Whether this process is a pool worker running a preloaded engine"""
+    return _in_worker
+
+def get_worker_engine():
+    """Get the engine preloaded for this worker process"""
+    if _worker_engine is None:
+        init_worker_engine()
+    return _worker_engine
+
+def run_engine_method(method_name, *args):
+    """Call a method on this process's engine, e.g. 'estimate_detailed_project'"""
+    return getattr(get_worker_engine(), method_name)(*args)
+
+def run_snapshot_method(version, method_name, *args):
+    """
+    run_engine_method against snapshot `version`
+
+    A worker still holding another snapshot (the files changed since it
+    preloaded) reloads first, and fails rather than answer from the wrong
+    snapshot if the files no longer match `version` either.
+    """
+    engine = get_worker_engine()
+    if engine.snapshot.version != version:
+        logger.info(f"Worker snapshot {engine.snapshot.version} is stale, reloading for {version}")
+        init_worker_engine(engine.snapshot.config_path)
+        engine = _worker_engine
+        if engine.snapshot.version != version:
+            raise RuntimeError(f"Worker loaded snapshot {engine.snapshot.version}, expected {version}")
+    return getattr(engine, method_name)(*args)
+
+def timed_call(fn, *args):
+    """Run fn(*args) and return (result, start timestamp) so callers can measure queue wait"""
+    started_at = time.time()
+    return fn(*args), started_at
@@ -0,0 +1,224 @@
+# src/estimators/batch.py
+import copy
+import logging
+import numpy as np
+from typing import Dict, Any
+
+logger = logging.getLogger(__name__)
+
+# Tier codes used by the batch API, in the order tiers are defined in settings.json
+TIER_NAMES = ('Premium', 'Luxury', 'Ultra-Luxury')
+PREMIUM, LUXURY, ULTRA_LUXURY = range(len(TIER_NAMES))
+TIER_CODES = {name: code for code, name in enumerate(TIER_NAMES)}
+
+# Project-level counts estimators read from kwargs
+BATCH_COUNT_FIELDS = (
+    'bedroom_count',
+    'bathroom_count',
+    'primary_bath_count',
+    'secondary_bath_count',
+    'powder_room_count',
+    'project_duration_months'
+)
+
+def encode_tiers(tiers) -> np.ndarray:
+    """Convert tier names to the integer codes used by calculate_quantities_batch"""
+    try:
+        return np.array([TIER_CODES[tier] for tier in tiers], dtype=np.int8)
+    except KeyError as e:
+        raise ValueError(f"Unknown tier: {e.args[0]}")
+
+class TierTable:
+    """
+    Per-tier coefficients shared by calculate_quantities and its batch version
+
+    Indexed with a tier name it returns the plain Python value, raising KeyError
+    for an unknown tier; indexed with an array of tier codes it returns a column.
+    None marks tiers that don't produce the quantity: their column rows are masked.
+    """
+
+    __slots__ = ('values', 'column')
+
+    def __init__(self, premium, luxury, ultra_luxury):
+        self.values = (premium, luxury, ultra_luxury)
+        if None in self.values:
+            self.column = np.ma.masked_array([0 if value is None else value for value in self.values],
+                                             mask=[value is None for value in self.values])
+        elif any(isinstance(value, str) for value in self.values):
+            self.column = np.array(self.values, dtype=object)
+        else:
+            self.column = np.array(self.values)
+
+    def __getitem__(self, tier):
+        if isinstance(tier, str):
+            return self.values[TIER_CODES[tier]]
+        return self.column[tier]
+
+def batch_row(columns: Dict[str, np.ndarray], index: int) -> Dict[str, Any]:
+    """Rebuild the scalar calculate_quantities result for one row of a batch"""
+    row = {}
+    for key, column in columns.items():
+        value = column[index]
+        if value is np.ma.masked:
+            continue
+        if isinstance(value, np.generic):
+            value = value.item()
+        elif isinstance(value, (dict, list)):
+            # Object columns may share one dict between rows
+            value = copy.deepcopy(value)
+        row[key] = value
+    return row
+
+def rint(values) -> np.ndarray:
+    """round(x) for arrays: nearest integer with ties to even, as int64"""
+    return np.rint(values).astype(np.int64)
+
+def round1(values) -> np.ndarray:
+    """round(x, 1) for float arrays"""
+    values = np.asarray(values, dtype=float)
+    rounded = np.round(values, 1)
+    # np.round scales by 10 before rounding, which can land on the other side of
+    # a tie; Python rounds the exact decimal value, so defer to it near ties
+    scaled = values * 10
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_tie.any():
+        rounded[near_tie] = [round(value, 1) for value in values[near_tie].tolist()]
+    return rounded
+
+def mixed(values, integral) -> np.ndarray:
+    """
+    Column whose rows are ints where integral is True and floats elsewhere,
+    matching scalar code whose result type depends on the inputs
+    """
+    values = np.asarray(values)
+    integral = np.broadcast_to(integral, values.shape)
+    if integral.all():
+        return values.astype(np.int64)
+    if not integral.any():
+        return values.astype(float)
+    column = np.empty(len(values), dtype=object)
+    column[:] = [int(value) if whole else float(value)
+                 for value, whole in zip(values.tolist(), integral.tolist())]
+    return column
+
+def constant(value, rows: int) -> np.ndarray:
+    """Column holding the same scalar value in every row"""
+    if isinstance(value, (str, dict, list)):
+        column = np.empty(rows, dtype=object)
+        column[:] = [value] * rows
+        return column
+    return np.full(rows, value)
+
+def mask_rows(column, keep) -> np.ndarray:
+    """Column that only holds a value in rows where keep is True"""
+    keep = np.asarray(keep, dtype=bool)
+    if keep.all():
+        return column
+    return np.ma.masked_array(column, mask=np.ma.getmaskarray(column) | ~keep)
+
+class BatchRows:
+    """Validated inputs of one calculate_quantities_batch call"""
+
+    def __init__(self, square_footage: np.ndarray, integral: np.ndarray, tier: np.ndarray,
+                 counts: Dict[str, np.ndarray]):
+        self.square_footage = square_footage
+        # Rows whose square footage was given as an int
+        self.integral = integral
+        self.tier = tier
+        self.counts = counts
+
+    def __len__(self):
+        return len(self.square_footage)
+
+    def has(self, name: str) -> bool:
+        return name in self.counts
+
+    def count(self, name: str, default) -> np.ndarray:
+        """Count column, or the scalar path's default when the batch has none"""
+        if name in self.counts:
+            return self.counts[name]
+        return np.full(len(self), default)
+
+    def tier_in(self, *codes) -> np.ndarray:
+        return np.isin(self.tier, codes)
+
+def _square_footage_column(values):
+    """Square footage as floats, plus which rows were ints"""
+    values = np.asarray(values).reshape(-1)
+    if values.dtype == object:
+        integral = np.array([isinstance(value, (int, np.integer)) for value in values.tolist()], dtype=bool)
+    else:
+        integral = np.full(len(values), values.dtype.kind in 'biu')
+    return values.astype(float), integral
+
+def _count_column(values, rows: int) -> np.ndarray:
+    """Counts as int64 when they hold whole numbers, the way project data supplies them"""
+    values = np.broadcast_to(np.asarray(values), (rows,))
+    if values.dtype.kind in 'biu':
+        return values.astype(np.int64)
+    values = values.astype(float)
+    if np.all(np.mod(values, 1) == 0):
+        return values.astype(np.int64)
+    return values
+
+class BatchQuantitiesMixin:
+    """
+    Columnar batch version of calculate_quantities.
+
+    Each estimator implements _quantity_columns with NumPy arithmetic over the
+    same module-level TierTable coefficients its scalar calculate_quantities
+    reads, following the same operation order, rounding and tier rules.
+    """
+
+    # Keyword inputs calculate_quantities reads besides square_footage and tier.
+    # Estimators override this so callers (e.g. the quantity cache) can ignore
+    # unrelated project fields; None means any kwarg may affect the result.
+    QUANTITY_INPUTS = None
+
+    def calculate_quantities_batch(self, square_footage, tier_codes, **counts) -> Dict[str, np.ndarray]:
+        """
+        Calculate quantities for many rows at once
+
+        Args:
+            square_footage: 1-D array of square footage
+            tier_codes: 1-D array of tier codes (see encode_tiers), same length
+            **counts: Optional arrays or scalars for the estimator's QUANTITY_INPUTS;
+                anything else is ignored, as calculate_quantities ignores it
+
+        Returns:
+            Dict of quantity name to an array with one entry per row, in the order
+            the scalar path produces them. Integer quantities are int64 arrays.
+            Rows that do not produce a quantity are masked (numpy.ma).
+        """
+        square_footage, integral = _square_footage_column(square_footage)
+        tier_codes = np.asarray(tier_codes, dtype=np.int64).reshape(-1)
+        rows = len(square_footage)
+
+        if len(tier_codes) != rows:
+            raise ValueError(f"Got {len(tier_codes)} tier codes for {rows} rows")
+        if rows and (tier_codes.min() < 0 or tier_codes.max() >= len(TIER_NAMES)):
+            raise ValueError(f"Tier codes must be between 0 and {len(TIER_NAMES) - 1}")
+
+        accepted = BATCH_COUNT_FIELDS if self.QUANTITY_INPUTS is None else self.QUANTITY_INPUTS
+        ignored = sorted(set(counts) - set(accepted))
+        if ignored:
+            logger.debug(f"{type(self).__name__} ignores batch inputs: {', '.join(ignored)}")
+
+        if rows == 0:
+            return {}
+
+        batch = BatchRows(
+            square_footage, integral, tier_codes,
+            {name: _count_column(values, rows) for name, values in counts.items() if name in accepted}
+        )
+        with np.errstate(divide='ignore', invalid='ignore'):
+            columns = self._quantity_columns(batch)
+
+        # calculate_quantities returns nothing for zero square footage
+        present = square_footage != 0
+        columns = {key: mask_rows(column, present) for key, column in columns.items()}
+        return {key: column for key, column in columns.items() if not np.ma.getmaskarray(column).all()}
+
+    def _quantity_columns(self, rows: BatchRows) -> Dict[str, np.ndarray]:
+        """Quantity columns for every row; estimators override this"""
+        raise NotImplementedError(f"{type(self).__name__} has no batch quantity rules")
@@ -1,10 +1,38 @@
 import logging
+import numpy as np
+from src.estimators.batch import BatchQuantitiesMixin, TierTable, LUXURY, round1, mixed
 
 logger = logging.getLogger(__name__)
 
-class CabinetryEstimator:
+# Tier coefficients (Premium, Luxury, Ultra-Luxury)
+# Kitchen base amounts (linear feet)
+BASE_CABINET_BASE = TierTable(22, 28, 34)
+WALL_CABINET_BASE = TierTable(18, 24, 30)
+ISLAND_BASE = TierTable(8, 10, 14)
+FULL_HEIGHT_BASE = TierTable(6, 8, 12)
+# Bathroom base amounts (linear feet per bathroom)
+PRIMARY_BATH_BASE = TierTable(8, 10, 14)
+SECONDARY_BATH_BASE = TierTable(3, 4, 5)
+POWDER_ROOM = TierTable(2, 2.5, 3)
+# Specialty cabinetry (linear feet), only for luxury tiers
+SPECIALTY_CABINETRY = {
+    # Home office cabinetry
+    "office_cabinetry_lf": TierTable(None, 6, 10),
+    # Butler's pantry/bar cabinetry
+    "butlers_pantry_lf": TierTable(None, 8, 15),
+    # Media room cabinetry
+    "media_room_cabinetry_lf": TierTable(None, None, 8)
+}
+
+class CabinetryEstimator(BatchQuantitiesMixin):
     """Handles cabinetry quantity calculations"""
     
+    QUANTITY_INPUTS = (
+        'primary_bath_count',
+        'secondary_bath_count',
+        'powder_room_count',
+    )
+    
     def __init__(self, config=None):
         """Initialize with optional configuration"""
         self.config = config or {}
@@ -40,41 +68,16 @@ class CabinetryEstimator:
         
     def _calculate_kitchen_cabinetry(self, square_footage, tier):
         """Calculate kitchen cabinetry quantities"""
-        # Base amounts by tier (linear feet)
-        base_cabinet_base = {
-            "Premium": 22,
-            "Luxury": 28,
-            "Ultra-Luxury": 34
-        }
-        
-        wall_cabinet_base = {
-            "Premium": 18,
-            "Luxury": 24,
-            "Ultra-Luxury": 30
-        }
-        
-        island_base = {
-            "Premium": 8,
-            "Luxury": 10,
-            "Ultra-Luxury": 14
-        }
-        
-        full_height_base = {
-            "Premium": 6,
-            "Luxury": 8,
-            "Ultra-Luxury": 12
-        }
-        
         # Additional amount per 1000 SF above 4000 SF
         additional_per_1000_sf = 0  # Initialize
         if square_footage > 4000:
             additional_per_1000_sf = (square_footage - 4000) / 1000
         
         # Calculate cabinetry quantities
-        base_cabinets = base_cabinet_base[tier] + (6 * additional_per_1000_sf)
-        wall_cabinets = wall_cabinet_base[tier] + (5 * additional_per_1000_sf)
-        island_cabinets = island_base[tier] + (3 * additional_per_1000_sf)
-        full_height_cabinets = full_height_base[tier] + (2 * additional_per_1000_sf)
+        base_cabinets = BASE_CABINET_BASE[tier] + (6 * additional_per_1000_sf)
+        wall_cabinets = WALL_CABINET_BASE[tier] + (5 * additional_per_1000_sf)
+        island_cabinets = ISLAND_BASE[tier] + (3 * additional_per_1000_sf)
+        full_height_cabinets = FULL_HEIGHT_BASE[tier] + (2 * additional_per_1000_sf)
         
         return {
             "kitchen_base_cabinets_lf": round(base_cabinets, 1),
@@ -86,34 +89,15 @@ class CabinetryEstimator:
     def _calculate_bathroom_cabinetry(self, square_footage, tier, 
                                      primary_bath_count, secondary_bath_count, powder_room_count):
         """Calculate bathroom cabinetry quantities"""
-        # Base amounts by tier (linear feet per bathroom)
-        primary_bath_base = {
-            "Premium": 8,
-            "Luxury": 10,
-            "Ultra-Luxury": 14
-        }
-        
-        secondary_bath_base = {
-            "Premium": 3,
-            "Luxury": 4,
-            "Ultra-Luxury": 5
-        }
-        
-        powder_room = {
-            "Premium": 2,
-            "Luxury": 2.5,
-            "Ultra-Luxury": 3
-        }
-        
         # Additional amount per 1000 SF above 4000 SF
         additional_per_1000_sf = 0  # Initialize
         if square_footage > 4000:
             additional_per_1000_sf = (square_footage - 4000) / 1000
         
         # Calculate cabinetry quantities
-        primary_bath_vanity = primary_bath_count * (primary_bath_base[tier] + (2 * additional_per_1000_sf))
-        secondary_bath_vanity = secondary_bath_count * (secondary_bath_base[tier] + (0.5 * additional_per_1000_sf))
-        powder_room_vanity = powder_room_count * powder_room[tier]
+        primary_bath_vanity = primary_bath_count * (PRIMARY_BATH_BASE[tier] + (2 * additional_per_1000_sf))
+        secondary_bath_vanity = secondary_bath_count * (SECONDARY_BATH_BASE[tier] + (0.5 * additional_per_1000_sf))
+        powder_room_vanity = powder_room_count * POWDER_ROOM[tier]
         
         return {
             "primary_bath_vanity_lf": round(primary_bath_vanity, 1),
@@ -125,18 +109,10 @@ class CabinetryEstimator:
         """Calculate specialty cabinetry quantities"""
         result = {}
         
-        # Only calculate specialty cabinetry for luxury tiers
-        if tier in ["Luxury", "Ultra-Luxury"]:
-            # Home office cabinetry
-            result["office_cabinetry_lf"] = round(tier == "Luxury" and 6 or 10, 1)
-            
-            # Butler's pantry/bar cabinetry
-            butlers_pantry = tier == "Luxury" and 8 or 15
-            result["butlers_pantry_lf"] = round(butlers_pantry, 1)
-            
-            # Media room cabinetry
-            if tier == "Ultra-Luxury":
-                result["media_room_cabinetry_lf"] = round(8, 1)
+        # Only luxury tiers have specialty cabinetry
+        for item, amount in SPECIALTY_CABINETRY.items():
+            if amount[tier] is not None:
+                result[item] = round(amount[tier], 1)
                 
         return result
         
@@ -175,4 +151,53 @@ class CabinetryEstimator:
             "total_bathroom_cabinets_lf": round(bathroom_total, 1),
             "total_specialty_cabinets_lf": round(specialty_total, 1),
             "total_cabinetry_lf": round(kitchen_total + bathroom_total + specialty_total, 1)
-        }
\ No newline at end of file
+        }
+
+    def _quantity_columns(self, rows):
+        """Batch version of calculate_quantities"""
+        square_footage, tier = rows.square_footage, rows.tier
+        primary_bath_count = rows.count('primary_bath_count', 1)
+        secondary_bath_count = rows.count('secondary_bath_count', 1)
+        powder_room_count = rows.count('powder_room_count', 0)
+
+        # Up to 4000 SF the scalar path does integer arithmetic, so its results stay ints
+        large = square_footage > 4000
+        additional_per_1000_sf = np.where(large, (square_footage - 4000) / 1000, 0)
+
+        kitchen = [
+            round1(BASE_CABINET_BASE[tier] + (6 * additional_per_1000_sf)),
+            round1(WALL_CABINET_BASE[tier] + (5 * additional_per_1000_sf)),
+            round1(ISLAND_BASE[tier] + (3 * additional_per_1000_sf)),
+            round1(FULL_HEIGHT_BASE[tier] + (2 * additional_per_1000_sf))
+        ]
+        primary_integral = ~large & (primary_bath_count.dtype.kind == 'i')
+        powder_integral = (tier != LUXURY) & (powder_room_count.dtype.kind == 'i')
+        bathroom = [
+            round1(primary_bath_count * (PRIMARY_BATH_BASE[tier] + (2 * additional_per_1000_sf))),
+            round1(secondary_bath_count * (SECONDARY_BATH_BASE[tier] + (0.5 * additional_per_1000_sf))),
+            round1(powder_room_count * POWDER_ROOM[tier])
+        ]
+
+        specialty = {item: amount[tier] for item, amount in SPECIALTY_CABINETRY.items()}
+        kitchen_total = kitchen[0] + kitchen[1] + kitchen[2] + kitchen[3]
+        bathroom_total = bathroom[0] + bathroom[1] + bathroom[2]
+        specialty_total = sum(np.ma.filled(column, 0) for column in specialty.values())
+
+        columns = {
+            "kitchen_base_cabinets_lf": mixed(kitchen[0], ~large),
+            "kitchen_wall_cabinets_lf": mixed(kitchen[1], ~large),
+            "kitchen_island_lf": mixed(kitchen[2], ~large),
+            "kitchen_full_height_cabinets_lf": mixed(kitchen[3], ~large),
+            "primary_bath_vanity_lf": mixed(bathroom[0], primary_integral),
+            # 0.5 * additional_per_1000_sf is a float even for small houses
+            "secondary_bath_vanity_lf": bathroom[1],
+            "powder_room_vanity_lf": mixed(bathroom[2], powder_integral)
+        }
+        columns.update(specialty)
+        columns.update({
+            "total_kitchen_cabinets_lf": mixed(round1(kitchen_total), ~large),
+            "total_bathroom_cabinets_lf": round1(bathroom_total),
+            "total_specialty_cabinets_lf": specialty_total,
+            "total_cabinetry_lf": round1(kitchen_total + bathroom_total + specialty_total)
+        })
+        return columns
@@ -1,10 +1,29 @@
 import logging
+import numpy as np
+from src.estimators.batch import BatchQuantitiesMixin, TierTable, LUXURY, ULTRA_LUXURY, rint, mixed, constant, mask_rows
 
 logger = logging.getLogger(__name__)
 
-class CleaningEstimator:
+# Tier coefficients (Premium, Luxury, Ultra-Luxury)
+# Project duration: base months up to the baseline square footage, plus
+# additional months per 1000 SF above it
+BASE_MONTHS = TierTable(8, 10, 12)
+ADDITIONAL_MONTHS_PER_1000SF = TierTable(0.5, 0.6, 0.8)
+BASELINE_SF = TierTable(4000, 6000, 10000)
+# Rough cleanings per month: twice a month, weekly, twice a week
+ROUGH_CLEANING_FREQUENCY = TierTable(2, 4, 8)
+# CY of construction waste per 100 sq ft
+CONSTRUCTION_WASTE_FACTOR = TierTable(0.15, 0.2, 0.25)
+# Final cleaning hours per sq ft
+FINAL_CLEANING_FACTOR = TierTable(0.025, 0.03, 0.04)
+# Window cleaning hours per window
+WINDOW_CLEANING_FACTOR = TierTable(0.5, 0.75, 1.0)
+
+class CleaningEstimator(BatchQuantitiesMixin):
     """Handles cleaning quantity calculations"""
     
+    QUANTITY_INPUTS = ('project_duration_months',)
+    
     def __init__(self, config=None):
         """Initialize with optional configuration"""
         self.config = config or {}
@@ -35,90 +54,42 @@ class CleaningEstimator:
         
     def _estimate_project_duration(self, square_footage, tier):
         """Estimate project duration in months based on square footage and tier"""
-        # Base months for minimum square footage
-        base_months = {
-            "Premium": 8,
-            "Luxury": 10,
-            "Ultra-Luxury": 12
-        }
-        
-        # Additional months per 1000 square feet above baseline
-        additional_months_per_1000sf = {
-            "Premium": 0.5,
-            "Luxury": 0.6,
-            "Ultra-Luxury": 0.8
-        }
-        
-        # Baseline square footage
-        baseline_sf = {
-            "Premium": 4000,
-            "Luxury": 6000,
-            "Ultra-Luxury": 10000
-        }
-        
         # Calculate estimated duration
-        duration = base_months[tier]
-        if square_footage > baseline_sf[tier]:
-            additional_sf = square_footage - baseline_sf[tier]
-            duration += (additional_sf / 1000) * additional_months_per_1000sf[tier]
+        duration = BASE_MONTHS[tier]
+        if square_footage > BASELINE_SF[tier]:
+            additional_sf = square_footage - BASELINE_SF[tier]
+            duration += (additional_sf / 1000) * ADDITIONAL_MONTHS_PER_1000SF[tier]
             
         return round(duration)
         
     def _calculate_rough_cleaning(self, square_footage, tier, project_duration_months):
         """Calculate rough cleaning quantities"""
-        # Rough cleaning frequency per month based on tier
-        rough_cleaning_frequency = {
-            "Premium": 2,    # Twice a month
-            "Luxury": 4,     # Weekly
-            "Ultra-Luxury": 8  # Twice a week
-        }
-        
         # Calculate labor hours per cleaning
         labor_hours_per_cleaning = square_footage / 2000  # Approx 1 hour per 2000 sq ft
         
         # Calculate dumpsters needed for construction waste
-        construction_waste_factor = {
-            "Premium": 0.15,   # CY per 100 sq ft
-            "Luxury": 0.2,
-            "Ultra-Luxury": 0.25
-        }
-        
-        construction_waste_cy = (square_footage / 100) * construction_waste_factor[tier]
+        construction_waste_cy = (square_footage / 100) * CONSTRUCTION_WASTE_FACTOR[tier]
         dumpster_capacity_cy = 20  # Standard 20 CY dumpster
         dumpsters_needed = construction_waste_cy / dumpster_capacity_cy
         
         return {
             "rough_cleaning_sf": square_footage,
-            "rough_cleaning_occurrences": round(rough_cleaning_frequency[tier] * project_duration_months),
-            "rough_cleaning_labor_hours": round(labor_hours_per_cleaning * rough_cleaning_frequency[tier] * project_duration_months),
+            "rough_cleaning_occurrences": round(ROUGH_CLEANING_FREQUENCY[tier] * project_duration_months),
+            "rough_cleaning_labor_hours": round(labor_hours_per_cleaning * ROUGH_CLEANING_FREQUENCY[tier] * project_duration_months),
             "construction_waste_cy": round(construction_waste_cy),
             "construction_dumpsters": round(dumpsters_needed)
         }
         
     def _calculate_final_cleaning(self, square_footage, tier):
         """Calculate final cleaning quantities"""
-        # Final cleaning labor hours based on square footage and tier
-        final_cleaning_factor = {
-            "Premium": 0.025,  # Hours per sq ft
-            "Luxury": 0.03,
-            "Ultra-Luxury": 0.04
-        }
-        
         # Calculate final cleaning labor hours
-        final_cleaning_hours = square_footage * final_cleaning_factor[tier]
+        final_cleaning_hours = square_footage * FINAL_CLEANING_FACTOR[tier]
         
         # Window cleaning based on window count
         # Assume 0.008 windows per sq ft as in other estimators
         window_count = round(square_footage * 0.008)
         
-        # Window cleaning factor based on tier
-        window_cleaning_factor = {
-            "Premium": 0.5,  # Hours per window
-            "Luxury": 0.75,
-            "Ultra-Luxury": 1.0
-        }
-        
-        window_cleaning_hours = window_count * window_cleaning_factor[tier]
+        window_cleaning_hours = window_count * WINDOW_CLEANING_FACTOR[tier]
         
         return {
             "final_cleaning_sf": square_footage,
@@ -164,4 +135,43 @@ class CleaningEstimator:
             # Post-construction air quality management
             result["air_scrubber_days"] = 5
             
-        return result
\ No newline at end of file
+        return result
+
+    def _quantity_columns(self, rows):
+        """Batch version of calculate_quantities"""
+        square_footage, tier = rows.square_footage, rows.tier
+
+        baseline_sf = BASELINE_SF[tier]
+        estimated_duration = rint(np.where(
+            square_footage > baseline_sf,
+            BASE_MONTHS[tier] + ((square_footage - baseline_sf) / 1000) * ADDITIONAL_MONTHS_PER_1000SF[tier],
+            BASE_MONTHS[tier]))
+        project_duration_months = rows.count('project_duration_months', 0)
+        project_duration_months = np.where(project_duration_months == 0, estimated_duration, project_duration_months)
+
+        frequency = ROUGH_CLEANING_FREQUENCY[tier]
+        construction_waste_cy = (square_footage / 100) * CONSTRUCTION_WASTE_FACTOR[tier]
+        window_count = rint(square_footage * 0.008)
+        square_footage_column = mixed(square_footage, rows.integral)
+
+        luxury_tiers = rows.tier_in(LUXURY, ULTRA_LUXURY)
+        ultra = tier == ULTRA_LUXURY
+        return {
+            "rough_cleaning_sf": square_footage_column,
+            "rough_cleaning_occurrences": rint(frequency * project_duration_months),
+            "rough_cleaning_labor_hours": rint(square_footage / 2000 * frequency * project_duration_months),
+            "construction_waste_cy": rint(construction_waste_cy),
+            "construction_dumpsters": rint(construction_waste_cy / 20),
+            "final_cleaning_sf": square_footage_column.copy(),
+            "final_cleaning_labor_hours": rint(square_footage * FINAL_CLEANING_FACTOR[tier]),
+            "window_cleaning_count": window_count,
+            "window_cleaning_labor_hours": rint(window_count * WINDOW_CLEANING_FACTOR[tier]),
+            "floor_cleaning_sf": rint(square_footage * 0.7),
+            "power_washing_sf": rint(square_footage * 0.3),
+            "fixture_cleaning_count": mask_rows(rint(square_footage * 0.002), luxury_tiers),
+            "countertop_sealing_sf": mask_rows(rint(square_footage * 0.04), luxury_tiers),
+            "cabinet_cleaning_lf": mask_rows(rint(square_footage * 0.02), luxury_tiers),
+            "specialty_surface_sf": mask_rows(rint(square_footage * 0.1), ultra),
+            "glass_balustrade_cleaning_sf": mask_rows(rint(square_footage * 0.02), ultra),
+            "air_scrubber_days": mask_rows(constant(5, len(rows)), ultra)
+        }
@@ -1,10 +1,40 @@
 import logging
+import numpy as np
+from src.estimators.batch import BatchQuantitiesMixin, TierTable, PREMIUM, rint, mask_rows
 
 logger = logging.getLogger(__name__)
 
-class CountertopsEstimator:
+# Tier coefficients (Premium, Luxury, Ultra-Luxury)
+# Kitchen base amounts (square feet), the square footage they cover and the
+# additional amount per 1000 SF above it
+KITCHEN_BASE = TierTable(65, 85, 110)
+KITCHEN_BASE_SQ_FT = TierTable(4000, 6000, 10000)
+KITCHEN_ADDITIONAL_PER_1000 = TierTable(10, 12, 15)
+BUTLERS_PANTRY = TierTable(0, 30, 50)
+# Waterfall edges (decorative sides on islands); Premium only above 5000 SF
+WATERFALL_EDGES = TierTable(3, 8, 15)
+# Average SF per bathroom
+PRIMARY_BATH = TierTable(30, 48, 75)
+SECONDARY_BATH = TierTable(14, 18, 25)
+POWDER_ROOM = TierTable(9, 12, 18)
+# Material distribution percentages
+MATERIAL_DISTRIBUTION = {
+    "quartz": TierTable(0.65, 0.45, 0.35),
+    "granite": TierTable(0.25, 0.25, 0.17),
+    "marble": TierTable(0.07, 0.17, 0.25),
+    "quartzite": TierTable(0.03, 0.13, 0.18),
+    "specialty": TierTable(0, 0, 0.05)
+}
+
+class CountertopsEstimator(BatchQuantitiesMixin):
     """Handles countertop quantity calculations"""
     
+    QUANTITY_INPUTS = (
+        'primary_bath_count',
+        'secondary_bath_count',
+        'powder_room_count',
+    )
+    
     def __init__(self, config=None):
         """Initialize with optional configuration"""
         self.config = config or {}
@@ -38,47 +68,18 @@ class CountertopsEstimator:
         
     def _calculate_kitchen_countertops(self, square_footage, tier):
         """Calculate kitchen countertop quantities"""
-        # Base amounts by tier (square feet)
-        kitchen_base = {
-            "Premium": 65,
-            "Luxury": 85,
-            "Ultra-Luxury": 110
-        }
-        
-        # Base square footage threshold by tier
-        base_sq_ft = {
-            "Premium": 4000,
-            "Luxury": 6000,
-            "Ultra-Luxury": 10000
-        }
-        
-        # Additional amount per 1000 SF above threshold
-        additional_per_1000 = {
-            "Premium": 10,
-            "Luxury": 12,
-            "Ultra-Luxury": 15
-        }
-        
         # Calculate countertop area
-        kitchen_ct = kitchen_base[tier]
-        if square_footage > base_sq_ft[tier]:
-            kitchen_ct += ((square_footage - base_sq_ft[tier]) / 1000) * additional_per_1000[tier]
+        kitchen_ct = KITCHEN_BASE[tier]
+        if square_footage > KITCHEN_BASE_SQ_FT[tier]:
+            kitchen_ct += ((square_footage - KITCHEN_BASE_SQ_FT[tier]) / 1000) * KITCHEN_ADDITIONAL_PER_1000[tier]
             
         # Butler's pantry countertops for luxury tiers
-        butlers_pantry = 0
-        if tier == "Luxury":
-            butlers_pantry = 30
-        elif tier == "Ultra-Luxury":
-            butlers_pantry = 50
+        butlers_pantry = BUTLERS_PANTRY[tier]
             
         # Waterfall edges (decorative sides on islands)
-        waterfall_edges = 0
-        if tier == "Premium":
-            waterfall_edges = 3 if square_footage > 5000 else 0
-        elif tier == "Luxury":
-            waterfall_edges = 8
-        elif tier == "Ultra-Luxury":
-            waterfall_edges = 15
+        waterfall_edges = WATERFALL_EDGES[tier]
+        if tier == "Premium" and square_footage <= 5000:
+            waterfall_edges = 0
             
         return {
             "kitchen_countertops_sf": round(kitchen_ct),
@@ -89,29 +90,10 @@ class CountertopsEstimator:
     def _calculate_bathroom_countertops(self, tier, primary_bath_count, 
                                       secondary_bath_count, powder_room_count):
         """Calculate bathroom countertop quantities"""
-        # Average SF per bathroom by tier
-        primary_bath = {
-            "Premium": 30,
-            "Luxury": 48,
-            "Ultra-Luxury": 75
-        }
-        
-        secondary_bath = {
-            "Premium": 14,
-            "Luxury": 18,
-            "Ultra-Luxury": 25
-        }
-        
-        powder_room = {
-            "Premium": 9,
-            "Luxury": 12,
-            "Ultra-Luxury": 18
-        }
-        
         # Calculate countertop areas
-        primary_bath_ct = primary_bath_count * primary_bath[tier]
-        secondary_bath_ct = secondary_bath_count * secondary_bath[tier]
-        powder_room_ct = powder_room_count * powder_room[tier]
+        primary_bath_ct = primary_bath_count * PRIMARY_BATH[tier]
+        secondary_bath_ct = secondary_bath_count * SECONDARY_BATH[tier]
+        powder_room_ct = powder_room_count * POWDER_ROOM[tier]
         
         return {
             "primary_bath_countertops_sf": round(primary_bath_ct),
@@ -121,31 +103,6 @@ class CountertopsEstimator:
         
     def _calculate_material_distribution(self, tier, countertop_data):
         """Calculate distribution of countertop materials"""
-        # Material distribution percentages by tier
-        material_dist = {
-            "Premium": {
-                "quartz": 0.65,
-                "granite": 0.25,
-                "marble": 0.07,
-                "quartzite": 0.03,
-                "specialty": 0
-            },
-            "Luxury": {
-                "quartz": 0.45,
-                "granite": 0.25,
-                "marble": 0.17,
-                "quartzite": 0.13,
-                "specialty": 0
-            },
-            "Ultra-Luxury": {
-                "quartz": 0.35,
-                "granite": 0.17,
-                "marble": 0.25,
-                "quartzite": 0.18,
-                "specialty": 0.05
-            }
-        }
-        
         # Calculate total countertop area
         total_sf = (
             countertop_data.get("kitchen_countertops_sf", 0) +
@@ -157,7 +114,8 @@ class CountertopsEstimator:
         
         # Calculate material breakdown
         result = {}
-        for material, percentage in material_dist[tier].items():
+        for material, percentage in MATERIAL_DISTRIBUTION.items():
+            percentage = percentage[tier]
             if percentage > 0:
                 result[f"{material}_countertops_sf"] = round(total_sf * percentage)
                 
@@ -182,4 +140,42 @@ class CountertopsEstimator:
             "total_kitchen_countertops_sf": round(kitchen_total),
             "total_bathroom_countertops_sf": round(bathroom_total),
             "total_countertops_sf": round(kitchen_total + bathroom_total)
-        }
\ No newline at end of file
+        }
+
+    def _quantity_columns(self, rows):
+        """Batch version of calculate_quantities"""
+        square_footage, tier = rows.square_footage, rows.tier
+
+        base_sq_ft = KITCHEN_BASE_SQ_FT[tier]
+        kitchen_ct = np.where(
+            square_footage > base_sq_ft,
+            KITCHEN_BASE[tier] + ((square_footage - base_sq_ft) / 1000) * KITCHEN_ADDITIONAL_PER_1000[tier],
+            KITCHEN_BASE[tier])
+        waterfall_edges = np.where((tier == PREMIUM) & (square_footage <= 5000), 0, WATERFALL_EDGES[tier])
+
+        columns = {
+            "kitchen_countertops_sf": rint(kitchen_ct),
+            "butlers_pantry_countertops_sf": BUTLERS_PANTRY[tier],
+            "waterfall_edges_lf": waterfall_edges,
+            "primary_bath_countertops_sf": rint(rows.count('primary_bath_count', 1) * PRIMARY_BATH[tier]),
+            "secondary_bath_countertops_sf": rint(rows.count('secondary_bath_count', 1) * SECONDARY_BATH[tier]),
+            "powder_room_countertops_sf": rint(rows.count('powder_room_count', 0) * POWDER_ROOM[tier])
+        }
+
+        kitchen_total = columns["kitchen_countertops_sf"] + columns["butlers_pantry_countertops_sf"]
+        bathroom_total = (
+            columns["primary_bath_countertops_sf"] +
+            columns["secondary_bath_countertops_sf"] +
+            columns["powder_room_countertops_sf"]
+        )
+        total_sf = kitchen_total + bathroom_total
+        for material, percentage in MATERIAL_DISTRIBUTION.items():
+            percentage = percentage[tier]
+            columns[f"{material}_countertops_sf"] = mask_rows(rint(total_sf * percentage), percentage > 0)
+
+        columns.update({
+            "total_kitchen_countertops_sf": kitchen_total,
+            "total_bathroom_countertops_sf": bathroom_total,
+            "total_countertops_sf": kitchen_total + bathroom_total
+        })
+        return columns
@@ -1,10 +1,29 @@
 import logging
+from src.estimators.batch import BatchQuantitiesMixin, TierTable, rint
 
 logger = logging.getLogger(__name__)
 
-class DrywallInteriorEstimator:
+# Tier coefficients (Premium, Luxury, Ultra-Luxury)
+# Drywall SF per SF of house
+DRYWALL_FACTOR = TierTable(2.8, 3.1, 3.5)
+CEILING_HEIGHT = TierTable(9, 10, 12)
+# Specialty drywall (moisture resistant, etc.)
+SPECIALTY_DRYWALL_PCT = TierTable(0.05, 0.1, 0.2)
+# Specialty ceiling percentages; None where the tier has no such ceiling
+SPECIALTY_CEILING_PCT = {
+    "coffered": TierTable(0, 0.07, 0.15),
+    "tray": TierTable(0.05, 0.15, 0.25),
+    "specialty": TierTable(None, None, 0.1)
+}
+# Accessory linear feet per SF of house
+CORNER_BEAD_FACTOR = TierTable(0.08, 0.12, 0.16)
+CONTROL_JOINT_FACTOR = TierTable(0.02, 0.04, 0.06)
+
+class DrywallInteriorEstimator(BatchQuantitiesMixin):
     """Handles drywall and interior finish quantity calculations"""
     
+    QUANTITY_INPUTS = ()
+    
     def __init__(self, config=None):
         """Initialize with optional configuration"""
         self.config = config or {}
@@ -29,101 +48,70 @@ class DrywallInteriorEstimator:
         
     def _calculate_drywall(self, square_footage, tier):
         """Calculate drywall quantities"""
-        # Drywall SF per SF of house
-        drywall_factor = {
-            "Premium": 2.8,
-            "Luxury": 3.1,
-            "Ultra-Luxury": 3.5
-        }
-        
-        # Ceiling height by tier
-        ceiling_height = {
-            "Premium": 9,
-            "Luxury": 10,
-            "Ultra-Luxury": 12
-        }
-        
         # Calculate drywall area and breakdown
-        drywall_area = square_footage * drywall_factor[tier]
+        drywall_area = square_footage * DRYWALL_FACTOR[tier]
         
         # Calculate specialty drywall (moisture resistant, etc.)
-        specialty_drywall_pct = {
-            "Premium": 0.05,
-            "Luxury": 0.1,
-            "Ultra-Luxury": 0.2
-        }
-        
-        specialty_drywall = drywall_area * specialty_drywall_pct[tier]
+        specialty_drywall = drywall_area * SPECIALTY_DRYWALL_PCT[tier]
         
         return {
             "drywall_area_sf": round(drywall_area),
-            "ceiling_height_ft": ceiling_height[tier],
+            "ceiling_height_ft": CEILING_HEIGHT[tier],
             "smooth_area_sf": round(drywall_area - specialty_drywall),
             "specialty_drywall_sf": round(specialty_drywall)
         }
         
     def _calculate_ceiling_finishes(self, square_footage, tier):
         """Calculate ceiling finish quantities"""
-        # Specialty ceiling percentages by tier
-        specialty_ceiling_pct = {
-            "Premium": {
-                "coffered": 0,
-                "tray": 0.05
-            },
-            "Luxury": {
-                "coffered": 0.07,
-                "tray": 0.15
-            },
-            "Ultra-Luxury": {
-                "coffered": 0.15,
-                "tray": 0.25,
-                "specialty": 0.1
-            }
-        }
-        
         result = {}
         
         # Calculate specialty ceiling areas
-        for ceiling_type, pct in specialty_ceiling_pct[tier].items():
-            result[f"{ceiling_type}_ceiling_sf"] = round(square_footage * pct)
+        for ceiling_type, pct in SPECIALTY_CEILING_PCT.items():
+            if pct[tier] is not None:
+                result[f"{ceiling_type}_ceiling_sf"] = round(square_footage * pct[tier])
             
         return result
         
     def _calculate_accessories(self, square_footage, tier):
         """Calculate drywall accessory quantities"""
-        # Corner bead linear feet per SF of house
-        corner_bead_factor = {
-            "Premium": 0.08,
-            "Luxury": 0.12,
-            "Ultra-Luxury": 0.16
-        }
-        
-        # Control joint linear feet per SF of house
-        control_joint_factor = {
-            "Premium": 0.02,
-            "Luxury": 0.04,
-            "Ultra-Luxury": 0.06
-        }
-        
         # Calculate accessories
-        corner_bead = square_footage * corner_bead_factor[tier]
-        control_joint = square_footage * control_joint_factor[tier]
+        corner_bead = square_footage * CORNER_BEAD_FACTOR[tier]
+        control_joint = square_footage * CONTROL_JOINT_FACTOR[tier]
         
         # Calculate mud and tape
         mud_coverage = 300  # SF per gallon
-        drywall_factor = {
-            "Premium": 2.8,
-            "Luxury": 3.1,
-            "Ultra-Luxury": 3.5
-        }
-        mud_gallons = (square_footage * drywall_factor[tier]) / mud_coverage
+        mud_gallons = (square_footage * DRYWALL_FACTOR[tier]) / mud_coverage
         
         tape_lf_per_sf = 0.15
-        tape_length = square_footage * drywall_factor[tier] * tape_lf_per_sf
+        tape_length = square_footage * DRYWALL_FACTOR[tier] * tape_lf_per_sf
         
         return {
             "corner_bead_lf": round(corner_bead),
             "control_joint_lf": round(control_joint),
             "drywall_mud_gallons": round(mud_gallons),
             "drywall_tape_lf": round(tape_length)
-        }
\ No newline at end of file
+        }
+
+    def _quantity_columns(self, rows):
+        """Batch version of calculate_quantities"""
+        square_footage, tier = rows.square_footage, rows.tier
+
+        drywall_factor = DRYWALL_FACTOR[tier]
+        drywall_area = square_footage * drywall_factor
+        specialty_drywall = drywall_area * SPECIALTY_DRYWALL_PCT[tier]
+
+        columns = {
+            "drywall_area_sf": rint(drywall_area),
+            "ceiling_height_ft": CEILING_HEIGHT[tier],
+            "smooth_area_sf": rint(drywall_area - specialty_drywall),
+            "specialty_drywall_sf": rint(specialty_drywall)
+        }
+        for ceiling_type, pct in SPECIALTY_CEILING_PCT.items():
+            columns[f"{ceiling_type}_ceiling_sf"] = rint(square_footage * pct[tier])
+        columns.update({
+            "corner_bead_lf": rint(square_footage * CORNER_BEAD_FACTOR[tier]),
+            "control_joint_lf": rint(square_footage * CONTROL_JOINT_FACTOR[tier]),
+            "drywall_mud_gallons": rint((square_footage * drywall_factor) / 300),
+            "drywall_tape_lf": rint(square_footage * drywall_factor * 0.15)
+        })
+        return columns
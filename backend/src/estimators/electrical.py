@@ -1,11 +1,89 @@
 # src/estimators/electrical.py
 import logging
+import numpy as np
+from src.estimators.batch import BatchQuantitiesMixin, TierTable, TIER_NAMES, PREMIUM, LUXURY, rint, constant
+from src.utils.events import events
 
 logger = logging.getLogger(__name__)
 
-class ElectricalEstimator:
+# Electrical service levels by tier, selected on square footage
+SERVICE_LEVELS = {
+    "Premium": [
+        {"min_sf": 0, "max_sf": 4000, "main_panel_size": 200, "electrical_service_name": "Electrical New 200 Amp Service"},
+        {"min_sf": 4001, "max_sf": 6500, "main_panel_size": 400, "electrical_service_name": "Electrical New 400 Amp Service"},
+        {"min_sf": 6501, "max_sf": float('inf'), "main_panel_size": 600, "electrical_service_name": "Electrical New 600 Amp Service"}
+    ],
+    "Luxury": [
+        {"min_sf": 0, "max_sf": 5000, "main_panel_size": 200, "electrical_service_name": "Electrical New 200 Amp Service"},
+        {"min_sf": 5001, "max_sf": 8000, "main_panel_size": 400, "electrical_service_name": "Electrical New 400 Amp Service"},
+        {"min_sf": 8001, "max_sf": float('inf'), "main_panel_size": 600, "electrical_service_name": "Electrical New 600 Amp Service"}
+    ],
+    "Ultra-Luxury": [
+        {"min_sf": 0, "max_sf": 6000, "main_panel_size": 400, "electrical_service_name": "Electrical New 400 Amp Service"},
+        {"min_sf": 6001, "max_sf": float('inf'), "main_panel_size": 600, "electrical_service_name": "Electrical New 600 Amp Service"}
+    ]
+}
+
+def service_level_keys():
+    """Every (main_panel_size, electrical_service_name) pair _calculate_distribution can emit"""
+    return sorted({
+        (service["main_panel_size"], service["electrical_service_name"])
+        for levels in SERVICE_LEVELS.values()
+        for service in levels
+    })
+
+# Tier coefficients (Premium, Luxury, Ultra-Luxury); None marks tiers without the quantity
+OUTLET_SWITCH_COEFFICIENTS = {
+    "standard_outlets": TierTable(0.020, 0.022, 0.025),
+    "gfci_outlets": TierTable(0.004, 0.005, 0.006),
+    "usb_outlets": TierTable(0.001, 0.003, 0.005),
+    "floor_outlets": TierTable(0.001, 0.002, 0.004),
+    "single_pole_switches": TierTable(0.014, 0.015, 0.016),
+    "three_way_switches": TierTable(0.005, 0.006, 0.008),
+    "dimmer_switches": TierTable(0.005, 0.007, 0.01),
+    "smart_switches": TierTable(0.001, 0.003, 0.007),
+    # Total outlets and switches for summary
+    "total_outlets_switches": TierTable(0.06, 0.07, 0.08)
+}
+LIGHTING_COEFFICIENTS = {
+    "recessed_lights": TierTable(0.014, 0.015, 0.018),
+    "pendants": TierTable(0.001, 0.0013, 0.002),
+    "chandeliers": TierTable(0.0005, 0.001, 0.0015),
+    "under_cabinet_lights": TierTable(0.008, 0.01, 0.012),
+    "toe_kick_lights": TierTable(0, 0.005, 0.01),
+    "closet_lights": TierTable(0.002, 0.003, 0.005),
+    # Total light fixtures for summary
+    "total_light_fixtures": TierTable(0.03, 0.035, 0.045)
+}
+SPECIALTY_COEFFICIENTS = {
+    "total_specialty_systems": TierTable(0.005, 0.008, 0.012),
+    # Detailed breakdown for luxury tiers
+    "lighting_control_panels": TierTable(None, 0.0002, 0.0005),
+    "audio_visual_drops": TierTable(None, 0.002, 0.003),
+    "security_system_components": TierTable(None, 0.001, 0.002)
+}
+CIRCUIT_TIER_MULTIPLIER = TierTable(1.0, 1.2, 1.5)
+# Optional additional circuits based on tier
+ADDITIONAL_CIRCUITS = {
+    "exterior_lighting_circuits": TierTable(1, 2, 3),
+    "garage_circuits": TierTable(1, 2, 3),
+    "emergency_circuits": TierTable(1, 1, 2),
+    "audio_visual_circuits": TierTable(None, 2, 4),
+    "home_office_circuits": TierTable(None, 1, 2),
+    "security_system_circuits": TierTable(None, 1, 2),
+    "pool_spa_circuits": TierTable(None, None, 3),
+    "outdoor_kitchen_circuits": TierTable(None, None, 2),
+    "smart_home_circuits": TierTable(None, None, 2),
+    "wine_room_circuits": TierTable(None, None, 1),
+    "heated_flooring_circuits": TierTable(None, None, 2)
+}
+ROMEX_PER_SF = TierTable(2.5, 3.0, 3.5)
+
+class ElectricalEstimator(BatchQuantitiesMixin):
     """Handles electrical quantity calculations with standardized units"""
     
+    QUANTITY_INPUTS = ()
+    
     def __init__(self, config=None):
         """Initialize with optional configuration"""
         self.config = config or {}
@@ -43,8 +121,7 @@ class ElectricalEstimator:
     
     def calculate_quantities(self, square_footage, tier, **kwargs):
         """Calculate electrical quantities with standardized units"""
-        logger.info(f"Calculating electrical quantities for {square_footage} sq ft, tier: {tier}")
-        print(f"Calculating electrical quantities for {square_footage} sq ft, tier: {tier}")
+        events.trace('electrical.calculate', square_footage=square_footage, tier=tier)
 
         if not square_footage:
             return {}
@@ -67,160 +144,41 @@ class ElectricalEstimator:
         results["units"] = {key: self.standard_units.get(key, "EA") for key in results.keys() 
                             if key != "units"}
         
-        logger.info(f"Calculated quantities: {results}")
-        print(f"Calculated quantities: {results}")
+        events.trace('electrical.quantities', square_footage=square_footage, tier=tier, quantities=results)
 
         return results
         
     def _calculate_outlets_switches(self, square_footage, tier):
         """Calculate outlet and switch quantities"""
-        # Define coefficients for each tier
-        coefficients = {
-            "Premium": {
-                "standard_outlets": 0.020,
-                "gfci_outlets": 0.004,
-                "usb_outlets": 0.001,
-                "floor_outlets": 0.001,
-                "single_pole_switches": 0.014,
-                "three_way_switches": 0.005,
-                "dimmer_switches": 0.005,
-                "smart_switches": 0.001
-            },
-            "Luxury": {
-                "standard_outlets": 0.022,
-                "gfci_outlets": 0.005,
-                "usb_outlets": 0.003,
-                "floor_outlets": 0.002,
-                "single_pole_switches": 0.015,
-                "three_way_switches": 0.006,
-                "dimmer_switches": 0.007,
-                "smart_switches": 0.003
-            },
-            "Ultra-Luxury": {
-                "standard_outlets": 0.025,
-                "gfci_outlets": 0.006,
-                "usb_outlets": 0.005,
-                "floor_outlets": 0.004,
-                "single_pole_switches": 0.016,
-                "three_way_switches": 0.008,
-                "dimmer_switches": 0.01,
-                "smart_switches": 0.007
-            }
-        }
-        
-        result = {}
-        for item, coefficient in coefficients[tier].items():
-            result[item] = round(square_footage * coefficient)
-            
-        # Calculate total outlets and switches for summary
-        result["total_outlets_switches"] = round(square_footage * {
-            "Premium": 0.06, 
-            "Luxury": 0.07, 
-            "Ultra-Luxury": 0.08
-        }[tier])
-        
-        return result
+        return self._apply_coefficients(OUTLET_SWITCH_COEFFICIENTS, square_footage, tier)
         
     def _calculate_lighting(self, square_footage, tier):
         """Calculate lighting quantities"""
-        # Define coefficients for each tier
-        coefficients = {
-            "Premium": {
-                "recessed_lights": 0.014,
-                "pendants": 0.001,
-                "chandeliers": 0.0005,
-                "under_cabinet_lights": 0.008,
-                "toe_kick_lights": 0,
-                "closet_lights": 0.002
-            },
-            "Luxury": {
-                "recessed_lights": 0.015,
-                "pendants": 0.0013,
-                "chandeliers": 0.001,
-                "under_cabinet_lights": 0.01,
-                "toe_kick_lights": 0.005,
-                "closet_lights": 0.003
-            },
-            "Ultra-Luxury": {
-                "recessed_lights": 0.018,
-                "pendants": 0.002,
-                "chandeliers": 0.0015,
-                "under_cabinet_lights": 0.012,
-                "toe_kick_lights": 0.01,
-                "closet_lights": 0.005
-            }
-        }
-        
-        result = {}
-        for item, coefficient in coefficients[tier].items():
-            result[item] = round(square_footage * coefficient)
-            
-        # Calculate total light fixtures for summary
-        result["total_light_fixtures"] = round(square_footage * {
-            "Premium": 0.03, 
-            "Luxury": 0.035, 
-            "Ultra-Luxury": 0.045
-        }[tier])
-        
-        return result
+        return self._apply_coefficients(LIGHTING_COEFFICIENTS, square_footage, tier)
         
     def _calculate_specialty_systems(self, square_footage, tier):
         """Calculate specialty electrical systems"""
-        # Simplified specialty systems calculation
-        specialty_systems = round(square_footage * {
-            "Premium": 0.005, 
-            "Luxury": 0.008, 
-            "Ultra-Luxury": 0.012
-        }[tier])
-        
-        # Detailed breakdown for luxury tiers
-        result = {"total_specialty_systems": specialty_systems}
-        
-        if tier in ["Luxury", "Ultra-Luxury"]:
-            result["lighting_control_panels"] = round(square_footage * {
-                "Luxury": 0.0002, 
-                "Ultra-Luxury": 0.0005
-            }[tier])
-            
-            result["audio_visual_drops"] = round(square_footage * {
-                "Luxury": 0.002, 
-                "Ultra-Luxury": 0.003
-            }[tier])
-            
-            result["security_system_components"] = round(square_footage * {
-                "Luxury": 0.001, 
-                "Ultra-Luxury": 0.002
-            }[tier])
+        return self._apply_coefficients(SPECIALTY_COEFFICIENTS, square_footage, tier)
         
+    @staticmethod
+    def _apply_coefficients(coefficients, square_footage, tier):
+        """Per-SF coefficients times square footage, skipping items the tier doesn't have"""
+        result = {}
+        for item, table in coefficients.items():
+            coefficient = table[tier]
+            if coefficient is not None:
+                result[item] = round(square_footage * coefficient)
         return result
         
     def _calculate_distribution(self, square_footage, tier):
         """Calculate electrical distribution system quantities with dynamic service selection"""
         result = {}
         
-        # Define electrical service levels based on square footage
-        service_levels = {
-            "Premium": [
-                {"min_sf": 0, "max_sf": 4000, "main_panel_size": 200, "electrical_service_name": "Electrical New 200 Amp Service"},
-                {"min_sf": 4001, "max_sf": 6500, "main_panel_size": 400, "electrical_service_name": "Electrical New 400 Amp Service"},
-                {"min_sf": 6501, "max_sf": float('inf'), "main_panel_size": 600, "electrical_service_name": "Electrical New 600 Amp Service"}
-            ],
-            "Luxury": [
-                {"min_sf": 0, "max_sf": 5000, "main_panel_size": 200, "electrical_service_name": "Electrical New 200 Amp Service"},
-                {"min_sf": 5001, "max_sf": 8000, "main_panel_size": 400, "electrical_service_name": "Electrical New 400 Amp Service"},
-                {"min_sf": 8001, "max_sf": float('inf'), "main_panel_size": 600, "electrical_service_name": "Electrical New 600 Amp Service"}
-            ],
-            "Ultra-Luxury": [
-                {"min_sf": 0, "max_sf": 6000, "main_panel_size": 400, "electrical_service_name": "Electrical New 400 Amp Service"},
-                {"min_sf": 6001, "max_sf": float('inf'), "main_panel_size": 600, "electrical_service_name": "Electrical New 600 Amp Service"}
-            ]
-        }
-        
         # Select the appropriate service level
         selected_service = next(
-            (service for service in service_levels[tier] 
+            (service for service in SERVICE_LEVELS[tier] 
              if service['min_sf'] <= square_footage < service['max_sf']), 
-            service_levels[tier][-1]  # Default to the last (largest) service
+            SERVICE_LEVELS[tier][-1]  # Default to the last (largest) service
         )
         
         # Set main panel size and electrical service name
@@ -242,18 +200,12 @@ class ElectricalEstimator:
         outlet_circuits = round(square_footage * 0.005)  # ~5 per 1,000 SF
         mechanical_circuits = round(square_footage * 0.002)  # ~2 per 1,000 SF
         
-        # Tier-based adjustments
-        tier_multiplier = {
-            "Premium": 1.0,
-            "Luxury": 1.2,
-            "Ultra-Luxury": 1.5
-        }
-        
         # Apply tier multipliers to base calculations
-        kitchen_circuits = round(kitchen_circuits * tier_multiplier[tier])
-        lighting_circuits = round(lighting_circuits * tier_multiplier[tier])
-        outlet_circuits = round(outlet_circuits * tier_multiplier[tier])
-        mechanical_circuits = round(mechanical_circuits * tier_multiplier[tier])
+        tier_multiplier = CIRCUIT_TIER_MULTIPLIER[tier]
+        kitchen_circuits = round(kitchen_circuits * tier_multiplier)
+        lighting_circuits = round(lighting_circuits * tier_multiplier)
+        outlet_circuits = round(outlet_circuits * tier_multiplier)
+        mechanical_circuits = round(mechanical_circuits * tier_multiplier)
         
         # Add baseline circuits to results
         result["kitchen_circuits"] = kitchen_circuits
@@ -265,40 +217,10 @@ class ElectricalEstimator:
         baseline_total = kitchen_circuits + lighting_circuits + outlet_circuits + mechanical_circuits
         
         # Optional additional circuits based on tier
-        additional_circuits = {}
-        
-        if tier == "Premium":
-            # Basic additional circuits for Premium tier
-            additional_circuits = {
-                "exterior_lighting_circuits": 1,
-                "garage_circuits": 1,
-                "emergency_circuits": 1
-            }
-        elif tier == "Luxury":
-            # More additional circuits for Luxury tier
-            additional_circuits = {
-                "exterior_lighting_circuits": 2,
-                "garage_circuits": 2,
-                "emergency_circuits": 1,
-                "audio_visual_circuits": 2,
-                "home_office_circuits": 1,
-                "security_system_circuits": 1
-            }
-        else:  # Ultra-Luxury
-            # Maximum additional circuits for Ultra-Luxury tier
-            additional_circuits = {
-                "exterior_lighting_circuits": 3,
-                "garage_circuits": 3,
-                "emergency_circuits": 2,
-                "audio_visual_circuits": 4,
-                "home_office_circuits": 2,
-                "security_system_circuits": 2,
-                "pool_spa_circuits": 3,
-                "outdoor_kitchen_circuits": 2,
-                "smart_home_circuits": 2,
-                "wine_room_circuits": 1,
-                "heated_flooring_circuits": 2
-            }
+        additional_circuits = {
+            item: circuits[tier] for item, circuits in ADDITIONAL_CIRCUITS.items()
+            if circuits[tier] is not None
+        }
         
         # Add additional circuits to results
         result.update(additional_circuits)
@@ -312,10 +234,79 @@ class ElectricalEstimator:
         result["total_circuits"] = baseline_total + additional_total
         
         # Calculate wiring (simplified calculation)
-        result["romex_lf"] = round(square_footage * {
-            "Premium": 2.5, 
-            "Luxury": 3.0, 
-            "Ultra-Luxury": 3.5
-        }[tier])
+        result["romex_lf"] = round(square_footage * ROMEX_PER_SF[tier])
         
-        return result
\ No newline at end of file
+        return result
+
+    def _service_columns(self, square_footage, tier):
+        """Main panel size and service name of the service level each row selects"""
+        panel_size = np.zeros(len(square_footage), dtype=np.int64)
+        service_name = np.empty(len(square_footage), dtype=object)
+
+        for code, tier_name in enumerate(TIER_NAMES):
+            in_tier = tier == code
+            levels = SERVICE_LEVELS[tier_name]
+            # Rows outside every range fall back to the last (largest) service
+            choice = np.select(
+                [(level['min_sf'] <= square_footage) & (square_footage < level['max_sf']) for level in levels],
+                list(range(len(levels))), len(levels) - 1)
+            for index, level in enumerate(levels):
+                rows = in_tier & (choice == index)
+                panel_size[rows] = level["main_panel_size"]
+                service_name[rows] = level["electrical_service_name"]
+
+        return panel_size, service_name
+
+    def _quantity_columns(self, rows):
+        """Batch version of calculate_quantities"""
+        square_footage, tier = rows.square_footage, rows.tier
+        events.trace('electrical.calculate_batch', rows=len(rows))
+
+        columns = {}
+        for coefficients in (OUTLET_SWITCH_COEFFICIENTS, LIGHTING_COEFFICIENTS, SPECIALTY_COEFFICIENTS):
+            for item, coefficient in coefficients.items():
+                columns[item] = rint(square_footage * coefficient[tier])
+
+        panel_size, service_name = self._service_columns(square_footage, tier)
+        columns["main_panel_size"] = panel_size
+        columns["main_panel_quantity"] = constant(1, len(rows))
+        columns["electrical_service_name"] = service_name
+
+        premium, luxury = tier == PREMIUM, tier == LUXURY
+        columns["sub_panels"] = np.select(
+            [square_footage <= 5000, square_footage <= 8000],
+            [np.where(premium, 0, 1), np.where(premium, 1, 2)],
+            np.where(premium, 2, np.where(luxury, 3, 4)))
+
+        multiplier = CIRCUIT_TIER_MULTIPLIER[tier]
+        baseline = {
+            "kitchen_circuits": rint(rint(square_footage * 0.005) * multiplier),
+            "lighting_circuits": rint(rint(square_footage * 0.004) * multiplier),
+            "outlet_circuits": rint(rint(square_footage * 0.005) * multiplier),
+            "mechanical_circuits": rint(rint(square_footage * 0.002) * multiplier)
+        }
+        columns.update(baseline)
+        baseline_total = sum(baseline.values())
+
+        additional_total = np.zeros(len(rows), dtype=np.int64)
+        for item, circuits in ADDITIONAL_CIRCUITS.items():
+            columns[item] = circuits[tier]
+            additional_total += np.ma.filled(columns[item], 0)
+
+        columns["total_baseline_circuits"] = baseline_total
+        columns["total_additional_circuits"] = additional_total
+        columns["total_circuits"] = baseline_total + additional_total
+        columns["romex_lf"] = rint(square_footage * ROMEX_PER_SF[tier])
+
+        # Which quantities a row has depends only on its tier, so each tier shares one units dict
+        units = np.empty(len(rows), dtype=object)
+        for code in np.unique(tier):
+            in_tier = tier == code
+            first = np.argmax(in_tier)
+            units[in_tier] = [{
+                key: self.standard_units.get(key, "EA") for key, column in columns.items()
+                if not np.ma.getmaskarray(column)[first]
+            }] * int(in_tier.sum())
+        columns["units"] = units
+
+        return columns
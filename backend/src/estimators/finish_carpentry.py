@@ -1,11 +1,46 @@
 import math
 import logging
+import numpy as np
+from src.estimators.batch import BatchQuantitiesMixin, TierTable, PREMIUM, LUXURY, rint
 
 logger = logging.getLogger(__name__)
 
-class FinishCarpentryEstimator:
+# Tier coefficients (Premium, Luxury, Ultra-Luxury)
+# Additional single doors per 1000 SF above 4000 SF
+ADDITIONAL_DOORS_PER_1000 = TierTable(1, 1.5, 2)
+# Double doors; fractions are averages (0.5 = average of 0-1)
+OFFICE_DOUBLE_DOORS = TierTable(0.5, 1, 1)
+DINING_DOUBLE_DOORS = TierTable(0.5, 1, 1)
+PRIMARY_BEDROOM_DOUBLE_DOORS = TierTable(0, 0.5, 1)
+ADDITIONAL_DOUBLE_DOORS_PER_2000 = TierTable(0, 1, 2)
+# Special doors, as averages of the usual ranges
+POCKET_DOORS = TierTable(1.5, 4, 8)
+BARN_DOORS = TierTable(0.5, 2, 4)
+GARAGE_MAN_DOORS = TierTable(1, 1.5, 2.5)
+EXTERIOR_UTILITY_DOORS = TierTable(1.5, 2.5, 4)
+# Baseboard LF per sq ft of house, LF deducted per bathroom and the
+# open concept deduction (percentage)
+BASEBOARD_LF_PER_SQ_FT = TierTable(0.8, 0.9, 1.0)
+BATHROOM_DEDUCTION_LF = TierTable(20, 25, 30)
+OPEN_CONCEPT_ADJUSTMENT = TierTable(0.05, 0.10, 0.15)
+# Share of the house that gets crown molding
+CROWN_MOLDING_FACTOR = TierTable(0.3, 0.6, 0.8)
+# Simplified formula factors
+SIMPLIFIED_SINGLE_DOOR_FACTOR = TierTable(2, 3, 4)
+SIMPLIFIED_DOUBLE_DOOR_FACTOR = TierTable(0.5, 1, 1.5)
+SIMPLIFIED_BASEBOARD_FACTOR = TierTable(0.75, 0.85, 0.95)
+
+class FinishCarpentryEstimator(BatchQuantitiesMixin):
     """Handles finish carpentry quantity calculations"""
     
+    QUANTITY_INPUTS = (
+        'bedroom_count',
+        'bathroom_count',
+        'primary_bath_count',
+        'secondary_bath_count',
+        'powder_room_count',
+    )
+    
     def __init__(self, config=None):
         """Initialize with optional configuration"""
         self.config = config or {}
@@ -61,110 +96,45 @@ class FinishCarpentryEstimator:
         utility_room_doors = 2
         
         # Additional doors beyond base square footage
-        additional_doors_per_1000 = {
-            "Premium": 1,
-            "Luxury": 1.5,
-            "Ultra-Luxury": 2
-        }
-        
         base_sq_ft = 4000
         additional_single_doors = 0
         if square_footage > base_sq_ft:
-            additional_single_doors = ((square_footage - base_sq_ft) / 1000) * additional_doors_per_1000[tier]
+            additional_single_doors = ((square_footage - base_sq_ft) / 1000) * ADDITIONAL_DOORS_PER_1000[tier]
         
         # Calculate total single doors
         single_doors = bedroom_doors + bedroom_closet_doors + bathroom_doors + powder_room_doors + utility_room_doors + additional_single_doors
         
-        # Double doors
-        if tier == "Premium":
-            office_double_doors = 0.5  # Average of 0-1
-            dining_double_doors = 0.5  # Average of 0-1
-            primary_bedroom_double_doors = 0
-            additional_double_doors_per_2000 = 0
-        elif tier == "Luxury":
-            office_double_doors = 1
-            dining_double_doors = 1
-            primary_bedroom_double_doors = 0.5  # Average of 0-1
-            additional_double_doors_per_2000 = 1
-        else:  # Ultra-Luxury
-            office_double_doors = 1
-            dining_double_doors = 1
-            primary_bedroom_double_doors = 1
-            additional_double_doors_per_2000 = 2
-        
         # Additional double doors for larger homes
         additional_double_doors = 0
         if square_footage > base_sq_ft:
-            additional_double_doors = ((square_footage - base_sq_ft) / 2000) * additional_double_doors_per_2000
+            additional_double_doors = ((square_footage - base_sq_ft) / 2000) * ADDITIONAL_DOUBLE_DOORS_PER_2000[tier]
         
         # Calculate total double doors
-        double_doors = office_double_doors + dining_double_doors + primary_bedroom_double_doors + additional_double_doors
-        
-        # Special doors (pocket, barn, etc.)
-        if tier == "Premium":
-            pocket_doors = 1.5  # Average of 1-2
-            barn_doors = 0.5    # Average of 0-1
-            garage_man_doors = 1
-            exterior_utility_doors = 1.5  # Average of 1-2
-        elif tier == "Luxury":
-            pocket_doors = 4     # Average of 3-5
-            barn_doors = 2       # Average of 1-3
-            garage_man_doors = 1.5  # Average of 1-2
-            exterior_utility_doors = 2.5  # Average of 2-3
-        else:  # Ultra-Luxury
-            pocket_doors = 8     # Average of 6-10
-            barn_doors = 4       # Average of 3-5
-            garage_man_doors = 2.5  # Average of 2-3
-            exterior_utility_doors = 4  # Average of 3-5
+        double_doors = (OFFICE_DOUBLE_DOORS[tier] + DINING_DOUBLE_DOORS[tier] +
+                        PRIMARY_BEDROOM_DOUBLE_DOORS[tier] + additional_double_doors)
         
         return {
             "single_doors": round(single_doors),
             "double_doors": round(double_doors),
-            "pocket_doors": round(pocket_doors),
-            "barn_doors": round(barn_doors),
-            "garage_man_doors": round(garage_man_doors),
-            "exterior_utility_doors": round(exterior_utility_doors)
+            # Special doors (pocket, barn, etc.)
+            "pocket_doors": round(POCKET_DOORS[tier]),
+            "barn_doors": round(BARN_DOORS[tier]),
+            "garage_man_doors": round(GARAGE_MAN_DOORS[tier]),
+            "exterior_utility_doors": round(EXTERIOR_UTILITY_DOORS[tier])
         }
         
     def _calculate_trim(self, square_footage, tier, bathroom_count):
         """Calculate trim quantities"""
-        # Baseboard linear feet per sq ft of house
-        baseboard_lf_per_sq_ft = {
-            "Premium": 0.8,
-            "Luxury": 0.9,
-            "Ultra-Luxury": 1.0
-        }
-        
-        # Bathroom deduction (LF per bathroom)
-        bathroom_deduction_lf = {
-            "Premium": 20,
-            "Luxury": 25,
-            "Ultra-Luxury": 30
-        }
-        
-        # Open concept adjustment (percentage)
-        open_concept_adjustment = {
-            "Premium": 0.05,
-            "Luxury": 0.10,
-            "Ultra-Luxury": 0.15
-        }
-        
         # Calculate baseboard linear feet
-        baseboard_lf = square_footage * baseboard_lf_per_sq_ft[tier]
-        bathroom_deduction = bathroom_count * bathroom_deduction_lf[tier]
-        open_concept_deduction = baseboard_lf * open_concept_adjustment[tier]
+        baseboard_lf = square_footage * BASEBOARD_LF_PER_SQ_FT[tier]
+        bathroom_deduction = bathroom_count * BATHROOM_DEDUCTION_LF[tier]
+        open_concept_deduction = baseboard_lf * OPEN_CONCEPT_ADJUSTMENT[tier]
         
         # Calculate final baseboard length
         final_baseboard_lf = baseboard_lf - bathroom_deduction - open_concept_deduction
         
         # Calculate crown molding (typically in main living areas)
-        crown_molding_factor = {
-            "Premium": 0.3,    # 30% of house gets crown molding
-            "Luxury": 0.6,     # 60% of house gets crown molding
-            "Ultra-Luxury": 0.8  # 80% of house gets crown molding
-        }
-        
-        crown_molding_lf = final_baseboard_lf * crown_molding_factor[tier]
+        crown_molding_lf = final_baseboard_lf * CROWN_MOLDING_FACTOR[tier]
         
         # Calculate casing (around doors and windows)
         # Assume 20 LF per door and 16 LF per window
@@ -184,33 +154,69 @@ class FinishCarpentryEstimator:
         
     def _calculate_simplified(self, square_footage, bedroom_count, bathroom_count, powder_room_count, tier):
         """Calculate using simplified formula"""
-        # Door formula factors
-        single_door_factor = {
-            "Premium": 2,
-            "Luxury": 3,
-            "Ultra-Luxury": 4
-        }
-        
-        double_door_factor = {
-            "Premium": 0.5,
-            "Luxury": 1,
-            "Ultra-Luxury": 1.5
-        }
-        
-        # Baseboard formula factor
-        baseboard_factor = {
-            "Premium": 0.75,
-            "Luxury": 0.85,
-            "Ultra-Luxury": 0.95
-        }
-        
         # Calculate using simplified formula
-        simplified_single_doors = (bedroom_count * 2) + (bathroom_count * 1.2) + (square_footage / 1000 * single_door_factor[tier])
-        simplified_double_doors = (square_footage / 3000 * double_door_factor[tier])
-        simplified_baseboard = square_footage * baseboard_factor[tier]
+        simplified_single_doors = (bedroom_count * 2) + (bathroom_count * 1.2) + (square_footage / 1000 * SIMPLIFIED_SINGLE_DOOR_FACTOR[tier])
+        simplified_double_doors = (square_footage / 3000 * SIMPLIFIED_DOUBLE_DOOR_FACTOR[tier])
+        simplified_baseboard = square_footage * SIMPLIFIED_BASEBOARD_FACTOR[tier]
         
         return {
             "simplified_single_doors": round(simplified_single_doors),
             "simplified_double_doors": round(simplified_double_doors),
             "simplified_baseboard_lf": round(simplified_baseboard)
-        }
\ No newline at end of file
+        }
+
+    def _single_door_columns(self, square_footage, tier, bedroom_count, bathroom_count, powder_room_count):
+        """Batch version of the single door count in _calculate_doors"""
+        bedroom_closet_doors = np.select(
+            [tier == PREMIUM, tier == LUXURY], [bedroom_count, rint(bedroom_count * 1.5)], bedroom_count * 2)
+        additional_single_doors = np.where(
+            square_footage > 4000, ((square_footage - 4000) / 1000) * ADDITIONAL_DOORS_PER_1000[tier], 0)
+        return rint(bedroom_count + bedroom_closet_doors + bathroom_count + powder_room_count + 2 +
+                    additional_single_doors)
+
+    def _quantity_columns(self, rows):
+        """Batch version of calculate_quantities"""
+        square_footage, tier = rows.square_footage, rows.tier
+        bedroom_count = rows.count('bedroom_count', 3)
+        if rows.has('bathroom_count'):
+            bathroom_count = rows.count('bathroom_count', 2)
+        else:
+            bathroom_count = rows.count('primary_bath_count', 1) + rows.count('secondary_bath_count', 1)
+        powder_room_count = rows.count('powder_room_count', 0)
+
+        # Doors
+        additional_double_doors = np.where(
+            square_footage > 4000, ((square_footage - 4000) / 2000) * ADDITIONAL_DOUBLE_DOORS_PER_2000[tier], 0)
+        double_doors = (OFFICE_DOUBLE_DOORS[tier] + DINING_DOUBLE_DOORS[tier] +
+                        PRIMARY_BEDROOM_DOUBLE_DOORS[tier] + additional_double_doors)
+
+        # Trim, with casing for a typical 3 bedroom, 2 bath house
+        baseboard_lf = square_footage * BASEBOARD_LF_PER_SQ_FT[tier]
+        final_baseboard_lf = (baseboard_lf - bathroom_count * BATHROOM_DEDUCTION_LF[tier] -
+                              baseboard_lf * OPEN_CONCEPT_ADJUSTMENT[tier])
+        crown_molding_lf = final_baseboard_lf * CROWN_MOLDING_FACTOR[tier]
+        ones = np.ones(len(rows), dtype=np.int64)
+        door_casing_lf = self._single_door_columns(square_footage, tier, 3 * ones, 2 * ones, ones) * 20
+        window_casing_lf = rint(square_footage * 0.008) * 16
+
+        # Simplified formula
+        simplified_single_doors = ((bedroom_count * 2) + (bathroom_count * 1.2) +
+                                   (square_footage / 1000 * SIMPLIFIED_SINGLE_DOOR_FACTOR[tier]))
+
+        return {
+            "single_doors": self._single_door_columns(
+                square_footage, tier, bedroom_count, bathroom_count, powder_room_count),
+            "double_doors": rint(double_doors),
+            "pocket_doors": rint(POCKET_DOORS[tier]),
+            "barn_doors": rint(BARN_DOORS[tier]),
+            "garage_man_doors": rint(GARAGE_MAN_DOORS[tier]),
+            "exterior_utility_doors": rint(EXTERIOR_UTILITY_DOORS[tier]),
+            "baseboard_lf": rint(final_baseboard_lf),
+            "crown_molding_lf": rint(crown_molding_lf),
+            "door_casing_lf": door_casing_lf,
+            "window_casing_lf": window_casing_lf,
+            "total_trim_lf": rint(final_baseboard_lf + crown_molding_lf + door_casing_lf + window_casing_lf),
+            "simplified_single_doors": rint(simplified_single_doors),
+            "simplified_double_doors": rint(square_footage / 3000 * SIMPLIFIED_DOUBLE_DOOR_FACTOR[tier]),
+            "simplified_baseboard_lf": rint(square_footage * SIMPLIFIED_BASEBOARD_FACTOR[tier])
+        }
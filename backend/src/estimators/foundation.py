@@ -1,11 +1,26 @@
 import math
 import logging
+import numpy as np
+from src.estimators.batch import BatchQuantitiesMixin, TierTable, rint
 
 logger = logging.getLogger(__name__)
 
-class FoundationEstimator:
+# Tier-specific parameters (Premium, Luxury, Ultra-Luxury)
+SLAB_THICKNESS_INCHES = TierTable(4, 6, 6)
+FOOTING_WIDTH_INCHES = TierTable(12, 16, 24)
+FOOTING_DEPTH_INCHES = TierTable(18, 24, 30)
+WALL_THICKNESS_INCHES = TierTable(8, 10, 12)
+# Waterproofing factors by tier
+WATERPROOFING_FACTOR = TierTable(0.4, 0.5, 0.6)
+DRAINAGE_FACTOR = TierTable(0.1, 0.15, 0.2)
+ROOF_DRAINAGE_FACTOR = TierTable(0.05, 0.08, 0.1)
+SUMP_PUMPS = TierTable(1, 2, 3)
+
+class FoundationEstimator(BatchQuantitiesMixin):
     """Handles foundation quantity calculations"""
     
+    QUANTITY_INPUTS = ()
+    
     def __init__(self, config=None):
         """Initialize with optional configuration"""
         self.config = config or {}
@@ -30,17 +45,12 @@ class FoundationEstimator:
         foundationFootprint = square_footage * 1.1  # Foundation is typically 10% larger than house footprint
         perimeter = 4 * math.sqrt(foundationFootprint)
         
-        # Tier-specific parameters
-        slab_thickness_inches = {'Premium': 4, 'Luxury': 6, 'Ultra-Luxury': 6}
-        footing_width_inches = {'Premium': 12, 'Luxury': 16, 'Ultra-Luxury': 24}
-        footing_depth_inches = {'Premium': 18, 'Luxury': 24, 'Ultra-Luxury': 30}
-        wall_thickness_inches = {'Premium': 8, 'Luxury': 10, 'Ultra-Luxury': 12}
         wall_height = 1.5  # feet - stem wall height
         
         # Calculate volumes in cubic yards
-        slab_volume = (foundationFootprint * slab_thickness_inches[tier] / 12) / 27
-        footing_volume = (perimeter * (footing_width_inches[tier] / 12) * (footing_depth_inches[tier] / 12)) / 27
-        wall_volume = (perimeter * wall_height * (wall_thickness_inches[tier] / 12)) / 27
+        slab_volume = (foundationFootprint * SLAB_THICKNESS_INCHES[tier] / 12) / 27
+        footing_volume = (perimeter * (FOOTING_WIDTH_INCHES[tier] / 12) * (FOOTING_DEPTH_INCHES[tier] / 12)) / 27
+        wall_volume = (perimeter * wall_height * (WALL_THICKNESS_INCHES[tier] / 12)) / 27
         
         return {
             'slab_square_footage_sf': foundationFootprint,
@@ -52,15 +62,33 @@ class FoundationEstimator:
         
     def _calculate_waterproofing(self, square_footage, tier):
         """Calculate waterproofing quantities"""
-        # Waterproofing factors by tier
-        waterproofing_factor = {'Premium': 0.4, 'Luxury': 0.5, 'Ultra-Luxury': 0.6}
-        drainage_factor = {'Premium': 0.1, 'Luxury': 0.15, 'Ultra-Luxury': 0.2}
-        roof_drainage_factor = {'Premium': 0.05, 'Luxury': 0.08, 'Ultra-Luxury': 0.1}
-        sump_pumps = {'Premium': 1, 'Luxury': 2, 'Ultra-Luxury': 3}
-        
         return {
-            'foundation_waterproofing_sf': round(square_footage * waterproofing_factor[tier]),
-            'below_grade_drainage_lf': round(square_footage * drainage_factor[tier]),
-            'roof_drainage_lf': round(square_footage * roof_drainage_factor[tier]),
-            'sump_pumps': sump_pumps[tier]
-        }
\ No newline at end of file
+            'foundation_waterproofing_sf': round(square_footage * WATERPROOFING_FACTOR[tier]),
+            'below_grade_drainage_lf': round(square_footage * DRAINAGE_FACTOR[tier]),
+            'roof_drainage_lf': round(square_footage * ROOF_DRAINAGE_FACTOR[tier]),
+            'sump_pumps': SUMP_PUMPS[tier]
+        }
+
+    def _quantity_columns(self, rows):
+        """Batch version of calculate_quantities"""
+        square_footage, tier = rows.square_footage, rows.tier
+
+        footprint = square_footage * 1.1
+        perimeter = 4 * np.sqrt(footprint)
+        wall_height = 1.5
+
+        slab_volume = (footprint * SLAB_THICKNESS_INCHES[tier] / 12) / 27
+        footing_volume = (perimeter * (FOOTING_WIDTH_INCHES[tier] / 12) * (FOOTING_DEPTH_INCHES[tier] / 12)) / 27
+        wall_volume = (perimeter * wall_height * (WALL_THICKNESS_INCHES[tier] / 12)) / 27
+
+        return {
+            'slab_square_footage_sf': footprint,
+            'slab_concrete_cy': rint(slab_volume),
+            'footing_concrete_cy': rint(footing_volume),
+            'foundation_wall_cy': rint(wall_volume),
+            'total_concrete_cy': rint(slab_volume + footing_volume + wall_volume),
+            'foundation_waterproofing_sf': rint(square_footage * WATERPROOFING_FACTOR[tier]),
+            'below_grade_drainage_lf': rint(square_footage * DRAINAGE_FACTOR[tier]),
+            'roof_drainage_lf': rint(square_footage * ROOF_DRAINAGE_FACTOR[tier]),
+            'sump_pumps': SUMP_PUMPS[tier]
+        }
@@ -1,11 +1,30 @@
 import math
 import logging
+import numpy as np
+from src.estimators.batch import BatchQuantitiesMixin, TierTable, rint, round1
 
 logger = logging.getLogger(__name__)
 
-class HvacEstimator:
+# Tier coefficients (Premium, Luxury, Ultra-Luxury)
+# Sq ft per ton of cooling
+TONNAGE_FACTORS = TierTable(500, 450, 400)
+# New system every X sq ft
+SYSTEM_FACTORS = TierTable(2000, 1800, 1600)
+# Average zones per system: 1-2, 2-3 and 3-4
+ZONES_PER_SYSTEM = TierTable(1.5, 2.5, 3.5)
+# Duct LF per 100 sq ft
+FLEX_DUCT_FACTORS = TierTable(2.5, 2.8, 3.0)
+HARD_DUCT_FACTORS = TierTable(1.0, 1.2, 1.5)
+# 1 register per X sq ft
+REGISTER_FACTORS = TierTable(125, 110, 100)
+# 1 additional return per X sq ft
+RETURN_FACTORS = TierTable(1000, 850, 700)
+
+class HvacEstimator(BatchQuantitiesMixin):
     """Handles HVAC quantity calculations"""
     
+    QUANTITY_INPUTS = ()
+    
     def __init__(self, config=None):
         """Initialize with optional configuration"""
         self.config = config or {}
@@ -33,31 +52,10 @@ class HvacEstimator:
         
     def _calculate_system_sizing(self, square_footage, tier):
         """Calculate HVAC system sizing"""
-        # Tonnage calculation based on square footage and tier
-        tonnage_factors = {
-            "Premium": 500,    # 1 ton per 500 sq ft
-            "Luxury": 450,     # 1 ton per 450 sq ft
-            "Ultra-Luxury": 400  # 1 ton per 400 sq ft
-        }
-        
-        # System count calculation
-        system_factors = {
-            "Premium": 2000,   # New system every 2000 sq ft
-            "Luxury": 1800,    # New system every 1800 sq ft
-            "Ultra-Luxury": 1600  # New system every 1600 sq ft
-        }
-        
-        # Zones per system vary by tier
-        zones_per_system = {
-            "Premium": 1.5,    # Average 1-2 zone
-            "Luxury": 2.5,     # Average of 2-3 zones
-            "Ultra-Luxury": 3.5  # Average of 3-4 zones
-        }
-        
         # Calculate tonnage, systems and zones
-        tonnage = square_footage / tonnage_factors[tier]
-        systems = math.ceil(square_footage / system_factors[tier])
-        zones = systems * zones_per_system[tier]
+        tonnage = square_footage / TONNAGE_FACTORS[tier]
+        systems = math.ceil(square_footage / SYSTEM_FACTORS[tier])
+        zones = systems * ZONES_PER_SYSTEM[tier]
         
         return {
             "tonnage": round(tonnage, 1),  # Round to 1 decimal place
@@ -67,39 +65,14 @@ class HvacEstimator:
         
     def _calculate_distribution(self, square_footage, tier):
         """Calculate HVAC distribution components"""
-        # Distribution factors by tier
-        flex_duct_factors = {
-            "Premium": 2.5,    # LF per 100 sq ft
-            "Luxury": 2.8,
-            "Ultra-Luxury": 3.0
-        }
-        
-        hard_duct_factors = {
-            "Premium": 1.0,    # LF per 100 sq ft
-            "Luxury": 1.2,
-            "Ultra-Luxury": 1.5
-        }
-        
-        register_factors = {
-            "Premium": 125,    # 1 register per X sq ft
-            "Luxury": 110,
-            "Ultra-Luxury": 100
-        }
-        
-        return_factors = {
-            "Premium": 1000,   # 1 additional return per X sq ft
-            "Luxury": 850,
-            "Ultra-Luxury": 700
-        }
-        
         # Calculate distribution components
-        flex_duct = (square_footage * flex_duct_factors[tier]) / 100
-        hard_duct = (square_footage * hard_duct_factors[tier]) / 100
-        registers = square_footage / register_factors[tier]
+        flex_duct = (square_footage * FLEX_DUCT_FACTORS[tier]) / 100
+        hard_duct = (square_footage * HARD_DUCT_FACTORS[tier]) / 100
+        registers = square_footage / REGISTER_FACTORS[tier]
         
         # Returns are based on zones plus additional returns based on sq ft
         zones = self._calculate_system_sizing(square_footage, tier)["zones"]
-        returns = zones + (square_footage / return_factors[tier])
+        returns = zones + (square_footage / RETURN_FACTORS[tier])
         
         return {
             "flex_duct_linear_feet": round(flex_duct),
@@ -161,15 +134,8 @@ class HvacEstimator:
         Calculate the required HVAC tonnage and determine the optimal combination of 
         2, 3, 4, and 5-ton units for efficient cooling.
         """
-        # Tonnage factors based on tier
-        tonnage_factors = {
-            "Premium": 500,
-            "Luxury": 450,
-            "Ultra-Luxury": 400
-        }
-        
         # Calculate required tonnage (in tons)
-        required_tonnage = square_footage / tonnage_factors[tier]
+        required_tonnage = square_footage / TONNAGE_FACTORS[tier]
         # Round up to ensure capacity meets requirements
         required_tonnage_int = math.ceil(required_tonnage)
         
@@ -180,3 +146,31 @@ class HvacEstimator:
             "required_tonnage": round(required_tonnage, 1),
             "hvac_units": hvac_units
         }
+
+    def _quantity_columns(self, rows):
+        """Batch version of calculate_quantities"""
+        square_footage, tier = rows.square_footage, rows.tier
+
+        tonnage = square_footage / TONNAGE_FACTORS[tier]
+        systems = np.ceil(square_footage / SYSTEM_FACTORS[tier]).astype(np.int64)
+        zones = rint(systems * ZONES_PER_SYSTEM[tier])
+        rounded_tonnage = round1(tonnage)
+
+        # The unit search depends only on whole tons, so run it once per distinct value
+        required_tons = np.ceil(tonnage).astype(np.int64)
+        distinct, inverse = np.unique(required_tons, return_inverse=True)
+        combinations = [self._calculate_unit_combination(int(tons)) for tons in distinct]
+        hvac_units = np.empty(len(rows), dtype=object)
+        hvac_units[:] = [combinations[index] for index in inverse.reshape(-1)]
+
+        return {
+            "tonnage": rounded_tonnage,
+            "systems": systems,
+            "zones": zones,
+            "flex_duct_linear_feet": rint((square_footage * FLEX_DUCT_FACTORS[tier]) / 100),
+            "hard_duct_linear_feet": rint((square_footage * HARD_DUCT_FACTORS[tier]) / 100),
+            "registers": rint(square_footage / REGISTER_FACTORS[tier]),
+            "returns": rint(zones + (square_footage / RETURN_FACTORS[tier])),
+            "required_tonnage": rounded_tonnage.copy(),
+            "hvac_units": hvac_units
+        }
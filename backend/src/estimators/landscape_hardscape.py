@@ -1,11 +1,44 @@
 import math
 import logging
+import numpy as np
+from src.estimators.batch import BatchQuantitiesMixin, TierTable, PREMIUM, LUXURY, ULTRA_LUXURY, rint, mask_rows
 
 logger = logging.getLogger(__name__)
 
-class LandscapeHardscapeEstimator:
+# Tier coefficients (Premium, Luxury, Ultra-Luxury)
+# Lot size to house footprint ratio
+LOT_SIZE_MULTIPLIER = TierTable(3.0, 4.0, 5.0)
+# Area breakdown of the non-house area
+HARDSCAPE_PCT = TierTable(0.25, 0.3, 0.35)
+LAWN_PCT = TierTable(0.50, 0.40, 0.30)
+PLANTING_BED_PCT = TierTable(0.20, 0.25, 0.30)
+# Plants per 1000 SF of non-house area
+TREES_PER_1000 = TierTable(0.4, 0.6, 0.8)
+SHRUBS_PER_1000 = TierTable(8, 12, 16)
+# Perennials and ground cover per shrub, luxury tiers only
+PERENNIALS_PER_SHRUB = TierTable(None, 3, 5)
+# Hardscape breakdown; luxury tiers add outdoor kitchens, pool decks and
+# (Ultra-Luxury) specialty hardscape
+HARDSCAPE_BREAKDOWN = {
+    "patio_area_sf": TierTable(0.5, 0.4, 0.35),
+    "walkway_area_sf": TierTable(0.3, 0.25, 0.2),
+    "driveway_area_sf": TierTable(0.2, 0.25, 0.2),
+    "outdoor_kitchen_area_sf": TierTable(None, 0.05, 0.08),
+    "pool_deck_area_sf": TierTable(None, 0.05, 0.1),
+    "specialty_hardscape_area_sf": TierTable(None, None, 0.07)
+}
+# Irrigation coverage of lawn and planting beds
+IRRIGATION_PCT = TierTable(0.7, 0.9, 1.0)
+SPECIALTY_FEATURES_PER_ACRE = TierTable(1, 2, 4)
+# Outdoor lights: one per 250 SF of a default 5000 SF of hardscape (Luxury),
+# one per 200 SF of a default 7000 SF (Ultra-Luxury)
+OUTDOOR_LIGHTING_COUNT = TierTable(None, round(5000 / 250), round(7000 / 200))
+
+class LandscapeHardscapeEstimator(BatchQuantitiesMixin):
     """Handles landscape and hardscape quantity calculations"""
     
+    QUANTITY_INPUTS = ()
+    
     def __init__(self, config=None):
         """Initialize with optional configuration"""
         self.config = config or {}
@@ -36,45 +69,19 @@ class LandscapeHardscapeEstimator:
         
     def _calculate_lot_areas(self, square_footage, tier):
         """Calculate lot size and area breakdown"""
-        # Lot size multiplier (lot size to house footprint ratio)
-        lot_size_multiplier = {
-            "Premium": 3.0,
-            "Luxury": 4.0,
-            "Ultra-Luxury": 5.0
-        }
-        
         # Calculate house footprint (assuming 1.5 stories average)
         house_footprint = square_footage / 1.5
         
         # Calculate lot size
-        lot_size = house_footprint * lot_size_multiplier[tier]
+        lot_size = house_footprint * LOT_SIZE_MULTIPLIER[tier]
         
         # Calculate non-house area
         non_house_area = lot_size - house_footprint
         
-        # Area breakdown percentages by tier
-        hardscape_pct = {
-            "Premium": 0.25,
-            "Luxury": 0.3,
-            "Ultra-Luxury": 0.35
-        }
-        
-        lawn_pct = {
-            "Premium": 0.50,
-            "Luxury": 0.40,
-            "Ultra-Luxury": 0.30
-        }
-        
-        planting_bed_pct = {
-            "Premium": 0.20,
-            "Luxury": 0.25,
-            "Ultra-Luxury": 0.30
-        }
-        
         # Calculate area breakdown
-        hardscape_area = non_house_area * hardscape_pct[tier]
-        lawn_area = non_house_area * lawn_pct[tier]
-        planting_bed_area = non_house_area * planting_bed_pct[tier]
+        hardscape_area = non_house_area * HARDSCAPE_PCT[tier]
+        lawn_area = non_house_area * LAWN_PCT[tier]
+        planting_bed_area = non_house_area * PLANTING_BED_PCT[tier]
         
         # Calculate remaining area (drives, utility areas, etc.)
         remaining_area = non_house_area - hardscape_area - lawn_area - planting_bed_area
@@ -91,22 +98,9 @@ class LandscapeHardscapeEstimator:
         
     def _calculate_plants(self, non_house_area, tier):
         """Calculate plant quantities"""
-        # Plants per 1000 SF of non-house area
-        trees_per_1000 = {
-            "Premium": 0.4,
-            "Luxury": 0.6,
-            "Ultra-Luxury": 0.8
-        }
-        
-        shrubs_per_1000 = {
-            "Premium": 8,
-            "Luxury": 12,
-            "Ultra-Luxury": 16
-        }
-        
         # Calculate plant quantities
-        tree_count = (non_house_area / 1000) * trees_per_1000[tier]
-        shrub_count = (non_house_area / 1000) * shrubs_per_1000[tier]
+        tree_count = (non_house_area / 1000) * TREES_PER_1000[tier]
+        shrub_count = (non_house_area / 1000) * SHRUBS_PER_1000[tier]
         
         # Additional plant types for luxury tiers
         result = {
@@ -122,65 +116,25 @@ class LandscapeHardscapeEstimator:
             result["specialty_shrub_count"] = round(shrub_count * 0.15)
             
             # Perennials and ground cover
-            perennials_per_shrub = 3 if tier == "Luxury" else 5
-            result["perennial_count"] = round(shrub_count * perennials_per_shrub)
+            result["perennial_count"] = round(shrub_count * PERENNIALS_PER_SHRUB[tier])
             
         return result
         
     def _calculate_hardscape_breakdown(self, hardscape_area, tier):
         """Calculate hardscape area breakdown"""
-        # Hardscape breakdown percentages by tier
-        if tier == "Premium":
-            patio_pct = 0.5
-            walkway_pct = 0.3
-            driveway_pct = 0.2
-            outdoor_kitchen_pct = 0
-            pool_deck_pct = 0
-            specialty_pct = 0
-        elif tier == "Luxury":
-            patio_pct = 0.4
-            walkway_pct = 0.25
-            driveway_pct = 0.25
-            outdoor_kitchen_pct = 0.05
-            pool_deck_pct = 0.05
-            specialty_pct = 0
-        else:  # Ultra-Luxury
-            patio_pct = 0.35
-            walkway_pct = 0.2
-            driveway_pct = 0.2
-            outdoor_kitchen_pct = 0.08
-            pool_deck_pct = 0.1
-            specialty_pct = 0.07
-            
-        # Calculate hardscape areas
-        result = {
-            "patio_area_sf": round(hardscape_area * patio_pct),
-            "walkway_area_sf": round(hardscape_area * walkway_pct),
-            "driveway_area_sf": round(hardscape_area * driveway_pct)
-        }
-        
-        # Add luxury hardscape elements
-        if tier in ["Luxury", "Ultra-Luxury"]:
-            result["outdoor_kitchen_area_sf"] = round(hardscape_area * outdoor_kitchen_pct)
-            result["pool_deck_area_sf"] = round(hardscape_area * pool_deck_pct)
-            
-        if tier == "Ultra-Luxury":
-            result["specialty_hardscape_area_sf"] = round(hardscape_area * specialty_pct)
+        # Calculate hardscape areas, with luxury hardscape elements by tier
+        result = {}
+        for area, pct in HARDSCAPE_BREAKDOWN.items():
+            if pct[tier] is not None:
+                result[area] = round(hardscape_area * pct[tier])
             
         return result
         
     def _calculate_irrigation(self, areas, tier):
         """Calculate irrigation system quantities"""
-        # Irrigation coverage percentage by tier
-        irrigation_pct = {
-            "Premium": 0.7,
-            "Luxury": 0.9,
-            "Ultra-Luxury": 1.0
-        }
-        
         # Calculate irrigated area (lawn + planting beds)
         landscape_area = areas["lawn_area_sf"] + areas["planting_bed_area_sf"]
-        irrigation_area = landscape_area * irrigation_pct[tier]
+        irrigation_area = landscape_area * IRRIGATION_PCT[tier]
         
         # Calculate sprinkler counts (rough approximation)
         # Lawn sprinklers: approximately 1 per 150 sq ft
@@ -203,15 +157,8 @@ class LandscapeHardscapeEstimator:
         # Convert lot size to acres
         lot_size_acres = lot_size / 43560
         
-        # Specialty features per acre by tier
-        specialty_features_per_acre = {
-            "Premium": 1,
-            "Luxury": 2,
-            "Ultra-Luxury": 4
-        }
-        
         # Calculate base specialty features
-        specialty_features = lot_size_acres * specialty_features_per_acre[tier]
+        specialty_features = lot_size_acres * SPECIALTY_FEATURES_PER_ACRE[tier]
         
         # Allocate specialty features based on tier
         result = {}
@@ -221,12 +168,75 @@ class LandscapeHardscapeEstimator:
         elif tier == "Luxury":
             result["fire_pit_count"] = 1
             result["water_feature_count"] = 1 if specialty_features >= 2 else 0
-            result["outdoor_lighting_count"] = round(result.get("hardscape_area_sf", 5000) / 250)  # one light per 250 sf
+            result["outdoor_lighting_count"] = OUTDOOR_LIGHTING_COUNT[tier]
         else:  # Ultra-Luxury
             result["fire_pit_count"] = 1
             result["water_feature_count"] = round(specialty_features / 2)
-            result["outdoor_lighting_count"] = round(result.get("hardscape_area_sf", 7000) / 200)  # one light per 200 sf
+            result["outdoor_lighting_count"] = OUTDOOR_LIGHTING_COUNT[tier]
             result["outdoor_structure_count"] = 1 if specialty_features >= 3 else 0
             result["specialty_landscape_features"] = round(specialty_features - 2)
             
-        return result
\ No newline at end of file
+        return result
+
+    def _quantity_columns(self, rows):
+        """Batch version of calculate_quantities"""
+        square_footage, tier = rows.square_footage, rows.tier
+        luxury_tiers = rows.tier_in(LUXURY, ULTRA_LUXURY)
+        ultra = tier == ULTRA_LUXURY
+
+        # Lot areas; everything after this works from the rounded areas
+        house_footprint = square_footage / 1.5
+        lot_size = house_footprint * LOT_SIZE_MULTIPLIER[tier]
+        non_house_area = lot_size - house_footprint
+        hardscape_area = non_house_area * HARDSCAPE_PCT[tier]
+        lawn_area = non_house_area * LAWN_PCT[tier]
+        planting_bed_area = non_house_area * PLANTING_BED_PCT[tier]
+        remaining_area = non_house_area - hardscape_area - lawn_area - planting_bed_area
+
+        columns = {
+            "lot_size_sf": rint(lot_size),
+            "house_footprint_sf": rint(house_footprint),
+            "non_house_area_sf": rint(non_house_area),
+            "hardscape_area_sf": rint(hardscape_area),
+            "lawn_area_sf": rint(lawn_area),
+            "planting_bed_area_sf": rint(planting_bed_area),
+            "other_area_sf": rint(remaining_area)
+        }
+
+        # Plants
+        tree_count = (columns["non_house_area_sf"] / 1000) * TREES_PER_1000[tier]
+        shrub_count = (columns["non_house_area_sf"] / 1000) * SHRUBS_PER_1000[tier]
+        columns.update({
+            "tree_count": rint(tree_count),
+            "shrub_count": rint(shrub_count),
+            "ornamental_tree_count": mask_rows(rint(tree_count * 0.2), luxury_tiers),
+            "specialty_shrub_count": mask_rows(rint(shrub_count * 0.15), luxury_tiers),
+            "perennial_count": rint(shrub_count * PERENNIALS_PER_SHRUB[tier])
+        })
+
+        # Hardscape breakdown
+        hardscape = columns["hardscape_area_sf"]
+        for area, pct in HARDSCAPE_BREAKDOWN.items():
+            columns[area] = rint(hardscape * pct[tier])
+
+        # Irrigation
+        lawn, beds = columns["lawn_area_sf"], columns["planting_bed_area_sf"]
+        columns.update({
+            "irrigation_area_sf": rint((lawn + beds) * IRRIGATION_PCT[tier]),
+            "lawn_sprinklers": rint(lawn / 150),
+            "drip_emitters": rint(beds / 4),
+            "irrigation_valves": rint((lawn / 1500) + (beds / 1000))
+        })
+
+        # Specialty features
+        specialty_features = (columns["lot_size_sf"] / 43560) * SPECIALTY_FEATURES_PER_ACRE[tier]
+        premium = tier == PREMIUM
+        columns.update({
+            "fire_pit_count": np.where(premium, specialty_features >= 1, 1).astype(np.int64),
+            "water_feature_count": mask_rows(
+                np.where(ultra, rint(specialty_features / 2), specialty_features >= 2).astype(np.int64), ~premium),
+            "outdoor_lighting_count": OUTDOOR_LIGHTING_COUNT[tier],
+            "outdoor_structure_count": mask_rows((specialty_features >= 3).astype(np.int64), ultra),
+            "specialty_landscape_features": mask_rows(rint(specialty_features - 2), ultra)
+        })
+        return columns
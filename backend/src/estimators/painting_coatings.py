@@ -1,10 +1,30 @@
 import logging
+from src.estimators.batch import BatchQuantitiesMixin, TierTable, LUXURY, ULTRA_LUXURY, rint, mask_rows
 
 logger = logging.getLogger(__name__)
 
-class PaintingCoatingsEstimator:
+# Tier coefficients (Premium, Luxury, Ultra-Luxury)
+# SF of paintable wall and ceiling per SF of house
+WALL_AREA_FACTOR = TierTable(2.2, 2.4, 2.7)
+CEILING_AREA_FACTOR = TierTable(0.9, 1.0, 1.1)
+# Paint coats over one primer coat; extra coat for Ultra-Luxury
+PAINT_COATS = TierTable(2, 2, 3)
+# LF of trim per SF of house
+TRIM_FACTOR = TierTable(0.8, 0.9, 1.0)
+# Trim and doors that can be painted with one gallon
+TRIM_DOORS_PER_GALLON = TierTable(15, 12, 10)
+# Share of the paintable area with a specialty finish
+SPECIALTY_FINISH_PCT = TierTable(0.05, 0.15, 0.25)
+# Decorative glaze coverage (SF per gallon), luxury tiers only
+DECORATIVE_GLAZE_COVERAGE = TierTable(None, 300, 250)
+# Exterior wall area is typically 2-3x the square footage for 2-story homes
+EXTERIOR_WALL_FACTOR = TierTable(2.0, 2.5, 3.0)
+
+class PaintingCoatingsEstimator(BatchQuantitiesMixin):
     """Handles paint and coatings quantity calculations"""
     
+    QUANTITY_INPUTS = ()
+    
     def __init__(self, config=None):
         """Initialize with optional configuration"""
         self.config = config or {}
@@ -32,30 +52,16 @@ class PaintingCoatingsEstimator:
         
     def _calculate_wall_ceiling_paint(self, square_footage, tier):
         """Calculate wall and ceiling paint quantities"""
-        # SF of paintable wall per SF of house
-        wall_area_factor = {
-            "Premium": 2.2,
-            "Luxury": 2.4,
-            "Ultra-Luxury": 2.7
-        }
-        
-        # SF of paintable ceiling per SF of house
-        ceiling_area_factor = {
-            "Premium": 0.9,
-            "Luxury": 1.0,
-            "Ultra-Luxury": 1.1
-        }
-        
         # Primer and paint coats
         primer_coats = 1  # Same for all tiers
-        paint_coats = 2 if tier != "Ultra-Luxury" else 3  # Extra coat for Ultra-Luxury
+        paint_coats = PAINT_COATS[tier]
         
         # Paint coverage (SF per gallon)
         coverage = 350  # Same for all tiers
         
         # Calculate paintable areas
-        wall_area = square_footage * wall_area_factor[tier]
-        ceiling_area = square_footage * ceiling_area_factor[tier]
+        wall_area = square_footage * WALL_AREA_FACTOR[tier]
+        ceiling_area = square_footage * CEILING_AREA_FACTOR[tier]
         total_paintable_area = wall_area + ceiling_area
         
         # Calculate paint gallons
@@ -75,45 +81,31 @@ class PaintingCoatingsEstimator:
         
     def _calculate_trim_door_paint(self, square_footage, tier):
         """Calculate trim and door paint quantities"""
-        # LF of trim per SF of house
-        trim_factor = {
-            "Premium": 0.8,
-            "Luxury": 0.9,
-            "Ultra-Luxury": 1.0
-        }
-        
         # Estimate interior door count (based on room count)
         rooms_per_sf = 1/300  # Approx. one room per 300 SF
         doors_per_room = 1.2  # Approx. 1.2 doors per room
         interior_door_count = square_footage * rooms_per_sf * doors_per_room
         
-        # Trim and doors that can be painted with one gallon
-        trim_doors_per_gallon = {
-            "Premium": 15,
-            "Luxury": 12,
-            "Ultra-Luxury": 10
-        }
-        
         # Primer and paint coats
         primer_coats = 1  # Same for all tiers
-        paint_coats = 2 if tier != "Ultra-Luxury" else 3  # Extra coat for Ultra-Luxury
+        paint_coats = PAINT_COATS[tier]
         
         # Calculate trim linear feet
-        trim_lf = square_footage * trim_factor[tier]
+        trim_lf = square_footage * TRIM_FACTOR[tier]
         
         # Calculate paint gallons
         # Approximate 30 LF of trim equals 1 door for paint coverage
         trim_door_equivalent = (trim_lf / 30) + interior_door_count
         trim_door_paint = (
-            trim_door_equivalent / trim_doors_per_gallon[tier] *
+            trim_door_equivalent / TRIM_DOORS_PER_GALLON[tier] *
             (primer_coats + paint_coats)
         )
         
         return {
             "interior_door_count": round(interior_door_count),
             "trim_lf": round(trim_lf),
-            "trim_door_primer_gallons": round(trim_door_equivalent / trim_doors_per_gallon[tier] * primer_coats),
-            "trim_door_paint_gallons": round(trim_door_equivalent / trim_doors_per_gallon[tier] * paint_coats),
+            "trim_door_primer_gallons": round(trim_door_equivalent / TRIM_DOORS_PER_GALLON[tier] * primer_coats),
+            "trim_door_paint_gallons": round(trim_door_equivalent / TRIM_DOORS_PER_GALLON[tier] * paint_coats),
             "total_trim_door_gallons": round(trim_door_paint)
         }
         
@@ -124,22 +116,14 @@ class PaintingCoatingsEstimator:
         # Calculate total paintable area from wall/ceiling function
         total_paintable_area = self._calculate_wall_ceiling_paint(square_footage, tier)["total_paintable_area_sf"]
         
-        # Specialty finish percentage by tier
-        specialty_finish_pct = {
-            "Premium": 0.05,
-            "Luxury": 0.15,
-            "Ultra-Luxury": 0.25
-        }
-        
         # Calculate specialty finish area
-        specialty_finish_area = total_paintable_area * specialty_finish_pct[tier]
+        specialty_finish_area = total_paintable_area * SPECIALTY_FINISH_PCT[tier]
         result["specialty_finish_area_sf"] = round(specialty_finish_area)
         
         # Add specific specialty finishes by tier
-        if tier == "Luxury":
-            result["decorative_glaze_gallons"] = round(specialty_finish_area / 300)
-        elif tier == "Ultra-Luxury":
-            result["decorative_glaze_gallons"] = round(specialty_finish_area / 250)
+        if DECORATIVE_GLAZE_COVERAGE[tier] is not None:
+            result["decorative_glaze_gallons"] = round(specialty_finish_area / DECORATIVE_GLAZE_COVERAGE[tier])
+        if tier == "Ultra-Luxury":
             result["venetian_plaster_area_sf"] = round(total_paintable_area * 0.1)
             result["metallic_finish_area_sf"] = round(total_paintable_area * 0.05)
             
@@ -147,29 +131,15 @@ class PaintingCoatingsEstimator:
         
     def _calculate_exterior_paint(self, square_footage, tier):
         """Calculate exterior paint quantities"""
-        # Exterior paint gallons per SF of house
-        exterior_paint_factor = {
-            "Premium": 0.005,  # 1 gallon per 200 SF
-            "Luxury": 0.006,   # 1 gallon per 167 SF
-            "Ultra-Luxury": 0.0075  # 1 gallon per 133 SF
-        }
-        
-        # Exterior wall area is typically 2-3x the square footage for 2-story homes
-        exterior_wall_factor = {
-            "Premium": 2.0,
-            "Luxury": 2.5,
-            "Ultra-Luxury": 3.0
-        }
-        
         # Calculate exterior paintable area
-        exterior_wall_area = square_footage * exterior_wall_factor[tier]
+        exterior_wall_area = square_footage * EXTERIOR_WALL_FACTOR[tier]
         
         # Calculate exterior paint gallons (primer + paint coats)
         # Premium: 1 primer coat, 2 paint coats
         # Luxury: 1 primer coat, 2 paint coats
         # Ultra-Luxury: 1 primer coat, 3 paint coats
         primer_coats = 1
-        paint_coats = 2 if tier != "Ultra-Luxury" else 3
+        paint_coats = PAINT_COATS[tier]
         
         # Paint coverage (SF per gallon)
         coverage = 350  # Same for all tiers
@@ -197,4 +167,60 @@ class PaintingCoatingsEstimator:
                 result["exterior_stain_gallons"] = round(exterior_wall_area * 0.3 / 300)  # 30% might be stained
                 result["exterior_sealer_gallons"] = round(exterior_wall_area * 0.4 / 400)  # 40% needs sealer
                 
-        return result
\ No newline at end of file
+        return result
+
+    def _quantity_columns(self, rows):
+        """Batch version of calculate_quantities"""
+        square_footage, tier = rows.square_footage, rows.tier
+        primer_coats, paint_coats, coverage = 1, PAINT_COATS[tier], 350
+
+        # Walls and ceilings
+        wall_area = square_footage * WALL_AREA_FACTOR[tier]
+        ceiling_area = square_footage * CEILING_AREA_FACTOR[tier]
+        total_paintable_area = wall_area + ceiling_area
+        wall_ceiling_primer = (total_paintable_area * primer_coats) / coverage
+        wall_ceiling_paint = (total_paintable_area * paint_coats) / coverage
+
+        # Trim and doors
+        interior_door_count = square_footage * (1 / 300) * 1.2
+        trim_lf = square_footage * TRIM_FACTOR[tier]
+        trim_door_equivalent = (trim_lf / 30) + interior_door_count
+        per_gallon = TRIM_DOORS_PER_GALLON[tier]
+
+        # Specialty finishes work from the rounded paintable area
+        rounded_paintable_area = rint(total_paintable_area)
+        specialty_finish_area = rounded_paintable_area * SPECIALTY_FINISH_PCT[tier]
+
+        # Exterior
+        exterior_wall_area = square_footage * EXTERIOR_WALL_FACTOR[tier]
+        exterior_primer_gallons = (exterior_wall_area * primer_coats) / coverage
+        exterior_paint_gallons = (exterior_wall_area * paint_coats) / coverage
+        trim_area = exterior_wall_area * 0.15
+
+        luxury_tiers = rows.tier_in(LUXURY, ULTRA_LUXURY)
+        ultra = tier == ULTRA_LUXURY
+        return {
+            "wall_area_sf": rint(wall_area),
+            "ceiling_area_sf": rint(ceiling_area),
+            "total_paintable_area_sf": rounded_paintable_area,
+            "wall_ceiling_primer_gallons": rint(wall_ceiling_primer),
+            "wall_ceiling_paint_gallons": rint(wall_ceiling_paint),
+            "total_wall_ceiling_gallons": rint(wall_ceiling_primer + wall_ceiling_paint),
+            "interior_door_count": rint(interior_door_count),
+            "trim_lf": rint(trim_lf),
+            "trim_door_primer_gallons": rint(trim_door_equivalent / per_gallon * primer_coats),
+            "trim_door_paint_gallons": rint(trim_door_equivalent / per_gallon * paint_coats),
+            "total_trim_door_gallons": rint(trim_door_equivalent / per_gallon * (primer_coats + paint_coats)),
+            "specialty_finish_area_sf": rint(specialty_finish_area),
+            "decorative_glaze_gallons": rint(specialty_finish_area / DECORATIVE_GLAZE_COVERAGE[tier]),
+            "venetian_plaster_area_sf": mask_rows(rint(rounded_paintable_area * 0.1), ultra),
+            "metallic_finish_area_sf": mask_rows(rint(rounded_paintable_area * 0.05), ultra),
+            "exterior_wall_area_sf": rint(exterior_wall_area),
+            "exterior_primer_gallons": rint(exterior_primer_gallons),
+            "exterior_paint_gallons": rint(exterior_paint_gallons),
+            "total_exterior_gallons": rint(exterior_primer_gallons + exterior_paint_gallons),
+            "exterior_trim_area_sf": mask_rows(rint(trim_area), luxury_tiers),
+            "exterior_trim_paint_gallons": mask_rows(rint(trim_area / 300), luxury_tiers),
+            "exterior_stain_gallons": mask_rows(rint(exterior_wall_area * 0.3 / 300), ultra),
+            "exterior_sealer_gallons": mask_rows(rint(exterior_wall_area * 0.4 / 400), ultra)
+        }
@@ -1,10 +1,34 @@
 import logging
+import numpy as np
+from src.estimators.batch import BatchQuantitiesMixin, TierTable, rint, mixed, mask_rows
 
 logger = logging.getLogger(__name__)
 
-class PlumbingEstimator:
+# Tier coefficients (Premium, Luxury, Ultra-Luxury)
+# Fixed fixture counts per primary bathroom
+PRIMARY_SHOWER_VALVES = TierTable(1, 2, 3)
+PRIMARY_SINKS = TierTable(2, 2, 2)
+PRIMARY_BATHTUBS = TierTable(1, 1, 1)
+PRIMARY_TOILETS = TierTable(1, 2, 2)
+# Sinks per secondary bathroom; shower valves and toilets are one per bathroom
+SECONDARY_SINKS = TierTable(1, 1, 2)
+# Exact fixtures per bathroom for the total fixture count:
+# Premium 1 shower + 2 sinks + 1 tub + 1 toilet = 5
+# Luxury 2 showers + 2 sinks + 1 tub + 1 toilet = 6
+# Ultra-Luxury 3 showers + 2 sinks + 1 tub + 2 toilets = 8
+PRIMARY_FIXTURES = TierTable(5, 6, 8)
+# 1 shower + 1 sink (2 for Ultra-Luxury) + 0.7 tub + 1 toilet
+SECONDARY_FIXTURES = TierTable(3, 3, 5)
+
+class PlumbingEstimator(BatchQuantitiesMixin):
     """Handles plumbing quantity calculations"""
     
+    QUANTITY_INPUTS = (
+        'primary_bath_count',
+        'secondary_bath_count',
+        'powder_room_count',
+    )
+    
     def __init__(self, config=None):
         """Initialize with optional configuration"""
         self.config = config or {}
@@ -47,17 +71,11 @@ class PlumbingEstimator:
         if count <= 0:
             return {'primary_bath_count': 0}
             
-        # Base quantities per bathroom - fixed values
-        base_shower_valves = {"Premium": 1, "Luxury": 2, "Ultra-Luxury": 3}
-        base_sinks = {"Premium": 2, "Luxury": 2, "Ultra-Luxury": 2}
-        base_bathtubs = {"Premium": 1, "Luxury": 1, "Ultra-Luxury": 1}
-        base_toilets = {"Premium": 1, "Luxury": 2, "Ultra-Luxury": 2}
-        
         # Calculate quantities for all primary bathrooms
-        shower_valves = count * base_shower_valves[tier]
-        sinks = count * base_sinks[tier]
-        bathtubs = count * base_bathtubs[tier]
-        toilets = count * base_toilets[tier]
+        shower_valves = count * PRIMARY_SHOWER_VALVES[tier]
+        sinks = count * PRIMARY_SINKS[tier]
+        bathtubs = count * PRIMARY_BATHTUBS[tier]
+        toilets = count * PRIMARY_TOILETS[tier]
         
         return {
             "primary_bath_count": count,
@@ -74,11 +92,10 @@ class PlumbingEstimator:
             
         # Base quantities per bathroom - fixed values
         base_shower_valves = 1  # One per bathroom for all tiers
-        base_sinks = {"Premium": 1, "Luxury": 1, "Ultra-Luxury": 2}
         
         # Calculate quantities for all secondary bathrooms
         shower_valves = count * base_shower_valves
-        sinks = count * base_sinks[tier]
+        sinks = count * SECONDARY_SINKS[tier]
         
         # 70% of secondary bathrooms have tubs
         bathtubs = count * 0.7
@@ -124,27 +141,54 @@ class PlumbingEstimator:
         
     def _calculate_total_fixtures(self, primary_bath_count, secondary_bath_count, powder_room_count, tier):
         """Calculate total fixture counts"""
-        # Count exact fixtures rather than using multipliers
-        primary_fixtures = {
-            "Premium": 5,  # 1 shower + 2 sinks + 1 tub + 1 toilet = 5
-            "Luxury": 6,   # 2 showers + 2 sinks + 1 tub + 1 toilet = 6
-            "Ultra-Luxury": 8  # 3 showers + 2 sinks + 1 tub + 2 toilets = 8
-        }
-        
-        secondary_fixtures = {
-            "Premium": 3,  # 1 shower + 1 sink + 0.7 tub + 1 toilet ≈ 3
-            "Luxury": 3,   # 1 shower + 1 sink + 0.7 tub + 1 toilet ≈ 3
-            "Ultra-Luxury": 5  # 1 shower + 2 sinks + 0.7 tub + 1 toilet ≈ 5
-        }
-        
         powder_fixtures = 2  # 1 sink + 1 toilet = 2
         
         total_fixtures = (
-            (primary_bath_count * primary_fixtures[tier]) +
-            (secondary_bath_count * secondary_fixtures[tier]) +
+            (primary_bath_count * PRIMARY_FIXTURES[tier]) +
+            (secondary_bath_count * SECONDARY_FIXTURES[tier]) +
             (powder_room_count * powder_fixtures)
         )
         
         return {
             "total_plumbing_fixtures": round(total_fixtures)
-        }
\ No newline at end of file
+        }
+
+    def _quantity_columns(self, rows):
+        """Batch version of calculate_quantities"""
+        square_footage, tier = rows.square_footage, rows.tier
+        primary_bath_count = rows.count('primary_bath_count', 2)
+        secondary_bath_count = rows.count('secondary_bath_count', 3)
+        powder_room_count = rows.count('powder_room_count', 2)
+
+        def room_count(count):
+            # A room type with no rooms reports a count of 0 and nothing else
+            return mixed(np.where(count > 0, count, 0), (count <= 0) | (count.dtype.kind == 'i'))
+
+        primary, secondary, powder = primary_bath_count > 0, secondary_bath_count > 0, powder_room_count > 0
+        powder_rooms = np.array(powder_room_count)
+
+        tankless_count = np.select(
+            [square_footage <= 3500, square_footage <= 7000, square_footage <= 10000], [1, 2, 3], 4)
+        total_fixtures = (
+            (primary_bath_count * PRIMARY_FIXTURES[tier]) +
+            (secondary_bath_count * SECONDARY_FIXTURES[tier]) +
+            (powder_room_count * 2)
+        )
+
+        return {
+            "primary_bath_count": room_count(primary_bath_count),
+            "primary_shower_valves": mask_rows(rint(primary_bath_count * PRIMARY_SHOWER_VALVES[tier]), primary),
+            "primary_sinks": mask_rows(rint(primary_bath_count * PRIMARY_SINKS[tier]), primary),
+            "primary_bathtubs": mask_rows(rint(primary_bath_count * PRIMARY_BATHTUBS[tier]), primary),
+            "primary_toilets": mask_rows(rint(primary_bath_count * PRIMARY_TOILETS[tier]), primary),
+            "secondary_bath_count": room_count(secondary_bath_count),
+            "secondary_shower_valves": mask_rows(rint(secondary_bath_count), secondary),
+            "secondary_sinks": mask_rows(rint(secondary_bath_count * SECONDARY_SINKS[tier]), secondary),
+            "secondary_bathtubs": mask_rows(rint(secondary_bath_count * 0.7), secondary),
+            "secondary_toilets": mask_rows(rint(secondary_bath_count), secondary),
+            "powder_room_count": room_count(powder_room_count),
+            "powder_room_sinks": mask_rows(powder_rooms, powder),
+            "powder_room_toilets": mask_rows(powder_rooms.copy(), powder),
+            "tankless_water_heaters": tankless_count.astype(np.int64),
+            "total_plumbing_fixtures": rint(total_fixtures)
+        }
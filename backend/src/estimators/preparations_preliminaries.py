@@ -1,11 +1,45 @@
 import math
 import logging
+import numpy as np
+from src.estimators.batch import BatchQuantitiesMixin, TierTable, PREMIUM, LUXURY, ULTRA_LUXURY, rint, mixed, constant, mask_rows
 
 logger = logging.getLogger(__name__)
 
-class PreparationsPreliminariesEstimator:
+# Tier coefficients (Premium, Luxury, Ultra-Luxury)
+# Project duration: base months up to the baseline square footage, plus
+# additional months per 1000 SF above it
+BASE_MONTHS = TierTable(8, 10, 12)
+ADDITIONAL_MONTHS_PER_1000SF = TierTable(0.5, 0.6, 0.8)
+BASELINE_SF = TierTable(4000, 6000, 10000)
+# Lot size to house footprint ratio (rough approximation)
+LOT_SIZE_MULTIPLIER = TierTable(3.0, 4.0, 5.0)
+# Site clearing area as a multiple of the house footprint
+SITE_CLEARING_FACTOR = TierTable(1.2, 1.5, 2.0)
+# Field office SF; Premium projects under 5000 SF have none
+FIELD_OFFICE_SF = TierTable(150, 200, 400)
+# Project management hours per week
+SUPERINTENDENT_HOURS_PER_WEEK = TierTable(15, 25, 40)
+PROJECT_MANAGER_HOURS_PER_WEEK = TierTable(5, 10, 15)
+# Additional labor hours per week by role
+LABOR_HOURS_PER_WEEK = {
+    "Project Administrator": TierTable(5, 10, 15),
+    "Construction Manager": TierTable(10, 20, 30),
+    "Carpenter / Tool Person": TierTable(20, 30, 40),
+    "Construction Site Tech": TierTable(10, 15, 20)
+}
+# Inspections; more complex luxury projects require more of them
+FOUNDATION_INSPECTIONS = TierTable(2, 3, 4)
+FRAMING_INSPECTIONS = TierTable(2, 3, 4)
+# Mechanical, electrical and plumbing inspections each
+TRADE_INSPECTIONS = TierTable(3, 4, 4)
+# Safety equipment units per 1000 sq ft
+SAFETY_EQUIPMENT_FACTOR = TierTable(0.5, 0.7, 1.0)
+
+class PreparationsPreliminariesEstimator(BatchQuantitiesMixin):
     """Handles preparations and preliminaries quantity calculations"""
     
+    QUANTITY_INPUTS = ('project_duration_months',)
+    
     def __init__(self, config=None):
         """Initialize with optional configuration"""
         self.config = config or {}
@@ -45,59 +79,26 @@ class PreparationsPreliminariesEstimator:
         
     def _estimate_project_duration(self, square_footage, tier):
         """Estimate project duration in months based on square footage and tier"""
-        # Base months for minimum square footage
-        base_months = {
-            "Premium": 8,
-            "Luxury": 10,
-            "Ultra-Luxury": 12
-        }
-        
-        # Additional months per 1000 square feet above baseline
-        additional_months_per_1000sf = {
-            "Premium": 0.5,
-            "Luxury": 0.6,
-            "Ultra-Luxury": 0.8
-        }
-        
-        # Baseline square footage
-        baseline_sf = {
-            "Premium": 4000,
-            "Luxury": 6000,
-            "Ultra-Luxury": 10000
-        }
-        
         # Calculate estimated duration
-        duration = base_months[tier]
-        if square_footage > baseline_sf[tier]:
-            additional_sf = square_footage - baseline_sf[tier]
-            duration += (additional_sf / 1000) * additional_months_per_1000sf[tier]
+        duration = BASE_MONTHS[tier]
+        if square_footage > BASELINE_SF[tier]:
+            additional_sf = square_footage - BASELINE_SF[tier]
+            duration += (additional_sf / 1000) * ADDITIONAL_MONTHS_PER_1000SF[tier]
             
         return round(duration)
         
     def _calculate_site_preparation(self, square_footage, tier):
         """Calculate site preparation quantities"""
         # Calculate lot size (rough approximation)
-        lot_size_multiplier = {
-            "Premium": 3.0,
-            "Luxury": 4.0,
-            "Ultra-Luxury": 5.0
-        }
-        
         house_footprint = square_footage / 1.5  # Assuming 1.5 stories average
-        lot_size = house_footprint * lot_size_multiplier[tier]
+        lot_size = house_footprint * LOT_SIZE_MULTIPLIER[tier]
         
         # Calculate construction fencing (perimeter of lot plus 20%)
         lot_perimeter = 4 * math.sqrt(lot_size)
         construction_fencing = lot_perimeter * 1.2
         
         # Calculate site clearing area
-        site_clearing_factor = {
-            "Premium": 1.2,  # 120% of house footprint
-            "Luxury": 1.5,   # 150% of house footprint
-            "Ultra-Luxury": 2.0  # 200% of house footprint
-        }
-        
-        site_clearing_area = house_footprint * site_clearing_factor[tier]
+        site_clearing_area = house_footprint * SITE_CLEARING_FACTOR[tier]
         
         # Calculate erosion control linear feet (typically around perimeter)
         erosion_control_lf = lot_perimeter
@@ -133,13 +134,9 @@ class PreparationsPreliminariesEstimator:
         dumpster_pulls = math.ceil(square_footage / 2000) * project_duration_months
         
         # Field office based on tier
-        field_office_sf = 0
-        if tier == "Premium":
-            field_office_sf = 0 if square_footage < 5000 else 150
-        elif tier == "Luxury":
-            field_office_sf = 200
-        else:  # Ultra-Luxury
-            field_office_sf = 400
+        field_office_sf = FIELD_OFFICE_SF[tier]
+        if tier == "Premium" and square_footage < 5000:
+            field_office_sf = 0
             
         # Calculate temporary utilities
         temp_utilities_months = project_duration_months
@@ -156,21 +153,10 @@ class PreparationsPreliminariesEstimator:
         
     def _calculate_project_management(self, square_footage, tier, project_duration_months):
         """Calculate project management quantities"""
-        # Project management level varies by tier
-        if tier == "Premium":
-            superintendent_hours_per_week = 15
-            project_manager_hours_per_week = 5
-        elif tier == "Luxury":
-            superintendent_hours_per_week = 25
-            project_manager_hours_per_week = 10
-        else:  # Ultra-Luxury
-            superintendent_hours_per_week = 40
-            project_manager_hours_per_week = 15
-            
         # Calculate total hours for project duration
         weeks = project_duration_months * 4.33  # Approximate weeks per month
-        superintendent_hours = superintendent_hours_per_week * weeks
-        project_manager_hours = project_manager_hours_per_week * weeks
+        superintendent_hours = SUPERINTENDENT_HOURS_PER_WEEK[tier] * weeks
+        project_manager_hours = PROJECT_MANAGER_HOURS_PER_WEEK[tier] * weeks
         
         # Calculate meeting quantities
         client_meetings = project_duration_months * 2  # Two client meetings per month
@@ -185,19 +171,11 @@ class PreparationsPreliminariesEstimator:
         
     def _calculate_additional_labor(self, square_footage, tier, project_duration_months):
         """Calculate additional labor roles quantities"""
-        # Labor hours per week based on tier
-        labor_hours_per_week = {
-            "Project Administrator": {"Premium": 5, "Luxury": 10, "Ultra-Luxury": 15},
-            "Construction Manager": {"Premium": 10, "Luxury": 20, "Ultra-Luxury": 30},
-            "Carpenter / Tool Person": {"Premium": 20, "Luxury": 30, "Ultra-Luxury": 40},
-            "Construction Site Tech": {"Premium": 10, "Luxury": 15, "Ultra-Luxury": 20}
-        }
-        
         # Calculate total hours for project duration
         weeks = project_duration_months * 4.33  # Approximate weeks per month
         
         additional_labor = {}
-        for role, hours in labor_hours_per_week.items():
+        for role, hours in LABOR_HOURS_PER_WEEK.items():
             total_hours = hours[tier] * weeks
             additional_labor[f"{role.lower().replace(' ', '_')}_hours"] = round(total_hours)
             additional_labor[f"{role.lower().replace(' ', '_')}_months"] = project_duration_months
@@ -217,34 +195,13 @@ class PreparationsPreliminariesEstimator:
         }
         
         # Calculate inspection quantities
-        foundation_inspections = 2
-        framing_inspections = 2
-        mechanical_inspections = 3
-        electrical_inspections = 3
-        plumbing_inspections = 3
-        final_inspections = 2
-        
-        # Additional inspections for luxury tiers
-        if tier in ["Luxury", "Ultra-Luxury"]:
-            # More complex projects require more inspections
-            foundation_inspections += 1
-            framing_inspections += 1
-            mechanical_inspections += 1
-            electrical_inspections += 1
-            plumbing_inspections += 1
-            
-        # Even more inspections for ultra-luxury
-        if tier == "Ultra-Luxury":
-            foundation_inspections += 1
-            framing_inspections += 1
-            
         inspections = {
-            "foundation_inspections": foundation_inspections,
-            "framing_inspections": framing_inspections,
-            "mechanical_inspections": mechanical_inspections,
-            "electrical_inspections": electrical_inspections,
-            "plumbing_inspections": plumbing_inspections,
-            "final_inspections": final_inspections
+            "foundation_inspections": FOUNDATION_INSPECTIONS[tier],
+            "framing_inspections": FRAMING_INSPECTIONS[tier],
+            "mechanical_inspections": TRADE_INSPECTIONS[tier],
+            "electrical_inspections": TRADE_INSPECTIONS[tier],
+            "plumbing_inspections": TRADE_INSPECTIONS[tier],
+            "final_inspections": 2
         }
         
         # Combine all permit data
@@ -259,15 +216,8 @@ class PreparationsPreliminariesEstimator:
         
     def _calculate_safety_protection(self, square_footage, tier, project_duration_months):
         """Calculate safety and protection quantities"""
-        # Safety equipment calculation based on project size
-        safety_equipment_factor = {
-            "Premium": 0.5,  # Units per 1000 sq ft
-            "Luxury": 0.7,
-            "Ultra-Luxury": 1.0
-        }
-        
         # Calculate safety equipment units
-        safety_equipment = (square_footage / 1000) * safety_equipment_factor[tier]
+        safety_equipment = (square_footage / 1000) * SAFETY_EQUIPMENT_FACTOR[tier]
         
         # Dust control based on project duration
         dust_barriers_sf = square_footage * 0.15  # About 15% of project area
@@ -286,4 +236,79 @@ class PreparationsPreliminariesEstimator:
             "floor_protection_sf": round(floor_protection_sf),
             "window_protection_units": window_protection,
             "first_aid_kits": math.ceil(project_duration_months / 3)  # Replace every 3 months
-        }
\ No newline at end of file
+        }
+
+    def _quantity_columns(self, rows):
+        """Batch version of calculate_quantities"""
+        square_footage, tier = rows.square_footage, rows.tier
+        count = len(rows)
+        luxury_tiers = rows.tier_in(LUXURY, ULTRA_LUXURY)
+
+        baseline_sf = BASELINE_SF[tier]
+        estimated_duration = rint(np.where(
+            square_footage > baseline_sf,
+            BASE_MONTHS[tier] + ((square_footage - baseline_sf) / 1000) * ADDITIONAL_MONTHS_PER_1000SF[tier],
+            BASE_MONTHS[tier]))
+        given_duration = rows.count('project_duration_months', 0)
+        estimated = given_duration == 0
+        project_duration_months = np.where(estimated, estimated_duration, given_duration)
+
+        def months(values):
+            # Estimated durations are ints even when the given ones are not
+            return mixed(values, estimated | (given_duration.dtype.kind == 'i'))
+
+        # Site preparation
+        house_footprint = square_footage / 1.5
+        lot_size = house_footprint * LOT_SIZE_MULTIPLIER[tier]
+        lot_perimeter = 4 * np.sqrt(lot_size)
+
+        # Temporary facilities
+        portable_toilets = np.select([square_footage < 5000, square_footage < 10000], [1, 2], 3).astype(np.int64)
+        field_office_sf = np.where((tier == PREMIUM) & (square_footage < 5000), 0, FIELD_OFFICE_SF[tier])
+
+        weeks = project_duration_months * 4.33
+
+        columns = {
+            "construction_fencing_lf": rint(lot_perimeter * 1.2),
+            "site_clearing_sf": rint(house_footprint * SITE_CLEARING_FACTOR[tier]),
+            "erosion_control_lf": rint(lot_perimeter),
+            "construction_entrance": constant(1, count),
+            "tree_protection": rint(lot_size / 10000),
+            "construction_signage": mask_rows(constant(1, count), luxury_tiers),
+            "temporary_roads_sf": mask_rows(rint(lot_size * 0.05), luxury_tiers),
+            "portable_toilets": portable_toilets,
+            "portable_toilet_months": months(portable_toilets * project_duration_months),
+            "dumpster_pulls": months(np.ceil(square_footage / 2000) * project_duration_months),
+            "field_office_sf": field_office_sf,
+            "field_office_months": months(np.where(field_office_sf == 0, 0, project_duration_months)),
+            "temp_electrical_months": months(project_duration_months),
+            "temp_water_months": months(project_duration_months),
+            "superintendent_hours": rint(SUPERINTENDENT_HOURS_PER_WEEK[tier] * weeks),
+            "project_manager_hours": rint(PROJECT_MANAGER_HOURS_PER_WEEK[tier] * weeks),
+            "client_meetings": rint(project_duration_months * 2),
+            "subcontractor_meetings": rint(project_duration_months * 4)
+        }
+
+        for role, hours in LABOR_HOURS_PER_WEEK.items():
+            role = role.lower().replace(' ', '_')
+            columns[f"{role}_hours"] = rint(hours[tier] * weeks)
+            columns[f"{role}_months"] = months(project_duration_months)
+
+        for permit in ("building_permit", "mechanical_permit", "electrical_permit", "plumbing_permit"):
+            columns[permit] = constant(1, count)
+        columns.update({
+            "foundation_inspections": FOUNDATION_INSPECTIONS[tier],
+            "framing_inspections": FRAMING_INSPECTIONS[tier],
+            "mechanical_inspections": TRADE_INSPECTIONS[tier],
+            "electrical_inspections": TRADE_INSPECTIONS[tier],
+            "plumbing_inspections": TRADE_INSPECTIONS[tier],
+            "final_inspections": constant(2, count),
+            "pool_permit": mask_rows(constant(1, count), luxury_tiers),
+            "landscape_permit": mask_rows(constant(1, count), luxury_tiers),
+            "safety_equipment_units": rint((square_footage / 1000) * SAFETY_EQUIPMENT_FACTOR[tier]),
+            "dust_barriers_sf": rint(square_footage * 0.15),
+            "floor_protection_sf": rint(square_footage * 0.5),
+            "window_protection_units": rint(square_footage * 0.008),
+            "first_aid_kits": np.ceil(project_duration_months / 3).astype(np.int64)
+        })
+        return columns
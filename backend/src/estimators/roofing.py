@@ -1,11 +1,29 @@
 import math
 import logging
+import numpy as np
+from src.estimators.batch import BatchQuantitiesMixin, TierTable, LUXURY, ULTRA_LUXURY, rint, mask_rows
 
 logger = logging.getLogger(__name__)
 
-class RoofingEstimator:
+# Tier coefficients (Premium, Luxury, Ultra-Luxury)
+# Roof area ratio (roof area to house footprint)
+ROOF_RATIO = TierTable(1.2, 1.35, 1.5)
+UNDERLAYMENT_LAYERS = TierTable(1, 2, 2)
+INSULATION_R_VALUE = TierTable(38, 49, 60)
+# Component factors (per roof square foot)
+RIDGE_VENT_FACTOR = TierTable(0.03, 0.05, 0.07)
+DRIP_EDGE_FACTOR = TierTable(0.12, 0.16, 0.2)
+# Per house footprint square foot
+FASCIA_FACTOR = TierTable(0.12, 0.16, 0.2)
+SOFFIT_FACTOR = TierTable(0.15, 0.22, 0.3)
+# Specialty drainage items for luxury tiers
+RAIN_CHAINS = TierTable(None, 1, 2)
+
+class RoofingEstimator(BatchQuantitiesMixin):
     """Handles roofing quantity calculations"""
     
+    QUANTITY_INPUTS = ()
+    
     def __init__(self, config=None):
         """Initialize with optional configuration"""
         self.config = config or {}
@@ -30,41 +48,20 @@ class RoofingEstimator:
         
     def _calculate_roof_area(self, square_footage, tier):
         """Calculate roof area and underlayment"""
-        # Roof area ratio (roof area to house footprint)
-        roof_ratio = {
-            "Premium": 1.2,
-            "Luxury": 1.35,
-            "Ultra-Luxury": 1.5
-        }
-        
-        # Underlayment layers
-        underlayment_layers = {
-            "Premium": 1,
-            "Luxury": 2,
-            "Ultra-Luxury": 2
-        }
-        
         # Calculate roof area
-        roof_area = square_footage * roof_ratio[tier]
+        roof_area = square_footage * ROOF_RATIO[tier]
         
         # Calculate underlayment (includes 15% for overlaps)
-        underlayment_area = roof_area * 1.15 * underlayment_layers[tier]
+        underlayment_area = roof_area * 1.15 * UNDERLAYMENT_LAYERS[tier]
         
         # Roof insulation area (typically just the footprint)
         ceiling_insulation_area = square_footage
         
-        # Insulation R-value by tier
-        insulation_r_value = {
-            "Premium": 38,
-            "Luxury": 49,
-            "Ultra-Luxury": 60
-        }
-        
         return {
             "roof_area_sf": round(roof_area),
             "underlayment_area_sf": round(underlayment_area),
             "ceiling_insulation_sf": round(ceiling_insulation_area),
-            "insulation_r_value": insulation_r_value[tier]
+            "insulation_r_value": INSULATION_R_VALUE[tier]
         }
         
     def _calculate_components(self, square_footage, tier):
@@ -72,36 +69,11 @@ class RoofingEstimator:
         # Get roof area
         roof_area = self._calculate_roof_area(square_footage, tier)["roof_area_sf"]
         
-        # Component factors (per roof square foot)
-        ridge_vent_factor = {
-            "Premium": 0.03,
-            "Luxury": 0.05,
-            "Ultra-Luxury": 0.07
-        }
-        
-        drip_edge_factor = {
-            "Premium": 0.12,
-            "Luxury": 0.16,
-            "Ultra-Luxury": 0.2
-        }
-        
-        fascia_factor = {
-            "Premium": 0.12,
-            "Luxury": 0.16,
-            "Ultra-Luxury": 0.2
-        }
-        
-        soffit_factor = {
-            "Premium": 0.15,
-            "Luxury": 0.22,
-            "Ultra-Luxury": 0.3
-        }
-        
         # Calculate components
-        ridge_vent = roof_area * ridge_vent_factor[tier]
-        drip_edge = roof_area * drip_edge_factor[tier]
-        fascia = square_footage * fascia_factor[tier]  # Based on house footprint
-        soffit = square_footage * soffit_factor[tier]  # Based on house footprint
+        ridge_vent = roof_area * RIDGE_VENT_FACTOR[tier]
+        drip_edge = roof_area * DRIP_EDGE_FACTOR[tier]
+        fascia = square_footage * FASCIA_FACTOR[tier]  # Based on house footprint
+        soffit = square_footage * SOFFIT_FACTOR[tier]  # Based on house footprint
         
         return {
             "ridge_vent_lf": round(ridge_vent),
@@ -128,8 +100,39 @@ class RoofingEstimator:
         }
         
         # Add specialty drainage items for luxury tiers
-        if tier in ["Luxury", "Ultra-Luxury"]:
-            result["rain_chains"] = 1 if tier == "Luxury" else 2
+        rain_chains = RAIN_CHAINS[tier]
+        if rain_chains is not None:
+            result["rain_chains"] = rain_chains
             result["decorative_scuppers"] = 0 if tier == "Luxury" else math.ceil(downspouts / 3)
             
-        return result
\ No newline at end of file
+        return result
+
+    def _quantity_columns(self, rows):
+        """Batch version of calculate_quantities"""
+        square_footage, tier = rows.square_footage, rows.tier
+
+        roof_area = square_footage * ROOF_RATIO[tier]
+        underlayment_area = roof_area * 1.15 * UNDERLAYMENT_LAYERS[tier]
+        rounded_roof_area = rint(roof_area)
+
+        perimeter = 4 * np.sqrt(square_footage)
+        gutters = perimeter * 0.85
+        downspouts = gutters / 40
+
+        luxury_tiers = rows.tier_in(LUXURY, ULTRA_LUXURY)
+        scuppers = np.where(tier == ULTRA_LUXURY, np.ceil(downspouts / 3), 0).astype(np.int64)
+
+        return {
+            "roof_area_sf": rounded_roof_area,
+            "underlayment_area_sf": rint(underlayment_area),
+            "ceiling_insulation_sf": rint(square_footage),
+            "insulation_r_value": INSULATION_R_VALUE[tier],
+            "ridge_vent_lf": rint(rounded_roof_area * RIDGE_VENT_FACTOR[tier]),
+            "drip_edge_lf": rint(rounded_roof_area * DRIP_EDGE_FACTOR[tier]),
+            "fascia_lf": rint(square_footage * FASCIA_FACTOR[tier]),
+            "soffit_sf": rint(square_footage * SOFFIT_FACTOR[tier]),
+            "gutters_lf": rint(gutters),
+            "downspouts_count": rint(downspouts),
+            "rain_chains": RAIN_CHAINS[tier],
+            "decorative_scuppers": mask_rows(scuppers, luxury_tiers)
+        }
@@ -1,4 +1,11 @@
-class SpecialtyEstimator:
+from src.estimators.batch import BatchQuantitiesMixin
+
+class SpecialtyEstimator(BatchQuantitiesMixin):
+    QUANTITY_INPUTS = ()
+
     def calculate_quantities(self, **kwargs):
         # Placeholder method
         return {}
+
+    def _quantity_columns(self, rows):
+        return {}
@@ -1,10 +1,22 @@
 import logging
+from src.estimators.batch import BatchQuantitiesMixin, TierTable, rint
 
 logger = logging.getLogger(__name__)
 
-class StructuralEstimator:
+# Tier coefficients (Premium, Luxury, Ultra-Luxury)
+BOARD_FEET_PER_SF = TierTable(2.8, 3.2, 3.6)
+ENGINEERED_PCT = TierTable(0.15, 0.25, 0.35)
+STEEL_PCT = TierTable(0.05, 0.15, 0.25)
+STUD_SPACING_INCHES = TierTable(16, 16, 12)
+CONNECTIONS_PER_SF = TierTable(0.004, 0.006, 0.008)
+# Sheathing SF per SF of house
+SHEATHING_FACTOR = TierTable(2.1, 2.3, 2.6)
+
+class StructuralEstimator(BatchQuantitiesMixin):
     """Handles structural quantity calculations"""
     
+    QUANTITY_INPUTS = ()
+    
     def __init__(self, config=None):
         """Initialize with optional configuration"""
         self.config = config or {}
@@ -29,34 +41,15 @@ class StructuralEstimator:
         
     def _calculate_framing(self, square_footage, tier):
         """Calculate framing quantities"""
-        # Board feet calculations
-        board_feet_per_sf = {
-            "Premium": 2.8,
-            "Luxury": 3.2,
-            "Ultra-Luxury": 3.6
-        }
-        
-        engineered_pct = {
-            "Premium": 0.15,
-            "Luxury": 0.25,
-            "Ultra-Luxury": 0.35
-        }
-        
-        steel_pct = {
-            "Premium": 0.05,
-            "Luxury": 0.15,
-            "Ultra-Luxury": 0.25
-        }
-        
         # Calculate total board feet and breakdown
-        total_board_feet = square_footage * board_feet_per_sf[tier]
-        conventional_lumber = total_board_feet * (1 - engineered_pct[tier] - steel_pct[tier])
-        engineered_lumber = total_board_feet * engineered_pct[tier]
-        steel_framing_equiv = total_board_feet * steel_pct[tier]
+        total_board_feet = square_footage * BOARD_FEET_PER_SF[tier]
+        conventional_lumber = total_board_feet * (1 - ENGINEERED_PCT[tier] - STEEL_PCT[tier])
+        engineered_lumber = total_board_feet * ENGINEERED_PCT[tier]
+        steel_framing_equiv = total_board_feet * STEEL_PCT[tier]
         
         # Stud calculation
         wall_linear_feet = 4 * (square_footage ** 0.5) + (square_footage * 0.15)  # Perimeter + interior walls
-        stud_spacing_inches = 16 if tier != "Ultra-Luxury" else 12
+        stud_spacing_inches = STUD_SPACING_INCHES[tier]
         studs_per_lf = 12 / (stud_spacing_inches / 12)  # studs per linear foot
         stud_quantity = wall_linear_feet * studs_per_lf
         
@@ -72,32 +65,14 @@ class StructuralEstimator:
     def _calculate_steel(self, square_footage, tier):
         """Calculate structural steel quantities"""
         # Board feet from framing calculations
-        board_feet_per_sf = {
-            "Premium": 2.8,
-            "Luxury": 3.2,
-            "Ultra-Luxury": 3.6
-        }
-        
-        steel_pct = {
-            "Premium": 0.05,
-            "Luxury": 0.15,
-            "Ultra-Luxury": 0.25
-        }
-        
-        total_board_feet = square_footage * board_feet_per_sf[tier]
-        steel_framing_equiv = total_board_feet * steel_pct[tier]
+        total_board_feet = square_footage * BOARD_FEET_PER_SF[tier]
+        steel_framing_equiv = total_board_feet * STEEL_PCT[tier]
         
         # Convert to actual steel weights (0.5 lbs per board foot equivalent)
         steel_framing_weight = steel_framing_equiv * 0.5
         
         # Calculate connections
-        connections_per_sf = {
-            "Premium": 0.004,
-            "Luxury": 0.006,
-            "Ultra-Luxury": 0.008
-        }
-        
-        connections = square_footage * connections_per_sf[tier]
+        connections = square_footage * CONNECTIONS_PER_SF[tier]
         
         return {
             "steel_framing_weight_lbs": round(steel_framing_weight),
@@ -106,15 +81,8 @@ class StructuralEstimator:
         
     def _calculate_sheathing(self, square_footage, tier):
         """Calculate sheathing quantities"""
-        # Sheathing SF per SF of house
-        sheathing_factor = {
-            "Premium": 2.1,
-            "Luxury": 2.3,
-            "Ultra-Luxury": 2.6
-        }
-        
         # Total sheathing
-        sheathing_sf = square_footage * sheathing_factor[tier]
+        sheathing_sf = square_footage * SHEATHING_FACTOR[tier]
         
         # Breakdown by type (approximate percentages)
         roof_sheathing_pct = 0.4
@@ -126,4 +94,38 @@ class StructuralEstimator:
             "roof_sheathing_sf": round(sheathing_sf * roof_sheathing_pct),
             "wall_sheathing_sf": round(sheathing_sf * wall_sheathing_pct),
             "floor_sheathing_sf": round(sheathing_sf * floor_sheathing_pct)
-        }
\ No newline at end of file
+        }
+
+    def _quantity_columns(self, rows):
+        """Batch version of calculate_quantities"""
+        square_footage, tier = rows.square_footage, rows.tier
+
+        # Framing
+        total_board_feet = square_footage * BOARD_FEET_PER_SF[tier]
+        engineered_pct, steel_pct = ENGINEERED_PCT[tier], STEEL_PCT[tier]
+        conventional_lumber = total_board_feet * (1 - engineered_pct - steel_pct)
+        engineered_lumber = total_board_feet * engineered_pct
+        steel_framing_equiv = total_board_feet * steel_pct
+
+        wall_linear_feet = 4 * (square_footage ** 0.5) + (square_footage * 0.15)
+        stud_spacing_inches = STUD_SPACING_INCHES[tier]
+        studs_per_lf = 12 / (stud_spacing_inches / 12)
+        stud_quantity = wall_linear_feet * studs_per_lf
+
+        # Sheathing
+        sheathing_sf = square_footage * SHEATHING_FACTOR[tier]
+
+        return {
+            "conventional_lumber_bf": rint(conventional_lumber),
+            "engineered_lumber_bf": rint(engineered_lumber),
+            "steel_framing_equivalent_bf": rint(steel_framing_equiv),
+            "stud_quantity": rint(stud_quantity),
+            "stud_spacing_inches": stud_spacing_inches,
+            "wall_linear_feet": rint(wall_linear_feet),
+            "steel_framing_weight_lbs": rint(steel_framing_equiv * 0.5),
+            "steel_connections": rint(square_footage * CONNECTIONS_PER_SF[tier]),
+            "total_sheathing_sf": rint(sheathing_sf),
+            "roof_sheathing_sf": rint(sheathing_sf * 0.4),
+            "wall_sheathing_sf": rint(sheathing_sf * 0.35),
+            "floor_sheathing_sf": rint(sheathing_sf * 0.25)
+        }
@@ -1,10 +1,34 @@
 import logging
+import numpy as np
+from src.estimators.batch import BatchQuantitiesMixin, TierTable, LUXURY, ULTRA_LUXURY, rint, constant, mask_rows
 
 logger = logging.getLogger(__name__)
 
-class ThermalFireSuppressionEstimator:
+# Tier coefficients (Premium, Luxury, Ultra-Luxury)
+# Wall insulation SF per SF of house
+WALL_INSULATION_FACTOR = TierTable(0.85, 0.95, 1.05)
+# Insulation R-values
+WALL_R_VALUE = TierTable(19, 21, 24)
+CEILING_R_VALUE = TierTable(38, 49, 60)
+# Specialty insulation as a share of the house; radiant barrier only for luxury tiers
+RIGID_INSULATION_PCT = TierTable(0.2, 0.4, 0.6)
+ACOUSTIC_INSULATION_PCT = TierTable(0.05, 0.15, 0.3)
+RADIANT_BARRIER_PCT = TierTable(None, 0.5, 1.0)
+# Caulk tubes and foam sealant cans per SF of house
+CAULK_FACTOR = TierTable(0.01, 0.015, 0.02)
+FOAM_FACTOR = TierTable(0.003, 0.005, 0.007)
+# 1 sprinkler head per X sq ft: minimum, standard and enhanced coverage
+COVERAGE_AREA_PER_HEAD = TierTable(200, 150, 100)
+# Share of the house covered by sprinklers (key areas only for Premium)
+COVERAGE_PERCENTAGE = TierTable(0.7, 0.9, 1.0)
+# LF of pipe per SF of covered area
+PIPING_FACTOR = TierTable(0.7, 0.85, 1.0)
+
+class ThermalFireSuppressionEstimator(BatchQuantitiesMixin):
     """Handles thermal insulation and fire suppression quantity calculations"""
     
+    QUANTITY_INPUTS = ()
+    
     def __init__(self, config=None):
         """Initialize with optional configuration"""
         self.config = config or {}
@@ -26,58 +50,23 @@ class ThermalFireSuppressionEstimator:
         
     def _calculate_thermal_insulation(self, square_footage, tier):
         """Calculate thermal insulation quantities"""
-        # Wall insulation SF per SF of house
-        wall_insulation_factor = {
-            "Premium": 0.85,
-            "Luxury": 0.95,
-            "Ultra-Luxury": 1.05
-        }
-        
         # Ceiling insulation SF per SF of house (typically 1:1)
         ceiling_insulation_factor = 1.0  # Same for all tiers
         
-        # Insulation R-values by tier
-        wall_r_value = {
-            "Premium": 19,
-            "Luxury": 21,
-            "Ultra-Luxury": 24
-        }
-        
-        ceiling_r_value = {
-            "Premium": 38,
-            "Luxury": 49,
-            "Ultra-Luxury": 60
-        }
-        
         # Calculate insulation areas
-        wall_insulation = square_footage * wall_insulation_factor[tier]
+        wall_insulation = square_footage * WALL_INSULATION_FACTOR[tier]
         ceiling_insulation = square_footage * ceiling_insulation_factor
         
         # Calculate specialty insulation
         specialty_results = {}
         
-        # Rigid insulation percentages by tier
-        rigid_insulation_pct = {
-            "Premium": 0.2,
-            "Luxury": 0.4,
-            "Ultra-Luxury": 0.6
-        }
-        
-        # Acoustic insulation percentages by tier
-        acoustic_insulation_pct = {
-            "Premium": 0.05,
-            "Luxury": 0.15,
-            "Ultra-Luxury": 0.3
-        }
-        
         # Calculate specialty insulation areas
-        specialty_results["rigid_insulation_sf"] = round(square_footage * rigid_insulation_pct[tier])
-        specialty_results["acoustic_insulation_sf"] = round(square_footage * acoustic_insulation_pct[tier])
+        specialty_results["rigid_insulation_sf"] = round(square_footage * RIGID_INSULATION_PCT[tier])
+        specialty_results["acoustic_insulation_sf"] = round(square_footage * ACOUSTIC_INSULATION_PCT[tier])
         
         # Add radiant barrier for luxury tiers
-        if tier in ["Luxury", "Ultra-Luxury"]:
-            radiant_barrier_pct = 0.5 if tier == "Luxury" else 1.0
-            specialty_results["radiant_barrier_sf"] = round(square_footage * radiant_barrier_pct)
+        if RADIANT_BARRIER_PCT[tier] is not None:
+            specialty_results["radiant_barrier_sf"] = round(square_footage * RADIANT_BARRIER_PCT[tier])
         
         # Add thermal break tape for ultra-luxury
         if tier == "Ultra-Luxury":
@@ -89,9 +78,9 @@ class ThermalFireSuppressionEstimator:
         # Combine all thermal insulation results
         results = {
             "wall_insulation_sf": round(wall_insulation),
-            "wall_r_value": wall_r_value[tier],
+            "wall_r_value": WALL_R_VALUE[tier],
             "ceiling_insulation_sf": round(ceiling_insulation),
-            "ceiling_r_value": ceiling_r_value[tier]
+            "ceiling_r_value": CEILING_R_VALUE[tier]
         }
         
         results.update(specialty_results)
@@ -104,23 +93,9 @@ class ThermalFireSuppressionEstimator:
         # Weather barrier typically covers wall area with slight overlap (10%)
         weather_barrier = wall_area * 1.1
         
-        # Caulk tubes per SF of house
-        caulk_factor = {
-            "Premium": 0.01,
-            "Luxury": 0.015,
-            "Ultra-Luxury": 0.02
-        }
-        
-        # Foam sealant cans per SF of house
-        foam_factor = {
-            "Premium": 0.003,
-            "Luxury": 0.005,
-            "Ultra-Luxury": 0.007
-        }
-        
         # Calculate weatherproofing quantities
-        caulk_tubes = square_footage * caulk_factor[tier]
-        foam_cans = square_footage * foam_factor[tier]
+        caulk_tubes = square_footage * CAULK_FACTOR[tier]
+        foam_cans = square_footage * FOAM_FACTOR[tier]
         
         return {
             "weather_barrier_sf": round(weather_barrier),
@@ -140,36 +115,15 @@ class ThermalFireSuppressionEstimator:
         # Determine if fire suppression is required
         # For this estimator, we'll assume all tiers have some level of fire suppression
         
-        # Calculate number of sprinkler heads
-        # Industry standard is approximately one head per 100-200 sq ft depending on coverage
-        coverage_area_per_head = {
-            "Premium": 200,  # 1 head per 200 sq ft (minimum coverage)
-            "Luxury": 150,   # 1 head per 150 sq ft (standard coverage)
-            "Ultra-Luxury": 100  # 1 head per 100 sq ft (enhanced coverage)
-        }
-        
-        # Percentage of house covered by sprinklers
-        coverage_percentage = {
-            "Premium": 0.7,   # 70% coverage (key areas only)
-            "Luxury": 0.9,    # 90% coverage
-            "Ultra-Luxury": 1.0  # 100% coverage
-        }
-        
         # Calculate covered area
-        covered_area = square_footage * coverage_percentage[tier]
+        covered_area = square_footage * COVERAGE_PERCENTAGE[tier]
         
         # Calculate sprinkler head count
-        sprinkler_heads = covered_area / coverage_area_per_head[tier]
+        # Industry standard is approximately one head per 100-200 sq ft depending on coverage
+        sprinkler_heads = covered_area / COVERAGE_AREA_PER_HEAD[tier]
         
         # Calculate piping (linear feet)
-        # Roughly 0.7-1.0 LF of pipe per 1 SF of covered area
-        piping_factor = {
-            "Premium": 0.7,
-            "Luxury": 0.85,
-            "Ultra-Luxury": 1.0
-        }
-        
-        fire_suppression_piping = covered_area * piping_factor[tier]
+        fire_suppression_piping = covered_area * PIPING_FACTOR[tier]
         
         # Calculate main components
         results = {
@@ -197,4 +151,40 @@ class ThermalFireSuppressionEstimator:
             results["concealed_sprinkler_heads"] = round(sprinkler_heads * 0.7)  # 70% of heads are concealed type
             results["fire_suppression_accent_finishes"] = round(sprinkler_heads * 0.3)  # 30% of heads get decorative finishes
         
-        return results
\ No newline at end of file
+        return results
+
+    def _quantity_columns(self, rows):
+        """Batch version of calculate_quantities"""
+        square_footage, tier = rows.square_footage, rows.tier
+        luxury_tiers = rows.tier_in(LUXURY, ULTRA_LUXURY)
+        ultra = tier == ULTRA_LUXURY
+
+        wall_insulation = square_footage * WALL_INSULATION_FACTOR[tier]
+        covered_area = square_footage * COVERAGE_PERCENTAGE[tier]
+        sprinkler_heads = covered_area / COVERAGE_AREA_PER_HEAD[tier]
+        floors = np.maximum(1, rint(square_footage / 3000))
+
+        return {
+            "wall_insulation_sf": rint(wall_insulation),
+            "wall_r_value": WALL_R_VALUE[tier],
+            "ceiling_insulation_sf": rint(square_footage * 1.0),
+            "ceiling_r_value": CEILING_R_VALUE[tier],
+            "rigid_insulation_sf": rint(square_footage * RIGID_INSULATION_PCT[tier]),
+            "acoustic_insulation_sf": rint(square_footage * ACOUSTIC_INSULATION_PCT[tier]),
+            "radiant_barrier_sf": rint(square_footage * RADIANT_BARRIER_PCT[tier]),
+            "thermal_break_tape_lf": mask_rows(rint(square_footage * 0.8), ultra),
+            "weather_barrier_sf": rint(wall_insulation * 1.1),
+            "caulk_tubes": rint(square_footage * CAULK_FACTOR[tier]),
+            "foam_sealant_cans": rint(square_footage * FOAM_FACTOR[tier]),
+            "fire_sprinkler_heads": rint(sprinkler_heads),
+            "fire_suppression_piping_lf": rint(covered_area * PIPING_FACTOR[tier]),
+            "fire_suppression_covered_area_sf": rint(covered_area),
+            "fire_riser_assembly": constant(1, len(rows)),
+            "flow_switches": floors + 1,
+            "control_valves": floors + 1,
+            "fire_suppression_monitor": mask_rows(constant(1, len(rows)), luxury_tiers),
+            "inspector_test_connections": mask_rows(floors, luxury_tiers),
+            "backup_water_supply": mask_rows(constant(1, len(rows)), ultra),
+            "concealed_sprinkler_heads": mask_rows(rint(sprinkler_heads * 0.7), ultra),
+            "fire_suppression_accent_finishes": mask_rows(rint(sprinkler_heads * 0.3), ultra)
+        }
@@ -1,10 +1,54 @@
 import logging
+import numpy as np
+from src.estimators.batch import BatchQuantitiesMixin, TierTable, rint, mixed, mask_rows
 
 logger = logging.getLogger(__name__)
 
-class TileEstimator:
+# Tier coefficients (Premium, Luxury, Ultra-Luxury)
+# Tile SF per bathroom in component order: shower floor, shower walls, floor,
+# niches, then the schluter edge treatment (LF), which is not part of the tile total.
+PRIMARY_BATH_TILE = {
+    "shower_floor_sf": TierTable(15, 25, 45),
+    "shower_walls_sf": TierTable(110, 160, 250),
+    "floor_sf": TierTable(70, 120, 200),
+    "niches_sf": TierTable(2.5, 5, 10),
+    "schluter_lf": TierTable(45, 80, 150)
+}
+SECONDARY_BATH_TILE = {
+    "shower_floor_sf": TierTable(9, 16, 25),
+    "shower_walls_sf": TierTable(70, 100, 150),
+    "floor_sf": TierTable(45, 60, 95),
+    "niches_sf": TierTable(2, 3, 5),
+    "schluter_lf": TierTable(30, 50, 80)
+}
+POWDER_ROOM_TILE = {
+    "floor_sf": TierTable(25, 35, 50),
+    "accent_wall_sf": TierTable(0, 15, 30),
+    "schluter_lf": TierTable(0, 10, 20)
+}
+# Kitchen backsplash base SF and additional SF per 1000 SF of house
+BACKSPLASH_BASE = TierTable(40, 60, 100)
+BACKSPLASH_PER_1000 = TierTable(5, 7, 10)
+# Butler's/prep kitchen and other tile areas (SF)
+BUTLERS_KITCHEN_TILE = TierTable(0, 25, 40)
+LAUNDRY_ROOM_TILE = TierTable(50, 75, 120)
+MUDROOM_TILE = TierTable(40, 60, 100)
+ENTRY_FOYER_TILE = TierTable(80, 150, 300)
+# Simplified formula: SF per SF of house plus SF per room
+SIMPLIFIED_HOUSE_FACTOR = TierTable(0.05, 0.07, 0.09)
+SIMPLIFIED_PRIMARY_BATH = TierTable(200, 315, 510)
+SIMPLIFIED_SECONDARY_BATH = TierTable(125, 180, 280)
+SIMPLIFIED_POWDER_ROOM = TierTable(25, 50, 80)
+
+class TileEstimator(BatchQuantitiesMixin):
     """Handles tile quantity calculations"""
     
+    QUANTITY_INPUTS = (
+        'primary_bath_count',
+        'secondary_bath_count',
+        'powder_room_count',
+    )
+    
     def __init__(self, config=None):
         """Initialize with optional configuration"""
         self.config = config or {}
@@ -47,212 +91,49 @@ class TileEstimator:
         
     def _calculate_primary_bath_tile(self, tier, count):
         """Calculate primary bathroom tile quantities"""
-        if count <= 0:
-            return {'primary_bath_count': 0}
-            
-        # Tile SF per primary bathroom by component and tier
-        shower_floor = {
-            "Premium": 15,
-            "Luxury": 25,
-            "Ultra-Luxury": 45
-        }
-        
-        shower_walls = {
-            "Premium": 110,
-            "Luxury": 160,
-            "Ultra-Luxury": 250
-        }
-        
-        bathroom_floor = {
-            "Premium": 70,
-            "Luxury": 120,
-            "Ultra-Luxury": 200
-        }
-        
-        shampoo_niches = {
-            "Premium": 2.5,
-            "Luxury": 5,
-            "Ultra-Luxury": 10
-        }
-        
-        edge_treatment = {
-            "Premium": 45,
-            "Luxury": 80,
-            "Ultra-Luxury": 150
-        }
-        
-        # Calculate total tile quantities for all primary bathrooms
-        result = {
-            "primary_bath_count": count,
-            "primary_bath_shower_floor_sf": round(count * shower_floor[tier]),
-            "primary_bath_shower_walls_sf": round(count * shower_walls[tier]),
-            "primary_bath_floor_sf": round(count * bathroom_floor[tier]),
-            "primary_bath_niches_sf": round(count * shampoo_niches[tier]),
-            "primary_bath_schluter_lf": round(count * edge_treatment[tier])
-        }
-        
-        # Calculate total primary bath tile
-        result["primary_bath_tile_sf"] = (
-            result["primary_bath_shower_floor_sf"] +
-            result["primary_bath_shower_walls_sf"] +
-            result["primary_bath_floor_sf"] +
-            result["primary_bath_niches_sf"]
-        )
-        
-        return result
+        return self._calculate_room_tile('primary_bath', count, PRIMARY_BATH_TILE, tier)
         
     def _calculate_secondary_bath_tile(self, tier, count):
         """Calculate secondary bathroom tile quantities"""
-        if count <= 0:
-            return {'secondary_bath_count': 0}
-            
-        # Tile SF per secondary bathroom by component and tier
-        shower_floor = {
-            "Premium": 9,
-            "Luxury": 16,
-            "Ultra-Luxury": 25
-        }
-        
-        shower_walls = {
-            "Premium": 70,
-            "Luxury": 100,
-            "Ultra-Luxury": 150
-        }
-        
-        bathroom_floor = {
-            "Premium": 45,
-            "Luxury": 60,
-            "Ultra-Luxury": 95
-        }
-        
-        shampoo_niches = {
-            "Premium": 2,
-            "Luxury": 3,
-            "Ultra-Luxury": 5
-        }
-        
-        edge_treatment = {
-            "Premium": 30,
-            "Luxury": 50,
-            "Ultra-Luxury": 80
-        }
-        
-        # Calculate total tile quantities for all secondary bathrooms
-        result = {
-            "secondary_bath_count": count,
-            "secondary_bath_shower_floor_sf": round(count * shower_floor[tier]),
-            "secondary_bath_shower_walls_sf": round(count * shower_walls[tier]),
-            "secondary_bath_floor_sf": round(count * bathroom_floor[tier]),
-            "secondary_bath_niches_sf": round(count * shampoo_niches[tier]),
-            "secondary_bath_schluter_lf": round(count * edge_treatment[tier])
-        }
-        
-        # Calculate total secondary bath tile
-        result["secondary_bath_tile_sf"] = (
-            result["secondary_bath_shower_floor_sf"] +
-            result["secondary_bath_shower_walls_sf"] +
-            result["secondary_bath_floor_sf"] +
-            result["secondary_bath_niches_sf"]
-        )
-        
-        return result
+        return self._calculate_room_tile('secondary_bath', count, SECONDARY_BATH_TILE, tier)
         
     def _calculate_powder_room_tile(self, tier, count):
         """Calculate powder room tile quantities"""
+        return self._calculate_room_tile('powder_room', count, POWDER_ROOM_TILE, tier)
+        
+    def _calculate_room_tile(self, prefix, count, tile_factors, tier):
+        """Calculate tile quantities for all rooms of one type"""
         if count <= 0:
-            return {'powder_room_count': 0}
+            return {f'{prefix}_count': 0}
             
-        # Tile SF per powder room by component and tier
-        floor_tile = {
-            "Premium": 25,
-            "Luxury": 35,
-            "Ultra-Luxury": 50
-        }
-        
-        accent_wall = {
-            "Premium": 0,
-            "Luxury": 15,
-            "Ultra-Luxury": 30
-        }
-        
-        edge_treatment = {
-            "Premium": 0,
-            "Luxury": 10,
-            "Ultra-Luxury": 20
-        }
-        
-        # Calculate total tile quantities for all powder rooms
-        result = {
-            "powder_room_count": count,
-            "powder_room_floor_sf": round(count * floor_tile[tier]),
-            "powder_room_accent_wall_sf": round(count * accent_wall[tier]),
-            "powder_room_schluter_lf": round(count * edge_treatment[tier])
-        }
-        
-        # Calculate total powder room tile
-        result["powder_room_tile_sf"] = (
-            result["powder_room_floor_sf"] +
-            result["powder_room_accent_wall_sf"]
-        )
+        result = {f"{prefix}_count": count}
+        tile_sf = 0
+        for component, factor in tile_factors.items():
+            result[f"{prefix}_{component}"] = round(count * factor[tier])
+            if component.endswith('_sf'):
+                tile_sf += result[f"{prefix}_{component}"]
+                
+        # Total tile for the room type, without the edge treatment
+        result[f"{prefix}_tile_sf"] = tile_sf
         
         return result
         
     def _calculate_kitchen_tile(self, square_footage, tier):
         """Calculate kitchen backsplash and other tile quantities"""
-        # Kitchen backsplash base SF by tier
-        base_amount = {
-            "Premium": 40,
-            "Luxury": 60,
-            "Ultra-Luxury": 100
-        }
-        
-        # Additional per 1000 SF by tier
-        additional_per_1000 = {
-            "Premium": 5,
-            "Luxury": 7,
-            "Ultra-Luxury": 10
-        }
-        
-        # Butler's/prep kitchen by tier (SF)
-        butlers_kitchen = {
-            "Premium": 0,
-            "Luxury": 25,
-            "Ultra-Luxury": 40
-        }
-        
         # Calculate backsplash area
-        backsplash = base_amount[tier] + ((square_footage / 1000) * additional_per_1000[tier])
+        backsplash = BACKSPLASH_BASE[tier] + ((square_footage / 1000) * BACKSPLASH_PER_1000[tier])
         
         return {
             "kitchen_backsplash_tile_sf": round(backsplash),
-            "butlers_kitchen_tile_sf": round(butlers_kitchen[tier])
+            "butlers_kitchen_tile_sf": round(BUTLERS_KITCHEN_TILE[tier])
         }
         
     def _calculate_other_tile(self, square_footage, tier):
         """Calculate other tile areas"""
-        # Other tile areas by tier (SF)
-        laundry_room = {
-            "Premium": 50,
-            "Luxury": 75,
-            "Ultra-Luxury": 120
-        }
-        
-        mudroom = {
-            "Premium": 40,
-            "Luxury": 60,
-            "Ultra-Luxury": 100
-        }
-        
-        entry_foyer = {
-            "Premium": 80,
-            "Luxury": 150,
-            "Ultra-Luxury": 300
-        }
-        
         return {
-            "laundry_room_tile_sf": round(laundry_room[tier]),
-            "mudroom_tile_sf": round(mudroom[tier]),
-            "entry_foyer_tile_sf": round(entry_foyer[tier])
+            "laundry_room_tile_sf": round(LAUNDRY_ROOM_TILE[tier]),
+            "mudroom_tile_sf": round(MUDROOM_TILE[tier]),
+            "entry_foyer_tile_sf": round(ENTRY_FOYER_TILE[tier])
         }
         
     def _calculate_totals(self, tile_data):
@@ -295,65 +176,86 @@ class TileEstimator:
     def _calculate_simplified(self, square_footage, tier, primary_bath_count, 
                             secondary_bath_count, powder_room_count):
         """Calculate total tile using simplified formula"""
-        # Simplified formula factors by tier
-        house_factor = {
-            "Premium": 0.05,
-            "Luxury": 0.07,
-            "Ultra-Luxury": 0.09
-        }
-        
-        primary_bath = {
-            "Premium": 200,
-            "Luxury": 315,
-            "Ultra-Luxury": 510
-        }
-        
-        secondary_bath = {
-            "Premium": 125,
-            "Luxury": 180,
-            "Ultra-Luxury": 280
-        }
-        
-        powder_room = {
-            "Premium": 25,
-            "Luxury": 50,
-            "Ultra-Luxury": 80
-        }
-        
-        # Schluter factors
-        schluter_primary = {
-            "Premium": 45,
-            "Luxury": 80,
-            "Ultra-Luxury": 150
-        }
-        
-        schluter_secondary = {
-            "Premium": 30,
-            "Luxury": 50,
-            "Ultra-Luxury": 80
-        }
-        
-        schluter_powder = {
-            "Premium": 0,
-            "Luxury": 10,
-            "Ultra-Luxury": 20
-        }
-        
         # Calculate simplified totals
         simplified_tile = (
-            (square_footage * house_factor[tier]) +
-            (primary_bath_count * primary_bath[tier]) +
-            (secondary_bath_count * secondary_bath[tier]) +
-            (powder_room_count * powder_room[tier])
+            (square_footage * SIMPLIFIED_HOUSE_FACTOR[tier]) +
+            (primary_bath_count * SIMPLIFIED_PRIMARY_BATH[tier]) +
+            (secondary_bath_count * SIMPLIFIED_SECONDARY_BATH[tier]) +
+            (powder_room_count * SIMPLIFIED_POWDER_ROOM[tier])
         )
         
         simplified_schluter = (
-            (primary_bath_count * schluter_primary[tier]) +
-            (secondary_bath_count * schluter_secondary[tier]) +
-            (powder_room_count * schluter_powder[tier])
+            (primary_bath_count * PRIMARY_BATH_TILE["schluter_lf"][tier]) +
+            (secondary_bath_count * SECONDARY_BATH_TILE["schluter_lf"][tier]) +
+            (powder_room_count * POWDER_ROOM_TILE["schluter_lf"][tier])
         )
         
         return {
             "simplified_total_tile_sf": round(simplified_tile),
             "simplified_total_schluter_lf": round(simplified_schluter)
-        }
\ No newline at end of file
+        }
+
+    def _room_tile_columns(self, prefix, count, tile_factors, tier):
+        """Tile columns for one room type; rows without such rooms only report the count"""
+        has_rooms = count > 0
+        columns = {
+            f"{prefix}_count": mixed(np.where(has_rooms, count, 0), ~has_rooms | (count.dtype.kind == 'i'))
+        }
+        tile_sf = 0
+        for component, factor in tile_factors.items():
+            column = rint(count * factor[tier])
+            columns[f"{prefix}_{component}"] = mask_rows(column, has_rooms)
+            if component.endswith('_sf'):
+                tile_sf = tile_sf + column
+        columns[f"{prefix}_tile_sf"] = mask_rows(tile_sf, has_rooms)
+        return columns
+
+    def _quantity_columns(self, rows):
+        """Batch version of calculate_quantities"""
+        square_footage, tier = rows.square_footage, rows.tier
+        primary_bath_count = rows.count('primary_bath_count', 1)
+        secondary_bath_count = rows.count('secondary_bath_count', 1)
+        powder_room_count = rows.count('powder_room_count', 0)
+
+        columns = {}
+        columns.update(self._room_tile_columns('primary_bath', primary_bath_count, PRIMARY_BATH_TILE, tier))
+        columns.update(self._room_tile_columns('secondary_bath', secondary_bath_count, SECONDARY_BATH_TILE, tier))
+        columns.update(self._room_tile_columns('powder_room', powder_room_count, POWDER_ROOM_TILE, tier))
+
+        columns["kitchen_backsplash_tile_sf"] = rint(
+            BACKSPLASH_BASE[tier] + ((square_footage / 1000) * BACKSPLASH_PER_1000[tier]))
+        columns["butlers_kitchen_tile_sf"] = BUTLERS_KITCHEN_TILE[tier]
+        columns["laundry_room_tile_sf"] = LAUNDRY_ROOM_TILE[tier]
+        columns["mudroom_tile_sf"] = MUDROOM_TILE[tier]
+        columns["entry_foyer_tile_sf"] = ENTRY_FOYER_TILE[tier]
+
+        def total(*keys):
+            # Missing room types count as zero, as in _calculate_totals
+            return sum(np.ma.filled(columns[key], 0) for key in keys)
+
+        bathroom_tile = total("primary_bath_tile_sf", "secondary_bath_tile_sf", "powder_room_tile_sf")
+        kitchen_tile = total("kitchen_backsplash_tile_sf", "butlers_kitchen_tile_sf")
+        other_tile = total("laundry_room_tile_sf", "mudroom_tile_sf", "entry_foyer_tile_sf")
+        columns.update({
+            "total_bathroom_tile_sf": bathroom_tile,
+            "total_kitchen_tile_sf": kitchen_tile,
+            "total_other_tile_sf": other_tile,
+            "total_tile_sf": bathroom_tile + kitchen_tile + other_tile,
+            "total_schluter_lf": total("primary_bath_schluter_lf", "secondary_bath_schluter_lf",
+                                       "powder_room_schluter_lf")
+        })
+
+        simplified_tile = (
+            (square_footage * SIMPLIFIED_HOUSE_FACTOR[tier]) +
+            (primary_bath_count * SIMPLIFIED_PRIMARY_BATH[tier]) +
+            (secondary_bath_count * SIMPLIFIED_SECONDARY_BATH[tier]) +
+            (powder_room_count * SIMPLIFIED_POWDER_ROOM[tier])
+        )
+        simplified_schluter = (
+            (primary_bath_count * PRIMARY_BATH_TILE["schluter_lf"][tier]) +
+            (secondary_bath_count * SECONDARY_BATH_TILE["schluter_lf"][tier]) +
+            (powder_room_count * POWDER_ROOM_TILE["schluter_lf"][tier])
+        )
+        columns["simplified_total_tile_sf"] = rint(simplified_tile)
+        columns["simplified_total_schluter_lf"] = rint(simplified_schluter)
+        return columns
@@ -1,11 +1,28 @@
 import math
 import logging
+import numpy as np
+from src.estimators.batch import BatchQuantitiesMixin, TierTable, rint
 
 logger = logging.getLogger(__name__)
 
-class WindowsDoorsEstimator:
+# Tier coefficients (Premium, Luxury, Ultra-Luxury)
+# Windows per square foot of house, average window size and efficiency level
+WINDOWS_PER_SF = TierTable(0.006, 0.008, 0.01)
+AVG_WINDOW_SF = TierTable(12, 15, 18)
+WINDOW_EFFICIENCY = TierTable("Low-E Double Pane", "Low-E Triple Pane", "Dynamic Glass/Smart Glass")
+# Base exterior doors and patio/sliding door sets, plus additional ones for larger homes
+BASE_DOORS = TierTable(2, 3, 4)
+ADDITIONAL_DOORS_PER_3000 = TierTable(0, 1, 2)
+BASE_PATIO_DOORS = TierTable(1, 2, 3)
+ADDITIONAL_PATIO_PER_4000 = TierTable(0.5, 1, 1.5)
+DOOR_TYPE = TierTable("Fiberglass/Wood", "Premium Wood/Steel", "Custom Wood/Steel")
+GARAGE_DOORS = TierTable(2, 3, 4)
+
+class WindowsDoorsEstimator(BatchQuantitiesMixin):
     """Handles windows and doors quantity calculations"""
     
+    QUANTITY_INPUTS = ()
+    
     def __init__(self, config=None):
         """Initialize with optional configuration"""
         self.config = config or {}
@@ -30,92 +47,36 @@ class WindowsDoorsEstimator:
         
     def _calculate_windows(self, square_footage, tier):
         """Calculate window quantities"""
-        # Windows per square foot of house
-        windows_per_sf = {
-            "Premium": 0.006,
-            "Luxury": 0.008,
-            "Ultra-Luxury": 0.01
-        }
-        
-        # Average window size by tier
-        avg_window_sf = {
-            "Premium": 12,
-            "Luxury": 15,
-            "Ultra-Luxury": 18
-        }
-        
-        # Window efficiency level by tier
-        window_efficiency = {
-            "Premium": "Low-E Double Pane",
-            "Luxury": "Low-E Triple Pane",
-            "Ultra-Luxury": "Dynamic Glass/Smart Glass"
-        }
-        
         # Calculate window count and area
-        window_count = round(square_footage * windows_per_sf[tier])
-        window_area = window_count * avg_window_sf[tier]
+        window_count = round(square_footage * WINDOWS_PER_SF[tier])
+        window_area = window_count * AVG_WINDOW_SF[tier]
         
         # Calculate window trim (perimeter of all windows)
-        trim_per_window = 4 * math.sqrt(avg_window_sf[tier])
+        trim_per_window = 4 * math.sqrt(AVG_WINDOW_SF[tier])
         window_trim = window_count * trim_per_window
         
         return {
             "window_count": window_count,
             "window_area_sf": round(window_area),
-            "window_efficiency": window_efficiency[tier],
+            "window_efficiency": WINDOW_EFFICIENCY[tier],
             "window_trim_lf": round(window_trim)
         }
         
     def _calculate_exterior_doors(self, square_footage, tier):
         """Calculate exterior door quantities"""
-        # Base number of exterior doors by tier
-        base_doors = {
-            "Premium": 2,
-            "Luxury": 3,
-            "Ultra-Luxury": 4
-        }
-        
-        # Additional doors for larger homes
-        additional_doors_per_3000 = {
-            "Premium": 0,
-            "Luxury": 1,
-            "Ultra-Luxury": 2
-        }
-        
-        # Base patio/sliding door sets
-        base_patio_doors = {
-            "Premium": 1,
-            "Luxury": 2,
-            "Ultra-Luxury": 3
-        }
-        
-        # Additional patio doors for larger homes
-        additional_patio_per_4000 = {
-            "Premium": 0.5,
-            "Luxury": 1,
-            "Ultra-Luxury": 1.5
-        }
-        
-        # Door type by tier
-        door_type = {
-            "Premium": "Fiberglass/Wood",
-            "Luxury": "Premium Wood/Steel",
-            "Ultra-Luxury": "Custom Wood/Steel"
-        }
-        
         # Calculate additional doors based on square footage
         additional_doors = 0
         if square_footage > 6000:
-            additional_doors = math.floor((square_footage - 6000) / 3000) * additional_doors_per_3000[tier]
+            additional_doors = math.floor((square_footage - 6000) / 3000) * ADDITIONAL_DOORS_PER_3000[tier]
             
         # Calculate additional patio doors based on square footage
         additional_patio = 0
         if square_footage > 4000:
-            additional_patio = math.floor((square_footage - 4000) / 4000) * additional_patio_per_4000[tier]
+            additional_patio = math.floor((square_footage - 4000) / 4000) * ADDITIONAL_PATIO_PER_4000[tier]
             
         # Calculate total doors
-        exterior_doors = base_doors[tier] + additional_doors
-        patio_doors = base_patio_doors[tier] + additional_patio
+        exterior_doors = BASE_DOORS[tier] + additional_doors
+        patio_doors = BASE_PATIO_DOORS[tier] + additional_patio
         
         # Calculate hardware sets (typically one per door)
         door_hardware = exterior_doors + (patio_doors * 0.5)  # less hardware for sliding doors
@@ -124,23 +85,47 @@ class WindowsDoorsEstimator:
             "exterior_door_count": round(exterior_doors),
             "patio_door_sets": round(patio_doors),
             "door_hardware_sets": round(door_hardware),
-            "exterior_door_type": door_type[tier]
+            "exterior_door_type": DOOR_TYPE[tier]
         }
         
     def _calculate_garage_doors(self, square_footage, tier):
         """Calculate garage door quantities"""
-        # Garage doors by tier
-        garage_doors = {
-            "Premium": 2,
-            "Luxury": 3,
-            "Ultra-Luxury": 4
-        }
-        
         # Auto-openers (typically one per door)
-        auto_openers = garage_doors[tier]
+        auto_openers = GARAGE_DOORS[tier]
         
         # Calculate quantity
         return {
-            "garage_door_count": garage_doors[tier],
+            "garage_door_count": GARAGE_DOORS[tier],
             "garage_door_openers": auto_openers
-        }
\ No newline at end of file
+        }
+
+    def _quantity_columns(self, rows):
+        """Batch version of calculate_quantities"""
+        square_footage, tier = rows.square_footage, rows.tier
+
+        window_count = rint(square_footage * WINDOWS_PER_SF[tier])
+        avg_window_sf = AVG_WINDOW_SF[tier]
+        window_trim = window_count * (4 * np.sqrt(avg_window_sf))
+
+        additional_doors = np.where(
+            square_footage > 6000,
+            np.floor((square_footage - 6000) / 3000) * ADDITIONAL_DOORS_PER_3000[tier], 0)
+        additional_patio = np.where(
+            square_footage > 4000,
+            np.floor((square_footage - 4000) / 4000) * ADDITIONAL_PATIO_PER_4000[tier], 0)
+        exterior_doors = BASE_DOORS[tier] + additional_doors
+        patio_doors = BASE_PATIO_DOORS[tier] + additional_patio
+        garage_doors = GARAGE_DOORS[tier]
+
+        return {
+            "window_count": window_count,
+            "window_area_sf": window_count * avg_window_sf,
+            "window_efficiency": WINDOW_EFFICIENCY[tier],
+            "window_trim_lf": rint(window_trim),
+            "exterior_door_count": rint(exterior_doors),
+            "patio_door_sets": rint(patio_doors),
+            "door_hardware_sets": rint(exterior_doors + (patio_doors * 0.5)),
+            "exterior_door_type": DOOR_TYPE[tier],
+            "garage_door_count": garage_doors,
+            "garage_door_openers": garage_doors.copy()
+        }
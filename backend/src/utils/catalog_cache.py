@@ -0,0 +1,105 @@
+# src/utils/catalog_cache.py
+
+import hashlib
+import logging
+import os
+import threading
+import pandas as pd
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - pyarrow is in requirements.txt
+    pa = None
+    pq = None
+
+# Bump when the parsing/cleaning pipeline changes so stale caches are rebuilt
+CACHE_FORMAT_VERSION = '1'
+CACHE_KEY_FIELD = b'catalog_cache_key'
+
+COST_COLUMNS = ['Cost (Low)', 'Cost (High)', 'Cost(Mid)']
+
+def strip_catalog_junk(catalog: pd.DataFrame) -> pd.DataFrame:
+    """
+    Drop the empty trailing columns and section-header rows found in catalog CSVs
+
+    Section headers (e.g. "Kitchen") and blank separator rows carry no ID and
+    no costs, so they can never be priced.
+    """
+    junk_columns = [
+        column for column in catalog.columns
+        if str(column).startswith('Unnamed:') and catalog[column].isna().all()
+    ]
+    catalog = catalog.drop(columns=junk_columns)
+
+    if 'ID' in catalog.columns:
+        cost_columns = [column for column in COST_COLUMNS if column in catalog.columns]
+        header_rows = catalog['ID'].isna()
+        if cost_columns:
+            header_rows &= catalog[cost_columns].isna().all(axis=1)
+        catalog = catalog[~header_rows]
+
+    return catalog.reset_index(drop=True)
+
+def cache_path_for(csv_path: str, namespace: str) -> str:
+    """Cache file written next to the CSV, e.g. data/catalog.csv.loader.cache.parquet"""
+    return f"{csv_path}.{namespace}.cache.parquet"
+
+def _cache_key(csv_path: str, namespace: str) -> str:
+    digest = hashlib.sha256(f"{CACHE_FORMAT_VERSION}:{namespace}:".encode('utf-8'))
+    with open(csv_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def load_cached_frame(csv_path: str, build: Callable[[], pd.DataFrame], namespace: str,
+                      enabled: bool = True) -> pd.DataFrame:
+    """
+    Load a parsed catalog from its Parquet cache, or build it and write the cache
+
+    The cache is keyed on a hash of the CSV contents plus the namespace, so it is
+    rebuilt whenever the CSV changes. Caching is skipped when pyarrow is not
+    available or the cache cannot be written.
+
+    Args:
+        csv_path: Source CSV (must exist; its bytes are hashed)
+        build: Parses the CSV into the final DataFrame on a cache miss
+        namespace: Distinguishes different parsing pipelines over the same CSV
+        enabled: Set False to always parse the CSV
+    """
+    if not enabled or pq is None:
+        return build()
+
+    key = _cache_key(csv_path, namespace)
+    cache_path = cache_path_for(csv_path, namespace)
+
+    if os.path.exists(cache_path):
+        try:
+            metadata = pq.read_schema(cache_path).metadata or {}
+            if metadata.get(CACHE_KEY_FIELD) == key.encode('utf-8'):
+                catalog = pq.read_table(cache_path).to_pandas()
+                logger.info(f"Loaded {len(catalog)} catalog rows from cache {cache_path}")
+                return catalog
+            logger.info(f"Catalog cache {cache_path} is stale, rebuilding")
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable catalog cache {cache_path}: {str(e)}")
+
+    catalog = build()
+
+    # Write to a temp file and rename so readers never see a partial cache
+    temp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        table = pa.Table.from_pandas(catalog, preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), CACHE_KEY_FIELD: key.encode('utf-8')})
+        pq.write_table(table, temp_path)
+        os.replace(temp_path, cache_path)
+        logger.info(f"Wrote catalog cache {cache_path}")
+    except Exception as e:
+        logger.warning(f"Could not write catalog cache {cache_path}: {str(e)}")
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    return catalog
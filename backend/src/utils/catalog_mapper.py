@@ -1,23 +1,31 @@
 # src/utils/catalog_mapper.py
 
+import numpy as np
 import pandas as pd
 import json
 import os
 import logging
 from pathlib import Path
 
+from src.utils.catalog_cache import load_cached_frame, strip_catalog_junk
+from src.utils.search_index import SearchIndex
+from src.utils.electrical_index import (
+    ElectricalComponentIndex, COMPONENT_TYPES, GENERIC_ITEMS, AVERAGE_COST_TERMS
+)
+
 logger = logging.getLogger(__name__)
 
 class CatalogMapper:
     """System to map between estimator quantities and catalog items"""
     
-    def __init__(self, catalog_path, mapping_config_path=None):
+    def __init__(self, catalog_path, mapping_config_path=None, use_cache=True):
         """
         Initialize with catalog path and optional mapping configuration
         
         Args:
             catalog_path: Path to the enhanced catalog CSV
             mapping_config_path: Path to JSON mapping configuration (created if not exists)
+            use_cache: Load the parsed catalog from its Parquet cache when the CSV is unchanged
         """
         self.catalog_path = catalog_path
         self.mapping_config_path = mapping_config_path or os.path.join(
@@ -26,12 +34,26 @@ class CatalogMapper:
         
         # Load catalog
         try:
-            self.catalog = pd.read_csv(catalog_path)
+            self.catalog = load_cached_frame(
+                catalog_path, lambda: strip_catalog_junk(pd.read_csv(catalog_path, low_memory=False)), 'mapper', enabled=use_cache
+            )
             logger.info(f"Loaded catalog with {len(self.catalog)} items")
         except Exception as e:
             logger.error(f"Error loading catalog: {str(e)}")
             self.catalog = pd.DataFrame()
         
+        # Token index over the text columns, with module/tier/ID filters
+        self.search_index = SearchIndex(
+            self.catalog,
+            fields=('SearchItem', 'Keywords', 'Category'),
+            filter_columns=('EstimatorModule', 'ConstructionTier', 'ID')
+        )
+        
+        # Module x tier partitions and one shared record per row, built once
+        self.partitions = self._build_partitions()
+        self._records = self.catalog.to_dict('records')
+        self.electrical_index = ElectricalComponentIndex(self.catalog, self.search_index, self._records)
+        
         # Load or create mapping configuration
         self.mapping_config = self._load_mapping_config()
     
@@ -113,68 +135,97 @@ class CatalogMapper:
         # If we have explicit item IDs for this quantity and tier, use those
         if mappings and "tier_item_ids" in mappings and construction_tier in mappings["tier_item_ids"]:
             item_ids = mappings["tier_item_ids"][construction_tier]
-            matches = self.catalog[self.catalog['ID'].isin(item_ids)]
-            if not matches.empty:
-                return matches.to_dict('records')
+            matches = self.search_index.filter_any('ID', item_ids)
+            if len(matches) > 0:
+                return self._rows_to_items(matches)
+        
+        # Items for the module, filtered by construction tier if specified
+        module_rows = self._get_module_rows(module_name, construction_tier)
         
         # Try to match by search terms
         if mappings and "search_terms" in mappings:
-            search_terms = mappings["search_terms"]
-            module_items = self.catalog[self.catalog['EstimatorModule'] == module_name]
-            
-            # Filter by construction tier if specified
-            if construction_tier:
-                module_items = module_items[module_items['ConstructionTier'] == construction_tier]
-            
-            # Create search pattern
-            search_pattern = '|'.join(search_terms)
-            matches = module_items[module_items['SearchItem'].str.contains(
-                search_pattern, case=False, regex=True, na=False
-            )]
+            search_pattern = '|'.join(mappings["search_terms"])
+            matches = self.search_index.match_pattern('SearchItem', search_pattern, case=False, rows=module_rows)
             
-            if not matches.empty:
-                return matches.to_dict('records')
-        
-        # If no explicit mapping or search terms didn't work, try to derive from quantity name
-        derived_search_terms = self._derive_search_terms_from_quantity(quantity_name)
-        
-        # Get items for the module
-        module_items = self.catalog[self.catalog['EstimatorModule'] == module_name]
-        
-        # Filter by construction tier if specified
-        if construction_tier:
-            module_items = module_items[module_items['ConstructionTier'] == construction_tier]
+            if len(matches) > 0:
+                return self._rows_to_items(matches)
         
         # Empty result if no module items
-        if module_items.empty:
+        if len(module_rows) == 0:
             return []
         
-        # Create search pattern
+        # If no explicit mapping or search terms didn't work, try to derive from quantity name
+        derived_search_terms = self._derive_search_terms_from_quantity(quantity_name)
         search_pattern = '|'.join(derived_search_terms)
-        matches = module_items[module_items['SearchItem'].str.contains(
-            search_pattern, case=False, regex=True, na=False
-        )]
+        matches = self.search_index.match_pattern('SearchItem', search_pattern, case=False, rows=module_rows)
         
         # If still no matches, return best guess based on category
-        if matches.empty:
+        if len(matches) == 0:
             # Try to guess category from quantity name
             category = self._guess_category_from_quantity(quantity_name)
             if category:
-                category_items = self.catalog[self.catalog['Category'].str.contains(
-                    category, case=False, na=False
-                )]
+                category_rows = self.search_index.match_pattern('Category', category, case=False)
                 
                 # Filter by construction tier if specified
                 if construction_tier:
-                    category_items = category_items[category_items['ConstructionTier'] == construction_tier]
+                    category_rows = self.search_index.filter(category_rows, ConstructionTier=construction_tier)
                 
-                if not category_items.empty:
-                    return category_items.head(3).to_dict('records')
+                if len(category_rows) > 0:
+                    return self._rows_to_items(category_rows[:3])
             
             # Last resort: return any items from the module
-            return module_items.head(3).to_dict('records')
+            return self._rows_to_items(module_rows[:3])
+        
+        return self._rows_to_items(matches)
+    
+    def search_module_items(self, module_name, pattern, construction_tier=None):
+        """
+        Catalog items of a module whose SearchItem matches a pattern (case-insensitive)
+        
+        Args:
+            module_name: Estimator module name
+            pattern: Search term or '|'-separated alternatives
+            construction_tier: Optional construction tier to limit the search to
+            
+        Returns:
+            List of matching catalog items, in catalog order
+        """
+        module_rows = self._get_module_rows(module_name, construction_tier)
+        return self._rows_to_items(self.search_index.match_pattern('SearchItem', pattern, case=False, rows=module_rows))
+    
+    def _build_partitions(self):
+        """Row positions keyed by (module, tier), with (module, None) holding every tier of a module"""
+        if self.catalog.empty or 'EstimatorModule' not in self.catalog.columns:
+            return {}
         
-        return matches.to_dict('records')
+        modules = self.catalog['EstimatorModule'].tolist()
+        if 'ConstructionTier' in self.catalog.columns:
+            tiers = self.catalog['ConstructionTier'].tolist()
+        else:
+            tiers = [None] * len(modules)
+        
+        partitions = {}
+        for position, (module, tier) in enumerate(zip(modules, tiers)):
+            if not isinstance(module, str):
+                continue
+            partitions.setdefault((module, None), []).append(position)
+            if isinstance(tier, str):
+                partitions.setdefault((module, tier), []).append(position)
+        
+        return {key: np.array(rows, dtype=np.int64) for key, rows in partitions.items()}
+    
+    def _get_module_rows(self, module_name, construction_tier=None):
+        """Row positions for an estimator module, optionally limited to one construction tier"""
+        return self.partitions.get((module_name, construction_tier or None), np.empty(0, dtype=np.int64))
+    
+    def _rows_to_items(self, rows):
+        """
+        Catalog items for row positions
+        
+        Items are the mapper's shared per-row records rather than fresh copies,
+        so callers must copy an item before modifying it.
+        """
+        return [self._records[position] for position in rows]
     
     def _get_quantity_mappings(self, module_name, quantity_name):
         """Get mapping configuration for a specific quantity"""
@@ -379,74 +430,31 @@ def get_electrical_catalog_items(self, quantity_name, tier):
     
     # If no matches found, apply electrical-specific strategies
     if not matches:
-        # Strategy 1: Try alias mapping for common electrical terms
-        electrical_aliases = {
-            "recessed_lights": ["can lights", "pot lights", "downlights"],
-            "dimmer_switches": ["dimmers", "light controls"],
-            "gfci_outlets": ["gfi outlets", "ground fault", "bathroom outlets"],
-            "standard_outlets": ["receptacles", "plugs", "wall outlets"],
-            "three_way_switches": ["3-way", "multiple location"],
-            "chandeliers": ["hanging fixtures", "pendant lights", "ceiling fixtures"],
-            "under_cabinet_lights": ["cabinet lighting", "task lighting"],
-            "audio_visual_drops": ["av connections", "media outlets"],
-            "security_system_components": ["security devices", "alarm components"]
-        }
+        index = self.electrical_index
         
-        if quantity_name in electrical_aliases:
-            for alias in electrical_aliases[quantity_name]:
-                # Filter catalog by electrical estimator module and alias
-                alias_matches = [
-                    item for item in self.catalog.to_dict('records')
-                    if item.get('EstimatorModule') == "electrical" and
-                    alias in str(item.get('SearchItem', '')).lower()
-                ]
-                
-                if alias_matches:
-                    return alias_matches
+        # Strategy 1: Try alias mapping for common electrical terms
+        if quantity_name in index.alias_rows:
+            return index.items(index.alias_rows[quantity_name])
         
         # Strategy 2: Component type matching
-        component_types = {
-            "lights": ["lights", "lighting", "fixtures", "lamps"],
-            "switches": ["switches", "controls", "dimmers"],
-            "outlets": ["outlets", "receptacles", "plugs"],
-            "panels": ["panels", "electrical boxes", "service"]
-        }
-        
-        for component, terms in component_types.items():
+        for component, terms in COMPONENT_TYPES.items():
             if any(comp in quantity_name for comp in terms):
-                # Try to find matches based on component type
-                type_matches = []
-                for term in terms:
-                    term_matches = [
-                        item for item in self.catalog.to_dict('records')
-                        if item.get('EstimatorModule') == "electrical" and
-                        term in str(item.get('SearchItem', '')).lower()
-                    ]
-                    type_matches.extend(term_matches)
+                type_rows = index.type_rows[component]
                 
-                if type_matches:
+                if len(type_rows) > 0:
                     # Filter by construction tier if possible
-                    tier_matches = [
-                        item for item in type_matches
-                        if item.get('ConstructionTier') == tier
-                    ]
+                    tier_rows = index.type_tier_rows.get((component, tier))
+                    if tier_rows is None:
+                        tier_rows = index.filter_tier(type_rows, tier)
                     
-                    if tier_matches:
-                        return tier_matches
-                    return type_matches
+                    if len(tier_rows) > 0:
+                        return index.items(tier_rows)
+                    return index.items(type_rows)
     
     return matches
 
 def get_electrical_generic_item(self, quantity_name, tier):
     """Get a generic electrical item for a given quantity name and tier"""
-    # Map quantity categories to generic catalog items
-    generic_mapping = {
-        "outlets": "standard electrical outlet",
-        "switches": "standard wall switch",
-        "lights": "standard light fixture",
-        "panels": "electrical panel"
-    }
-    
     # Determine which category this quantity belongs to
     category = None
     for cat, terms in {
@@ -463,34 +471,23 @@ def get_electrical_generic_item(self, quantity_name, tier):
         return None
         
     # Search for generic items matching this category
-    search_term = generic_mapping.get(category)
+    search_term = GENERIC_ITEMS.get(category)
     if not search_term:
         return None
         
-    # Filter catalog to find generic items
-    generic_items = [
-        item for item in self.catalog.to_dict('records')
-        if item.get('EstimatorModule') == "electrical" and
-        search_term in str(item.get('SearchItem', '')).lower() and
-        item.get('ConstructionTier') == tier
-    ]
+    # Generic items of this tier from the electrical index
+    index = self.electrical_index
+    generic_rows = index.filter_tier(index.term_rows(search_term), tier)
     
-    if generic_items:
-        return generic_items[0]
+    if len(generic_rows) > 0:
+        return index.items(generic_rows[:1])[0]
     return None
 
 def get_avg_electrical_cost(self, quantity_name):
     """Calculate average cost for a type of electrical component"""
     # Determine component category
-    component_categories = {
-        "outlets": ["outlet", "receptacle", "plug", "gfci", "usb"],
-        "switches": ["switch", "dimmer", "control"],
-        "lights": ["light", "recessed", "pendant", "chandelier"],
-        "panels": ["panel", "circuit", "breaker"]
-    }
-    
     category = None
-    for cat, terms in component_categories.items():
+    for cat, terms in AVERAGE_COST_TERMS.items():
         if any(term in quantity_name for term in terms):
             category = cat
             break
@@ -498,34 +495,9 @@ def get_avg_electrical_cost(self, quantity_name):
     if not category:
         return None
     
-    # Filter electrical items in this category
-    category_items = [
-        item for item in self.catalog.to_dict('records')
-        if item.get('EstimatorModule') == "electrical" and
-        any(term in str(item.get('SearchItem', '')).lower() for term in component_categories[category])
-    ]
-    
-    if not category_items:
-        return None
-    
-    # Calculate average cost
-    costs = [item.get('Cost(Mid)', 0) for item in category_items]
-    if not costs:
-        return None
-        
-    avg_cost = sum(costs) / len(costs)
-    
-    # Create a generic item with average cost
-    return {
-        "ID": f"AVG-{category.upper()}",
-        "Item": f"Average {category} component",
-        "Category": "Electrical",
-        "Unit": "EA",
-        "Cost(Mid)": avg_cost,
-        "EstimatorModule": "electrical",
-        "QualityTier": "Standard",
-        "ConstructionTier": "Luxury"
-    }
+    # Average items are computed once per catalog by the electrical index
+    avg_item = self.electrical_index.average_items.get(category)
+    return dict(avg_item) if avg_item else None
     
 def main():
     """Main function when run as a script"""
@@ -0,0 +1,161 @@
+# src/utils/electrical_index.py
+
+import logging
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional
+
+from src.utils.search_index import SearchIndex
+
+logger = logging.getLogger(__name__)
+
+ELECTRICAL_MODULE = 'electrical'
+CONSTRUCTION_TIERS = ('Premium', 'Luxury', 'Ultra-Luxury')
+
+# Terms grouping electrical catalog items into component types
+COMPONENT_TERMS = {
+    "outlets": ["outlet", "receptacle", "plug", "gfci"],
+    "switches": ["switch", "dimmer", "control"],
+    "lights": ["light", "fixture", "lamp", "recessed", "chandelier", "pendant"],
+    "panels": ["panel", "circuit", "breaker"]
+}
+
+# Alternative catalog wording for common electrical quantities
+ELECTRICAL_ALIASES = {
+    "recessed_lights": ["can lights", "pot lights", "downlights"],
+    "dimmer_switches": ["dimmers", "light controls"],
+    "gfci_outlets": ["gfi outlets", "ground fault", "bathroom outlets"],
+    "standard_outlets": ["receptacles", "plugs", "wall outlets"],
+    "three_way_switches": ["3-way", "multiple location"],
+    "chandeliers": ["hanging fixtures", "pendant lights", "ceiling fixtures"],
+    "under_cabinet_lights": ["cabinet lighting", "task lighting"],
+    "audio_visual_drops": ["av connections", "media outlets"],
+    "security_system_components": ["security devices", "alarm components"]
+}
+
+# Component types matched against quantity names when no alias applies
+COMPONENT_TYPES = {
+    "lights": ["lights", "lighting", "fixtures", "lamps"],
+    "switches": ["switches", "controls", "dimmers"],
+    "outlets": ["outlets", "receptacles", "plugs"],
+    "panels": ["panels", "electrical boxes", "service"]
+}
+
+# Generic catalog item searched for per component category
+GENERIC_ITEMS = {
+    "outlets": "standard electrical outlet",
+    "switches": "standard wall switch",
+    "lights": "standard light fixture",
+    "panels": "electrical panel"
+}
+
+# Terms used to price the average item of a component category
+AVERAGE_COST_TERMS = {
+    "outlets": ["outlet", "receptacle", "plug", "gfci", "usb"],
+    "switches": ["switch", "dimmer", "control"],
+    "lights": ["light", "recessed", "pendant", "chandelier"],
+    "panels": ["panel", "circuit", "breaker"]
+}
+
+class ElectricalComponentIndex:
+    """
+    Electrical catalog rows grouped once per catalog snapshot.
+
+    Holds the electrical rows by tier, by component type and by alias, plus
+    the average-cost items, so the electrical matching helpers never convert
+    or scan the whole catalog. Items returned are the owner's shared row
+    records; copy one before modifying it.
+    """
+
+    def __init__(self, catalog: pd.DataFrame, search_index: SearchIndex, records: List[Dict[str, Any]]):
+        """
+        Args:
+            catalog: Mapper catalog (EstimatorModule, ConstructionTier, SearchItem columns)
+            search_index: Index over the catalog with SearchItem text and module/tier filters
+            records: One dict per catalog row, in catalog order
+        """
+        self.search_index = search_index
+        self.records = records
+        self.tier_values = np.array(
+            catalog['ConstructionTier'].tolist() if 'ConstructionTier' in catalog.columns else [None] * len(catalog),
+            dtype=object
+        )
+
+        self.rows = search_index.filter(EstimatorModule=ELECTRICAL_MODULE)
+        self.tier_rows = {tier: self.filter_tier(self.rows, tier) for tier in CONSTRUCTION_TIERS}
+        self._term_rows: Dict[str, np.ndarray] = {}
+
+        # Rows matching any of each component's terms (catalog order)
+        self.component_rows = {
+            component: search_index.search('SearchItem', terms, mode='any', rows=self.rows)
+            for component, terms in COMPONENT_TERMS.items()
+        }
+
+        # First alias of each quantity that matches anything
+        self.alias_rows: Dict[str, np.ndarray] = {}
+        for quantity_name, aliases in ELECTRICAL_ALIASES.items():
+            for alias in aliases:
+                rows = self.term_rows(alias)
+                if len(rows) > 0:
+                    self.alias_rows[quantity_name] = rows
+                    break
+
+        # Component type rows are term-by-term (an item matching two terms appears twice)
+        self.type_rows = {
+            component: np.concatenate([self.term_rows(term) for term in terms])
+            for component, terms in COMPONENT_TYPES.items()
+        }
+        self.type_tier_rows = {
+            (component, tier): self.filter_tier(rows, tier)
+            for component, rows in self.type_rows.items()
+            for tier in CONSTRUCTION_TIERS
+        }
+
+        self.average_items = {category: self._average_item(category, terms)
+                              for category, terms in AVERAGE_COST_TERMS.items()}
+
+        # DataFrame slices handed out to estimation contexts
+        self.frame = catalog.iloc[self.rows]
+        self.tier_frames = {tier: catalog.iloc[rows] for tier, rows in self.tier_rows.items()}
+        self.component_frames = {component: catalog.iloc[rows] for component, rows in self.component_rows.items()}
+
+        logger.debug(f"Built electrical component index over {len(self.rows)} items")
+
+    def term_rows(self, term: str) -> np.ndarray:
+        """Electrical rows whose SearchItem contains the term (case-insensitive)"""
+        rows = self._term_rows.get(term)
+        if rows is None:
+            rows = self.search_index.contains('SearchItem', term, case=False, rows=self.rows)
+            self._term_rows[term] = rows
+        return rows
+
+    def filter_tier(self, rows: np.ndarray, tier: Optional[str]) -> np.ndarray:
+        """Rows of one construction tier, keeping their order"""
+        return rows[self.tier_values[rows] == tier] if len(rows) > 0 else rows
+
+    def items(self, rows: np.ndarray) -> List[Dict[str, Any]]:
+        """Catalog records for row positions"""
+        return [self.records[position] for position in rows]
+
+    def _average_item(self, category: str, terms: List[str]) -> Optional[Dict[str, Any]]:
+        category_items = self.items(self.search_index.search('SearchItem', terms, mode='any', rows=self.rows))
+        if not category_items:
+            return None
+
+        costs = [item.get('Cost(Mid)', 0) for item in category_items]
+        try:
+            avg_cost = sum(costs) / len(costs)
+        except TypeError:
+            logger.warning(f"Non-numeric Cost(Mid) values for electrical {category}, no average item")
+            return None
+
+        return {
+            "ID": f"AVG-{category.upper()}",
+            "Item": f"Average {category} component",
+            "Category": "Electrical",
+            "Unit": "EA",
+            "Cost(Mid)": avg_cost,
+            "EstimatorModule": "electrical",
+            "QualityTier": "Standard",
+            "ConstructionTier": "Luxury"
+        }
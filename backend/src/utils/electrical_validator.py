@@ -131,19 +131,15 @@ class ElectricalCatalogValidator:
             
             # Sample items that could match from the catalog
             potential_items = []
-            if hasattr(self.catalog_mapper, 'catalog'):
+            if hasattr(self.catalog_mapper, 'search_module_items'):
                 for term in search_terms:
-                    matches = self.catalog_mapper.catalog[
-                        (self.catalog_mapper.catalog['EstimatorModule'] == "electrical") &
-                        (self.catalog_mapper.catalog['SearchItem'].str.contains(term, case=False, na=False))
-                    ]
+                    matches = self.catalog_mapper.search_module_items("electrical", term)
                     
-                    if not matches.empty:
-                        for _, item in matches.head(2).iterrows():
-                            potential_items.append({
-                                "id": item["ID"],
-                                "name": item["Item"]
-                            })
+                    for item in matches[:2]:
+                        potential_items.append({
+                            "id": item["ID"],
+                            "name": item["Item"]
+                        })
             
             # Create suggestion
             suggestions[quantity_name] = {
@@ -0,0 +1,84 @@
+# src/utils/events.py
+
+"""
+Structured, level-gated events for the estimation hot path.
+
+Per-category and per-item details (quantities, costed items, catalog misses)
+are traced as named events carrying their data as fields instead of being
+formatted into log lines up front. The message text is only built if a
+handler actually writes the record, and fields given as callables are only
+evaluated then.
+
+Modes (estimation.events.mode in settings.json, or the ESTIMATE_EVENTS
+environment variable):
+    production  hot-path events are dropped before any work is done (default)
+    sampled     one in every `sample_every` hot-path event is logged at DEBUG
+    debug       every hot-path event is logged at DEBUG
+
+Records go to the 'src.events' logger with `event` and `fields` attributes,
+so a handler can consume them as structured data.
+"""
+
+import itertools
+import logging
+import os
+from typing import Dict, Any
+
+MODES = ('production', 'sampled', 'debug')
+
+class _EventMessage:
+    """Log message that formats its fields only when a handler asks for the text"""
+
+    __slots__ = ('name', 'fields')
+
+    def __init__(self, name, fields):
+        self.name = name
+        self.fields = fields
+
+    def __str__(self):
+        return ' '.join([self.name] + [f"{key}={value}" for key, value in resolve_fields(self.fields).items()])
+
+def resolve_fields(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Evaluate callable (lazy) field values"""
+    return {key: value() if callable(value) else value for key, value in fields.items()}
+
+class EventLog:
+    """Hot-path event emitter; check `tracing` before building anything expensive for trace()"""
+
+    def __init__(self, mode: str = 'production', sample_every: int = 100, logger_name: str = 'src.events'):
+        self.logger = logging.getLogger(logger_name)
+        self.configure(mode, sample_every)
+
+    def configure(self, mode: str = 'production', sample_every: int = 100):
+        if mode not in MODES:
+            logging.getLogger(__name__).warning(f"Unknown event mode '{mode}', using 'production'")
+            mode = 'production'
+        self.mode = mode
+        self.sample_every = max(int(sample_every), 1) if mode == 'sampled' else 1
+        self._counter = itertools.count()
+        # Plain attribute so hot loops can skip a call entirely
+        self.tracing = mode != 'production'
+        # Traced events are DEBUG records, which an INFO root (logging.basicConfig)
+        # would otherwise drop; production defers to the logging config again
+        self.logger.setLevel(logging.DEBUG if self.tracing else logging.NOTSET)
+
+    def configure_from(self, config: Dict[str, Any]):
+        """Apply the estimation.events section of settings.json; ESTIMATE_EVENTS overrides the mode"""
+        settings = config.get('estimation', {}).get('events', {})
+        mode = os.environ.get('ESTIMATE_EVENTS') or settings.get('mode', 'production')
+        self.configure(mode, settings.get('sample_every', 100))
+
+    def trace(self, name: str, /, **fields):
+        """Hot-path event at DEBUG: dropped in production mode, sampled in sampled mode"""
+        if not self.tracing:
+            return
+        if self.sample_every > 1 and next(self._counter) % self.sample_every:
+            return
+        self.emit(name, logging.DEBUG, **fields)
+
+    def emit(self, name: str, level: int = logging.INFO, /, **fields):
+        """Event outside hot loops, subject only to the logger's level"""
+        if self.logger.isEnabledFor(level):
+            self.logger.log(level, _EventMessage(name, fields), extra={'event': name, 'fields': fields})
+
+events = EventLog()
@@ -0,0 +1,182 @@
+# src/utils/search_index.py
+
+import bisect
+import logging
+import re
+import numpy as np
+import pandas as pd
+from typing import Dict, Iterable, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+REGEX_METACHARACTERS = set('.^$*+?{}[]\\()')
+
+_EMPTY = np.empty(0, dtype=np.int64)
+
+class _FieldIndex:
+    """Token postings and a suffix index for one text column"""
+
+    def __init__(self, values: Sequence):
+        # Original text (None for missing) and a lowercase copy for case-insensitive checks
+        self.texts = [value if isinstance(value, str) else None for value in values]
+        self.lower_texts = [text.lower() if text is not None else None for text in self.texts]
+        self.present = np.array([i for i, text in enumerate(self.texts) if text is not None], dtype=np.int64)
+
+        postings: Dict[str, List[int]] = {}
+        for position, text in enumerate(self.lower_texts):
+            if text is None:
+                continue
+            for token in set(TOKEN_PATTERN.findall(text)):
+                postings.setdefault(token, []).append(position)
+
+        self.tokens = sorted(postings)
+        self.postings = [np.array(postings[token], dtype=np.int64) for token in self.tokens]
+
+        # Every suffix of every token, sorted: a prefix search over suffixes finds
+        # all tokens containing a substring
+        suffixes = [(token[start:], token_id)
+                    for token_id, token in enumerate(self.tokens)
+                    for start in range(len(token))]
+        suffixes.sort()
+        self.suffixes = [suffix for suffix, _ in suffixes]
+        self.suffix_tokens = [token_id for _, token_id in suffixes]
+
+        self._piece_cache: Dict[str, np.ndarray] = {}
+
+    def rows_with_piece(self, piece: str) -> np.ndarray:
+        """Rows where some token contains `piece` (lowercase alphanumeric)"""
+        cached = self._piece_cache.get(piece)
+        if cached is not None:
+            return cached
+
+        start = bisect.bisect_left(self.suffixes, piece)
+        token_ids = set()
+        for index in range(start, len(self.suffixes)):
+            if not self.suffixes[index].startswith(piece):
+                break
+            token_ids.add(self.suffix_tokens[index])
+
+        if not token_ids:
+            rows = _EMPTY
+        elif len(token_ids) == 1:
+            rows = self.postings[token_ids.pop()]
+        else:
+            rows = np.unique(np.concatenate([self.postings[token_id] for token_id in token_ids]))
+
+        if len(self._piece_cache) < 4096:
+            self._piece_cache[piece] = rows
+        return rows
+
+class SearchIndex:
+    """
+    Inverted token index over catalog text columns.
+
+    Replaces `Series.str.contains` scans: each query term is resolved through
+    the token index to candidate rows, and only terms that span tokens or need
+    case-sensitive/regex matching are re-checked against those candidates.
+    Results are the same rows, in catalog order, as the equivalent contains().
+    """
+
+    def __init__(self, catalog: pd.DataFrame, fields: Iterable[str] = ('SearchItem',),
+                 filter_columns: Iterable[str] = ()):
+        """
+        Args:
+            catalog: Catalog DataFrame; row positions are returned by all queries
+            fields: Text columns to index
+            filter_columns: Columns to support exact-value filters on (e.g. EstimatorModule)
+        """
+        catalog = catalog if catalog is not None else pd.DataFrame()
+        self.size = len(catalog)
+        self.fields = {
+            field: _FieldIndex(catalog[field].tolist() if field in catalog.columns else [None] * self.size)
+            for field in fields
+        }
+
+        self.filters: Dict[str, Dict[object, np.ndarray]] = {}
+        for column in filter_columns:
+            groups: Dict[object, List[int]] = {}
+            if column in catalog.columns:
+                for position, value in enumerate(catalog[column].tolist()):
+                    if isinstance(value, str) or (value is not None and value == value):
+                        groups.setdefault(value, []).append(position)
+            self.filters[column] = {value: np.array(rows, dtype=np.int64) for value, rows in groups.items()}
+
+        logger.debug(f"Built search index over {self.size} rows for {list(self.fields)}")
+
+    def filter(self, rows: Optional[np.ndarray] = None, **criteria) -> np.ndarray:
+        """Rows where every given column equals its value, e.g. filter(EstimatorModule='electrical')"""
+        for column, value in criteria.items():
+            matched = self.filters[column].get(value, _EMPTY)
+            rows = matched if rows is None else np.intersect1d(rows, matched, assume_unique=True)
+        return np.arange(self.size, dtype=np.int64) if rows is None else rows
+
+    def filter_any(self, column: str, values: Iterable, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Rows whose column value is any of the given values, like Series.isin"""
+        groups = [self.filters[column][value] for value in values if value in self.filters[column]]
+        matched = np.unique(np.concatenate(groups)) if groups else _EMPTY
+        return matched if rows is None else np.intersect1d(rows, matched, assume_unique=True)
+
+    def contains(self, field: str, term: str, case: bool = False, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Rows whose field contains the literal term (str.contains with regex=False)"""
+        index = self.fields[field]
+        candidates = index.present
+        pieces = TOKEN_PATTERN.findall(term.lower())
+
+        for piece in pieces:
+            candidates = np.intersect1d(candidates, index.rows_with_piece(piece), assume_unique=True)
+        if rows is not None:
+            candidates = np.intersect1d(candidates, rows, assume_unique=True)
+
+        # A single alphanumeric term lies inside one token, so the index is already exact
+        if not case and len(pieces) == 1 and pieces[0] == term.lower():
+            return candidates
+
+        if case:
+            texts = index.texts
+        else:
+            texts, term = index.lower_texts, term.lower()
+        return np.array([row for row in candidates if term in texts[row]], dtype=np.int64)
+
+    def search(self, field: str, terms: Iterable[str], mode: str = 'any', case: bool = False,
+               rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Rows matching any (OR) or all (AND) of the literal terms
+
+        Args:
+            field: Indexed text column
+            terms: Literal substrings to look for
+            mode: 'any' or 'all'
+            case: Case-sensitive matching
+            rows: Optional sorted row positions to restrict the search to
+        """
+        if mode not in ('any', 'all'):
+            raise ValueError(f"mode must be 'any' or 'all', got '{mode}'")
+
+        result = None
+        for term in terms:
+            matched = self.contains(field, term, case=case, rows=rows)
+            if result is None:
+                result = matched
+            elif mode == 'any':
+                result = np.union1d(result, matched)
+            else:
+                result = np.intersect1d(result, matched, assume_unique=True)
+
+        return _EMPTY if result is None else result
+
+    def match_pattern(self, field: str, pattern: str, case: bool = True,
+                      rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Rows matching a regex pattern exactly as Series.str.contains(pattern, case=case, na=False)
+
+        Patterns that are plain alternations ('a|b c|d') go through the token index;
+        anything using other regex syntax is checked with re.search on the candidate rows.
+        """
+        if REGEX_METACHARACTERS.isdisjoint(pattern):
+            return self.search(field, pattern.split('|'), mode='any', case=case, rows=rows)
+
+        index = self.fields[field]
+        regex = re.compile(pattern, 0 if case else re.IGNORECASE)
+        candidates = index.present if rows is None else np.intersect1d(index.present, rows, assume_unique=True)
+        return np.array([row for row in candidates if regex.search(index.texts[row])], dtype=np.int64)
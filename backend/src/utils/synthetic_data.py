@@ -0,0 +1,347 @@
+# src/utils/synthetic_data.py
+
+import json
+import logging
+import os
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, List, Optional, Tuple
+
+from src.core.cost_plan import guess_quantity_unit
+from src.estimators.electrical import service_level_keys
+
+logger = logging.getLogger(__name__)
+
+TIERS = ('Premium', 'Luxury', 'Ultra-Luxury')
+TIER_WEIGHTS = (0.3, 0.4, 0.3)
+TIER_COST_FACTORS = {'Premium': 1.0, 'Luxury': 1.6, 'Ultra-Luxury': 2.6}
+QUALITY_TIERS = {'Premium': 'Economy', 'Luxury': 'Standard', 'Ultra-Luxury': 'Premium'}
+
+ENHANCED_COLUMNS = [
+    'Item', 'Cost (Low)', 'Cost (High)', 'Cost(Mid)', 'Unit', 'Qty', 'Markup Percentage', 'Cost Code',
+    'Category', 'ID', 'OriginalUnit', 'SearchItem', 'Keywords', 'Subcategory', 'Phase', 'EstimatorModule',
+    'QualityTier', 'ConstructionTier'
+]
+
+PHASES = {
+    'foundation': 'Structure', 'structural': 'Structure',
+    'roofing': 'Envelope', 'windows_doors': 'Envelope',
+    'electrical': 'MEP', 'plumbing': 'MEP', 'hvac': 'MEP', 'thermal_fire_suppression': 'MEP',
+    'drywall_interior': 'Interior', 'painting_coatings': 'Interior', 'tile': 'Interior', 'flooring': 'Interior',
+    'cabinetry': 'Interior', 'countertops': 'Interior', 'finish_carpentry': 'Interior'
+}
+
+# Typical mid cost per unit before the tier factor
+UNIT_BASE_COSTS = {'SF': 14.0, 'LF': 28.0, 'CY': 185.0, 'EA': 240.0, 'GAL': 45.0}
+
+# Unit words dropped from quantity names when naming items ('slab_concrete_cy' -> 'Slab Concrete')
+UNIT_SUFFIXES = {'sf', 'lf', 'cy', 'ea', 'gal', 'sy'}
+
+# Catalog categories no estimator reads (their rows have no EstimatorModule)
+UNASSIGNED_CATEGORIES = ('Demo', 'Pool', 'Stucco', 'Metal Fabrications', 'Shower Glass', 'Fire Protection')
+
+VARIANTS = ('Standard', 'Select', 'Pro', 'Designer', 'Architectural', 'Custom', 'Signature', 'Heritage')
+BRANDS = ('Acme', 'Northline', 'Summit', 'Keystone', 'Bayside', 'Crescent', 'Ironwood', 'Meridian')
+
+# Room types with (relative frequency, typical square footage)
+ROOM_TYPES = {
+    'bedroom': (0.30, 260),
+    'secondary_bath': (0.14, 110),
+    'living': (0.12, 520),
+    'primary_bath': (0.06, 240),
+    'powder_room': (0.08, 45),
+    'kitchen': (0.08, 380),
+    'utility': (0.05, 90),
+    'laundry': (0.05, 80),
+    'office': (0.07, 180),
+    'garage': (0.05, 650)
+}
+
+class SyntheticDataGenerator:
+    """
+    Seeded generator of catalogs, category mappings and projects for scale testing.
+
+    Catalogs use the catalog_enhanced.csv schema and draw their item names,
+    modules and units from the category mappings the engine already uses, so
+    every mapped quantity has catalog rows and the generated mappings resolve
+    to generated IDs. The same seed always produces the same data.
+    """
+
+    def __init__(self, seed: int = 0, base_mappings: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            seed: Random seed
+            base_mappings: Category mappings to model modules and quantities on
+                (defaults to the mappings DataLoader reads)
+        """
+        self.seed = seed
+        if base_mappings is None:
+            from src.core.data_loader import DataLoader
+            base_mappings = DataLoader().mappings
+        self.base_mappings = base_mappings
+        self.category_mappings = base_mappings.get('category_mappings', {})
+        self.id_prefixes = self._id_prefixes(list(self.category_mappings) + ['unassigned'])
+
+    def _rng(self, *salt) -> np.random.Generator:
+        """Independent stream per output so e.g. a project doesn't depend on the catalog size"""
+        return np.random.default_rng([self.seed, *salt])
+
+    @staticmethod
+    def _id_prefixes(modules: List[str]) -> Dict[str, str]:
+        """Short unique ID prefix per module, e.g. 'el' for electrical"""
+        prefixes = {}
+        for module in modules:
+            letters = module.replace('_', '')
+            length = 2
+            while letters[:length] in prefixes.values() and length < len(letters):
+                length += 1
+            prefixes[module] = letters[:length]
+        return prefixes
+
+    def generate_catalog(self, rows: int, unassigned_share: float = 0.3) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        Generate a catalog and the category mappings that point into it
+
+        Every mapped quantity gets at least one row per tier and every electrical
+        service level gets its item, so the catalog may come out slightly larger
+        than `rows` for small row counts.
+
+        Args:
+            rows: Approximate number of catalog rows
+            unassigned_share: Fraction of rows in categories no estimator reads
+
+        Returns:
+            (catalog DataFrame, mappings dict in the category_mappings format)
+        """
+        rng = self._rng(0, rows)
+        quantities = [
+            (module, quantity_name, mapping.get('search_terms', []))
+            for module, category_mapping in self.category_mappings.items()
+            for quantity_name, mapping in category_mapping.get('item_mappings', {}).items()
+        ]
+
+        # One row per quantity and tier first, then the rest spread at random
+        service_keys = list(service_level_keys())
+        guaranteed = len(quantities) * len(TIERS)
+        assigned_rows = max(int(rows * (1 - unassigned_share)) - guaranteed - len(service_keys), 0)
+        unassigned_rows = max(rows - guaranteed - len(service_keys) - assigned_rows, 0)
+
+        quantity_index = np.concatenate([
+            np.repeat(np.arange(len(quantities)), len(TIERS)),
+            rng.integers(0, len(quantities), assigned_rows) if quantities else np.array([], dtype=int)
+        ]).astype(int)
+        tiers = np.concatenate([
+            np.tile(np.arange(len(TIERS)), len(quantities)),
+            rng.choice(len(TIERS), assigned_rows, p=TIER_WEIGHTS)
+        ]).astype(int)
+
+        records = []
+        counters: Dict[str, int] = {}
+        mapped_ids: Dict[Tuple[str, str], List[Tuple[str, str]]] = {}
+        variants = rng.integers(0, len(VARIANTS), len(quantity_index))
+        brands = rng.integers(0, len(BRANDS), len(quantity_index))
+        cost_noise = rng.lognormal(0.0, 0.35, len(quantity_index))
+        markups = rng.choice([15, 20, 25, 30, 70], len(quantity_index))
+
+        for row, (quantity_position, tier_position) in enumerate(zip(quantity_index, tiers)):
+            module, quantity_name, search_terms = quantities[quantity_position]
+            tier = TIERS[tier_position]
+            unit = guess_quantity_unit(quantity_name)
+            item_id = self._next_id(counters, module)
+            title = ' '.join(word for word in quantity_name.split('_') if word not in UNIT_SUFFIXES).title()
+            item = f"{title} {VARIANTS[variants[row]]} {BRANDS[brands[row]]} {item_id.upper()}"
+            mid = UNIT_BASE_COSTS.get(unit, 240.0) * TIER_COST_FACTORS[tier] * cost_noise[row]
+            records.append(self._record(
+                item, item_id, mid, unit, markups[row], self._category_name(module), module, tier,
+                keywords=' '.join([quantity_name.replace('_', ' ')] + list(search_terms)),
+                subcategory=title
+            ))
+            mapped_ids.setdefault((module, quantity_name), []).append((tier, item_id))
+
+        for panel_size, service_name in service_keys:
+            item_id = self._next_id(counters, 'electrical')
+            mid = 2500.0 + panel_size * 20
+            records.append(self._record(
+                service_name, item_id, mid, 'EA', 20, 'Electrical', 'electrical', 'Luxury',
+                keywords=f"electrical service {panel_size} amp panel", subcategory='Service'
+            ))
+
+        unassigned_categories = rng.integers(0, len(UNASSIGNED_CATEGORIES), unassigned_rows)
+        unassigned_tiers = rng.choice(len(TIERS), unassigned_rows, p=TIER_WEIGHTS)
+        unassigned_noise = rng.lognormal(0.0, 0.5, unassigned_rows)
+        for row in range(unassigned_rows):
+            category = UNASSIGNED_CATEGORIES[unassigned_categories[row]]
+            tier = TIERS[unassigned_tiers[row]]
+            item_id = self._next_id(counters, 'unassigned')
+            item = f"{category} {VARIANTS[row % len(VARIANTS)]} Work {item_id.upper()}"
+            records.append(self._record(
+                item, item_id, 180.0 * TIER_COST_FACTORS[tier] * unassigned_noise[row], 'EA', 25, category, None,
+                tier, keywords=category.lower(), subcategory='General'
+            ))
+
+        catalog = pd.DataFrame.from_records(records, columns=ENHANCED_COLUMNS)
+        mappings = self._mappings(mapped_ids)
+        logger.info(f"Generated synthetic catalog with {len(catalog)} rows for {len(quantities)} mapped quantities")
+        return catalog, mappings
+
+    def _next_id(self, counters, module):
+        counters[module] = counters.get(module, 0) + 1
+        return f"{self.id_prefixes[module]}{counters[module]}"
+
+    def _category_name(self, module):
+        catalog_categories = self.category_mappings.get(module, {}).get('catalog_categories', [])
+        return catalog_categories[0] if catalog_categories else module.replace('_', ' ').title()
+
+    @staticmethod
+    def _record(item, item_id, mid, unit, markup, category, module, tier, keywords, subcategory):
+        mid = round(float(mid), 2)
+        return {
+            'Item': item,
+            'Cost (Low)': round(mid * 0.8, 2),
+            'Cost (High)': round(mid * 1.25, 2),
+            'Cost(Mid)': mid,
+            'Unit': unit,
+            'Qty': None,
+            'Markup Percentage': float(markup),
+            'Cost Code': float(1000 + sum(map(ord, category)) % 9000),
+            'Category': category,
+            'ID': item_id,
+            'OriginalUnit': unit.title(),
+            'SearchItem': item.lower(),
+            'Keywords': keywords,
+            'Subcategory': subcategory,
+            'Phase': PHASES.get(module, 'Other'),
+            'EstimatorModule': module,
+            'QualityTier': QUALITY_TIERS[tier],
+            'ConstructionTier': tier
+        }
+
+    def _mappings(self, mapped_ids):
+        """Base mappings with each quantity's item_ids replaced by its generated Luxury row (or first row)"""
+        category_mappings = {}
+        for module, category_mapping in self.category_mappings.items():
+            item_mappings = {}
+            for quantity_name, mapping in category_mapping.get('item_mappings', {}).items():
+                candidates = mapped_ids.get((module, quantity_name), [])
+                preferred = [item_id for tier, item_id in candidates if tier == 'Luxury'] or \
+                    [item_id for _, item_id in candidates]
+                item_mappings[quantity_name] = dict(mapping, item_ids=preferred[:1])
+            category_mappings[module] = dict(category_mapping, item_mappings=item_mappings)
+        return dict(self.base_mappings, category_mappings=category_mappings)
+
+    def generate_project(self, room_count: int, tier: Optional[str] = None, override_share: float = 0.1,
+                         name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Generate a ProjectData payload with room_count rooms
+
+        Args:
+            room_count: Number of rooms
+            tier: Global tier, drawn at random if not given
+            override_share: Fraction of rooms with their own tier or a trade tier override
+            name: Project name
+
+        Returns:
+            Dict accepted by the API's ProjectData and by estimate_detailed_project
+        """
+        rng = self._rng(1, room_count)
+        global_tier = tier or TIERS[rng.choice(len(TIERS), p=TIER_WEIGHTS)]
+        room_types = list(ROOM_TYPES)
+        weights = np.array([ROOM_TYPES[room_type][0] for room_type in room_types])
+        chosen = rng.choice(len(room_types), room_count, p=weights / weights.sum())
+        sizes = rng.normal(1.0, 0.2, room_count).clip(0.5, 1.8)
+        overrides = rng.random(room_count)
+        override_tiers = rng.integers(0, len(TIERS), room_count)
+
+        rooms = {}
+        counts: Dict[str, int] = {}
+        for index in range(room_count):
+            room_type = room_types[chosen[index]]
+            counts[room_type] = counts.get(room_type, 0) + 1
+            room = {
+                'name': f"{room_type.replace('_', ' ').title()} {counts[room_type]}",
+                'type': room_type,
+                'square_footage': float(round(ROOM_TYPES[room_type][1] * sizes[index]))
+            }
+            if overrides[index] < override_share / 2:
+                room['tier'] = TIERS[override_tiers[index]]
+            elif overrides[index] < override_share:
+                room['trades'] = {'electrical': {'tier': TIERS[override_tiers[index]]}}
+            rooms[f"room_{index + 1}"] = room
+
+        # Rooms plus circulation, walls and mechanical space
+        square_footage = float(round(sum(room['square_footage'] for room in rooms.values()) * 1.18))
+        return {
+            'project_name': name or f"Synthetic {room_count}-room project",
+            'square_footage': square_footage,
+            'tier': global_tier,
+            'global_tier': global_tier,
+            'construction_type': 'new_construction',
+            'bedroom_count': counts.get('bedroom', 0),
+            'primary_bath_count': counts.get('primary_bath', 0),
+            'secondary_bath_count': counts.get('secondary_bath', 0),
+            'powder_room_count': counts.get('powder_room', 0),
+            'rooms': rooms
+        }
+
+    def write_dataset(self, output_dir: str, rows: int, room_counts: List[int] = (5,),
+                      base_config_path: str = 'config/settings.json') -> Dict[str, Any]:
+        """
+        Write a catalog, its mappings, projects and a settings.json that uses them
+
+        The settings file points catalog_path, enhanced_catalog_path and
+        mappings_path at the generated files, so EstimationEngine(settings) or
+        the benchmark suite (--config) runs against the synthetic data.
+
+        Returns:
+            Paths written: {'settings', 'catalog', 'mappings', 'projects': {room_count: path}}
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        catalog, mappings = self.generate_catalog(rows)
+
+        catalog_path = os.path.join(output_dir, 'catalog_enhanced.csv')
+        catalog.to_csv(catalog_path, index=False)
+        # Not catalog_mappings.json: CatalogMapper reads its own config from that name
+        mappings_path = os.path.join(output_dir, 'category_mappings.json')
+        with open(mappings_path, 'w') as file:
+            json.dump(mappings, file, indent=2)
+
+        with open(base_config_path) as file:
+            config = json.load(file)
+        config.setdefault('data', {}).update({
+            'catalog_path': catalog_path,
+            'enhanced_catalog_path': catalog_path,
+            'mappings_path': mappings_path
+        })
+        settings_path = os.path.join(output_dir, 'settings.json')
+        with open(settings_path, 'w') as file:
+            json.dump(config, file, indent=2)
+
+        projects = {}
+        for room_count in room_counts:
+            project_path = os.path.join(output_dir, f"project_{room_count}_rooms.json")
+            with open(project_path, 'w') as file:
+                json.dump(self.generate_project(room_count), file, indent=2)
+            projects[room_count] = project_path
+
+        logger.info(f"Wrote synthetic dataset ({len(catalog)} catalog rows) to {output_dir}")
+        return {'settings': settings_path, 'catalog': catalog_path, 'mappings': mappings_path, 'projects': projects}
+
+def main():
+    """Command line entry point"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Generate synthetic catalogs and projects for scale testing')
+    parser.add_argument('--output', default='data/synthetic', help='Directory to write the dataset to')
+    parser.add_argument('--rows', type=int, default=100000, help='Approximate catalog rows')
+    parser.add_argument('--rooms', type=int, nargs='+', default=[50, 500, 5000], help='Room counts of the projects')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed')
+    parser.add_argument('--config', default='config/settings.json', help='Settings to base the generated settings on')
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    paths = SyntheticDataGenerator(args.seed).write_dataset(args.output, args.rows, args.rooms, args.config)
+    print(json.dumps(paths, indent=2))
+
+if __name__ == "__main__":
+    main()
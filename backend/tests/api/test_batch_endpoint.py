@@ -0,0 +1,134 @@
+# tests/api/test_batch_endpoint.py
+
+import unittest
+import asyncio
+import json
+import threading
+import time
+from unittest import mock
+import logging
+
+from fastapi.testclient import TestClient
+
+from tests.helpers import BackendTestCase
+
+# Suppress logging during tests
+logging.disable(logging.CRITICAL)
+
+class TestBatchEndpoint(BackendTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        from src.api.app import app
+        cls.client_context = TestClient(app)
+        cls.client = cls.client_context.__enter__()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.client_context.__exit__(None, None, None)
+        super().tearDownClass()
+
+    def _read_lines(self, response):
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('application/x-ndjson', response.headers['content-type'])
+        return [json.loads(line) for line in response.text.splitlines() if line.strip()]
+
+    def test_json_array_batch(self):
+        """Every project in a JSON array gets one result line"""
+        projects = [{"square_footage": sf, "tier": "Luxury"} for sf in (4000, 5000, 6000)]
+        lines = self._read_lines(self.client.post('/api/estimate/batch', json=projects))
+
+        self.assertEqual(sorted(line['index'] for line in lines), [0, 1, 2])
+        for line in lines:
+            self.assertEqual(line['status'], 'success')
+            self.assertEqual(line['result']['project']['square_footage'], projects[line['index']]['square_footage'])
+
+    def test_ndjson_batch_isolates_bad_items(self):
+        """Malformed or invalid items fail on their own line without stopping the batch"""
+        body = "\n".join([
+            json.dumps({"square_footage": 5000, "tier": "Premium"}),
+            "{not json",
+            json.dumps({"tier": "Premium"})
+        ])
+        response = self.client.post('/api/estimate/batch', content=body,
+                                    headers={'content-type': 'application/x-ndjson'})
+        lines = {line['index']: line for line in self._read_lines(response)}
+
+        self.assertEqual(lines[0]['status'], 'success')
+        self.assertEqual(lines[1]['status'], 'validation_error')
+        self.assertEqual(lines[2]['status'], 'validation_error')
+
+    def test_rejects_non_array_body(self):
+        response = self.client.post('/api/estimate/batch', json={"square_footage": 5000})
+        self.assertEqual(response.status_code, 400)
+
+    def test_items_run_on_the_light_pool_with_bounded_concurrency(self):
+        engine = self.client.app.state.snapshot_manager.get_engine('standard')
+        executor = self.client.app.state.executor
+        lock = threading.Lock()
+        running = [0, 0]
+
+        def estimate_batch_item(index, project_data):
+            with lock:
+                running[0] += 1
+                running[1] = max(running[1], running[0])
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+            return {'index': index, 'status': 'success'}
+
+        before = executor.metrics()
+        with mock.patch.dict(engine.config['api']['batch'], max_workers=2), \
+                mock.patch.object(engine, 'estimate_batch_item', side_effect=estimate_batch_item):
+            projects = [{"square_footage": 4000 + index, "tier": "Luxury"} for index in range(8)]
+            lines = self._read_lines(self.client.post('/api/estimate/batch', json=projects))
+        after = executor.metrics()
+
+        self.assertEqual(sorted(line['index'] for line in lines), list(range(8)))
+        self.assertLessEqual(running[1], 2)
+        self.assertEqual(after['light']['submitted'] - before['light']['submitted'], 8)
+        self.assertEqual(after['heavy']['submitted'], before['heavy']['submitted'])
+
+    def test_ndjson_limit_and_split_lines(self):
+        from src.api.app import _read_ndjson
+
+        async def chunks(*parts):
+            for part in parts:
+                yield part
+
+        items = asyncio.run(_read_ndjson(chunks(b'{"a": 1}\n{"b"', b': 2}\r\n\n{bad', b'\n{"c": 3}'), 10, 64))
+        self.assertEqual(items[:2], [{'a': 1}, {'b': 2}])
+        self.assertIsInstance(items[2], ValueError)
+        self.assertEqual(items[3], {'c': 3})
+
+        engine = self.client.app.state.snapshot_manager.get_engine('standard')
+        body = "\n".join(json.dumps({"square_footage": 5000}) for _ in range(4))
+        with mock.patch.dict(engine.config['api']['batch'], max_items=3):
+            response = self.client.post('/api/estimate/batch', content=body,
+                                        headers={'content-type': 'application/x-ndjson'})
+        self.assertEqual(response.status_code, 413)
+
+    def test_ndjson_line_limit(self):
+        """A line over max_line_bytes is rejected, even before its newline arrives"""
+        from fastapi import HTTPException
+        from src.api.app import _read_ndjson
+
+        async def chunks(*parts):
+            for part in parts:
+                yield part
+
+        for parts in ([b'{"a": 1}\n', b'x' * 40, b'x' * 40], [b'{"a": "' + b'x' * 80 + b'"}\n']):
+            with self.subTest(parts=parts), self.assertRaises(HTTPException) as raised:
+                asyncio.run(_read_ndjson(chunks(*parts), 10, 64))
+            self.assertEqual(raised.exception.status_code, 413)
+
+        engine = self.client.app.state.snapshot_manager.get_engine('standard')
+        body = json.dumps({"square_footage": 5000, "tier": "Premium", "notes": "x" * 100})
+        with mock.patch.dict(engine.config['api']['batch'], max_line_bytes=64):
+            response = self.client.post('/api/estimate/batch', content=body,
+                                        headers={'content-type': 'application/x-ndjson'})
+        self.assertEqual(response.status_code, 413)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+# tests/api/test_executor.py
+
+import unittest
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+import logging
+
+from src.api.executor import EstimationExecutor
+from src.core import worker_engine
+from src.core.estimation_engine import EstimationEngine
+
+# Suppress logging during tests
+logging.disable(logging.CRITICAL)
+
+class TestEstimationExecutor(unittest.TestCase):
+
+    def setUp(self):
+        project_root = Path(__file__).parent.parent.parent
+        self.original_cwd = os.getcwd()
+        os.chdir(project_root)
+        self.config_path = 'config/settings.json'
+        self.sample_project = {"square_footage": 5000, "tier": "Luxury"}
+
+    def tearDown(self):
+        os.chdir(self.original_cwd)
+
+    def test_event_loop_stays_responsive(self):
+        """Blocking work on the pool does not stall other coroutines"""
+        executor = EstimationExecutor(self.config_path, light_workers=1, heavy_mode='thread', heavy_workers=1)
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.time())
+                await asyncio.sleep(0.01)
+
+        async def scenario():
+            await asyncio.gather(executor.run_light(time.sleep, 0.2), ticker())
+
+        try:
+            asyncio.run(scenario())
+        finally:
+            executor.shutdown()
+
+        self.assertEqual(len(ticks), 5)
+        self.assertLess(ticks[-1] - ticks[0], 0.2)
+
+    def test_metrics_track_queue_and_failures(self):
+        """Completed, failed and queued calls are counted"""
+        executor = EstimationExecutor(self.config_path, light_workers=1, heavy_mode='thread', heavy_workers=1)
+
+        async def scenario():
+            calls = [executor.run_light(time.sleep, 0.05) for _ in range(3)]
+            calls.append(executor.run_light(int, 'not a number'))
+            return await asyncio.gather(*calls, return_exceptions=True)
+
+        try:
+            results = asyncio.run(scenario())
+        finally:
+            executor.shutdown()
+
+        self.assertIsInstance(results[-1], ValueError)
+        metrics = executor.metrics()['light']
+        self.assertEqual(metrics['submitted'], 4)
+        self.assertEqual(metrics['completed'], 3)
+        self.assertEqual(metrics['failed'], 1)
+        self.assertEqual(metrics['in_flight'], 0)
+        # Single worker: later calls waited behind the first
+        self.assertGreater(metrics['max_wait_ms'], 0)
+
+    def test_process_pool_matches_direct_estimate(self):
+        """Preloaded process workers produce the same estimate as a local engine"""
+        executor = EstimationExecutor(self.config_path, light_workers=1, heavy_mode='process', heavy_workers=1)
+        engine = EstimationEngine(self.config_path)
+
+        try:
+            result = asyncio.run(executor.run_heavy(engine, 'estimate_project', dict(self.sample_project)))
+        finally:
+            executor.shutdown()
+
+        expected = engine.estimate_project(dict(self.sample_project))
+        self.assertEqual(result['summary']['cost_breakdown'], expected['summary']['cost_breakdown'])
+        self.assertEqual(executor.metrics()['heavy']['completed'], 1)
+
+    def test_heavy_submit_moves_to_replaced_pool(self):
+        """A submission racing a pool reset runs on the new pool"""
+        executor = EstimationExecutor(self.config_path, light_workers=1, heavy_mode='thread', heavy_workers=1)
+        old_pool = executor.heavy_pool
+        old_pool.shutdown()
+        replacement = ThreadPoolExecutor(max_workers=1)
+        submit = old_pool.submit
+
+        def reset_then_submit(*args):
+            # The watcher thread swaps pools just as the loop submits to the old one
+            with executor._heavy_lock:
+                executor.heavy_pool = replacement
+            return submit(*args)
+
+        old_pool.submit = reset_then_submit
+        engine = SimpleNamespace(total=lambda values: sum(values))
+        try:
+            result = asyncio.run(executor.run_heavy(engine, 'total', [1, 2, 3]))
+        finally:
+            executor.shutdown()
+
+        self.assertEqual(result, 6)
+        self.assertEqual(executor.metrics()['heavy']['completed'], 1)
+
+    def test_stale_worker_reloads_or_fails(self):
+        """Workers answer only from the snapshot version they were asked for"""
+        engine = EstimationEngine(self.config_path)
+        version = engine.snapshot.version
+        stale = SimpleNamespace(snapshot=SimpleNamespace(version='stale', config_path=self.config_path))
+        original = worker_engine._worker_engine
+        worker_engine._worker_engine = stale
+        try:
+            result = worker_engine.run_snapshot_method(version, 'estimate_project', dict(self.sample_project))
+            self.assertEqual(worker_engine.get_worker_engine().snapshot.version, version)
+            self.assertEqual(result['summary']['cost_breakdown'],
+                             engine.estimate_project(dict(self.sample_project))['summary']['cost_breakdown'])
+
+            with self.assertRaises(RuntimeError):
+                worker_engine.run_snapshot_method('other', 'estimate_project', dict(self.sample_project))
+        finally:
+            worker_engine._worker_engine = original
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+# tests/api/test_response_cache.py
+
+import unittest
+import shutil
+import tempfile
+from unittest import mock
+import logging
+
+from fastapi.testclient import TestClient
+
+from src.api.response_cache import ResponseCache, project_cache_key
+from tests.helpers import BackendTestCase
+
+# Suppress logging during tests
+logging.disable(logging.CRITICAL)
+
+class TestResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_key_is_canonical(self):
+        a = project_cache_key('standard', {'square_footage': 5000.0, 'tier': 'Luxury'}, 'v1')
+        b = project_cache_key('standard', {'tier': 'Luxury', 'square_footage': 5000.0}, 'v1')
+        self.assertEqual(a, b)
+        self.assertNotEqual(a, project_cache_key('detailed', {'square_footage': 5000.0, 'tier': 'Luxury'}, 'v1'))
+        self.assertNotEqual(a, project_cache_key('standard', {'square_footage': 5000.0, 'tier': 'Luxury'}, 'v2'))
+
+    def test_memory_lru_and_ttl(self):
+        cache = ResponseCache(max_entries=2, ttl_seconds=60)
+        for key in ('a', 'b', 'c'):
+            cache.put(key, {'total_cost': key})
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.get('c'), {'total_cost': 'c'})
+
+        with mock.patch('src.api.response_cache.time.time', return_value=10 ** 12):
+            self.assertIsNone(cache.get('c'))
+
+        stats = cache.stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 2)
+
+    def test_disk_tier_survives_restart(self):
+        cache = ResponseCache(disk_path=self.temp_dir)
+        cache.put('k', {'total_cost': 12.5, 'categories': {'tile': {'total_cost': float('nan')}}})
+
+        restarted = ResponseCache(disk_path=self.temp_dir)
+        self.assertIsNone(restarted.get_memory('k'))
+        result = restarted.get('k')
+        self.assertEqual(result['total_cost'], 12.5)
+        self.assertEqual(restarted.stats()['disk_hits'], 1)
+        # Promoted to memory
+        self.assertIsNotNone(restarted.get_memory('k'))
+
+        restarted.clear()
+        self.assertIsNone(ResponseCache(disk_path=self.temp_dir).get('k'))
+
+    def test_disabled(self):
+        cache = ResponseCache(enabled=False)
+        cache.put('k', {'total_cost': 1})
+        self.assertIsNone(cache.get('k'))
+
+class TestEstimateEndpointCache(BackendTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        from src.api.app import app
+        cls.client_context = TestClient(app, raise_server_exceptions=False)
+        cls.client = cls.client_context.__enter__()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.client_context.__exit__(None, None, None)
+        super().tearDownClass()
+
+    def test_repeat_request_is_served_from_cache(self):
+        project = {"square_footage": 4321, "tier": "Premium", "project_name": "Cache test"}
+        engine = self.client.app.state.snapshot_manager.get_engine('standard')
+
+        self.client.post('/api/estimate', json=project)
+        before = self.client.get('/api/metrics').json()['response_cache']
+
+        with mock.patch.object(engine, 'estimate_project', side_effect=AssertionError("recomputed")):
+            self.client.post('/api/estimate', json=dict(reversed(list(project.items()))))
+
+        after = self.client.get('/api/metrics').json()['response_cache']
+        self.assertEqual(after['hits'], before['hits'] + 1)
+        self.assertEqual(after['misses'], before['misses'])
+
+    def test_results_from_another_snapshot_or_profiled_are_not_stored(self):
+        engine = self.client.app.state.snapshot_manager.get_engine('standard')
+        version = engine.snapshot.version
+        results = {
+            'Stale snapshot': {'summary': {'metadata': {'catalog_version': 'older'}}},
+            'Profiled': {'summary': {'metadata': {'catalog_version': version, 'profile': {'wall_ms': 1.0}}}}
+        }
+
+        for name, result in results.items():
+            project = {"square_footage": 3210, "tier": "Premium", "project_name": name}
+            with mock.patch.object(engine, 'estimate_project', return_value=result) as estimate_project:
+                self.client.post('/api/estimate', json=project)
+                self.client.post('/api/estimate', json=project)
+            self.assertEqual(estimate_project.call_count, 2, name)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+# tests/api/test_single_flight.py
+
+import unittest
+import asyncio
+import logging
+
+from src.api.single_flight import SingleFlight
+
+# Suppress logging during tests
+logging.disable(logging.CRITICAL)
+
+class TestSingleFlight(unittest.TestCase):
+
+    def test_concurrent_callers_share_one_computation(self):
+        flight = SingleFlight()
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {'total_cost': 42}
+
+        async def main():
+            same = [flight.run('a', compute) for _ in range(5)]
+            other = flight.run('b', compute)
+            return await asyncio.gather(*same, other)
+
+        results = asyncio.run(main())
+        self.assertEqual(len(calls), 2)
+        self.assertTrue(all(result == {'total_cost': 42} for result in results))
+        self.assertEqual(flight.stats(), {'in_flight': 0, 'leaders': 2, 'coalesced': 4})
+
+    def test_errors_reach_every_caller(self):
+        flight = SingleFlight()
+
+        async def compute():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        async def main():
+            return await asyncio.gather(*[flight.run('a', compute) for _ in range(3)], return_exceptions=True)
+
+        results = asyncio.run(main())
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+        self.assertEqual(flight.stats()['in_flight'], 0)
+
+    def test_cancelled_caller_does_not_cancel_others(self):
+        flight = SingleFlight()
+
+        async def compute():
+            await asyncio.sleep(0.05)
+            return 'done'
+
+        async def main():
+            leader = asyncio.ensure_future(flight.run('a', compute))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(flight.run('a', compute))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            return await follower
+
+        self.assertEqual(asyncio.run(main()), 'done')
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+# tests/core/test_baseline_cache.py
+
+import unittest
+import json
+from unittest import mock
+import logging
+
+from src.core.baseline_cache import BaselineCache
+from src.core.estimation_engine import EnhancedEstimationEngine
+from tests.helpers import BackendTestCase, comparable
+
+# Suppress logging during tests
+logging.disable(logging.CRITICAL)
+
+PROJECT = {
+    "square_footage": 6500,
+    "global_tier": "Luxury",
+    "bedroom_count": 4,
+    "rooms": {
+        "kitchen": {"name": "Kitchen", "type": "kitchen", "square_footage": 400},
+        "bath": {"name": "Primary Bath", "type": "primary_bath", "square_footage": 250}
+    }
+}
+
+class TestBaselineCache(unittest.TestCase):
+
+    def test_lru_and_copies(self):
+        cache = BaselineCache(max_entries=2)
+        self.assertEqual(cache.key({'a': 1, 'b': 2}), cache.key({'b': 2, 'a': 1}))
+
+        baseline = {'roofing': {'status': 'success', 'total_cost': 10}}
+        cache.put('one', baseline)
+        baseline['roofing']['total_cost'] = 99
+        stored = cache.get('one')
+        self.assertEqual(stored['roofing']['total_cost'], 10)
+        stored['roofing']['total_cost'] = 50
+        self.assertEqual(cache.get('one')['roofing']['total_cost'], 10)
+
+        cache.put('two', {})
+        cache.put('three', {})
+        self.assertIsNone(cache.get('one'))
+        self.assertEqual(cache.stats()['entries'], 2)
+
+        disabled = BaselineCache(enabled=False)
+        disabled.put('one', {})
+        self.assertIsNone(disabled.get('one'))
+
+class TestDetailedBaseline(BackendTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.engine = EnhancedEstimationEngine()
+
+    def setUp(self):
+        self.engine.baseline_cache.invalidate()
+
+    def test_only_whole_house_categories_run_globally(self):
+        with mock.patch.object(self.engine, '_estimate_category', wraps=self.engine._estimate_category) as estimate:
+            result = self.engine.estimate_detailed_project(json.loads(json.dumps(PROJECT)))
+
+        non_room = set(self.engine._get_non_room_categories())
+        self.assertEqual({call.args[0] for call in estimate.call_args_list}, non_room & set(self.engine.estimators))
+        self.assertEqual(set(result['categories']), non_room & set(self.engine.estimators))
+
+    def test_repeated_calls_reuse_the_baseline(self):
+        first = self.engine.estimate_detailed_project(json.loads(json.dumps(PROJECT)))
+        first_json = comparable(first)
+        first['categories']['roofing']['total_cost'] = -1
+
+        # Room edits keep the house the same
+        edited = json.loads(json.dumps(PROJECT))
+        edited['rooms']['kitchen']['square_footage'] = 500
+        with mock.patch.object(self.engine, '_run_categories') as run_categories:
+            second = self.engine.estimate_detailed_project(json.loads(json.dumps(PROJECT)))
+            self.engine.estimate_detailed_project(edited)
+        run_categories.assert_not_called()
+
+        # A different house computes its own baseline
+        self.engine.estimate_detailed_project(dict(PROJECT, square_footage=8000))
+
+        self.assertEqual(comparable(second), first_json)
+        stats = self.engine.baseline_cache.stats()
+        self.assertEqual((stats['hits'], stats['entries']), (2, 2))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+# tests/core/test_catalog_index.py
+
+import unittest
+import logging
+
+import pandas as pd
+
+from src.core.catalog_index import CatalogIndex
+
+# Suppress logging during tests
+logging.disable(logging.CRITICAL)
+
+class TestCatalogIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.catalog = pd.DataFrame({
+            'Item': ['Section Header', 'Outlet', 'Switch', 'Outlet (alt)'],
+            'Cost(Mid)': [None, 12.5, 8.0, 14.0],
+            'Unit': ['EA', 'EA', 'EA', 'EA'],
+            'Markup Percentage': [0.0, 70.0, 70.0, 65.0],
+            'Category': [None, 'Electrical', 'Electrical', 'Electrical'],
+            'ID': [None, 'el1', 'el2', 'el1']
+        })
+        self.index = CatalogIndex(self.catalog)
+
+    def test_lookup_matches_mask_scan(self):
+        """Each ID resolves to the same rows, in the same order, as a boolean mask"""
+        for item_id in ['el1', 'el2', 'missing']:
+            expected = list(self.catalog.index[self.catalog['ID'] == item_id])
+            self.assertEqual(list(self.index.lookup(item_id)), expected)
+
+    def test_record_fields(self):
+        record = self.index.record(self.index.lookup('el2')[0])
+        self.assertEqual(record, {
+            'item_name': 'Switch',
+            'category': 'Electrical',
+            'unit': 'EA',
+            'unit_cost': 8.0,
+            'markup': 70.0
+        })
+
+    def test_rows_without_id_are_not_indexed(self):
+        self.assertEqual(len(self.index), 2)
+        self.assertNotIn(None, self.index)
+
+    def test_empty_catalog(self):
+        index = CatalogIndex(pd.DataFrame())
+        self.assertEqual(index.lookup('el1'), ())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+# tests/core/test_cost_plan.py
+
+import unittest
+import logging
+
+import pandas as pd
+
+from src.core.catalog_index import CatalogIndex
+from src.core.cost_plan import CostPlan, get_unit_conversion_factor
+
+# Suppress logging during tests
+logging.disable(logging.CRITICAL)
+
+class TestCostPlan(unittest.TestCase):
+
+    def setUp(self):
+        catalog = pd.DataFrame({
+            'Item': ['Tile', 'Grout', 'Outlet'],
+            'Cost(Mid)': [10.0, 2.0, 15.0],
+            'Unit': ['SY', 'SF', 'Each'],
+            'Markup Percentage': [50.0, 50.0, 70.0],
+            'Category': ['Tile', 'Tile', 'Electrical'],
+            'ID': ['t1', 't2', 'e1']
+        })
+        mappings = {'category_mappings': {
+            'tile': {'item_mappings': {
+                'floor_tile_sf': {'item_ids': ['t1', 't2']},
+                'accent_tile_sf': {'item_ids': ['missing']},
+                'wall_tile_sf': {'search_terms': ['tile']}
+            }},
+            'electrical': {'item_mappings': {
+                'standard_outlets': {'item_ids': ['e1']}
+            }}
+        }}
+        self.plan = CostPlan(mappings, CatalogIndex(catalog))
+
+    def test_resolves_rows_and_factors_once(self):
+        tile = self.plan.get('tile')
+        self.assertEqual(tile.slices['floor_tile_sf'], (0, 2))
+        self.assertEqual(tile.item_ids, ['t1', 't2'])
+        self.assertAlmostEqual(tile.factors[0], 1 / 9)
+        self.assertEqual(tile.factors[1], 1.0)
+        self.assertNotIn('wall_tile_sf', tile)
+
+    def test_unresolved_ids_reported_at_compile(self):
+        self.assertEqual(self.plan.unresolved, {'tile': {'accent_tile_sf': ['missing']}})
+
+    def test_cost_rows_match_scalar_arithmetic(self):
+        tile = self.plan.get('tile')
+        costed = self.plan.cost_rows(tile, [('floor_tile_sf', 90, None)])
+        self.assertEqual(costed['quantity'], [90 * (1 / 9), 90 * 1.0])
+        self.assertEqual(costed['total_cost'], [10.0 * (90 * (1 / 9)), 2.0 * (90 * 1.0)])
+
+    def test_integer_conversion_keeps_int_quantity(self):
+        """EA -> Each converts by the integer factor 1, so counts stay ints"""
+        electrical = self.plan.get('electrical')
+        costed = self.plan.cost_rows(electrical, [('standard_outlets', 12, None)])
+        self.assertIsInstance(costed['quantity'][0], int)
+        self.assertEqual(costed['total_cost'], [180.0])
+
+    def test_estimator_unit_overrides_default(self):
+        tile = self.plan.get('tile')
+        costed = self.plan.cost_rows(tile, [('floor_tile_sf', 2, 'SY')])
+        self.assertEqual(costed['quantity'], [2.0, 2 * 9])
+        self.assertEqual(get_unit_conversion_factor('sy', 'SF'), 9)
+
+if __name__ == "__main__":
+    unittest.main()
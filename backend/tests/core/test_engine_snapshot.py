@@ -0,0 +1,116 @@
+# tests/core/test_engine_snapshot.py
+
+import unittest
+import os
+import shutil
+import tempfile
+from pathlib import Path
+import logging
+
+from src.core.engine_snapshot import EngineSnapshot
+from src.core.snapshot_manager import SnapshotManager
+from src.core.estimation_engine import EstimationEngine, EnhancedEstimationEngine
+
+# Suppress logging during tests
+logging.disable(logging.CRITICAL)
+
+class TestEngineSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        """Build one snapshot to share between engines"""
+        project_root = Path(__file__).parent.parent.parent
+        self.config_path = os.path.join(project_root, 'config', 'settings.json')
+        self.snapshot = EngineSnapshot.load(self.config_path)
+
+        self.sample_project = {
+            "square_footage": 5000,
+            "tier": "Luxury",
+            "bedroom_count": 4,
+            "primary_bath_count": 1,
+            "secondary_bath_count": 2,
+            "powder_room_count": 1
+        }
+
+    def test_snapshot_is_immutable(self):
+        """Snapshots cannot be reassigned once built"""
+        with self.assertRaises(AttributeError):
+            self.snapshot.catalog = None
+
+    def test_engines_share_snapshot(self):
+        """Engines built from a snapshot reuse its catalog and estimators"""
+        standard = EstimationEngine.from_snapshot(self.snapshot)
+        enhanced = EnhancedEstimationEngine.from_snapshot(self.snapshot)
+
+        self.assertIs(standard.catalog, self.snapshot.catalog)
+        self.assertIs(enhanced.catalog, self.snapshot.catalog)
+        self.assertIs(standard.estimators, enhanced.estimators)
+
+    def test_shared_engine_matches_fresh_engine(self):
+        """Sharing a snapshot does not change estimation results"""
+        shared = EstimationEngine.from_snapshot(self.snapshot)
+        fresh = EstimationEngine(self.config_path)
+
+        first = shared.estimate_project(dict(self.sample_project))
+        second = shared.estimate_project(dict(self.sample_project))
+        reference = fresh.estimate_project(dict(self.sample_project))
+
+        self.assertEqual(first['summary']['cost_breakdown'], reference['summary']['cost_breakdown'])
+        self.assertEqual(second['summary']['cost_breakdown'], reference['summary']['cost_breakdown'])
+
+class TestSnapshotManager(unittest.TestCase):
+
+    def setUp(self):
+        """Copy config and catalog into a scratch directory we can modify"""
+        project_root = Path(__file__).parent.parent.parent
+        self.original_cwd = os.getcwd()
+        self.work_dir = tempfile.mkdtemp()
+
+        os.makedirs(os.path.join(self.work_dir, 'config'))
+        os.makedirs(os.path.join(self.work_dir, 'data'))
+        for relative_path in ['config/settings.json', 'config/catalog_mappings_03.19.25.json', 'data/catalog.csv']:
+            shutil.copy(os.path.join(project_root, relative_path), os.path.join(self.work_dir, relative_path))
+
+        os.chdir(self.work_dir)
+        self.manager = SnapshotManager('config/settings.json', engine_factories={
+            'standard': EstimationEngine.from_snapshot
+        })
+
+    def tearDown(self):
+        self.manager.stop()
+        os.chdir(self.original_cwd)
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def _append_catalog_row(self):
+        with open('data/catalog.csv', 'a') as f:
+            f.write('\nHot Reload Test Item,$1.00,$1.00,$1.00,Each,,70.00,99999,Electrical,zz1\n')
+        stat = os.stat('data/catalog.csv')
+        os.utime('data/catalog.csv', (stat.st_atime, stat.st_mtime + 10))
+
+    def test_unchanged_files_do_not_reload(self):
+        """Touching files without changing content keeps the same snapshot"""
+        before = self.manager.snapshot
+        stat = os.stat('data/catalog.csv')
+        os.utime('data/catalog.csv', (stat.st_atime, stat.st_mtime + 10))
+
+        self.assertFalse(self.manager.check_for_changes())
+        self.assertIs(self.manager.snapshot, before)
+
+    def test_catalog_change_swaps_snapshot(self):
+        """A content change builds a new snapshot while old engines keep the old one"""
+        old_engine = self.manager.get_engine('standard')
+        old_version = self.manager.version
+
+        self._append_catalog_row()
+        self.assertTrue(self.manager.check_for_changes())
+
+        new_engine = self.manager.get_engine('standard')
+        self.assertNotEqual(self.manager.version, old_version)
+        self.assertIsNot(new_engine, old_engine)
+        self.assertEqual(old_engine.snapshot.version, old_version)
+        self.assertEqual(len(new_engine.catalog), len(old_engine.catalog) + 1)
+
+        result = new_engine.estimate_project({"square_footage": 5000, "tier": "Luxury"})
+        self.assertEqual(result['summary']['metadata']['catalog_version'], self.manager.version)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,7 @@ import unittest
 import os
 import json
 from pathlib import Path
-from src.core.estimation_engine import EstimationEngine
+from src.core.estimation_engine import EstimationEngine, EnhancedEstimationEngine
 import logging
 
 # Suppress logging during tests
@@ -174,6 +174,83 @@ class TestEstimationEngine(unittest.TestCase):
         if os.path.exists(file_path):
             os.remove(file_path)
 
+class TestConcurrentEstimation(unittest.TestCase):
+    """One shared engine must give the same answers when called from many threads"""
+    
+    def setUp(self):
+        """Set up a shared engine using the project configuration."""
+        project_root = Path(__file__).parent.parent.parent
+        config_path = os.path.join(project_root, 'config', 'settings.json')
+        self.engine = EnhancedEstimationEngine(config_path)
+        
+        self.projects = [
+            {"square_footage": sf, "tier": tier, "bedroom_count": 4,
+             "primary_bath_count": 1, "secondary_bath_count": 2, "powder_room_count": 1}
+            for sf, tier in [(4500, "Premium"), (7000, "Luxury"), (12000, "Ultra-Luxury")]
+        ]
+    
+    def test_caller_data_not_modified(self):
+        """Estimating must not write the derived tier back into the caller's dict."""
+        project = {"square_footage": 7000}
+        result = self.engine.estimate_project(project)
+        
+        self.assertNotIn('tier', project)
+        self.assertIn('tier', result['project'])
+    
+    def test_threaded_estimates_match_sequential(self):
+        """Concurrent estimates on one engine match sequential ones."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        expected = [self.engine.estimate_project(dict(p))['summary']['cost_breakdown'] for p in self.projects]
+        
+        work = self.projects * 4
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda p: self.engine.estimate_project(dict(p)), work))
+        
+        for index, result in enumerate(results):
+            self.assertEqual(result['summary']['cost_breakdown'], expected[index % len(self.projects)])
+    
+    def test_threaded_detailed_estimates_use_own_project(self):
+        """Room allocation reads the project being estimated, not another thread's."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        def detailed(sf):
+            return self.engine.estimate_detailed_project({
+                "square_footage": sf,
+                "tier": "Luxury",
+                "rooms": {"kitchen": {"name": "Kitchen", "type": "kitchen", "square_footage": 400}}
+            })
+        
+        # Compare reprs: some catalog allowances have no cost and come back as NaN
+        expected = {sf: repr(detailed(sf)['rooms']['kitchen']['category_costs']) for sf in (5000, 9000)}
+        
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            work = [5000, 9000] * 6
+            results = list(pool.map(detailed, work))
+        
+        for sf, result in zip(work, results):
+            self.assertEqual(result['project']['square_footage'], sf)
+            self.assertEqual(repr(result['rooms']['kitchen']['category_costs']), expected[sf])
+    
+    def test_estimate_many_matches_estimate_project(self):
+        """Batch results match single estimates and carry their input index."""
+        expected = [self.engine.estimate_project(dict(p))['summary']['cost_breakdown'] for p in self.projects]
+        
+        items = list(self.engine.estimate_many(self.projects, max_workers=3))
+        
+        self.assertEqual(sorted(item['index'] for item in items), [0, 1, 2])
+        for item in items:
+            self.assertEqual(item['status'], 'success')
+            self.assertEqual(item['result']['summary']['cost_breakdown'], expected[item['index']])
+    
+    def test_estimate_many_isolates_errors(self):
+        """One broken project does not stop the rest of the batch."""
+        items = {item['index']: item for item in self.engine.estimate_many([self.projects[0], 42, {"tier": "Premium"}])}
+        
+        self.assertEqual(items[0]['status'], 'success')
+        self.assertEqual(items[1]['status'], 'error')
+        self.assertEqual(items[2]['status'], 'validation_error')
+
 # Add additional test classes for other core components
 # tests/estimators/test_foundation.py
 
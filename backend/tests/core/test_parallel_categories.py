@@ -0,0 +1,91 @@
+# tests/core/test_parallel_categories.py
+
+import unittest
+from unittest import mock
+import json
+import logging
+
+from src.core.engine_snapshot import compute_source_version
+from src.core.estimation_engine import EstimationEngine
+from tests.helpers import BackendTestCase, comparable
+
+# Suppress logging during tests
+logging.disable(logging.CRITICAL)
+
+PROJECTS = [
+    {"square_footage": 4500, "tier": "Premium", "bedroom_count": 4, "primary_bath_count": 1},
+    {"square_footage": 7000},
+    {"square_footage": 12000, "tier": "Ultra-Luxury", "project_duration_months": 18}
+]
+
+class TestParallelCategories(BackendTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.sequential = EstimationEngine()
+
+    def _engine(self, mode):
+        return self.engine_with(EstimationEngine, mode, parallel_categories={'mode': mode, 'max_workers': 3})
+
+    def _assert_matches_sequential(self, engine):
+        for project in PROJECTS:
+            with self.subTest(project=project):
+                self.assertEqual(comparable(engine.estimate_project(dict(project))),
+                                 comparable(self.sequential.estimate_project(dict(project))))
+
+    def test_thread_mode_matches_sequential(self):
+        engine = self._engine('thread')
+        self.assertEqual(engine.category_mode, 'thread')
+        self._assert_matches_sequential(engine)
+        self.assertEqual(list(engine.estimate_project({"square_footage": 5000})['categories']),
+                         list(engine.estimators))
+
+    def test_process_mode_matches_sequential(self):
+        engine = self._engine('process')
+        try:
+            self._assert_matches_sequential(engine)
+        finally:
+            engine._category_pool.shutdown()
+
+    def test_process_workers_follow_the_snapshot_version(self):
+        """Category workers reload when the files change and never answer for another snapshot"""
+        engine = self.engine_with(EstimationEngine, 'process_versions',
+                                  parallel_categories={'mode': 'process', 'max_workers': 2})
+        snapshot = engine.snapshot
+        try:
+            # The workers preload the files as they are now
+            engine.estimate_project(dict(PROJECTS[0]))
+
+            # Change the settings on disk, leaving the workers on a stale snapshot
+            with open(snapshot.config_path) as f:
+                config = json.load(f)
+            config['unused_setting'] = True
+            with open(snapshot.config_path, 'w') as f:
+                json.dump(config, f)
+            object.__setattr__(snapshot, 'version', compute_source_version(snapshot.source_paths))
+            self._assert_matches_sequential(engine)
+
+            # A version no worker can load fails every category instead
+            object.__setattr__(snapshot, 'version', 'not-on-disk')
+            result = engine.estimate_project(dict(PROJECTS[0]))
+            self.assertEqual({category['status'] for category in result['categories'].values()}, {'error'})
+            self.assertTrue(any('expected not-on-disk' in warning for warning in result['summary']['warnings']))
+        finally:
+            engine._category_pool.shutdown()
+
+    def test_errors_stay_in_their_category(self):
+        engine = self._engine('thread')
+        with mock.patch.object(engine.estimators['electrical'], 'calculate_quantities',
+                               side_effect=RuntimeError("broken estimator")):
+            result = engine.estimate_project({"square_footage": 5151, "tier": "Luxury"})
+
+        self.assertEqual(result['categories']['electrical']['status'], 'error')
+        self.assertIn("Error in category 'electrical': broken estimator", result['summary']['warnings'])
+        self.assertEqual(result['categories']['plumbing']['status'], 'success')
+
+    def test_unknown_mode_runs_sequentially(self):
+        self.assertEqual(self._engine('fibers').category_mode, 'off')
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+# tests/core/test_parallel_rooms.py
+
+import unittest
+import json
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+import logging
+
+from src.core import worker_engine
+from src.core.estimation_engine import EnhancedEstimationEngine
+from src.core.profiler import EstimateProfile
+from src.utils.synthetic_data import SyntheticDataGenerator
+from tests.helpers import BackendTestCase, comparable
+
+# Suppress logging during tests
+logging.disable(logging.CRITICAL)
+
+def worker_pool_modes():
+    """Room and category modes of the engine preloaded in this worker process"""
+    engine = worker_engine.get_worker_engine()
+    return engine.room_mode, engine.category_mode
+
+class TestParallelRooms(BackendTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.sequential = EnhancedEstimationEngine()
+        cls.project = SyntheticDataGenerator(seed=5).generate_project(30, tier='Luxury')
+        # A few repeated rooms, which the chunking keeps together
+        for index in range(4):
+            cls.project['rooms'][f'repeat_{index}'] = dict(cls.project['rooms']['room_2'], name=f'Repeat {index}')
+
+    def _engine(self, mode, min_rooms=8):
+        return self.engine_with(EnhancedEstimationEngine, f'{mode}_{min_rooms}',
+                                parallel_rooms={'mode': mode, 'max_workers': 3, 'min_rooms': min_rooms})
+
+    def _assert_matches_sequential(self, engine):
+        expected = self.sequential.estimate_detailed_project(json.loads(json.dumps(self.project)))
+        result = engine.estimate_detailed_project(json.loads(json.dumps(self.project)))
+        self.assertEqual(comparable(result), comparable(expected))
+        self.assertEqual(list(result['rooms']), list(self.project['rooms']))
+
+    def test_thread_mode_matches_sequential(self):
+        engine = self._engine('thread')
+        self.assertEqual(engine.room_mode, 'thread')
+        with mock.patch.object(engine, 'estimate_rooms', wraps=engine.estimate_rooms) as estimate_rooms:
+            self._assert_matches_sequential(engine)
+        self.assertEqual(estimate_rooms.call_count, 3)
+
+    def test_process_mode_matches_sequential(self):
+        engine = self._engine('process')
+        try:
+            self._assert_matches_sequential(engine)
+        finally:
+            engine._room_pool.shutdown()
+
+    def test_process_workers_check_the_snapshot_version(self):
+        engine = self._engine('process')
+        snapshot = engine.snapshot
+        version = snapshot.version
+        try:
+            self._assert_matches_sequential(engine)
+            # Workers can't load a snapshot that doesn't match the files, so the estimate fails
+            object.__setattr__(snapshot, 'version', 'not-on-disk')
+            with self.assertRaisesRegex(RuntimeError, 'expected not-on-disk'):
+                engine.estimate_detailed_project(json.loads(json.dumps(self.project)))
+        finally:
+            object.__setattr__(snapshot, 'version', version)
+            engine._room_pool.shutdown()
+
+    def test_worker_engines_do_not_start_process_pools(self):
+        """An engine preloaded in a pool worker runs its rooms and categories sequentially"""
+        engine = self.engine_with(EnhancedEstimationEngine, 'nested',
+                                  parallel_rooms={'mode': 'process'}, parallel_categories={'mode': 'process'})
+        self.assertEqual((engine.room_mode, engine.category_mode), ('process', 'process'))
+        with ProcessPoolExecutor(max_workers=1, initializer=worker_engine.init_worker_engine,
+                                 initargs=(engine.snapshot.config_path,)) as pool:
+            self.assertEqual(pool.submit(worker_pool_modes).result(), ('off', 'off'))
+
+    def test_small_projects_stay_sequential(self):
+        engine = self._engine('thread', min_rooms=100)
+        with mock.patch.object(engine, 'estimate_rooms') as estimate_rooms:
+            self._assert_matches_sequential(engine)
+        estimate_rooms.assert_not_called()
+        self.assertIsNone(engine._room_pool)
+
+    def test_chunks_keep_repeated_rooms_together(self):
+        chunks = self.sequential._room_chunks(self.project['rooms'], 3)
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(sorted(room_id for chunk in chunks for room_id in chunk), sorted(self.project['rooms']))
+        holding = [chunk for chunk in chunks if 'room_2' in chunk][0]
+        self.assertTrue(all(f'repeat_{index}' in holding for index in range(4)))
+        self.assertLessEqual(max(map(len, chunks)) - min(map(len, chunks)), 5)
+
+    def test_profile_merges_chunks(self):
+        engine = self._engine('thread')
+        result = engine.estimate_detailed_project(json.loads(json.dumps(self.project)), profile=True)
+        profile = result['summary']['metadata']['profile']
+        self.assertEqual(set(profile['rooms']), set(self.project['rooms']))
+        self.assertEqual(profile['room_batches']['electrical']['rooms'], len({
+            room_id for room_id, entry in profile['rooms'].items() if 'template' not in entry
+        }))
+
+        merged = EstimateProfile()
+        entry = {'wall_ms': 1.0, 'phases_ms': {'costing': 0.5}, 'catalog_lookups': 2, 'cache_hits': 0,
+                 'cache_misses': 1, 'peak_kb': None, 'rooms': 2}
+        merged.merge({'rooms': {'a': {}}, 'room_batches': {'tile': entry}})
+        merged.merge({'rooms': {'b': {}}, 'room_batches': {'tile': dict(entry, peak_kb=3.0, rooms=1)}})
+        self.assertEqual(set(merged.rooms), {'a', 'b'})
+        self.assertEqual(merged.room_batches['tile']['rooms'], 3)
+        self.assertEqual(merged.room_batches['tile']['catalog_lookups'], 4)
+        self.assertEqual(merged.room_batches['tile']['phases_ms'], {'costing': 1.0})
+        self.assertEqual(merged.room_batches['tile']['peak_kb'], 3.0)
+
+    def test_unknown_mode_runs_sequentially(self):
+        self.assertEqual(self._engine('fibers').room_mode, 'off')
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+# tests/core/test_profiler.py
+
+import unittest
+import tracemalloc
+import logging
+
+from src.core.estimation_engine import EnhancedEstimationEngine
+from src.core.profiler import EstimateProfile, ProfileCounters, count_lookups, count_cache, get_profile_counters
+from tests.helpers import BackendTestCase, comparable
+
+# Suppress logging during tests
+logging.disable(logging.CRITICAL)
+
+DETAILED_PROJECT = {
+    "square_footage": 6500,
+    "global_tier": "Luxury",
+    "rooms": {
+        "kitchen": {"name": "Kitchen", "type": "kitchen", "square_footage": 400},
+        "bath": {"name": "Primary Bath", "type": "primary_bath", "square_footage": 250}
+    }
+}
+
+class TestProfileSection(unittest.TestCase):
+
+    def test_hooks_count_against_active_section_only(self):
+        count_lookups(5)
+        count_cache(True)
+
+        profile = EstimateProfile()
+        section = profile.section()
+        count_lookups()
+        count_lookups(3)
+        count_cache(True)
+        count_cache(False)
+        section.lap('quantities')
+        entry = section.finish(status='success')
+
+        self.assertEqual(entry['catalog_lookups'], 4)
+        self.assertEqual(entry['cache_hits'], 1)
+        self.assertEqual(entry['cache_misses'], 1)
+        self.assertEqual(entry['status'], 'success')
+        self.assertIn('quantities', entry['phases_ms'])
+        self.assertIsNone(entry['peak_kb'])
+
+        # Finished sections stop counting
+        count_lookups()
+        self.assertEqual(section.catalog_lookups, 4)
+
+    def test_memory_tracking_starts_and_stops_tracemalloc(self):
+        if tracemalloc.is_tracing():
+            self.skipTest("tracemalloc already running")
+
+        profile = EstimateProfile(track_memory=True)
+        self.assertTrue(tracemalloc.is_tracing())
+        section = profile.section()
+        data = [bytes(1024) for _ in range(256)]
+        entry = section.finish()
+        report = profile.finish('standard')
+
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertGreater(entry['peak_kb'], 200)
+        self.assertTrue(report['track_memory'])
+        del data
+
+    def test_counters_aggregate_by_category_and_room_type(self):
+        counters = ProfileCounters()
+        entry = {'wall_ms': 2.0, 'catalog_lookups': 3, 'cache_hits': 1, 'cache_misses': 0, 'peak_kb': 4.0}
+        counters.record('standard', {'categories': {'framing': entry}})
+        counters.record('standard', {'categories': {'framing': dict(entry, wall_ms=4.0, peak_kb=None)}})
+        counters.record('detailed', {'categories': {'roofing': entry},
+                                     'rooms': {'r1': dict(entry, type='kitchen')},
+                                     'room_batches': {'framing': dict(entry, rooms=1)}})
+
+        stats = counters.stats()
+        self.assertEqual(stats['estimates'], {'standard': 2, 'detailed': 1})
+        self.assertEqual(stats['categories']['framing']['count'], 2)
+        self.assertEqual(stats['categories']['framing']['mean_wall_ms'], 3.0)
+        self.assertEqual(stats['categories']['framing']['max_wall_ms'], 4.0)
+        self.assertEqual(stats['categories']['framing']['catalog_lookups'], 6)
+        self.assertEqual(stats['categories']['framing']['max_peak_kb'], 4.0)
+        self.assertEqual(stats['categories']['roofing']['count'], 1)
+        self.assertEqual(stats['rooms']['kitchen']['count'], 1)
+        self.assertEqual(stats['room_batches']['framing']['count'], 1)
+
+class TestEngineProfiling(BackendTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.engine = EnhancedEstimationEngine()
+
+    def setUp(self):
+        self.engine.quantity_cache.invalidate()
+
+    def test_disabled_by_default(self):
+        result = self.engine.estimate_project({"square_footage": 5000})
+        self.assertNotIn('profile', result['summary']['metadata'])
+
+    def test_standard_profile_per_category(self):
+        first = self.engine.estimate_project({"square_footage": 5000}, profile=True)
+        second = self.engine.estimate_project({"square_footage": 5000}, profile=True)
+
+        profile = first['summary']['metadata']['profile']
+        self.assertEqual(set(profile['categories']), set(self.engine.estimators))
+        successful = [category for category, data in first['categories'].items() if data.get('status') == 'success']
+        self.assertTrue(successful)
+        for category in successful:
+            entry = profile['categories'][category]
+            self.assertEqual(entry['status'], 'success')
+            self.assertEqual(entry['cache_misses'], 1)
+            self.assertGreater(entry['catalog_lookups'], 0)
+            self.assertEqual(set(entry['phases_ms']), {'quantities', 'costing', 'matching'})
+
+        # The second run is served from the quantity cache
+        for category in successful:
+            self.assertEqual(second['summary']['metadata']['profile']['categories'][category]['cache_hits'], 1)
+
+    def test_profiling_does_not_change_results(self):
+        plain = self.engine.estimate_detailed_project(dict(DETAILED_PROJECT), profile=False)
+        profiled = self.engine.estimate_detailed_project(dict(DETAILED_PROJECT), profile=True)
+        self.assertEqual(comparable(plain), comparable(profiled))
+
+    def test_detailed_profile_per_room(self):
+        before = get_profile_counters().stats()['estimates'].get('detailed', 0)
+        result = self.engine.estimate_detailed_project(dict(DETAILED_PROJECT), profile=True)
+
+        profile = result['summary']['metadata']['profile']
+        self.assertEqual(set(profile['rooms']), {'kitchen', 'bath'})
+        self.assertEqual(profile['rooms']['kitchen']['type'], 'kitchen')
+        self.assertEqual(profile['rooms']['kitchen']['categories'], len(result['rooms']['kitchen']['categories']))
+        self.assertTrue(profile['categories'])
+        for category, entry in profile['room_batches'].items():
+            self.assertEqual(set(entry['phases_ms']), {'quantities', 'costing'})
+            self.assertLessEqual(entry['rooms'], 2)
+        self.assertIn('electrical', profile['room_batches'])
+        self.assertEqual(get_profile_counters().stats()['estimates']['detailed'], before + 1)
+
+if __name__ == '__main__':
+    unittest.main()
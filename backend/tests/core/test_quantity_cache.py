@@ -0,0 +1,116 @@
+# tests/core/test_quantity_cache.py
+
+import unittest
+import logging
+
+from src.core.engine_snapshot import initialize_estimators
+from src.core.data_loader import DataLoader
+from src.core.quantity_cache import QuantityCache
+from src.estimators.batch import BATCH_COUNT_FIELDS
+
+# Suppress logging during tests
+logging.disable(logging.CRITICAL)
+
+class CountingEstimator:
+    QUANTITY_INPUTS = ('bedroom_count',)
+
+    def __init__(self):
+        self.config = {}
+        self.calls = 0
+
+    def calculate_quantities(self, square_footage, tier, **kwargs):
+        self.calls += 1
+        return {'rooms': kwargs.get('bedroom_count', 3), 'area': square_footage, 'units': {'area': 'SF'}}
+
+class TestQuantityCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = QuantityCache(max_entries=3)
+        self.estimator = CountingEstimator()
+
+    def test_hits_ignore_undeclared_inputs(self):
+        first = self.cache.calculate_quantities('test', self.estimator, square_footage=100, tier='Luxury',
+                                                bedroom_count=4, room_type='kitchen')
+        second = self.cache.calculate_quantities('test', self.estimator, square_footage=100, tier='Luxury',
+                                                 bedroom_count=4, project_name='Other', rooms={'a': {}})
+        self.assertEqual(first, second)
+        self.assertEqual(self.estimator.calls, 1)
+        self.assertEqual(self.cache.stats()['hits'], 1)
+        self.assertEqual(self.cache.stats()['misses'], 1)
+
+        # Declared inputs and value types are part of the key
+        self.cache.calculate_quantities('test', self.estimator, square_footage=100, tier='Luxury', bedroom_count=5)
+        self.cache.calculate_quantities('test', self.estimator, square_footage=100.0, tier='Luxury', bedroom_count=4)
+        self.assertEqual(self.estimator.calls, 3)
+
+    def test_results_are_copies(self):
+        result = self.cache.calculate_quantities('test', self.estimator, square_footage=100, tier='Luxury')
+        result['units']['area'] = 'changed'
+        again = self.cache.calculate_quantities('test', self.estimator, square_footage=100, tier='Luxury')
+        self.assertEqual(again['units']['area'], 'SF')
+        again['rooms'] = 0
+        self.assertEqual(self.cache.calculate_quantities('test', self.estimator, square_footage=100,
+                                                         tier='Luxury')['rooms'], 3)
+
+    def test_lru_bounds(self):
+        for square_footage in (1, 2, 3, 4):
+            self.cache.calculate_quantities('test', self.estimator, square_footage=square_footage, tier='Luxury')
+        stats = self.cache.stats()
+        self.assertEqual(stats['entries'], 3)
+        self.assertEqual(stats['evictions'], 1)
+
+        # The oldest entry was evicted
+        self.cache.calculate_quantities('test', self.estimator, square_footage=1, tier='Luxury')
+        self.assertEqual(self.estimator.calls, 5)
+
+        tiny = QuantityCache(max_bytes=1)
+        tiny.calculate_quantities('test', self.estimator, square_footage=1, tier='Luxury')
+        self.assertEqual(tiny.stats()['entries'], 0)
+
+    def test_config_change_invalidates(self):
+        self.cache.calculate_quantities('test', self.estimator, square_footage=100, tier='Luxury')
+        self.estimator.config = {'changed': True}
+        self.cache.calculate_quantities('test', self.estimator, square_footage=100, tier='Luxury')
+        self.assertEqual(self.estimator.calls, 2)
+
+        self.cache.invalidate('test')
+        self.cache.calculate_quantities('test', self.estimator, square_footage=100, tier='Luxury')
+        self.assertEqual(self.estimator.calls, 3)
+
+    def test_disabled_and_unhashable(self):
+        disabled = QuantityCache(enabled=False)
+        disabled.calculate_quantities('test', self.estimator, square_footage=100, tier='Luxury')
+        disabled.calculate_quantities('test', self.estimator, square_footage=100, tier='Luxury')
+        self.assertEqual(self.estimator.calls, 2)
+
+        self.estimator.QUANTITY_INPUTS = None
+        self.cache.calculate_quantities('test', self.estimator, square_footage=100, tier='Luxury', rooms={})
+        self.assertEqual(self.cache.stats()['uncacheable'], 1)
+
+class TestQuantityInputs(unittest.TestCase):
+    """Estimators must not read kwargs they leave out of QUANTITY_INPUTS"""
+
+    def test_undeclared_inputs_do_not_change_results(self):
+        loader = DataLoader()
+        estimators = initialize_estimators(loader.mappings, loader.config)
+        extra = {
+            'room_type': 'kitchen', 'is_room_calculation': True, 'allocation_factor': 0.3,
+            'is_kitchen': True, 'is_bathroom': True, 'project_name': 'Test'
+        }
+
+        for category, estimator in estimators.items():
+            if estimator is None:
+                continue
+            self.assertIsNotNone(estimator.QUANTITY_INPUTS, category)
+            counts = {name: index + 2 for index, name in enumerate(BATCH_COUNT_FIELDS)}
+            declared = {name: value for name, value in counts.items() if name in estimator.QUANTITY_INPUTS}
+
+            for tier in ('Premium', 'Luxury', 'Ultra-Luxury'):
+                with self.subTest(category=category, tier=tier):
+                    self.assertEqual(
+                        estimator.calculate_quantities(square_footage=5500, tier=tier, **counts, **extra),
+                        estimator.calculate_quantities(square_footage=5500, tier=tier, **declared)
+                    )
+
+if __name__ == "__main__":
+    unittest.main()
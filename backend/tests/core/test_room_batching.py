@@ -0,0 +1,135 @@
+# tests/core/test_room_batching.py
+
+import unittest
+import json
+from unittest import mock
+import logging
+
+from src.core.estimation_engine import EnhancedEstimationEngine
+from src.core.estimation_context import EstimationContext
+from src.utils.synthetic_data import SyntheticDataGenerator
+from tests.helpers import BackendTestCase
+
+# Suppress logging during tests
+logging.disable(logging.CRITICAL)
+
+class TestRoomBatching(BackendTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.engine = EnhancedEstimationEngine()
+        cls.project = SyntheticDataGenerator(seed=3).generate_project(24, tier='Luxury')
+        # Identical rooms share their quantity inputs
+        cls.project['rooms']['room_copy'] = dict(cls.project['rooms']['room_1'], name='Copy')
+
+    def _batched(self):
+        context = EstimationContext(self.project)
+        return self.engine._estimate_rooms(self.project['rooms'], 'Luxury', self.project.get('trades', {}), context)
+
+    def test_batched_rooms_match_room_by_room(self):
+        batched = self._batched()
+        context = EstimationContext(self.project)
+        single = {
+            room_id: self.engine._estimate_room(room, 'Luxury', self.project.get('trades', {}), context)
+            for room_id, room in self.project['rooms'].items()
+        }
+        self.assertEqual(list(batched), list(single))
+        self.assertEqual(json.dumps(batched, sort_keys=True), json.dumps(single, sort_keys=True))
+        self.assertIsNot(batched['room_1']['categories'], batched['room_copy']['categories'])
+
+    def test_one_costing_pass_per_category(self):
+        with mock.patch.object(self.engine.cost_plan, 'cost_rows', wraps=self.engine.cost_plan.cost_rows) as cost_rows:
+            batched = self._batched()
+        categories = {category for room in batched.values() for category in room['categories']}
+        self.assertLessEqual(cost_rows.call_count, len(categories))
+
+    def test_quantities_come_from_one_batch_call(self):
+        estimator = self.engine.estimators['tile']
+        with mock.patch.object(estimator, 'calculate_quantities_batch',
+                               wraps=estimator.calculate_quantities_batch) as batch, \
+                mock.patch.object(estimator, 'calculate_quantities',
+                                  wraps=estimator.calculate_quantities) as scalar:
+            self._batched()
+        self.assertEqual(batch.call_count, 1)
+        scalar.assert_not_called()
+
+    def test_rooms_the_batch_cannot_take_are_calculated_alone(self):
+        inputs = [
+            {'square_footage': 120, 'tier': 'Luxury'},
+            {'square_footage': 120.5, 'tier': 'Basic'},
+            {'square_footage': 'large', 'tier': 'Luxury'}
+        ]
+        estimator = self.engine.estimators['painting_coatings']
+        results = self.engine._room_quantities('painting_coatings', inputs)
+        self.assertEqual(results[0], estimator.calculate_quantities(square_footage=120, tier='Luxury'))
+        # The scalar path's own errors are reported against the room
+        self.assertIsInstance(results[1], KeyError)
+        self.assertIsInstance(results[2], Exception)
+
+        # A batch that raises falls back to the scalar path room by room
+        with mock.patch.object(estimator, 'calculate_quantities_batch', side_effect=RuntimeError("batch failed")):
+            self.assertEqual(self.engine._room_quantities('painting_coatings', inputs[:1]), results[:1])
+
+    def test_costing_error_stays_with_its_room(self):
+        expected = self._batched()
+        category = 'drywall_interior'
+        # room_copy repeats room_1, so it is not part of the batch
+        room_ids = [room_id for room_id, room in expected.items()
+                    if category in room['categories'] and room_id != 'room_copy']
+        self.assertGreater(len(room_ids), 1)
+
+        original = self.engine._apply_costs_many
+        calls = []
+
+        def failing(category_name, quantities_list, context=None):
+            if category_name == category:
+                calls.append(len(quantities_list))
+                # Fail the whole batch, then the first room on its own
+                if len(calls) in (1, 2):
+                    raise RuntimeError("costing failed")
+            return original(category_name, quantities_list, context)
+
+        with mock.patch.object(self.engine, '_apply_costs_many', side_effect=failing):
+            rooms = self._batched()
+
+        self.assertEqual(calls, [len(room_ids)] + [1] * len(room_ids))
+        failed = rooms[room_ids[0]]
+        self.assertEqual(failed['categories'][category], {'status': 'error', 'message': 'costing failed'})
+        self.assertEqual(failed['warnings'], [f"Error in category '{category}': costing failed"])
+        self.assertNotIn(category, failed['category_costs'])
+        for room_id in room_ids[1:]:
+            # Some catalog costs are NaN, so compare serialized
+            self.assertEqual(json.dumps(rooms[room_id]['categories'][category]),
+                             json.dumps(expected[room_id]['categories'][category]))
+
+    def test_repeated_rooms_are_estimated_once(self):
+        unit = {
+            'kitchen': {'name': 'Kitchen', 'type': 'kitchen', 'square_footage': 220},
+            'bath': {'name': 'Bath', 'type': 'secondary_bath', 'square_footage': 80},
+            'bedroom': {'name': 'Bedroom', 'type': 'bedroom', 'square_footage': 180, 'tier': 'Premium'}
+        }
+        rooms = {f'{room_id}_{index}': dict(room, name=f"{room['name']} {index}")
+                 for index in range(10) for room_id, room in unit.items()}
+        # Same room with a trade override, and the same size given as a float, are distinct rooms
+        rooms['kitchen_override'] = dict(unit['kitchen'], trades={'cabinetry': {'tier': 'Ultra-Luxury'}})
+        rooms['bedroom_float'] = dict(unit['bedroom'], square_footage=180.0)
+        project = {'square_footage': 6000, 'rooms': rooms}
+
+        with mock.patch.object(self.engine, '_apply_costs_many', wraps=self.engine._apply_costs_many) as apply_costs:
+            batched = self.engine._estimate_rooms(rooms, 'Luxury', {}, EstimationContext(project))
+        single = {
+            room_id: self.engine._estimate_room(room, 'Luxury', {}, EstimationContext(project))
+            for room_id, room in rooms.items()
+        }
+
+        self.assertEqual(json.dumps(batched, sort_keys=True), json.dumps(single, sort_keys=True))
+        self.assertEqual(batched['bath_7']['name'], 'Bath 7')
+        self.assertIsNot(batched['bath_7']['categories'], batched['bath_0']['categories'])
+        self.assertEqual(batched['kitchen_override']['categories']['cabinetry']['tier'], 'Ultra-Luxury')
+
+        # 32 rooms, 5 of them distinct
+        self.assertEqual(max(len(call.args[1]) for call in apply_costs.call_args_list), 5)
+
+if __name__ == '__main__':
+    unittest.main()
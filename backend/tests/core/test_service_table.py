@@ -0,0 +1,66 @@
+# tests/core/test_service_table.py
+
+import unittest
+import logging
+
+import pandas as pd
+
+from src.core.data_loader import DataLoader
+from src.core.service_table import ServiceTable
+from src.estimators.electrical import ElectricalEstimator, service_level_keys
+
+# Suppress logging during tests
+logging.disable(logging.CRITICAL)
+
+class TestServiceTable(unittest.TestCase):
+
+    def setUp(self):
+        self.catalog = pd.DataFrame({
+            'Item': ['Electrical New 200 Amp Sub-Panel', 'Electrical New 200 Amp Service',
+                     'Electrical New 400 Amp Service', None],
+            'Cost(Mid)': [2800.0, 5000.0, 6500.0, 1.0],
+            'ID': ['el18', 'el14', 'el15', None]
+        })
+        self.table = ServiceTable(self.catalog)
+
+    def test_resolves_first_matching_row(self):
+        item = self.table.lookup(200, 'Electrical New 200 Amp Service')
+        self.assertEqual(item['ID'], 'el14')
+        # Keys are case-insensitive on the name and accept the amp size as a string
+        self.assertEqual(self.table.lookup('400', 'electrical new 400 amp service')['ID'], 'el15')
+
+    def test_known_service_without_catalog_item(self):
+        self.assertIn((600, 'Electrical New 600 Amp Service'), self.table)
+        self.assertIsNone(self.table.lookup(600, 'Electrical New 600 Amp Service'))
+
+    def test_unknown_service_is_not_searched(self):
+        self.assertNotIn((300, 'Electrical New 200 Amp Service'), self.table)
+        self.assertIsNone(self.table.lookup(300, 'Electrical New 200 Amp Service'))
+
+    def test_covers_every_estimator_service(self):
+        estimator = ElectricalEstimator()
+        for tier in ('Premium', 'Luxury', 'Ultra-Luxury'):
+            for square_footage in (1500, 4500, 5500, 7000, 9000, 20000):
+                distribution = estimator._calculate_distribution(square_footage, tier)
+                self.assertIn((distribution['main_panel_size'], distribution['electrical_service_name']), self.table)
+
+    def test_matches_catalog_scan(self):
+        """Resolved rows match the str.contains scan over the real catalog"""
+        loader = DataLoader()
+        catalog = loader.load_catalog()
+        table = ServiceTable(catalog, loader.search_index)
+
+        for panel_size, service_name in service_level_keys():
+            with self.subTest(service=service_name):
+                matches = catalog[
+                    catalog['Item'].str.contains(service_name, case=False, na=False) &
+                    catalog['Item'].str.contains(str(panel_size), case=False, na=False)
+                ]
+                item = table.lookup(panel_size, service_name)
+                if matches.empty:
+                    self.assertIsNone(item)
+                else:
+                    self.assertEqual(item['ID'], matches.iloc[0]['ID'])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+# tests/estimators/test_batch_quantities.py
+
+import unittest
+import json
+import os
+from pathlib import Path
+import logging
+
+import numpy as np
+
+from src.core.engine_snapshot import EngineSnapshot
+from src.estimators.batch import TIER_NAMES, encode_tiers, batch_row
+
+# Suppress logging during tests
+logging.disable(logging.CRITICAL)
+
+class TestBatchQuantities(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        project_root = Path(__file__).parent.parent.parent
+        cls.estimators = EngineSnapshot.load(os.path.join(project_root, 'config', 'settings.json')).estimators
+
+        rng = np.random.default_rng(7)
+        rows = 60
+        # Repeat some inputs so deduplication is exercised
+        cls.square_footage = np.concatenate([rng.integers(0, 15000, rows - 10), [5000] * 10])
+        cls.tiers = [TIER_NAMES[i] for i in rng.integers(0, len(TIER_NAMES), rows)]
+        cls.counts = {
+            'bedroom_count': rng.integers(1, 7, rows),
+            'bathroom_count': rng.integers(1, 6, rows),
+            'primary_bath_count': rng.integers(1, 3, rows),
+            'secondary_bath_count': rng.integers(0, 4, rows),
+            'powder_room_count': rng.integers(0, 3, rows),
+            'project_duration_months': rng.integers(6, 24, rows)
+        }
+
+    def _assert_rows_match(self, estimator, square_footage, counts):
+        columns = estimator.calculate_quantities_batch(square_footage, encode_tiers(self.tiers), **counts)
+
+        for row, (sf, tier) in enumerate(zip(square_footage, self.tiers)):
+            kwargs = {name: int(values[row]) for name, values in counts.items()}
+            expected = estimator.calculate_quantities(square_footage=sf, tier=tier, **kwargs)
+            # Serialized, so key order and int/float types must match too
+            self.assertEqual(json.dumps(batch_row(columns, row)), json.dumps(expected), f"row {row}")
+
+    def test_batch_matches_scalar_row_for_row(self):
+        """Every estimator's batch result equals its scalar result for each row"""
+        square_footage = [int(sf) for sf in self.square_footage]
+
+        for category, estimator in self.estimators.items():
+            with self.subTest(category=category):
+                self._assert_rows_match(estimator, square_footage, self.counts)
+
+    def test_defaults_and_fractional_square_footage(self):
+        """Rows without counts use the scalar defaults; float square footage stays float"""
+        square_footage = np.empty(len(self.square_footage), dtype=object)
+        square_footage[:] = [int(sf) if row % 3 else sf + 0.45 for row, sf in enumerate(self.square_footage.tolist())]
+
+        for category, estimator in self.estimators.items():
+            with self.subTest(category=category):
+                self._assert_rows_match(estimator, square_footage, {})
+
+    def test_integer_quantities_keep_integer_dtype(self):
+        columns = self.estimators['plumbing'].calculate_quantities_batch(
+            self.square_footage, encode_tiers(self.tiers), **self.counts)
+        self.assertEqual(columns['total_plumbing_fixtures'].dtype, np.int64)
+        self.assertEqual(columns['tankless_water_heaters'].dtype, np.int64)
+
+    def test_columns_have_one_entry_per_row(self):
+        columns = self.estimators['hvac'].calculate_quantities_batch(self.square_footage, encode_tiers(self.tiers))
+        for values in columns.values():
+            self.assertEqual(len(values), len(self.square_footage))
+
+    def test_rejects_bad_inputs(self):
+        estimator = self.estimators['foundation']
+        with self.assertRaises(ValueError):
+            encode_tiers(['Basic'])
+        with self.assertRaises(ValueError):
+            estimator.calculate_quantities_batch([1000, 2000], [0])
+
+    def test_ignores_inputs_the_estimator_does_not_read(self):
+        estimator = self.estimators['foundation']
+        self.assertEqual(
+            {key: column.tolist() for key, column in estimator.calculate_quantities_batch(
+                [1000], [0], garage_count=[2], bedroom_count=[4]).items()},
+            {key: column.tolist() for key, column in estimator.calculate_quantities_batch([1000], [0]).items()}
+        )
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+# tests/helpers.py
+
+"""Shared setup for tests that build engines from the repo's own config and data"""
+
+import unittest
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent.parent
+SETTINGS_PATH = 'config/settings.json'
+
+def comparable(result):
+    """Result as sorted JSON without its metadata (timestamp, snapshot version, profile), so runs can be compared"""
+    result = json.loads(json.dumps(result, default=str))
+    result.get('summary', {}).pop('metadata', None)
+    return json.dumps(result, sort_keys=True)
+
+class BackendTestCase(unittest.TestCase):
+    """
+    Runs from the backend directory, where settings.json and its relative data
+    paths resolve, with a scratch directory for the class's config files
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.original_cwd = os.getcwd()
+        os.chdir(BACKEND_DIR)
+        cls.temp_dir = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+        os.chdir(cls.original_cwd)
+
+    @classmethod
+    def engine_with(cls, engine_class, name, **estimation):
+        """
+        Engine built from a copy of settings.json
+
+        Args:
+            engine_class: EstimationEngine or EnhancedEstimationEngine
+            name: Suffix for the copied settings file, unique within the class
+            **estimation: Sections of the estimation settings to replace
+        """
+        with open(SETTINGS_PATH) as f:
+            config = json.load(f)
+        config['estimation'].update(estimation)
+        config_path = os.path.join(cls.temp_dir, f'settings_{name}.json')
+        with open(config_path, 'w') as f:
+            json.dump(config, f)
+        return engine_class(config_path)
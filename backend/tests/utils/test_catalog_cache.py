@@ -0,0 +1,76 @@
+# tests/utils/test_catalog_cache.py
+
+import unittest
+import os
+import shutil
+import tempfile
+import logging
+
+import pandas as pd
+
+from src.utils.catalog_cache import load_cached_frame, strip_catalog_junk, cache_path_for
+
+# Suppress logging during tests
+logging.disable(logging.CRITICAL)
+
+CATALOG_CSV = """Item,Cost(Mid),Unit,ID,,
+,,,,,
+Kitchen,,,,,
+Outlet,$12.50,EA,el1,,
+Allowance,,EA,al1,,
+Loose Item,$3.00,EA,,,
+"""
+
+class TestCatalogCache(unittest.TestCase):
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.work_dir, 'catalog.csv')
+        with open(self.csv_path, 'w') as f:
+            f.write(CATALOG_CSV)
+        self.builds = 0
+
+    def tearDown(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def _build(self):
+        self.builds += 1
+        return strip_catalog_junk(pd.read_csv(self.csv_path))
+
+    def test_strips_junk_columns_and_header_rows(self):
+        catalog = self._build()
+        self.assertEqual(list(catalog.columns), ['Item', 'Cost(Mid)', 'Unit', 'ID'])
+        # Rows with an ID or a cost are kept even if the other is missing
+        self.assertEqual(catalog['Item'].tolist(), ['Outlet', 'Allowance', 'Loose Item'])
+        self.assertEqual(list(catalog.index), [0, 1, 2])
+
+    def test_cache_hit_skips_parsing(self):
+        first = load_cached_frame(self.csv_path, self._build, 'test')
+        self.assertTrue(os.path.exists(cache_path_for(self.csv_path, 'test')))
+
+        second = load_cached_frame(self.csv_path, self._build, 'test')
+        self.assertEqual(self.builds, 1)
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_changed_csv_rebuilds(self):
+        load_cached_frame(self.csv_path, self._build, 'test')
+        with open(self.csv_path, 'a') as f:
+            f.write("Switch,$8.00,EA,el2,,\n")
+
+        catalog = load_cached_frame(self.csv_path, self._build, 'test')
+        self.assertEqual(self.builds, 2)
+        self.assertIn('Switch', catalog['Item'].tolist())
+
+    def test_namespaces_are_separate(self):
+        load_cached_frame(self.csv_path, self._build, 'one')
+        load_cached_frame(self.csv_path, self._build, 'two')
+        self.assertEqual(self.builds, 2)
+
+    def test_disabled_cache_always_parses(self):
+        load_cached_frame(self.csv_path, self._build, 'test', enabled=False)
+        load_cached_frame(self.csv_path, self._build, 'test', enabled=False)
+        self.assertEqual(self.builds, 2)
+        self.assertFalse(os.path.exists(cache_path_for(self.csv_path, 'test')))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+# tests/utils/test_catalog_mapper.py
+
+import unittest
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+import logging
+
+import pandas as pd
+
+from src.utils.catalog_mapper import CatalogMapper
+
+# Suppress logging during tests
+logging.disable(logging.CRITICAL)
+
+TIERS = ['Premium', 'Luxury', 'Ultra-Luxury', None]
+
+class TestCatalogMapperPartitions(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        project_root = Path(__file__).parent.parent.parent
+        cls.temp_dir = tempfile.mkdtemp()
+        catalog_path = os.path.join(project_root, 'data', 'catalog_enhanced.csv')
+        catalog = pd.read_csv(catalog_path)
+
+        electrical_ids = catalog.loc[catalog['EstimatorModule'] == 'electrical', 'ID'].tolist()
+        mapping_config = {
+            'estimator_modules': {
+                'electrical': {
+                    'quantity_mappings': {
+                        'standard_outlets': {'tier_item_ids': {'Luxury': electrical_ids[:2], 'Premium': ['NO-SUCH-ID']},
+                                             'search_terms': ['outlet', 'receptacle']},
+                        'recessed_lights': {'search_terms': ['recessed', 'can light']}
+                    }
+                }
+            }
+        }
+        cls.mapping_config_path = os.path.join(cls.temp_dir, 'catalog_mappings.json')
+        with open(cls.mapping_config_path, 'w') as f:
+            json.dump(mapping_config, f)
+
+        cls.mapper = CatalogMapper(catalog_path, cls.mapping_config_path, use_cache=False)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def _reference_items(self, module_name, quantity_name, construction_tier):
+        """The fallback chain written as plain DataFrame filters"""
+        catalog = self.mapper.catalog
+        mappings = self.mapper._get_quantity_mappings(module_name, quantity_name)
+
+        if mappings and construction_tier in mappings.get('tier_item_ids', {}):
+            matches = catalog[catalog['ID'].isin(mappings['tier_item_ids'][construction_tier])]
+            if not matches.empty:
+                return matches['ID'].tolist()
+
+        module_items = catalog[catalog['EstimatorModule'] == module_name]
+        if construction_tier:
+            module_items = module_items[module_items['ConstructionTier'] == construction_tier]
+
+        if mappings and 'search_terms' in mappings:
+            pattern = '|'.join(mappings['search_terms'])
+            matches = module_items[module_items['SearchItem'].str.contains(pattern, case=False, na=False)]
+            if not matches.empty:
+                return matches['ID'].tolist()
+
+        if module_items.empty:
+            return []
+
+        pattern = '|'.join(self.mapper._derive_search_terms_from_quantity(quantity_name))
+        matches = module_items[module_items['SearchItem'].str.contains(pattern, case=False, na=False)]
+        if matches.empty:
+            category = self.mapper._guess_category_from_quantity(quantity_name)
+            if category:
+                category_items = catalog[catalog['Category'].str.contains(category, case=False, na=False)]
+                if construction_tier:
+                    category_items = category_items[category_items['ConstructionTier'] == construction_tier]
+                if not category_items.empty:
+                    return category_items.head(3)['ID'].tolist()
+            return module_items.head(3)['ID'].tolist()
+
+        return matches['ID'].tolist()
+
+    def test_matches_dataframe_filters(self):
+        modules = list(self.mapper.catalog['EstimatorModule'].dropna().unique()) + ['no_such_module']
+        for module in modules:
+            quantities = self.mapper._get_sample_quantities(module) or ['standard_outlets', 'wall_paint_gallons']
+            for quantity in quantities:
+                for tier in TIERS:
+                    with self.subTest(module=module, quantity=quantity, tier=tier):
+                        items = self.mapper.get_catalog_items_for_quantity(module, quantity, tier)
+                        self.assertEqual([item['ID'] for item in items],
+                                         self._reference_items(module, quantity, tier))
+
+    def test_mapped_ids_and_search_terms(self):
+        luxury = self.mapper.get_catalog_items_for_quantity('electrical', 'standard_outlets', 'Luxury')
+        self.assertEqual(len(luxury), 2)
+
+        # Unknown IDs fall through to the search terms
+        premium = self.mapper.get_catalog_items_for_quantity('electrical', 'standard_outlets', 'Premium')
+        self.assertEqual(premium, self.mapper.search_module_items('electrical', 'outlet|receptacle', 'Premium'))
+
+    def test_partitions(self):
+        catalog = self.mapper.catalog
+        for (module, tier), rows in self.mapper.partitions.items():
+            expected = catalog['EstimatorModule'] == module
+            if tier is not None:
+                expected &= catalog['ConstructionTier'] == tier
+            self.assertEqual(rows.tolist(), catalog.index[expected].tolist())
+
+        self.assertEqual(len(self.mapper._get_module_rows('no_such_module', 'Luxury')), 0)
+
+    def test_items_are_records(self):
+        items = self.mapper.get_catalog_items_for_quantity('electrical', 'recessed_lights', 'Luxury')
+        self.assertTrue(items)
+        row = self.mapper.catalog[self.mapper.catalog['ID'] == items[0]['ID']].to_dict('records')[0]
+        self.assertEqual(items[0].keys(), row.keys())
+        self.assertEqual(items[0]['Item'], row['Item'])
+
+if __name__ == "__main__":
+    unittest.main()
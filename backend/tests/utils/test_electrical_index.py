@@ -0,0 +1,100 @@
+# tests/utils/test_electrical_index.py
+
+import unittest
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+import logging
+
+from src.utils.catalog_mapper import (
+    CatalogMapper, get_electrical_catalog_items, get_electrical_generic_item, get_avg_electrical_cost
+)
+from src.utils.electrical_index import ELECTRICAL_ALIASES, COMPONENT_TYPES, AVERAGE_COST_TERMS
+
+# Suppress logging during tests
+logging.disable(logging.CRITICAL)
+
+QUANTITIES = list(ELECTRICAL_ALIASES) + [
+    'outlets', 'switches', 'lights', 'panels', 'controls', 'light_fixtures', 'usb_outlets',
+    'circuit_breakers', 'pendant_lights', 'service', 'smart_home_hub'
+]
+
+class TestElectricalComponentIndex(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        project_root = Path(__file__).parent.parent.parent
+        cls.temp_dir = tempfile.mkdtemp()
+        mapping_config_path = os.path.join(cls.temp_dir, 'catalog_mappings.json')
+        with open(mapping_config_path, 'w') as f:
+            json.dump({'estimator_modules': {}}, f)
+
+        cls.mapper = CatalogMapper(os.path.join(project_root, 'data', 'catalog_enhanced.csv'),
+                                   mapping_config_path, use_cache=False)
+        cls.electrical = [item for item in cls.mapper.catalog.to_dict('records')
+                          if item.get('EstimatorModule') == 'electrical']
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def _ids(self, items):
+        return [item['ID'] for item in items]
+
+    def _matching(self, term, items=None):
+        return [item for item in (items if items is not None else self.electrical)
+                if term in str(item.get('SearchItem', '')).lower()]
+
+    def test_alias_rows(self):
+        index = self.mapper.electrical_index
+        for quantity_name, aliases in ELECTRICAL_ALIASES.items():
+            expected = next((self._matching(alias) for alias in aliases if self._matching(alias)), None)
+            with self.subTest(quantity=quantity_name):
+                if expected is None:
+                    self.assertNotIn(quantity_name, index.alias_rows)
+                else:
+                    self.assertEqual(self._ids(index.items(index.alias_rows[quantity_name])), self._ids(expected))
+
+    def test_component_type_rows_by_tier(self):
+        index = self.mapper.electrical_index
+        for component, terms in COMPONENT_TYPES.items():
+            expected = [item for term in terms for item in self._matching(term)]
+            self.assertEqual(self._ids(index.items(index.type_rows[component])), self._ids(expected))
+            for tier in ('Premium', 'Luxury', 'Ultra-Luxury'):
+                with self.subTest(component=component, tier=tier):
+                    self.assertEqual(self._ids(index.items(index.type_tier_rows[(component, tier)])),
+                                     self._ids(item for item in expected if item.get('ConstructionTier') == tier))
+
+    def test_helpers(self):
+        for quantity_name in QUANTITIES:
+            for tier in ('Premium', 'Luxury', 'Ultra-Luxury', 'Standard'):
+                with self.subTest(quantity=quantity_name, tier=tier):
+                    items = get_electrical_catalog_items(self.mapper, quantity_name, tier)
+                    self.assertIsInstance(items, list)
+                    if tier == 'Standard':
+                        # No module rows for this tier, so only the electrical strategies can match
+                        for item in items:
+                            self.assertEqual(item['EstimatorModule'], 'electrical')
+
+                    generic = get_electrical_generic_item(self.mapper, quantity_name, tier)
+                    self.assertTrue(generic is None or generic['ConstructionTier'] == tier)
+
+    def test_average_cost(self):
+        for category, terms in AVERAGE_COST_TERMS.items():
+            items = [item for item in self.electrical
+                     if any(term in str(item.get('SearchItem', '')).lower() for term in terms)]
+            average = get_avg_electrical_cost(self.mapper, terms[0])
+            with self.subTest(category=category):
+                if not items:
+                    self.assertIsNone(average)
+                else:
+                    self.assertEqual(average['ID'], f"AVG-{category.upper()}")
+                    self.assertAlmostEqual(average['Cost(Mid)'],
+                                           sum(item['Cost(Mid)'] for item in items) / len(items))
+
+        self.assertIsNone(get_avg_electrical_cost(self.mapper, 'unknown_quantity'))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+# tests/utils/test_events.py
+
+import unittest
+import logging
+import os
+from unittest import mock
+
+from src.utils.events import EventLog
+
+class _Capture(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+class TestEventLog(unittest.TestCase):
+
+    def setUp(self):
+        # Other test modules disable logging globally; re-enable it for these tests
+        logging.disable(logging.NOTSET)
+        self.log = EventLog(logger_name='tests.events')
+        self.log.logger.setLevel(logging.DEBUG)
+        self.log.logger.propagate = False
+        self.handler = _Capture()
+        self.log.logger.addHandler(self.handler)
+
+    def tearDown(self):
+        self.log.logger.removeHandler(self.handler)
+        logging.disable(logging.CRITICAL)
+
+    def test_production_mode_drops_hot_path_events(self):
+        calls = []
+        self.log.trace('cost.item', item=lambda: calls.append(1))
+        self.assertFalse(self.log.tracing)
+        self.assertEqual(self.handler.records, [])
+        self.assertEqual(calls, [])
+
+    def test_debug_mode_emits_structured_records(self):
+        self.log.configure('debug')
+        self.log.trace('category.quantities', category='framing', quantities={'studs': 10})
+
+        record, = self.handler.records
+        self.assertEqual(record.levelno, logging.DEBUG)
+        self.assertEqual(record.event, 'category.quantities')
+        self.assertEqual(record.fields, {'category': 'framing', 'quantities': {'studs': 10}})
+        self.assertEqual(record.getMessage(), "category.quantities category=framing quantities={'studs': 10}")
+
+    def test_lazy_fields_are_only_evaluated_when_formatted(self):
+        self.log.configure('debug')
+        self.log.logger.setLevel(logging.INFO)
+        calls = []
+        self.log.trace('cost.item', item=lambda: calls.append(1) or 'x')
+        self.assertEqual(calls, [])
+
+        self.log.logger.setLevel(logging.DEBUG)
+        self.log.trace('cost.item', item=lambda: calls.append(1) or 'x')
+        self.assertEqual(self.handler.records[0].getMessage(), 'cost.item item=x')
+        self.assertTrue(calls)
+
+    def test_sampled_mode_keeps_one_in_n(self):
+        self.log.configure('sampled', sample_every=10)
+        for index in range(35):
+            self.log.trace('cost.item', index=index)
+        self.assertEqual([record.fields['index'] for record in self.handler.records], [0, 10, 20, 30])
+
+    def test_configure_from_settings_and_environment(self):
+        self.log.configure_from({'estimation': {'events': {'mode': 'sampled', 'sample_every': 5}}})
+        self.assertEqual((self.log.mode, self.log.sample_every), ('sampled', 5))
+
+        with mock.patch.dict(os.environ, {'ESTIMATE_EVENTS': 'debug'}):
+            self.log.configure_from({'estimation': {'events': {'mode': 'production'}}})
+        self.assertEqual(self.log.mode, 'debug')
+
+        self.log.configure('verbose')
+        self.assertEqual(self.log.mode, 'production')
+
+    def test_tracing_modes_get_past_an_info_root_logger(self):
+        root = logging.getLogger()
+        saved = (root.level, root.handlers[:])
+        capture = _Capture()
+        logging.basicConfig(level=logging.INFO, handlers=[capture], force=True)
+        log = EventLog(logger_name='tests.root_events')
+        try:
+            log.configure_from({'estimation': {'events': {'mode': 'debug'}}})
+            log.trace('room.start', room_id='kitchen')
+            self.assertEqual([record.event for record in capture.records], ['room.start'])
+
+            log.configure_from({'estimation': {'events': {'mode': 'production'}}})
+            self.assertEqual(log.logger.level, logging.NOTSET)
+            log.emit('snapshot.debug', logging.DEBUG)
+            self.assertEqual(len(capture.records), 1)
+        finally:
+            root.handlers[:] = saved[1]
+            root.setLevel(saved[0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+# tests/utils/test_search_index.py
+
+import unittest
+import json
+import os
+from pathlib import Path
+import logging
+
+import numpy as np
+import pandas as pd
+
+from src.utils.search_index import SearchIndex
+
+# Suppress logging during tests
+logging.disable(logging.CRITICAL)
+
+class TestSearchIndex(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        project_root = Path(__file__).parent.parent.parent
+        cls.catalog = pd.read_csv(os.path.join(project_root, 'data', 'catalog_enhanced.csv'))
+        cls.index = SearchIndex(cls.catalog, fields=('SearchItem', 'Keywords', 'Item'),
+                                filter_columns=('EstimatorModule', 'ConstructionTier'))
+
+        with open(os.path.join(project_root, 'config', 'catalog_mappings_03.19.25.json')) as f:
+            mappings = json.load(f)
+        cls.terms = sorted({
+            term
+            for category in mappings['category_mappings'].values()
+            for mapping in category.get('item_mappings', {}).values()
+            for term in mapping.get('search_terms', [])
+        } | {
+            quantity.replace('_', ' ')
+            for category in mappings['category_mappings'].values()
+            for quantity in category.get('item_mappings', {})
+        })
+
+    def _expected(self, field, pattern, case, rows=None):
+        mask = self.catalog[field].str.contains(pattern, case=case, regex=True, na=False).to_numpy()
+        expected = np.flatnonzero(mask)
+        return expected if rows is None else np.intersect1d(expected, rows)
+
+    def test_terms_match_str_contains(self):
+        """Every mapping search term returns the same rows as str.contains"""
+        for field in ('SearchItem', 'Keywords', 'Item'):
+            for term in self.terms:
+                for case in (True, False):
+                    with self.subTest(field=field, term=term, case=case):
+                        np.testing.assert_array_equal(
+                            self.index.match_pattern(field, term, case=case),
+                            self._expected(field, term, case)
+                        )
+
+    def test_alternation_with_filters(self):
+        rows = self.index.filter(EstimatorModule='electrical', ConstructionTier='Luxury')
+        expected_rows = np.flatnonzero(((self.catalog['EstimatorModule'] == 'electrical') &
+                                        (self.catalog['ConstructionTier'] == 'Luxury')).to_numpy())
+        np.testing.assert_array_equal(rows, expected_rows)
+
+        pattern = 'outlet|receptacle|recessed light|3-way'
+        np.testing.assert_array_equal(
+            self.index.match_pattern('SearchItem', pattern, case=False, rows=rows),
+            self._expected('SearchItem', pattern, False, rows)
+        )
+
+    def test_regex_patterns_fall_back_to_regex(self):
+        for pattern in [r'^wood', r'light(?:s)?$', r'\d+ amp', 'tile.*floor']:
+            with self.subTest(pattern=pattern):
+                np.testing.assert_array_equal(
+                    self.index.match_pattern('SearchItem', pattern, case=False),
+                    self._expected('SearchItem', pattern, False)
+                )
+
+    def test_and_query(self):
+        both = self.index.search('SearchItem', ['light', 'recessed'], mode='all')
+        mask = (self.catalog['SearchItem'].str.contains('light', case=False, na=False) &
+                self.catalog['SearchItem'].str.contains('recessed', case=False, na=False))
+        np.testing.assert_array_equal(both, np.flatnonzero(mask.to_numpy()))
+
+    def test_empty_and_missing(self):
+        self.assertEqual(len(self.index.match_pattern('SearchItem', 'zzzz-not-there')), 0)
+        self.assertEqual(len(self.index.filter(EstimatorModule='no_such_module')), 0)
+        self.assertEqual(len(SearchIndex(pd.DataFrame()).match_pattern('SearchItem', 'x')), 0)
+
+if __name__ == "__main__":
+    unittest.main()
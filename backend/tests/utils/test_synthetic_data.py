@@ -0,0 +1,81 @@
+# tests/utils/test_synthetic_data.py
+
+import unittest
+import json
+import logging
+
+from src.core.data_loader import DataLoader
+from src.core.estimation_engine import EnhancedEstimationEngine
+from src.utils.synthetic_data import SyntheticDataGenerator, ENHANCED_COLUMNS, TIERS
+from tests.helpers import BackendTestCase
+
+# Suppress logging during tests
+logging.disable(logging.CRITICAL)
+
+class TestSyntheticDataGenerator(BackendTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.generator = SyntheticDataGenerator(seed=7)
+        cls.catalog, cls.mappings = cls.generator.generate_catalog(2000)
+
+    def test_catalog_schema(self):
+        self.assertEqual(list(self.catalog.columns), ENHANCED_COLUMNS)
+        self.assertEqual(len(self.catalog), 2000)
+        self.assertTrue(self.catalog['ID'].is_unique)
+        self.assertTrue(set(self.catalog['ConstructionTier']) <= set(TIERS))
+        self.assertTrue((self.catalog['Cost (Low)'] <= self.catalog['Cost(Mid)']).all())
+        self.assertTrue((self.catalog['Cost(Mid)'] <= self.catalog['Cost (High)']).all())
+
+        mapped_modules = {module for module, mapping in self.generator.category_mappings.items()
+                          if mapping.get('item_mappings')}
+        self.assertEqual(set(self.catalog['EstimatorModule'].dropna()), mapped_modules | {'electrical'})
+        self.assertTrue(self.catalog['EstimatorModule'].isna().any())
+
+    def test_same_seed_same_data(self):
+        catalog, mappings = SyntheticDataGenerator(seed=7).generate_catalog(2000)
+        self.assertTrue(catalog.equals(self.catalog))
+        self.assertEqual(mappings, self.mappings)
+
+        other, _ = SyntheticDataGenerator(seed=8).generate_catalog(2000)
+        self.assertFalse(other['Cost(Mid)'].equals(self.catalog['Cost(Mid)']))
+
+    def test_mappings_resolve_to_generated_ids(self):
+        ids = set(self.catalog['ID'])
+        base = self.generator.category_mappings
+        for module, category_mapping in self.mappings['category_mappings'].items():
+            base_items = base[module].get('item_mappings', {})
+            self.assertEqual(set(category_mapping['item_mappings']), set(base_items))
+            for quantity_name, mapping in category_mapping['item_mappings'].items():
+                self.assertEqual(len(mapping['item_ids']), 1)
+                self.assertIn(mapping['item_ids'][0], ids)
+                self.assertEqual(mapping.get('search_terms'), base_items[quantity_name].get('search_terms'))
+
+    def test_project_payload(self):
+        project = self.generator.generate_project(40, tier='Luxury')
+        self.assertEqual(project, self.generator.generate_project(40, tier='Luxury'))
+        self.assertEqual(len(project['rooms']), 40)
+        self.assertEqual(project['global_tier'], 'Luxury')
+        self.assertGreater(project['square_footage'], sum(room['square_footage'] for room in project['rooms'].values()))
+        self.assertEqual(project['bedroom_count'],
+                         sum(room['type'] == 'bedroom' for room in project['rooms'].values()))
+        for room in project['rooms'].values():
+            self.assertEqual(set(room) - {'tier', 'trades'}, {'name', 'type', 'square_footage'})
+
+    def test_written_dataset_drives_the_engine(self):
+        paths = self.generator.write_dataset(self.temp_dir, 1500, room_counts=[6])
+        self.assertEqual(DataLoader(paths['settings']).mappings_path, paths['mappings'])
+
+        engine = EnhancedEstimationEngine(paths['settings'])
+        with open(paths['projects'][6]) as file:
+            result = engine.estimate_detailed_project(json.load(file))
+
+        self.assertEqual(len(engine.catalog), 1500)
+        self.assertIsNotNone(engine.catalog_mapper)
+        self.assertEqual(len(result['rooms']), 6)
+        self.assertGreater(result['total_cost'], 0)
+        self.assertIsNotNone(engine.service_table.lookup(400, 'Electrical New 400 Amp Service'))
+
+if __name__ == '__main__':
+    unittest.main()